@@ -206,22 +206,27 @@ const FirstAssessment: React.FC<FirstAssessmentProps> = ({
                 };
               });
 
-              const requestData = {
+              const baseRequest = {
                 company_id: searchResult.data.company_id,
                 report_period: searchResult.data.search_period,
                 request_type: 'middleissue_assessment',
                 timestamp: new Date().toISOString(),
-                articles: formattedArticles,
                 total_results: searchResult.data.total_results || 0
               };
 
+              // 서버에 보관된 검색 결과가 있으면 기사 목록 대신 result_id만 전송
+              const resultId = searchResult.data.result_id;
+              const requestData = resultId
+                ? { ...baseRequest, result_id: resultId }
+                : { ...baseRequest, articles: formattedArticles };
+
               console.log('🚀 중대성 평가 요청 데이터:', requestData);
 
               // Gateway를 통해 materiality-service 호출
               const gatewayUrl = 'https://gateway-production-4c8b.up.railway.app';
-              const response = await axios.post(
+              const postAssessment = (data: any) => axios.post(
                 `${gatewayUrl}/api/v1/materiality-service/middleissue/assessment`,
-                requestData,
+                data,
                 {
                   headers: {
                     'Content-Type': 'application/json',
@@ -229,6 +234,13 @@ const FirstAssessment: React.FC<FirstAssessmentProps> = ({
                   timeout: 120000  // 2분 타임아웃 설정
                 }
               );
+              let response = await postAssessment(requestData);
+
+              // 보관 기간이 지났으면 기사 목록을 직접 보내서 한 번 더 시도
+              if (!response.data.success && response.data.data?.result_expired) {
+                console.log('⚠️ 검색 결과 보관 만료 - 기사 목록으로 재요청');
+                response = await postAssessment({ ...baseRequest, articles: formattedArticles });
+              }
 
               if (response.data.success) {
                 // 4. 응답 데이터 구조 통일 - response.data.data가 우선, 없으면 response.data 사용
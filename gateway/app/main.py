@@ -12,6 +12,7 @@ import json
 
 from app.www.jwt_auth_middleware import AuthMiddleware
 from app.domain.discovery.service_factory import SimpleServiceFactory
+from app.common.loop_monitor import install_loop_monitor
 
 # Gateway는 DB에 직접 접근하지 않음 (MSA 원칙)
 
@@ -32,8 +33,15 @@ async def lifespan(app: FastAPI):
     # 서비스 팩토리 초기화
     app.state.service_factory = SimpleServiceFactory()
     logger.info("✅ Service Factory 초기화 완료")
+
+    # lifespan을 쓰므로 on_event 훅 대신 여기서 루프 감시 시작/종료
+    loop_monitor = getattr(app.state, "loop_monitor", None)
+    if loop_monitor is not None:
+        loop_monitor.start()
     
     yield
+    if loop_monitor is not None:
+        await loop_monitor.stop()
     logger.info("🛑 Gateway API 서비스 종료")
 
 app = FastAPI(
@@ -44,6 +52,9 @@ app = FastAPI(
     lifespan=lifespan
 )
 
+# 이벤트 루프 블로킹 감시 (GET /debug/loop-lag) - 모든 프록시 요청이 지나가는 루프
+install_loop_monitor(app, "gateway", register_hooks=False)
+
 app.add_middleware(
     CORSMiddleware,
     allow_origins=[
@@ -63,6 +63,16 @@ async def test_connection():
         logger.error(f"❌ 데이터베이스 연결 실패: {str(e)}")
         return False
 
+# 가입 중복 확인용 유니크 인덱스 보장 (이미 있으면 건너뜀)
+async def ensure_user_indexes():
+    try:
+        async with engine.begin() as conn:
+            await conn.execute(text('CREATE UNIQUE INDEX IF NOT EXISTS ux_user_email ON "user" (email)'))
+            await conn.execute(text('CREATE UNIQUE INDEX IF NOT EXISTS ux_user_auth_id ON "user" (auth_id)'))
+        logger.info("✅ user 유니크 인덱스 확인 완료 (email, auth_id)")
+    except Exception as e:
+        logger.error(f"❌ user 유니크 인덱스 생성 중 오류: {str(e)}")
+
 # 테이블 생성 함수 (존재하지 않는 경우에만 생성, 데이터 보호)
 async def create_tables():
     try:
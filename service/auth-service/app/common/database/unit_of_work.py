@@ -0,0 +1,96 @@
+"""
+Auth Service Unit of Work - 요청 단위 DB 세션 관리
+하나의 요청 안에서 모든 리포지토리가 같은 커넥션과 같은 트랜잭션을 공유하도록 함
+"""
+import logging
+from contextlib import asynccontextmanager
+from typing import AsyncIterator, Optional
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.common.database.database import AsyncSessionLocal
+
+logger = logging.getLogger("auth_service_unit_of_work")
+
+# 읽기 요청은 하나의 스냅샷을 보도록 REPEATABLE READ 사용
+READ_ISOLATION_LEVEL = "REPEATABLE READ"
+
+
+class UnitOfWork:
+    """요청 단위 세션 - 첫 쿼리 시점에 커넥션을 한 번만 체크아웃"""
+
+    def __init__(self, read_only: bool = True):
+        self.read_only = read_only
+        self._session: Optional[AsyncSession] = None
+
+    async def get_session(self) -> AsyncSession:
+        """요청 세션 반환 (없으면 생성)"""
+        if self._session is None:
+            self._session = AsyncSessionLocal()
+            if self.read_only:
+                await self._session.connection(
+                    execution_options={"isolation_level": READ_ISOLATION_LEVEL}
+                )
+        return self._session
+
+    async def commit(self) -> None:
+        """쓰기 요청이면 커밋, 읽기 요청이면 트랜잭션 종료"""
+        if self._session is None:
+            return
+        if self.read_only:
+            await self._session.rollback()
+        else:
+            await self._session.commit()
+
+    async def rollback(self) -> None:
+        if self._session is not None:
+            await self._session.rollback()
+
+    async def close(self) -> None:
+        if self._session is not None:
+            await self._session.close()
+            self._session = None
+
+
+async def _unit_of_work_scope(read_only: bool) -> AsyncIterator[UnitOfWork]:
+    uow = UnitOfWork(read_only=read_only)
+    try:
+        yield uow
+        await uow.commit()
+    except Exception:
+        try:
+            await uow.rollback()
+        except Exception as rb_e:
+            logger.error(f"❌ UnitOfWork 롤백 중 오류: {rb_e}")
+        raise
+    finally:
+        await uow.close()
+
+
+# FastAPI 의존성 - 조회 요청 (로그인 등)
+async def get_unit_of_work() -> AsyncIterator[UnitOfWork]:
+    async for uow in _unit_of_work_scope(read_only=True):
+        yield uow
+
+
+# FastAPI 의존성 - 쓰기 요청 (회원가입 등)
+async def get_write_unit_of_work() -> AsyncIterator[UnitOfWork]:
+    async for uow in _unit_of_work_scope(read_only=False):
+        yield uow
+
+
+@asynccontextmanager
+async def session_scope(uow: Optional[UnitOfWork] = None) -> AsyncIterator[AsyncSession]:
+    """
+    리포지토리용 세션 컨텍스트
+    - uow가 있으면 요청 세션을 그대로 사용 (닫지 않음)
+    - 없으면 기존처럼 호출마다 새 세션 사용
+    """
+    if uow is not None:
+        yield await uow.get_session()
+        return
+    async with AsyncSessionLocal() as session:
+        try:
+            yield session
+        finally:
+            await session.close()
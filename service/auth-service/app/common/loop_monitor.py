@@ -0,0 +1,232 @@
+"""
+Event Loop Lag Monitor - asyncio 이벤트 루프 블로킹 감시 (표준 라이브러리만 사용)
+- 샘플러 코루틴: interval마다 sleep 후 실제로 깨어난 시각과의 차이(스케줄러 지연)를 기록 → p50/p90/p99/max
+- 워치독 스레드: 샘플러 heartbeat가 threshold 넘게 멈추면 그 순간 루프 스레드의 스택을 캡처
+  (= 루프를 붙잡고 있는 동기 코드 위치), 블로킹이 풀리면 실제 블로킹 시간을 함께 기록
+- install_loop_monitor(app): startup/shutdown 훅 + 조회 엔드포인트 등록 (JSON / Prometheus 텍스트)
+  lifespan을 쓰는 앱은 register_hooks=False로 등록하고 lifespan 안에서 monitor.start()/stop() 호출
+
+서비스마다 독립 배포되므로 각 서비스 app/common/loop_monitor.py에 같은 파일을 둔다.
+
+환경변수:
+    LOOP_MONITOR_ENABLED (기본 true), LOOP_LAG_INTERVAL (초, 기본 0.1), LOOP_LAG_THRESHOLD (초, 기본 0.25)
+    LOOP_LAG_WINDOW (percentile 계산에 쓰는 최근 샘플 수, 기본 3000 ≈ 5분), LOOP_LAG_EVENTS (보관할 블로킹 이벤트 수, 기본 20)
+    LOOP_LAG_EXPOSE_STACKS (조회 엔드포인트 응답에 스택 포함 여부, 기본 false - 스택은 로그에만 남김)
+"""
+import asyncio
+import logging
+import os
+import sys
+import threading
+import time
+import traceback
+from collections import deque
+from datetime import datetime
+from typing import Any, Deque, Dict, List, Optional
+
+logger = logging.getLogger("loop_monitor")
+
+LOOP_MONITOR_ENABLED = os.getenv("LOOP_MONITOR_ENABLED", "true").lower() == "true"
+LOOP_LAG_INTERVAL = float(os.getenv("LOOP_LAG_INTERVAL", "0.1"))
+LOOP_LAG_THRESHOLD = float(os.getenv("LOOP_LAG_THRESHOLD", "0.25"))
+LOOP_LAG_WINDOW = int(os.getenv("LOOP_LAG_WINDOW", "3000"))
+LOOP_LAG_EVENTS = int(os.getenv("LOOP_LAG_EVENTS", "20"))
+# 조회 엔드포인트는 인증 없이 열려 있으므로 소스 경로가 담긴 스택은 명시적으로 켠 경우에만 응답
+LOOP_LAG_EXPOSE_STACKS = os.getenv("LOOP_LAG_EXPOSE_STACKS", "false").lower() == "true"
+# 캡처할 스택 프레임 수 (안쪽부터)
+STACK_LIMIT = 30
+
+
+def _percentile(ordered: List[float], q: float) -> float:
+    if not ordered:
+        return 0.0
+    k = (len(ordered) - 1) * q
+    lo = int(k)
+    hi = min(lo + 1, len(ordered) - 1)
+    return ordered[lo] + (ordered[hi] - ordered[lo]) * (k - lo)
+
+
+class LoopLagMonitor:
+    """이벤트 루프 지연 샘플링 + 블로킹 스택 캡처"""
+
+    def __init__(
+        self,
+        service_name: str,
+        *,
+        interval: float = LOOP_LAG_INTERVAL,
+        threshold: float = LOOP_LAG_THRESHOLD,
+        window: int = LOOP_LAG_WINDOW,
+        max_events: int = LOOP_LAG_EVENTS,
+    ):
+        self.service_name = service_name
+        self.interval = interval
+        self.threshold = threshold
+        self._lags: Deque[float] = deque(maxlen=window)
+        self.events: Deque[Dict[str, Any]] = deque(maxlen=max_events)
+        self.total_samples = 0
+        self.total_blocked = 0
+        self.max_lag = 0.0
+
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._loop_thread_id: Optional[int] = None
+        self._task: Optional[asyncio.Task] = None
+        self._watchdog: Optional[threading.Thread] = None
+        self._stop = threading.Event()
+        self._lock = threading.Lock()
+        self._last_beat = time.monotonic()
+        self._pending_event: Optional[Dict[str, Any]] = None
+
+    # ── 샘플러 (이벤트 루프) ──────────────────────────────────────────────
+    async def _sample_loop(self):
+        loop = asyncio.get_running_loop()
+        while True:
+            started = loop.time()
+            await asyncio.sleep(self.interval)
+            lag = max(0.0, loop.time() - started - self.interval)
+            now = time.monotonic()
+            with self._lock:
+                self._lags.append(lag)
+                self.total_samples += 1
+                self.max_lag = max(self.max_lag, lag)
+                self._last_beat = now
+                pending, self._pending_event = self._pending_event, None
+            if pending is not None:
+                # 워치독이 잡아 둔 블로킹 이벤트를 실제 지연 시간으로 마무리
+                pending["blocked_ms"] = round(lag * 1000, 1)
+                self.events.append(pending)
+                logger.warning(
+                    f"⚠️ 이벤트 루프 블로킹 {lag * 1000:.0f}ms ({self.service_name})\n{pending['stack']}"
+                )
+
+    # ── 워치독 (별도 스레드) ─────────────────────────────────────────────
+    def _watch(self):
+        check_every = max(0.01, min(self.interval, self.threshold) / 2)
+        while not self._stop.wait(check_every):
+            with self._lock:
+                stalled = time.monotonic() - self._last_beat - self.interval
+                capture = stalled > self.threshold and self._pending_event is None
+            if not capture:
+                continue
+            frame = sys._current_frames().get(self._loop_thread_id)
+            if frame is None:
+                continue
+            stack = "".join(traceback.format_stack(frame, limit=STACK_LIMIT))
+            with self._lock:
+                self.total_blocked += 1
+                # heartbeat가 돌아올 때까지 같은 블로킹은 한 번만 캡처
+                self._pending_event = {
+                    "detected_at": datetime.now().isoformat(timespec="milliseconds"),
+                    "stalled_ms_at_capture": round(stalled * 1000, 1),
+                    "blocked_ms": None,
+                    "stack": stack,
+                }
+
+    # ── 수명 주기 ────────────────────────────────────────────────────────
+    def start(self):
+        if self._task is not None:
+            return
+        self._loop = asyncio.get_running_loop()
+        self._loop_thread_id = threading.get_ident()
+        self._last_beat = time.monotonic()
+        self._stop.clear()
+        self._task = self._loop.create_task(self._sample_loop())
+        self._watchdog = threading.Thread(target=self._watch, name=f"loop-watchdog-{self.service_name}", daemon=True)
+        self._watchdog.start()
+        logger.info(f"✅ 이벤트 루프 감시 시작 (interval={self.interval}s, threshold={self.threshold}s)")
+
+    async def stop(self):
+        self._stop.set()
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+        if self._watchdog is not None:
+            self._watchdog.join(timeout=1)
+            self._watchdog = None
+
+    # ── 조회 ─────────────────────────────────────────────────────────────
+    def snapshot(self, include_stacks: bool = True) -> Dict[str, Any]:
+        with self._lock:
+            ordered = sorted(self._lags)
+            events = list(self.events)
+            if self._pending_event is not None:
+                # 지금 블로킹 중인 이벤트도 포함
+                events.append(dict(self._pending_event, in_progress=True))
+            total_samples, total_blocked, max_lag = self.total_samples, self.total_blocked, self.max_lag
+        ms = lambda v: round(v * 1000, 2)  # noqa: E731
+        return {
+            "service": self.service_name,
+            "running": self._task is not None,
+            "interval_ms": ms(self.interval),
+            "threshold_ms": ms(self.threshold),
+            "window_samples": len(ordered),
+            "total_samples": total_samples,
+            "blocked_events_total": total_blocked,
+            "lag_ms": {
+                "p50": ms(_percentile(ordered, 0.50)),
+                "p90": ms(_percentile(ordered, 0.90)),
+                "p99": ms(_percentile(ordered, 0.99)),
+                "max_window": ms(ordered[-1]) if ordered else 0.0,
+                "max_total": ms(max_lag),
+            },
+            "recent_blocking": [
+                e if include_stacks else {k: v for k, v in e.items() if k != "stack"}
+                for e in reversed(events)
+            ],
+        }
+
+    def prometheus(self) -> str:
+        """Prometheus 텍스트 형식"""
+        snap = self.snapshot(include_stacks=False)
+        label = f'service="{self.service_name}"'
+        lines = [
+            "# HELP event_loop_lag_seconds asyncio scheduler delay (recent window)",
+            "# TYPE event_loop_lag_seconds summary",
+        ]
+        for q, key in (("0.5", "p50"), ("0.9", "p90"), ("0.99", "p99")):
+            lines.append(f'event_loop_lag_seconds{{{label},quantile="{q}"}} {snap["lag_ms"][key] / 1000:.6f}')
+        lines += [
+            f"event_loop_lag_seconds_count{{{label}}} {snap['total_samples']}",
+            "# HELP event_loop_lag_max_seconds max scheduler delay since start",
+            "# TYPE event_loop_lag_max_seconds gauge",
+            f"event_loop_lag_max_seconds{{{label}}} {snap['lag_ms']['max_total'] / 1000:.6f}",
+            "# HELP event_loop_blocked_total loop stalls longer than threshold",
+            "# TYPE event_loop_blocked_total counter",
+            f"event_loop_blocked_total{{{label}}} {snap['blocked_events_total']}",
+        ]
+        return "\n".join(lines) + "\n"
+
+
+def install_loop_monitor(
+    app, service_name: str, path: str = "/debug/loop-lag", register_hooks: bool = True
+) -> Optional[LoopLagMonitor]:
+    """FastAPI 앱에 루프 감시 등록 - GET {path} (JSON), GET {path}?format=prometheus (텍스트)"""
+    if not LOOP_MONITOR_ENABLED:
+        logger.info("ℹ️ 이벤트 루프 감시 비활성화 (LOOP_MONITOR_ENABLED=false)")
+        return None
+
+    from fastapi.responses import PlainTextResponse
+
+    monitor = LoopLagMonitor(service_name)
+
+    if register_hooks:
+        @app.on_event("startup")
+        async def _start_loop_monitor():
+            monitor.start()
+
+        @app.on_event("shutdown")
+        async def _stop_loop_monitor():
+            await monitor.stop()
+
+    async def loop_lag(format: str = "json", stacks: bool = True):
+        """이벤트 루프 지연 percentile + 최근 블로킹 스택 (LOOP_LAG_EXPOSE_STACKS=true일 때만)"""
+        if format == "prometheus":
+            return PlainTextResponse(monitor.prometheus(), media_type="text/plain; version=0.0.4")
+        return monitor.snapshot(include_stacks=stacks and LOOP_LAG_EXPOSE_STACKS)
+
+    app.add_api_route(path, loop_lag, methods=["GET"], summary="이벤트 루프 지연 모니터", tags=["debug"])
+    app.state.loop_monitor = monitor
+    return monitor
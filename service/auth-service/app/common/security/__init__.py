@@ -0,0 +1 @@
+# Security utilities package
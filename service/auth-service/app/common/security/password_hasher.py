@@ -0,0 +1,111 @@
+"""
+Password Hasher - 비밀번호 해시/검증 (scrypt, 이벤트 루프 밖 스레드 풀에서 실행)
+- 신규 해시: scrypt$N$r$p$salt$hash (메모리 하드 KDF, 표준 라이브러리 hashlib.scrypt)
+- 기존 해시: SHA-256 hex 64자 → 검증 후 scrypt로 재해시 대상
+"""
+import asyncio
+import base64
+import hashlib
+import hmac
+import logging
+import os
+import re
+from concurrent.futures import ThreadPoolExecutor
+
+logger = logging.getLogger("auth_password_hasher")
+
+# scrypt 파라미터 (N=2^14, r=8 → 약 16MB 메모리)
+SCRYPT_N = int(os.getenv("AUTH_SCRYPT_N", str(2 ** 14)))
+SCRYPT_R = int(os.getenv("AUTH_SCRYPT_R", "8"))
+SCRYPT_P = int(os.getenv("AUTH_SCRYPT_P", "1"))
+SCRYPT_DKLEN = 32
+SCRYPT_SALT_BYTES = 16
+
+# 해시 전용 스레드 수 (hashlib.scrypt는 GIL을 풀고 실행됨) - 동시 KDF 메모리 사용량 상한 역할
+HASH_WORKERS = int(os.getenv("AUTH_HASH_WORKERS", str(min(4, os.cpu_count() or 1))))
+
+SCRYPT_PREFIX = "scrypt"
+_LEGACY_SHA256_RE = re.compile(r"^[0-9a-f]{64}$")
+
+_executor = ThreadPoolExecutor(max_workers=HASH_WORKERS, thread_name_prefix="auth-kdf")
+
+
+def _b64encode(raw: bytes) -> str:
+    return base64.b64encode(raw).decode("ascii")
+
+
+def _b64decode(text: str) -> bytes:
+    return base64.b64decode(text.encode("ascii"))
+
+
+def _scrypt(password: str, salt: bytes, n: int, r: int, p: int) -> bytes:
+    return hashlib.scrypt(
+        password.encode("utf-8"),
+        salt=salt,
+        n=n,
+        r=r,
+        p=p,
+        maxmem=256 * n * r * max(p, 1),
+        dklen=SCRYPT_DKLEN,
+    )
+
+
+def is_legacy_hash(stored_hash: str) -> bool:
+    """SHA-256 hex 형식의 기존 해시인지 여부"""
+    return bool(stored_hash) and bool(_LEGACY_SHA256_RE.match(stored_hash))
+
+
+def needs_rehash(stored_hash: str) -> bool:
+    """기존 SHA-256 이거나 현재 파라미터보다 약한 scrypt 해시면 재해시 대상"""
+    if is_legacy_hash(stored_hash):
+        return True
+    parts = (stored_hash or "").split("$")
+    if len(parts) != 6 or parts[0] != SCRYPT_PREFIX:
+        return True
+    try:
+        n, r, p = int(parts[1]), int(parts[2]), int(parts[3])
+    except ValueError:
+        return True
+    return (n, r, p) != (SCRYPT_N, SCRYPT_R, SCRYPT_P)
+
+
+def hash_password_sync(password: str) -> str:
+    """비밀번호 → scrypt 해시 문자열 (블로킹)"""
+    salt = os.urandom(SCRYPT_SALT_BYTES)
+    derived = _scrypt(password, salt, SCRYPT_N, SCRYPT_R, SCRYPT_P)
+    return f"{SCRYPT_PREFIX}${SCRYPT_N}${SCRYPT_R}${SCRYPT_P}${_b64encode(salt)}${_b64encode(derived)}"
+
+
+def verify_password_sync(password: str, stored_hash: str) -> bool:
+    """비밀번호 검증 (블로킹) - scrypt / 기존 SHA-256 모두 지원, 상수 시간 비교"""
+    if not stored_hash:
+        return False
+
+    if is_legacy_hash(stored_hash):
+        candidate = hashlib.sha256(password.encode()).hexdigest()
+        return hmac.compare_digest(candidate, stored_hash)
+
+    parts = stored_hash.split("$")
+    if len(parts) != 6 or parts[0] != SCRYPT_PREFIX:
+        logger.warning("⚠️ 알 수 없는 비밀번호 해시 형식")
+        return False
+    try:
+        n, r, p = int(parts[1]), int(parts[2]), int(parts[3])
+        salt, expected = _b64decode(parts[4]), _b64decode(parts[5])
+    except (ValueError, TypeError) as e:
+        logger.warning(f"⚠️ 비밀번호 해시 파싱 실패: {e}")
+        return False
+    derived = _scrypt(password, salt, n, r, p)
+    return hmac.compare_digest(derived, expected)
+
+
+async def hash_password(password: str) -> str:
+    """비밀번호 해시 - 스레드 풀에서 실행 (이벤트 루프 블로킹 없음)"""
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(_executor, hash_password_sync, password)
+
+
+async def verify_password(password: str, stored_hash: str) -> bool:
+    """비밀번호 검증 - 스레드 풀에서 실행 (이벤트 루프 블로킹 없음)"""
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(_executor, verify_password_sync, password, stored_hash)
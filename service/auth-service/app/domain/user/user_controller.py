@@ -3,7 +3,9 @@ User Controller - MVC 구조에서 BaseModel을 UserService로 전달하는 컨
 데이터베이스 연결은 하지 않고, Service를 거쳐 Repository까지 BaseModel을 전달
 """
 import logging
+from typing import Optional
 from app.domain.user.user_service import UserService
+from app.common.database.unit_of_work import UnitOfWork
 from app.domain.user.user_schema import LoginRequest, SignupRequest
 
 logger = logging.getLogger(__name__)
@@ -14,18 +16,19 @@ class UserController:
     def __init__(self):
         self.user_service = UserService()
     
-    async def login_user(self, login_data: LoginRequest):
+    async def login_user(self, login_data: LoginRequest, uow: Optional[UnitOfWork] = None):
         """
         로그인 BaseModel을 UserService로 전달
         
         Args:
             login_data: LoginRequest BaseModel
+            uow: 요청 단위 세션
         """
         try:
             logger.info(f"🔐 컨트롤러: 로그인 요청을 Service로 전달 - {login_data.auth_id}")
             
             # BaseModel을 Service로 전달 (데이터베이스 연결 없음)
-            result = await self.user_service.authenticate_user(login_data)
+            result = await self.user_service.authenticate_user(login_data, uow)
             
             logger.info(f"✅ 컨트롤러: Service 응답 수신 - {result.get('success', False)}")
             return result
@@ -34,18 +37,19 @@ class UserController:
             logger.error(f"❌ 컨트롤러: Service 호출 중 오류 - {str(e)}")
             raise
 
-    async def signup_user(self, signup_data: SignupRequest):
+    async def signup_user(self, signup_data: SignupRequest, uow: Optional[UnitOfWork] = None):
         """
         회원가입 BaseModel을 UserService로 전달
         
         Args:
             signup_data: SignupRequest BaseModel
+            uow: 요청 단위 세션
         """
         try:
             logger.info(f"📝 컨트롤러: 회원가입 요청을 Service로 전달 - {signup_data.email}")
             
             # BaseModel을 Service로 전달 (데이터베이스 연결 없음)
-            result = await self.user_service.create_user(signup_data)
+            result = await self.user_service.create_user(signup_data, uow)
             
             logger.info(f"✅ 컨트롤러: Service 응답 수신 - {result.get('success', False)}")
             return result
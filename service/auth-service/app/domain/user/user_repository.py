@@ -3,19 +3,29 @@ User Repository - BaseModel을 받아서 데이터베이스 작업을 수행하
 데이터베이스 연결을 담당하며, BaseModel과 Entity 간의 변환을 처리
 """
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select
+from sqlalchemy import select, update, or_
+from sqlalchemy.exc import IntegrityError
 from app.domain.user.user_schema import SignupRequest, LoginRequest
 from app.domain.user.user_entity import UserEntity
-from app.common.database.database import get_db
+from app.common.database.unit_of_work import UnitOfWork, session_scope
+from typing import Optional
 import logging
 
 logger = logging.getLogger(__name__)
 
+class DuplicateUserError(Exception):
+    """이메일 또는 인증 ID 유니크 제약 위반"""
+    
+    def __init__(self, field: str):
+        super().__init__(f"duplicate {field}")
+        self.field = field
+
 class UserRepository:
     """사용자 리포지토리 - BaseModel을 받아서 데이터베이스 작업 수행"""
     
-    def __init__(self):
-        pass
+    def __init__(self, uow: Optional[UnitOfWork] = None):
+        # 요청 단위 세션 (없으면 호출마다 새 세션)
+        self.uow = uow
     
     async def find_by_email(self, email: str):
         """이메일로 사용자 조회 - BaseModel 반환"""
@@ -23,7 +33,7 @@ class UserRepository:
             logger.info(f"🔍 리포지토리: 이메일로 사용자 조회 - {email}")
             
             # 데이터베이스 연결
-            async for db in get_db():
+            async with session_scope(self.uow) as db:
                 query = select(UserEntity).where(UserEntity.email == email)
                 result = await db.execute(query)
                 user_entity = result.scalar_one_or_none()
@@ -55,7 +65,7 @@ class UserRepository:
             logger.info(f"🔍 리포지토리: 인증 ID로 사용자 조회 - {auth_id}")
             
             # 데이터베이스 연결
-            async for db in get_db():
+            async with session_scope(self.uow) as db:
                 query = select(UserEntity).where(UserEntity.auth_id == auth_id)
                 result = await db.execute(query)
                 user_entity = result.scalar_one_or_none()
@@ -88,7 +98,7 @@ class UserRepository:
             logger.info(f"🔍 리포지토리: ID로 사용자 조회 - {user_id}")
             
             # 데이터베이스 연결
-            async for db in get_db():
+            async with session_scope(self.uow) as db:
                 query = select(UserEntity).where(UserEntity.id == user_id)
                 result = await db.execute(query)
                 user_entity = result.scalar_one_or_none()
@@ -115,13 +125,51 @@ class UserRepository:
             logger.error(f"❌ 리포지토리: ID 조회 중 오류 - {str(e)}")
             raise
     
+    async def find_duplicates(self, email: str, auth_id: str) -> dict:
+        """이메일/인증 ID 중복 여부를 쿼리 1회로 확인 (두 컬럼 모두 유니크 인덱스)"""
+        try:
+            logger.info(f"🔍 리포지토리: 이메일/인증 ID 중복 확인 - {email}, {auth_id}")
+            
+            async with session_scope(self.uow) as db:
+                query = select(UserEntity.email, UserEntity.auth_id).where(
+                    or_(UserEntity.email == email, UserEntity.auth_id == auth_id)
+                ).limit(2)
+                result = await db.execute(query)
+                rows = result.all()
+                
+                return {
+                    "email": any(row.email == email for row in rows),
+                    "auth_id": any(row.auth_id == auth_id for row in rows)
+                }
+                    
+        except Exception as e:
+            logger.error(f"❌ 리포지토리: 중복 확인 중 오류 - {str(e)}")
+            raise
+    
+    async def update_password(self, user_id: int, auth_pw: str) -> None:
+        """비밀번호 해시 갱신 (기존 SHA-256 → scrypt 업그레이드)"""
+        try:
+            logger.info(f"🔐 리포지토리: 비밀번호 해시 갱신 - ID: {user_id}")
+            
+            async with session_scope(self.uow) as db:
+                await db.execute(
+                    update(UserEntity).where(UserEntity.id == user_id).values(auth_pw=auth_pw)
+                )
+                # 요청 단위 세션이면 커밋은 UnitOfWork가 담당
+                if self.uow is None:
+                    await db.commit()
+                    
+        except Exception as e:
+            logger.error(f"❌ 리포지토리: 비밀번호 해시 갱신 중 오류 - {str(e)}")
+            raise
+    
     async def create_user(self, user_data: dict):
         """새 사용자 생성 - dict를 받아서 Entity로 변환 후 데이터베이스에 저장"""
         try:
             logger.info(f"📝 리포지토리: 새 사용자 생성 - {user_data.get('email', 'N/A')}")
             
             # 데이터베이스 연결
-            async for db in get_db():
+            async with session_scope(self.uow) as db:
                 # dict를 Entity로 변환
                 new_user_entity = UserEntity(
                     company_id=user_data['company_id'],
@@ -135,8 +183,11 @@ class UserRepository:
                 
                 # 데이터베이스에 저장
                 db.add(new_user_entity)
-                await db.commit()
+                await db.flush()
                 await db.refresh(new_user_entity)
+                # 요청 단위 세션이면 커밋은 UnitOfWork가 담당
+                if self.uow is None:
+                    await db.commit()
                 
                 logger.info(f"✅ 리포지토리: 사용자 생성 완료 - {new_user_entity.email} (ID: {new_user_entity.id})")
                 
@@ -155,10 +206,19 @@ class UserRepository:
                 
         except Exception as e:
             logger.error(f"❌ 리포지토리: 사용자 생성 중 오류 - {str(e)}")
-            # 롤백 처리
-            try:
-                async for db in get_db():
-                    await db.rollback()
-            except:
-                pass
+            if isinstance(e, IntegrityError):
+                # 동시 가입 등으로 유니크 인덱스에 걸린 경우
+                message = str(e.orig) if e.orig is not None else str(e)
+                if self.uow is not None:
+                    try:
+                        await self.uow.rollback()
+                    except Exception:
+                        pass
+                raise DuplicateUserError("email" if "email" in message else "auth_id") from e
+            # 롤백 처리 (단독 세션은 컨텍스트 종료 시 자동 롤백)
+            if self.uow is not None:
+                try:
+                    await self.uow.rollback()
+                except Exception:
+                    pass
             raise
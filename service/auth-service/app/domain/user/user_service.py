@@ -3,38 +3,83 @@ User Service - 사용자 관련 모든 서비스 통합
 BaseModel을 받아서 Repository로 전달하는 중간 계층
 데이터베이스 연결은 하지 않음
 """
-import hashlib
 import logging
+import os
+import time
+from typing import Optional, Dict, Tuple
 from app.domain.user.user_entity import UserEntity as User
-from app.domain.user.user_repository import UserRepository
+from app.domain.user.user_repository import UserRepository, DuplicateUserError
 from app.domain.user.user_schema import LoginRequest, SignupRequest
+from app.common.database.unit_of_work import UnitOfWork
+from app.common.security.password_hasher import hash_password, verify_password, needs_rehash
 
 logger = logging.getLogger("user_service")
 
+# 프로필 조회용 사용자 캐시 (짧은 TTL)
+USER_CACHE_TTL = float(os.getenv("AUTH_USER_CACHE_TTL", "30"))
+USER_CACHE_MAX_ENTRIES = int(os.getenv("AUTH_USER_CACHE_MAX_ENTRIES", "1024"))
+
 class UserService:
     """사용자 서비스 - BaseModel을 Repository로 전달하는 중간 계층 (DB 연결 없음)"""
     
     def __init__(self):
         self.user_repository = UserRepository()
+        # {user_id: (만료 시각, 사용자)}
+        self._user_cache: Dict[int, Tuple[float, SignupRequest]] = {}
+    
+    def _get_cached_user(self, user_id: int) -> Optional[SignupRequest]:
+        cached = self._user_cache.get(user_id)
+        if cached is None:
+            return None
+        expires_at, user = cached
+        if expires_at <= time.monotonic():
+            self._user_cache.pop(user_id, None)
+            return None
+        return user
+    
+    def _cache_user(self, user: SignupRequest) -> None:
+        if user.id is None:
+            return
+        self._user_cache.pop(user.id, None)
+        while len(self._user_cache) >= USER_CACHE_MAX_ENTRIES:
+            self._user_cache.pop(next(iter(self._user_cache)))
+        self._user_cache[user.id] = (time.monotonic() + USER_CACHE_TTL, user)
+    
+    async def _upgrade_password_hash(self, user_id: int, password: str) -> None:
+        """기존 SHA-256 해시를 scrypt로 교체 (로그인 성공 시, 실패해도 로그인은 유지)"""
+        try:
+            new_hash = await hash_password(password)
+            # 로그인 요청 세션은 읽기 전용이므로 별도 세션으로 갱신
+            await UserRepository().update_password(user_id, new_hash)
+            self._user_cache.pop(user_id, None)
+            logger.info(f"🔐 서비스: 비밀번호 해시 업그레이드 완료 - ID: {user_id}")
+        except Exception as e:
+            logger.error(f"❌ 서비스: 비밀번호 해시 업그레이드 실패 - ID: {user_id}, {str(e)}")
+    
+    def _get_repository(self, uow: Optional[UnitOfWork] = None) -> UserRepository:
+        """요청 단위 세션이 있으면 해당 세션을 쓰는 리포지토리 반환"""
+        return UserRepository(uow) if uow is not None else self.user_repository
     
-    async def authenticate_user(self, login_data: LoginRequest) -> dict:
+    async def authenticate_user(self, login_data: LoginRequest, uow: Optional[UnitOfWork] = None) -> dict:
         """사용자 인증 (로그인) - BaseModel을 Repository로 전달"""
         try:
             logger.info(f"🔐 서비스: 로그인 요청을 Repository로 전달 - {login_data.auth_id}")
             
             # BaseModel을 Repository로 전달 (데이터베이스 연결 없음)
-            user = await self.user_repository.find_by_auth_id(login_data.auth_id)
+            user = await self._get_repository(uow).find_by_auth_id(login_data.auth_id)
             
             if not user:
                 logger.warning(f"❌ 서비스: 존재하지 않는 인증 ID - {login_data.auth_id}")
                 return {"success": False, "message": "존재하지 않는 인증 ID입니다."}
 
-            # 비밀번호 해시화하여 비교
-            hashed_password = hashlib.sha256(login_data.auth_pw.encode()).hexdigest()
-
-            if user.auth_pw != hashed_password:
+            # 비밀번호 검증 (scrypt/기존 SHA-256, 스레드 풀에서 실행)
+            if not await verify_password(login_data.auth_pw, user.auth_pw):
                 logger.warning(f"❌ 서비스: 비밀번호 불일치 - {login_data.auth_id}")
                 return {"success": False, "message": "비밀번호가 일치하지 않습니다."}
+            
+            # 기존 SHA-256 해시는 로그인 시점에 투명하게 scrypt로 교체
+            if needs_rehash(user.auth_pw):
+                await self._upgrade_password_hash(user.id, login_data.auth_pw)
 
             logger.info(f"✅ 서비스: 로그인 성공 - {user.email} (ID: {user.id})")
             return {
@@ -49,31 +94,29 @@ class UserService:
             logger.error(f"❌ 서비스: 로그인 처리 중 오류 - {str(e)}")
             return {"success": False, "message": f"로그인 처리 중 오류가 발생했습니다: {str(e)}"}
 
-    async def create_user(self, signup_data: SignupRequest) -> dict:
+    async def create_user(self, signup_data: SignupRequest, uow: Optional[UnitOfWork] = None) -> dict:
         """새 사용자 생성 (회원가입) - BaseModel을 Repository로 전달"""
         try:
+            repository = self._get_repository(uow)
             logger.info(f"📝 서비스: 회원가입 요청을 Repository로 전달 - {signup_data.email}")
             
-            # 이메일 중복 확인 - Repository 호출 (데이터베이스 연결 없음)
-            existing_email_user = await self.user_repository.find_by_email(signup_data.email)
-            if existing_email_user:
+            # 이메일/인증 ID 중복 확인 - 쿼리 1회 (동시 가입은 유니크 인덱스가 최종 방어)
+            duplicates = await repository.find_duplicates(signup_data.email, signup_data.auth_id)
+            if duplicates["email"]:
                 logger.warning(f"❌ 서비스: 이미 존재하는 이메일 - {signup_data.email}")
                 return {
                     "success": False,
                     "message": "이미 존재하는 이메일입니다."
                 }
-            
-            # 인증 ID 중복 확인 - Repository 호출 (데이터베이스 연결 없음)
-            existing_auth_user = await self.user_repository.find_by_auth_id(signup_data.auth_id)
-            if existing_auth_user:
+            if duplicates["auth_id"]:
                 logger.warning(f"❌ 서비스: 이미 존재하는 인증 ID - {signup_data.auth_id}")
                 return {
                     "success": False,
                     "message": "이미 존재하는 인증 ID입니다."
                 }
             
-            # 비밀번호 해시화 (SHA256)
-            hashed_password = hashlib.sha256(signup_data.auth_pw.encode()).hexdigest()
+            # 비밀번호 해시화 (scrypt, 스레드 풀에서 실행)
+            hashed_password = await hash_password(signup_data.auth_pw)
             
             # BaseModel을 dict로 변환하여 Repository로 전달
             user_data = {
@@ -87,7 +130,11 @@ class UserService:
             }
             
             # Repository를 통해 사용자 생성 (데이터베이스 연결 없음)
-            new_user = await self.user_repository.create_user(user_data)
+            new_user = await repository.create_user(user_data)
+            
+            # 중복 확인과 생성을 한 트랜잭션으로 확정한 뒤 응답
+            if uow is not None:
+                await uow.commit()
             
             logger.info(f"✅ 서비스: 새 사용자 생성 완료 - {new_user.email} (ID: {new_user.id})")
             
@@ -98,6 +145,12 @@ class UserService:
                 "email": new_user.email
             }
             
+        except DuplicateUserError as e:
+            logger.warning(f"❌ 서비스: 가입 중 유니크 제약 위반 - {e.field}")
+            return {
+                "success": False,
+                "message": "이미 존재하는 이메일입니다." if e.field == "email" else "이미 존재하는 인증 ID입니다."
+            }
         except Exception as e:
             logger.error(f"❌ 서비스: 사용자 생성 중 오류 - {str(e)}")
             return {
@@ -110,8 +163,12 @@ class UserService:
         try:
             logger.info(f"👤 서비스: 프로필 조회 요청을 Repository로 전달 - ID: {user_id}")
             
-            # Repository를 통해 사용자 조회 (데이터베이스 연결 없음)
-            user = await self.user_repository.find_by_id(user_id)
+            # 짧은 TTL 캐시 우선, 없으면 Repository를 통해 조회
+            user = self._get_cached_user(user_id)
+            if user is None:
+                user = await self.user_repository.find_by_id(user_id)
+                if user:
+                    self._cache_user(user)
             
             if user:
                 return {
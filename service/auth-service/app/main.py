@@ -4,6 +4,7 @@ Auth 서비스 메인 애플리케이션 진입점
 import os
 import logging
 import sys
+import traceback
 from dotenv import load_dotenv
 from contextlib import asynccontextmanager
 from typing import List
@@ -15,6 +16,8 @@ from fastapi import APIRouter
 
 # Router import
 from app.router.auth_router import auth_router
+from app.common.database.database import ensure_user_indexes
+from app.common.loop_monitor import install_loop_monitor
 
 
 # 환경 변수 로드
@@ -50,6 +53,14 @@ app = FastAPI()
 
 app.include_router(auth_router)
 
+# 이벤트 루프 블로킹 감시 (GET /auth-service/debug/loop-lag)
+install_loop_monitor(app, "auth-service", path="/auth-service/debug/loop-lag")
+
+@app.on_event("startup")
+async def startup_event():
+    # 가입 중복 확인이 기대는 유니크 인덱스 보장
+    await ensure_user_indexes()
+
 # 기본 루트 경로
 @app.get("/")
 async def root():
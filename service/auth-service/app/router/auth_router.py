@@ -1,4 +1,4 @@
-from fastapi import APIRouter, Cookie, HTTPException, Query, Request
+from fastapi import APIRouter, Cookie, HTTPException, Query, Request, Depends
 from fastapi.responses import JSONResponse
 import logging
 
@@ -7,11 +7,12 @@ logger = logging.getLogger(__name__)
 
 from app.domain.user.user_schema import LoginRequest, SignupRequest
 from app.domain.user.user_controller import user_controller
+from app.common.database.unit_of_work import UnitOfWork, get_unit_of_work, get_write_unit_of_work
 
 auth_router = APIRouter(prefix="/auth-service", tags=["Auth"])
 
 @auth_router.post("/login", summary="로그인")
-async def login_process(request: Request):
+async def login_process(request: Request, uow: UnitOfWork = Depends(get_unit_of_work)):
     logger.info("🔐 로그인 POST 요청 받음")
     try:
         form_data = await request.json()
@@ -29,7 +30,7 @@ async def login_process(request: Request):
             logger.info(f"✅ 로그인 데이터 검증 성공: {login_request.auth_id}")
             
             # user_controller로 BaseModel 전달 (데이터베이스 연결 없음)
-            result = await user_controller.login_user(login_request)
+            result = await user_controller.login_user(login_request, uow)
             return result
                 
         except Exception as validation_error:
@@ -41,7 +42,7 @@ async def login_process(request: Request):
         return {"success": False, "message": f"로그인 처리 중 오류가 발생했습니다: {str(e)}"}
 
 @auth_router.post("/signup", summary="회원가입")
-async def signup_process(request: Request):
+async def signup_process(request: Request, uow: UnitOfWork = Depends(get_write_unit_of_work)):
     logger.info("📝 회원가입 POST 요청 받음")
     try:
         form_data = await request.json()
@@ -68,7 +69,7 @@ async def signup_process(request: Request):
             logger.info(f"✅ 회원가입 데이터 검증 성공: {signup_request.email}")
             
             # user_controller로 BaseModel 전달 (데이터베이스 연결 없음)
-            result = await user_controller.signup_user(signup_request)
+            result = await user_controller.signup_user(signup_request, uow)
             return result
             
         except Exception as validation_error:
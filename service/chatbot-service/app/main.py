@@ -1,6 +1,8 @@
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 
+from app.common.loop_monitor import install_loop_monitor
+
 app = FastAPI(title="Chatbot Service", version="1.0.0")
 
 # CORS 설정
@@ -12,6 +14,9 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+# 이벤트 루프 블로킹 감시 (GET /debug/loop-lag)
+install_loop_monitor(app, "chatbot-service")
+
 @app.get("/")
 async def root():
     return {"message": "Chatbot Service is running"}
@@ -2,6 +2,13 @@ from konlpy.tag import Okt
 from nltk.tokenize import word_tokenize
 import nltk
 import re
+import os
+import hashlib
+import sqlite3
+import multiprocessing as mp
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
+from itertools import chain
 import pandas as pd
 from nltk import FreqDist
 from wordcloud import WordCloud
@@ -9,16 +16,137 @@ import matplotlib.pyplot as plt
 from icecream import ic
 import numpy as np
 
+# 형태소 분석 캐시 (정제된 텍스트 해시 → 명사 목록), 분석 규칙이 바뀌면 버전을 올려서 무효화
+TOKEN_CACHE_PATH = './.token_cache/okt_nouns.sqlite'
+TOKENIZER_VERSION = 'okt-pos-stem-noun-len2-v1'
+# 형태소 분석 워커 수 (1이면 현재 프로세스에서 처리)
+TOKENIZE_WORKERS = max(1, (os.cpu_count() or 2) - 1)
+TOKENIZE_CHUNKSIZE = 64
+
+
+def _text_key(text):
+    return hashlib.sha1(f"{TOKENIZER_VERSION}\x00{text}".encode('utf-8')).hexdigest()
+
+
+class TokenCache:
+    """정제된 텍스트 → 명사 목록 디스크 캐시 (sqlite, 재실행 시 형태소 분석 생략)"""
+
+    def __init__(self, path=TOKEN_CACHE_PATH):
+        os.makedirs(os.path.dirname(path) or '.', exist_ok=True)
+        self.conn = sqlite3.connect(path)
+        self.conn.execute('CREATE TABLE IF NOT EXISTS tokens (key TEXT PRIMARY KEY, nouns TEXT NOT NULL)')
+
+    def get_many(self, texts):
+        """{텍스트: 명사 목록} (캐시에 있는 것만)"""
+        keys = {_text_key(t): t for t in texts}
+        found = {}
+        key_list = list(keys)
+        for i in range(0, len(key_list), 500):
+            chunk = key_list[i:i + 500]
+            placeholders = ','.join('?' * len(chunk))
+            for key, nouns in self.conn.execute(
+                f'SELECT key, nouns FROM tokens WHERE key IN ({placeholders})', chunk
+            ):
+                found[keys[key]] = nouns.split(' ') if nouns else []
+        return found
+
+    def put_many(self, items):
+        self.conn.executemany(
+            'INSERT OR REPLACE INTO tokens (key, nouns) VALUES (?, ?)',
+            [(_text_key(t), ' '.join(nouns)) for t, nouns in items]
+        )
+        self.conn.commit()
+
+    def close(self):
+        self.conn.close()
+
+
+# ── 형태소 분석 워커 (프로세스마다 Okt 1개) ─────────────────────────────────────
+_WORKER_OKT = None
+
+def _init_tokenize_worker():
+    global _WORKER_OKT
+    _WORKER_OKT = Okt()
+
+def _nouns_with(okt, text):
+    if not text:
+        return []
+    try:
+        pos_result = okt.pos(text, stem=True)
+        # 길이가 1인 토큰 제거 (베이스라인으로 충분)
+        return [word for word, pos in pos_result if pos == 'Noun' and len(word) > 1]
+    except Exception as e:
+        ic(f"명사 추출 오류: {e}")
+        return []
+
+def _tokenize_worker(text):
+    return _nouns_with(_WORKER_OKT, text)
+
+
+class CompanyNameMatcher:
+    """
+    기업명 부분 일치 판별을 set 조회로 처리
+    - token in company  ⇔ token이 기업명의 부분 문자열 집합에 있음
+    - company in token  ⇔ token의 부분 문자열 중 하나가 기업명 집합에 있음
+    """
+
+    def __init__(self, company_names):
+        self.companies = set()
+        for company in company_names or []:
+            if pd.notna(company) and company:
+                company_str = str(company).strip()
+                if company_str:
+                    # 기업명을 토큰으로 분할하여 각각 제거
+                    company_tokens = company_str.split()
+                    self.companies.update(company_tokens)
+                    # 띄어쓰기가 있는 기업명도 추가 (예: "HL 만도" -> "HL", "만도")
+                    if len(company_tokens) > 1:
+                        self.companies.add(company_str)
+
+        self.company_substrings = set()
+        for company in self.companies:
+            n = len(company)
+            for i in range(n):
+                for j in range(i + 1, n + 1):
+                    self.company_substrings.add(company[i:j])
+        self.max_company_len = max((len(c) for c in self.companies), default=0)
+
+    def matches(self, token):
+        if token in self.company_substrings:
+            return True
+        n = len(token)
+        for i in range(n):
+            for j in range(i + 1, min(n, i + self.max_company_len) + 1):
+                if token[i:j] in self.companies:
+                    return True
+        return False
+
+    def filter(self, tokens):
+        if not self.companies:
+            return tokens
+        return [token for token in tokens if not self.matches(token)]
+
+
 class KoreanNewsPreprocessor:
     """
     한국어 뉴스 데이터 전처리를 위한 클래스
     title, description, 검색어(company+issue)를 활용해 judge를 구하는 ML 모델을 위한 전처리
     """
     
-    def __init__(self):
-        self.okt = Okt()
+    def __init__(self, n_workers=TOKENIZE_WORKERS, cache_path=TOKEN_CACHE_PATH):
+        self._okt = None
+        self.n_workers = n_workers
+        self.cache_path = cache_path
+        self._company_matcher = (None, None)
         self.stopwords = set()
         self.load_korean_stopwords()
+
+    @property
+    def okt(self):
+        # JVM 시작 비용이 커서 실제로 쓸 때만 생성 (병렬 처리 시 메인 프로세스는 생성하지 않음)
+        if self._okt is None:
+            self._okt = Okt()
+        return self._okt
         
     def load_korean_stopwords(self):
         """한국어 기본 불용어 로드"""
@@ -119,18 +247,48 @@ class KoreanNewsPreprocessor:
         if not text:
             return []
         
+        # 형태소 분석으로 명사 추출
+        return _nouns_with(self.okt, text)
+
+    def tokenize_texts(self, texts):
+        """
+        정제된 텍스트 목록 → {텍스트: 명사 목록}
+        - 중복 텍스트는 한 번만, 디스크 캐시에 있으면 형태소 분석 생략
+        - 남은 텍스트는 프로세스 풀(워커마다 Okt 1개)로 분석 후 캐시에 저장
+        """
+        unique_texts = [t for t in dict.fromkeys(texts) if t]
+        cache = TokenCache(self.cache_path) if self.cache_path else None
         try:
-            # 형태소 분석으로 명사 추출
-            pos_result = self.okt.pos(text, stem=True)
-            nouns = [word for word, pos in pos_result if pos == 'Noun']
-            
-            # 길이가 1인 토큰 제거 (베이스라인으로 충분)
-            nouns = [noun for noun in nouns if len(noun) > 1]
-            
-            return nouns
-        except Exception as e:
-            ic(f"명사 추출 오류: {e}")
-            return []
+            result = cache.get_many(unique_texts) if cache else {}
+            missing = [t for t in unique_texts if t not in result]
+            ic(f"형태소 분석: 고유 텍스트 {len(unique_texts)}건, 캐시 적중 {len(result)}건, 분석 {len(missing)}건")
+
+            if missing:
+                if self.n_workers > 1 and len(missing) > TOKENIZE_CHUNKSIZE:
+                    # JPype(JVM)는 fork 이후 안전하지 않으므로 spawn으로 워커 생성
+                    with ProcessPoolExecutor(
+                        max_workers=self.n_workers,
+                        mp_context=mp.get_context('spawn'),
+                        initializer=_init_tokenize_worker,
+                    ) as pool:
+                        analyzed = list(pool.map(_tokenize_worker, missing, chunksize=TOKENIZE_CHUNKSIZE))
+                else:
+                    analyzed = [self.extract_nouns(t) for t in missing]
+
+                new_items = list(zip(missing, analyzed))
+                result.update(new_items)
+                if cache:
+                    cache.put_many(new_items)
+            return result
+        finally:
+            if cache:
+                cache.close()
+
+    def get_company_matcher(self, company_names):
+        key = tuple(company_names or ())
+        if self._company_matcher[0] != key:
+            self._company_matcher = (key, CompanyNameMatcher(company_names))
+        return self._company_matcher[1]
     
     def remove_stopwords(self, tokens):
         """불용어 제거"""
@@ -142,31 +300,8 @@ class KoreanNewsPreprocessor:
         if not company_names:
             return tokens
         
-        # company_names를 set으로 변환하여 검색 속도 향상
-        company_set = set()
-        for company in company_names:
-            if pd.notna(company) and company:
-                company_str = str(company).strip()
-                if company_str:
-                    # 기업명을 토큰으로 분할하여 각각 제거
-                    company_tokens = company_str.split()
-                    company_set.update(company_tokens)
-                    
-                    # 띄어쓰기가 있는 기업명도 추가 (예: "HL 만도" -> "HL", "만도")
-                    if len(company_tokens) > 1:
-                        # 전체 기업명도 추가
-                        company_set.add(company_str)
-        
-        # 기업명 토큰 제거 (부분 일치도 제거)
-        filtered_tokens = []
-        for token in tokens:
-            should_remove = False
-            for company in company_set:
-                if token in company or company in token:
-                    should_remove = True
-                    break
-            if not should_remove:
-                filtered_tokens.append(token)
+        # 기업명 토큰 제거 (부분 일치도 제거) - 부분 문자열 집합 조회
+        filtered_tokens = self.get_company_matcher(company_names).filter(tokens)
         
         return filtered_tokens
     
@@ -204,36 +339,32 @@ class KoreanNewsPreprocessor:
         company_names = []
         if 'company' in df.columns:
             company_names = df['company'].dropna().unique().tolist()
+        matcher = self.get_company_matcher(company_names)
         
-        # 각 행별로 전처리 수행
-        for idx, row in df.iterrows():
-            if idx % 100 == 0:
-                ic(f"처리 진행률: {idx}/{len(df)}")
-            
-            # title 전처리
-            if 'title' in df.columns:
-                title_tokens = self.preprocess_text(row['title'], company_names)
-                df.at[idx, 'title_processed'] = ' '.join(title_tokens)
-            
-            # description 전처리
-            if 'description' in df.columns:
-                desc_tokens = self.preprocess_text(row['description'], company_names)
-                df.at[idx, 'description_processed'] = ' '.join(desc_tokens)
+        # 1. 텍스트 정제 (title/description 전체)
+        columns = [c for c in ('title', 'description') if c in df.columns]
+        cleaned = {c: [self.clean_text(v) for v in df[c]] for c in columns}
+        
+        # 2. 명사 추출 (중복 제거 + 캐시 + 프로세스 풀)
+        nouns_by_text = self.tokenize_texts(chain.from_iterable(cleaned.values()))
+        
+        # 3~4. 불용어/기업명 제거 후 컬럼 채우기
+        def finish(text):
+            tokens = self.remove_stopwords(nouns_by_text.get(text, []))
+            return ' '.join(matcher.filter(tokens))
+        
+        for c in columns:
+            df[f'{c}_processed'] = [finish(t) for t in cleaned[c]]
         
         ic("전처리 완료!")
         return df
     
     def analyze_frequency(self, df, column_name):
         """특정 컬럼의 단어 빈도 분석"""
-        all_tokens = []
-        
-        for tokens_str in df[column_name]:
-            if tokens_str:
-                tokens = tokens_str.split()
-                all_tokens.extend(tokens)
-        
-        # 빈도 분석
-        freq_dist = FreqDist(all_tokens)
+        # 빈도 분석 (토큰 리스트를 따로 만들지 않고 바로 집계)
+        freq_dist = FreqDist(chain.from_iterable(
+            tokens_str.split() for tokens_str in df[column_name] if tokens_str
+        ))
         freq_df = pd.DataFrame(freq_dist.most_common(50), columns=['단어', '빈도'])
         
         ic(f"{column_name} 상위 10개 단어:")
@@ -245,20 +376,15 @@ class KoreanNewsPreprocessor:
     
     def create_wordcloud(self, df, column_name, output_path=None):
         """워드클라우드 생성"""
-        all_tokens = []
-        
-        for tokens_str in df[column_name]:
-            if tokens_str:
-                tokens = tokens_str.split()
-                all_tokens.extend(tokens)
+        # 빈도 집계 (전체 텍스트를 이어 붙여 다시 토큰화하지 않음)
+        frequencies = Counter(chain.from_iterable(
+            tokens_str.split() for tokens_str in df[column_name] if tokens_str
+        ))
         
-        if not all_tokens:
+        if not frequencies:
             ic(f"{column_name}에 처리된 토큰이 없습니다.")
             return
         
-        # 텍스트 결합
-        text = ' '.join(all_tokens)
-        
         # 워드클라우드 생성
         try:
             wordcloud = WordCloud(
@@ -268,7 +394,7 @@ class KoreanNewsPreprocessor:
                 height=600,
                 max_words=100,
                 relative_scaling=0.2
-            ).generate(text)
+            ).generate_from_frequencies(frequencies)
             
             # 시각화
             plt.figure(figsize=(12, 8))
@@ -0,0 +1,176 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+어휘 규칙 cascade 오프라인 평가 - materiality-service의 감성 분석 1단계(어휘 규칙)를 켜기 전에 확인용
+- materiality-service lexicon.py(사전 + cascade_decision)를 그대로 읽어서 서비스와 같은 규칙으로 판정
+- 규칙 조합 × MIN_NEG/MIN_POS 설정마다:
+    절감률(모델을 건너뛰는 기사 비율), 모델 단독 결과와 일치율, 정확도/부정 F1 (정답 라벨 기준),
+    규칙별 정밀도, 실제 추론 시간 절감
+- 모델 단독 결과는 서비스와 같게 "모델이 negative인데 부정+긍정 키워드가 함께 있으면 other"로 보정
+- 부정 F1 하락이 --max-f1-drop 이하인 설정 중 절감률이 가장 큰 설정을 추천 (SENTIMENT_CASCADE_* 값 출력)
+
+사용 예:
+    python cascade_eval.py "./학습데이터 400개.xlsx"
+    python cascade_eval.py "./학습데이터 1200개.xlsx" "./학습데이터 800개.xlsx" --max-f1-drop 0.01
+"""
+
+import argparse
+import importlib.util
+import itertools
+import time
+from pathlib import Path
+from typing import Any, Dict, List
+
+import joblib
+import numpy as np
+import pandas as pd
+from sklearn.metrics import accuracy_score, f1_score
+
+from machine_learning import OUTPUT_DIR, load_data
+
+# ── 설정 ───────────────────────────────────────────────────────────────────────
+SERVICE_DIR = Path("../../materiality-service/app")
+LEXICON_PATH = SERVICE_DIR / "domain/middleissue/lexicon.py"
+MODEL_PATH = SERVICE_DIR / "models/model_multinomialnb.joblib"
+MIN_NEG_VALUES = (1, 2, 3, 4)
+MIN_POS_VALUES = (1, 2, 3)
+MAX_F1_DROP = 0.005
+
+def load_lexicon(path: Path):
+    """서비스 lexicon.py를 모듈로 로드 (서비스 의존성 없이 표준 라이브러리만 사용하는 파일)"""
+    spec = importlib.util.spec_from_file_location("service_lexicon", path)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+def model_only_predictions(model, texts: List[str], has_both: np.ndarray) -> np.ndarray:
+    """서비스와 같은 최종 판정: 모델 예측, 단 negative + 부정/긍정 동시 출현이면 other"""
+    y_pred = np.asarray(model.predict(texts), dtype=object)
+    y_pred[(y_pred == "negative") & has_both] = "other"
+    return y_pred
+
+def time_inference(model, texts: List[str], repeat: int = 3) -> float:
+    """predict_proba 한 번 호출 시간 (서비스 배치 예측과 같은 방식, 최솟값)"""
+    if not texts:
+        return 0.0
+    best = float("inf")
+    for _ in range(repeat):
+        t0 = time.perf_counter()
+        model.predict_proba(texts)
+        best = min(best, time.perf_counter() - t0)
+    return best
+
+def candidate_configs() -> List[Dict[str, Any]]:
+    configs = []
+    for n_rules in range(1, 4):
+        for rules in itertools.combinations(("neg_only", "pos_only", "no_hits"), n_rules):
+            min_negs = MIN_NEG_VALUES if "neg_only" in rules else (None,)
+            min_poss = MIN_POS_VALUES if "pos_only" in rules else (None,)
+            for min_neg, min_pos in itertools.product(min_negs, min_poss):
+                configs.append({"rules": rules, "min_neg": min_neg or 0, "min_pos": min_pos or 0})
+    return configs
+
+def evaluate_config(lexicon, config: Dict[str, Any], keywords, y_true: np.ndarray,
+                    y_model: np.ndarray) -> Dict[str, Any]:
+    y_cascade = y_model.copy()
+    decided = np.zeros(len(y_true), dtype=bool)
+    rule_hits: Dict[str, List[int]] = {rule: [] for rule in config["rules"]}
+    for i, (neg_kw, pos_kw) in enumerate(keywords):
+        decision = lexicon.cascade_decision(
+            neg_kw, pos_kw, rules=config["rules"], min_neg=config["min_neg"], min_pos=config["min_pos"]
+        )
+        if decision is not None:
+            y_cascade[i] = decision[0]
+            decided[i] = True
+            rule_hits[decision[1]].append(i)
+
+    row = {
+        "rules": ",".join(config["rules"]),
+        "min_neg": config["min_neg"] or "",
+        "min_pos": config["min_pos"] or "",
+        "coverage": float(decided.mean()),
+        "agreement_with_model": float((y_cascade == y_model).mean()),
+        "accuracy": float(accuracy_score(y_true, y_cascade)),
+        "f1_negative": float(f1_score(y_true, y_cascade, pos_label="negative", zero_division=0)),
+    }
+    for rule, idx in rule_hits.items():
+        # 규칙이 판정한 기사 중 정답과 같은 비율
+        row[f"{rule}_n"] = len(idx)
+        row[f"{rule}_precision"] = float((y_cascade[idx] == y_true[idx]).mean()) if idx else ""
+    row["_decided"] = decided
+    return row
+
+# ── 메인 ────────────────────────────────────────────────────────────────────────
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="어휘 규칙 cascade 절감률/정확도 평가")
+    parser.add_argument("paths", nargs="+", type=Path, help="라벨링된 엑셀 파일들 (judge 라벨)")
+    parser.add_argument("--label-col", default="judge", help="라벨 컬럼명 (negative.py 결과는 neg_label)")
+    parser.add_argument("--model", type=Path, default=MODEL_PATH, help="평가할 모델 (joblib)")
+    parser.add_argument("--lexicon", type=Path, default=LEXICON_PATH, help="materiality-service lexicon.py")
+    parser.add_argument("--max-f1-drop", type=float, default=MAX_F1_DROP,
+                        help="추천 기준: 모델 단독 대비 허용하는 부정 F1 하락폭")
+    return parser.parse_args()
+
+def main():
+    args = parse_args()
+    print("="*60); print("어휘 규칙 cascade 평가"); print("="*60)
+
+    lexicon = load_lexicon(args.lexicon)
+    model = joblib.load(args.model)
+    print(f"모델: {args.model} / 사전: {args.lexicon} "
+          f"(부정 {len(lexicon.NEGATIVE_LEXICON)}개, 긍정 {len(lexicon.POSITIVE_LEXICON)}개)")
+
+    df = pd.concat([load_data(str(p), min_rows=1, label_col=args.label_col) for p in args.paths],
+                   ignore_index=True)
+    # 서비스 입력과 같은 형식 (제목 + 공백 + 본문)
+    texts = (df['title'].astype(str) + ' ' + df['description'].astype(str)).tolist()
+    y_true = df['judge'].values.astype(object)
+    keywords = [(lexicon.extract_keywords(t, lexicon.NEG_RE), lexicon.extract_keywords(t, lexicon.POS_RE))
+                for t in texts]
+    has_both = np.array([bool(n) and bool(p) for n, p in keywords])
+
+    y_model = model_only_predictions(model, texts, has_both)
+    base = {
+        "accuracy": float(accuracy_score(y_true, y_model)),
+        "f1_negative": float(f1_score(y_true, y_model, pos_label="negative", zero_division=0)),
+    }
+    full_seconds = time_inference(model, texts)
+    print(f"\n평가 데이터 {len(texts)}건 | 모델 단독: Accuracy={base['accuracy']:.4f}, "
+          f"F1(negative)={base['f1_negative']:.4f}, 추론 {full_seconds * 1000:.1f}ms")
+
+    rows = []
+    for config in candidate_configs():
+        row = evaluate_config(lexicon, config, keywords, y_true, y_model)
+        decided = row.pop("_decided")
+        remaining = [t for t, d in zip(texts, decided) if not d]
+        row["inference_ms"] = round(time_inference(model, remaining) * 1000, 2)
+        row["f1_drop"] = base["f1_negative"] - row["f1_negative"]
+        rows.append(row)
+
+    result = pd.DataFrame(rows).sort_values(["f1_drop", "coverage"], ascending=[True, False])
+    out_path = OUTPUT_DIR / "cascade_eval.csv"
+    result.to_csv(out_path, index=False, encoding='utf-8-sig')
+    with pd.option_context("display.max_columns", None, "display.width", 200):
+        print(result[["rules", "min_neg", "min_pos", "coverage", "agreement_with_model",
+                      "accuracy", "f1_negative", "f1_drop", "inference_ms"]].to_string(index=False))
+    print(f"\n결과 저장: {out_path}")
+
+    ok = result[result["f1_drop"] <= args.max_f1_drop]
+    if ok.empty:
+        print(f"\n[추천 없음] 부정 F1 하락 {args.max_f1_drop} 이하인 설정이 없습니다. cascade를 켜지 마세요.")
+        return
+    best = ok.sort_values("coverage", ascending=False).iloc[0]
+    print("\n" + "="*60)
+    print(f"추천 설정 (부정 F1 하락 ≤ {args.max_f1_drop}): 절감률 {best['coverage']:.1%}, "
+          f"F1(negative) {best['f1_negative']:.4f} (모델 단독 {base['f1_negative']:.4f}), "
+          f"추론 {full_seconds * 1000:.1f}ms → {best['inference_ms']}ms")
+    print("SENTIMENT_CASCADE_ENABLED=true")
+    print(f"SENTIMENT_CASCADE_RULES={best['rules']}")
+    if best["min_neg"] != "":
+        print(f"SENTIMENT_CASCADE_MIN_NEG={best['min_neg']}")
+    if best["min_pos"] != "":
+        print(f"SENTIMENT_CASCADE_MIN_POS={best['min_pos']}")
+    print("="*60)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,359 @@
+# -*- coding: utf-8 -*-
+"""
+경량 모델 아티팩트 (TF-IDF + 선형 분류기 Pipeline → 디렉터리 형식)
+
+joblib Pipeline은 TF-IDF 어휘(dict)와 float64 계수를 통째로 pickle하므로 로드가 느리고 메모리를 많이 씀.
+이 모듈은 학습이 끝난 Pipeline을 다음 형식으로 내보내고, 같은 predict/predict_proba를 재현하는 로더를 제공.
+
+    model_xxx.compact/
+      meta.json     형식 버전, 모델 버전, 클래스, TF-IDF 설정, 분류기 종류
+      vocab.txt     가중치가 있는 단어만 (줄 번호 = 특성 번호)
+      idf.npy       float32 (n_features,)            ← np.load(mmap_mode='r')
+      weights.npy   float32 (n_features, n_classes)  ← np.load(mmap_mode='r')
+      bias.npy      float32 (n_classes,)
+
+- 가지치기: 클래스 간 가중치 차이가 prune_tol 이하인 특성 제거
+  (MultinomialNB는 클래스 0 기준 상대 로그확률로 바꿔 저장 → softmax 결과는 동일)
+- 내보낼 때 검증 문장으로 원본 Pipeline과 예측/확률 차이를 확인해서 보고
+- 로더(CompactSentimentModel)는 numpy만 사용, materiality-service에도 같은 형식의 로더가 있음
+"""
+
+import json
+import os
+import re
+import shutil
+import time
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, Iterable, Optional, Tuple
+
+import numpy as np
+
+FORMAT_VERSION = 1
+PRUNE_TOL = 1e-4           # 클래스 간 가중치 차이가 이 값 이하인 특성은 제거
+MAX_PROBA_DIFF = 1e-4      # 원본과 확률 차이 허용치 (float32 저장 + 가지치기 오차)
+
+
+# ── 로더 ───────────────────────────────────────────────────────────────────────
+class CompactSentimentModel:
+    """
+    compact 디렉터리를 읽어 sklearn Pipeline처럼 사용하는 모델
+    - predict / predict_proba(softmax 계열) / decision_function(LinearSVC 계열)
+    - classes_, named_steps["clf"] 제공 → 기존 호출 코드(predict.py, materiality-service) 그대로 사용
+    """
+
+    def __init__(self, path):
+        path = Path(path)
+        self.path = path
+        self.meta = json.loads((path / "meta.json").read_text(encoding="utf-8"))
+        if self.meta.get("format_version") != FORMAT_VERSION:
+            raise ValueError(f"지원하지 않는 compact 형식 버전: {self.meta.get('format_version')}")
+
+        self.version = self.meta.get("model_version")
+        self.kind = self.meta["kind"]
+        self.classes_ = np.array(self.meta["classes"])
+
+        tfidf = self.meta["tfidf"]
+        self._token_re = re.compile(tfidf["token_pattern"])
+        self._min_n, self._max_n = tfidf["ngram_range"]
+        self._lowercase = tfidf["lowercase"]
+        self._sublinear_tf = tfidf["sublinear_tf"]
+        self._use_idf = tfidf["use_idf"]
+        self._norm = tfidf["norm"]
+
+        vocab_text = (path / "vocab.txt").read_text(encoding="utf-8")
+        terms = vocab_text.split("\n") if vocab_text else []
+        self.vocabulary_ = dict(zip(terms, range(len(terms))))
+
+        self.idf_ = np.load(path / "idf.npy", mmap_mode="r")
+        self.weights_ = np.load(path / "weights.npy", mmap_mode="r")
+        self.bias_ = np.load(path / "bias.npy").astype(np.float64)
+
+        self.named_steps = {"clf": self}
+
+    # TF-IDF 재현 (TfidfVectorizer analyzer='word' 규칙)
+    def _term_counts(self, text: str) -> Dict[int, int]:
+        if not isinstance(text, str):
+            text = "" if text is None else str(text)
+        if self._lowercase:
+            text = text.lower()
+        tokens = self._token_re.findall(text)
+
+        vocab = self.vocabulary_
+        counts: Dict[int, int] = {}
+        for n in range(self._min_n, self._max_n + 1):
+            for i in range(len(tokens) - n + 1):
+                term = tokens[i] if n == 1 else " ".join(tokens[i:i + n])
+                j = vocab.get(term)
+                if j is not None:
+                    counts[j] = counts.get(j, 0) + 1
+        return counts
+
+    def _transform(self, texts: Iterable[str]) -> Tuple[int, np.ndarray, np.ndarray, np.ndarray]:
+        """
+        배치 전체를 COO 형태 (행 번호, 특성 번호, 값)로 변환
+        - 토큰화/어휘 조회만 문서 단위, tf/idf/정규화는 배치 전체에 대해 배열 연산
+        """
+        lengths, indices, counts = [], [], []
+        for text in texts:
+            doc = self._term_counts(text)
+            lengths.append(len(doc))
+            indices.extend(doc.keys())
+            counts.extend(doc.values())
+
+        n_docs = len(lengths)
+        rows = np.repeat(np.arange(n_docs), lengths)
+        indices = np.asarray(indices, dtype=np.int64)
+        data = np.asarray(counts, dtype=np.float64)
+        if not len(data):
+            return n_docs, rows, indices, data
+
+        if self._sublinear_tf:
+            data = np.log(data) + 1.0
+        if self._use_idf:
+            data *= self.idf_[indices]
+        if self._norm in ("l1", "l2"):
+            weights = data * data if self._norm == "l2" else np.abs(data)
+            norms = np.bincount(rows, weights=weights, minlength=n_docs)
+            if self._norm == "l2":
+                norms = np.sqrt(norms)
+            norms[norms == 0] = 1.0
+            data /= norms[rows]
+        return n_docs, rows, indices, data
+
+    def _scores(self, texts: Iterable[str]) -> np.ndarray:
+        """배치 점수 (n_docs, n_classes) = 희소 X · weights + bias (sklearn 입력 검증/희소 행렬 생성 없음)"""
+        n_docs, rows, indices, data = self._transform(texts)
+        scores = np.tile(self.bias_, (n_docs, 1))
+        if len(data):
+            contrib = data[:, None] * self.weights_[indices]
+            for k in range(scores.shape[1]):
+                scores[:, k] += np.bincount(rows, weights=contrib[:, k], minlength=n_docs)
+        return scores
+
+    def _predict_proba(self, texts: Iterable[str]) -> np.ndarray:
+        scores = self._scores(texts)
+        scores -= scores.max(axis=1, keepdims=True)
+        np.exp(scores, out=scores)
+        scores /= scores.sum(axis=1, keepdims=True)
+        return scores
+
+    def _decision_function(self, texts: Iterable[str]) -> np.ndarray:
+        scores = self._scores(texts)
+        # 이진 분류: sklearn처럼 classes_[1]에 대한 1차원 점수
+        if scores.shape[1] == 2:
+            return scores[:, 1] - scores[:, 0]
+        return scores
+
+    @property
+    def predict_proba(self):
+        if self.kind != "softmax":
+            raise AttributeError("이 모델은 predict_proba를 지원하지 않습니다 (decision_function 사용)")
+        return self._predict_proba
+
+    @property
+    def decision_function(self):
+        if self.kind != "decision":
+            raise AttributeError("이 모델은 decision_function을 지원하지 않습니다 (predict_proba 사용)")
+        return self._decision_function
+
+    def predict(self, texts: Iterable[str]) -> np.ndarray:
+        return self.classes_[self._scores(texts).argmax(axis=1)]
+
+
+def is_compact_model(path) -> bool:
+    return Path(path).is_dir() and (Path(path) / "meta.json").exists()
+
+
+# ── 내보내기 ───────────────────────────────────────────────────────────────────
+def _linear_weights(clf) -> Tuple[np.ndarray, np.ndarray, str]:
+    """분류기 → (가중치 (n_features, n_classes), 편향 (n_classes,), kind)"""
+    name = type(clf).__name__
+    if name == "MultinomialNB":
+        # jll = X @ feature_log_prob_.T + class_log_prior_
+        # 클래스 0 기준 상대값으로 바꿔도 softmax는 같음 (샘플별 상수 이동)
+        weights = clf.feature_log_prob_.T.astype(np.float64)
+        weights = weights - weights[:, :1]
+        return weights, clf.class_log_prior_.astype(np.float64), "softmax"
+
+    coef = np.asarray(clf.coef_, dtype=np.float64)
+    intercept = np.atleast_1d(np.asarray(clf.intercept_, dtype=np.float64))
+    if name == "LogisticRegression" or (name == "SGDClassifier" and clf.loss in ("log_loss", "log")):
+        kind = "softmax"
+    elif name in ("LinearSVC", "SGDClassifier", "RidgeClassifier"):
+        kind = "decision"
+    else:
+        raise TypeError(f"compact 형식으로 내보낼 수 없는 분류기입니다: {name}")
+
+    if coef.shape[0] == 1:
+        # 이진: classes_[1] 점수 = coef·x + b → 2열 [0, coef]로 저장 (softmax = sigmoid)
+        weights = np.zeros((coef.shape[1], 2))
+        weights[:, 1] = coef[0]
+        return weights, np.array([0.0, intercept[0]]), kind
+    return coef.T, intercept, kind
+
+
+def export_compact(pipe, out_dir, model_version: Optional[str] = None,
+                   prune_tol: float = PRUNE_TOL, check_texts: Optional[Iterable[str]] = None,
+                   max_proba_diff: float = MAX_PROBA_DIFF) -> Dict[str, Any]:
+    """학습된 Pipeline(tfidf + clf)을 compact 디렉터리로 저장하고 검증 결과를 반환"""
+    out_dir = Path(out_dir)
+    tfidf = pipe.named_steps["tfidf"]
+    clf = pipe.named_steps["clf"]
+
+    if tfidf.analyzer != "word" or tfidf.tokenizer is not None or tfidf.preprocessor is not None \
+            or tfidf.stop_words is not None or tfidf.strip_accents is not None:
+        raise ValueError("compact 형식은 기본 word analyzer + token_pattern 설정만 지원합니다.")
+
+    weights, bias, kind = _linear_weights(clf)
+
+    # 가지치기: 클래스 간 차이가 없는(= 결정에 기여하지 않는) 특성 제거
+    spread = weights.max(axis=1) - weights.min(axis=1)
+    keep = np.flatnonzero(spread > prune_tol)
+
+    terms = np.empty(len(tfidf.vocabulary_), dtype=object)
+    for term, j in tfidf.vocabulary_.items():
+        terms[j] = term
+    kept_terms = terms[keep]
+    if any("\n" in t for t in kept_terms):
+        raise ValueError("줄바꿈이 포함된 단어는 vocab.txt에 저장할 수 없습니다.")
+
+    idf = tfidf.idf_[keep] if tfidf.use_idf else np.ones(len(keep))
+    model_version = model_version or datetime.now().strftime("%Y%m%d%H%M%S")
+    meta = {
+        "format_version": FORMAT_VERSION,
+        "model_version": model_version,
+        "estimator": type(clf).__name__,
+        "kind": kind,
+        "classes": [str(c) for c in clf.classes_],
+        "tfidf": {
+            "token_pattern": tfidf.token_pattern,
+            "ngram_range": list(tfidf.ngram_range),
+            "lowercase": bool(tfidf.lowercase),
+            "sublinear_tf": bool(tfidf.sublinear_tf),
+            "use_idf": bool(tfidf.use_idf),
+            "norm": tfidf.norm,
+        },
+        "n_features_original": int(len(terms)),
+        "n_features": int(len(keep)),
+        "prune_tol": prune_tol,
+        "created_at": datetime.now().isoformat(timespec="seconds"),
+    }
+
+    # 임시 디렉터리에 모두 쓴 뒤 교체
+    tmp_dir = out_dir.with_name(out_dir.name + ".tmp")
+    if tmp_dir.exists():
+        shutil.rmtree(tmp_dir)
+    tmp_dir.mkdir(parents=True)
+    (tmp_dir / "vocab.txt").write_text("\n".join(kept_terms), encoding="utf-8")
+    np.save(tmp_dir / "idf.npy", np.ascontiguousarray(idf, dtype=np.float32))
+    np.save(tmp_dir / "weights.npy", np.ascontiguousarray(weights[keep], dtype=np.float32))
+    np.save(tmp_dir / "bias.npy", np.asarray(bias, dtype=np.float32))
+    (tmp_dir / "meta.json").write_text(json.dumps(meta, ensure_ascii=False, indent=2), encoding="utf-8")
+    if out_dir.exists():
+        shutil.rmtree(out_dir)
+    os.replace(tmp_dir, out_dir)
+
+    size = sum(p.stat().st_size for p in out_dir.iterdir())
+    report = {
+        "path": str(out_dir),
+        "model_version": model_version,
+        "n_features_original": meta["n_features_original"],
+        "n_features": meta["n_features"],
+        "size_bytes": size,
+    }
+
+    if check_texts is not None:
+        report.update(check_parity(pipe, out_dir, list(check_texts), max_proba_diff))
+    return report
+
+
+def check_parity(pipe, compact_dir, texts, max_proba_diff: float = MAX_PROBA_DIFF) -> Dict[str, Any]:
+    """원본 Pipeline과 compact 모델의 라벨 일치율 / 점수 최대 차이 / 로드 시간 비교"""
+    t0 = time.perf_counter()
+    compact = CompactSentimentModel(compact_dir)
+    load_sec = time.perf_counter() - t0
+
+    label_match = float(np.mean(pipe.predict(texts) == compact.predict(texts))) if texts else 1.0
+    if compact.kind == "softmax":
+        diff = np.abs(pipe.predict_proba(texts) - compact.predict_proba(texts)) if texts else np.zeros(1)
+    else:
+        diff = np.abs(pipe.decision_function(texts) - compact.decision_function(texts)) if texts else np.zeros(1)
+    max_diff = float(diff.max()) if diff.size else 0.0
+
+    return {
+        "parity_ok": label_match == 1.0 and max_diff <= max_proba_diff,
+        "label_match": label_match,
+        "max_score_diff": max_diff,
+        "compact_load_sec": load_sec,
+    }
+
+
+def measure_latency(model, texts, repeat: int = 3) -> Dict[str, float]:
+    """기사 1건 단위 / 배치 단위 평균 지연 (ms/건)"""
+    texts = list(texts)
+    if not texts:
+        return {"single_ms": 0.0, "batch_ms": 0.0}
+    sample = texts[:200]
+    t0 = time.perf_counter()
+    for _ in range(repeat):
+        for text in sample:
+            model.predict_proba([text]) if hasattr(model, "predict_proba") else model.decision_function([text])
+    single = (time.perf_counter() - t0) / (repeat * len(sample)) * 1000
+
+    t0 = time.perf_counter()
+    for _ in range(repeat):
+        model.predict_proba(texts) if hasattr(model, "predict_proba") else model.decision_function(texts)
+    batch = (time.perf_counter() - t0) / (repeat * len(texts)) * 1000
+    return {"single_ms": single, "batch_ms": batch}
+
+
+def main():
+    """
+    패리티/지연 확인:
+        python compact_model.py output/model_multinomialnb.joblib "./학습데이터 400개.xlsx"
+    (compact 디렉터리가 없으면 joblib 옆에 새로 내보낸 뒤 비교)
+    """
+    import argparse
+    import joblib
+    from machine_learning import load_data
+
+    parser = argparse.ArgumentParser(description="compact 모델 내보내기 + 원본 Pipeline과 결과/지연 비교")
+    parser.add_argument("model", type=Path, help="학습된 Pipeline (.joblib)")
+    parser.add_argument("data", type=Path, help="비교용 엑셀 (title/description/judge)")
+    parser.add_argument("--compact", type=Path, default=None, help="compact 디렉터리 (기본: <model>.compact)")
+    parser.add_argument("--prune-tol", type=float, default=PRUNE_TOL)
+    parser.add_argument("--max-diff", type=float, default=MAX_PROBA_DIFF)
+    parser.add_argument("--re-export", action="store_true", help="기존 compact가 있어도 다시 내보내기")
+    args = parser.parse_args()
+
+    pipe = joblib.load(args.model)
+    compact_dir = args.compact or args.model.with_suffix(".compact")
+    texts = load_data(str(args.data), min_rows=1)['text'].tolist()
+
+    if args.re_export or not is_compact_model(compact_dir):
+        report = export_compact(pipe, compact_dir, prune_tol=args.prune_tol)
+        print(f"내보내기: {report['path']} (특성 {report['n_features_original']} → {report['n_features']}, "
+              f"{report['size_bytes'] / 1024:.0f}KB)")
+
+    t0 = time.perf_counter()
+    joblib.load(args.model)
+    pipeline_load = time.perf_counter() - t0
+
+    parity = check_parity(pipe, compact_dir, texts, args.max_diff)
+    print(f"\n[패리티] {len(texts)}건: 라벨 일치 {parity['label_match']:.4f}, "
+          f"최대 점수 차이 {parity['max_score_diff']:.2e} (허용 {args.max_diff:.0e}) → "
+          f"{'통과' if parity['parity_ok'] else '실패'}")
+    print(f"[로드] Pipeline {pipeline_load * 1000:.1f}ms / compact {parity['compact_load_sec'] * 1000:.1f}ms")
+
+    compact = CompactSentimentModel(compact_dir)
+    for name, model in (("Pipeline", pipe), ("compact", compact)):
+        lat = measure_latency(model, texts)
+        print(f"[지연] {name}: 1건씩 {lat['single_ms']:.3f}ms/건, 배치 {lat['batch_ms']:.3f}ms/건")
+
+    if not parity['parity_ok']:
+        raise SystemExit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,247 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+부정(negative vs other) 분류 모델 증분 학습 스크립트
+- HashingVectorizer(상태 없음) + partial_fit 분류기 → 어휘 사전이 없어 말뭉치가 커져도 메모리 고정
+- 새로 라벨링한 엑셀(1random 샘플링 라운드, negative.py 결과 등)을 배치 단위로 흡수
+- 체크포인트(output/incremental/checkpoint.joblib)에 모델/누적 통계 저장 → 다음 실행에서 이어서 학습
+- --publish 시 materiality-service 모델 폴더에 새 버전 파일 + model_manifest.json 기록
+  (materiality-service는 manifest가 바뀌면 새 버전을 다시 로드)
+
+사용 예:
+    python incremental_learning.py "./학습데이터 1200개.xlsx" --reset          # 초기 학습
+    python incremental_learning.py "../2부정학습자료(하드코딩)/4차with_negative_labels.xlsx" \
+        --label-col neg_label --eval "./학습데이터 400개.xlsx" --publish
+"""
+
+import argparse
+import hashlib
+import json
+import os
+import re
+import time
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, List
+
+import joblib
+import numpy as np
+from sklearn.feature_extraction.text import HashingVectorizer
+from sklearn.linear_model import SGDClassifier
+from sklearn.metrics import accuracy_score, classification_report, f1_score
+from sklearn.naive_bayes import MultinomialNB
+from sklearn.pipeline import Pipeline
+
+from machine_learning import LABELS, OUTPUT_DIR, RANDOM_STATE, load_data
+
+# ── 설정 ───────────────────────────────────────────────────────────────────────
+INCREMENTAL_DIR = OUTPUT_DIR / "incremental"
+CHECKPOINT_PATH = INCREMENTAL_DIR / "checkpoint.joblib"
+
+# materiality-service가 읽는 모델 폴더 (app/models)
+PUBLISH_DIR = Path("../../materiality-service/app/models")
+MANIFEST_NAME = "model_manifest.json"
+MODEL_FILE_PATTERN = re.compile(r"^model_incremental_v(\d+)\.joblib$")
+KEEP_VERSIONS = 3          # 게시 폴더에 남겨둘 최근 버전 수
+
+N_FEATURES = 2 ** 20       # 해시 공간 크기 (모델 크기 상한)
+CHUNK_SIZE = 2000          # partial_fit 한 번에 넣는 행 수
+CLASSIFIER = "nb"          # nb | sgd
+
+# ── 모델 구성 ──────────────────────────────────────────────────────────────────
+def build_vectorizer() -> HashingVectorizer:
+    # TfidfVectorizer와 같은 토큰 규칙, 음수 없는 값(alternate_sign=False)으로 NB에도 사용 가능
+    return HashingVectorizer(
+        token_pattern=r"[가-힣]{2,}",
+        ngram_range=(1, 2),
+        n_features=N_FEATURES,
+        alternate_sign=False,
+        norm='l2'
+    )
+
+def build_classifier(kind: str):
+    if kind == "sgd":
+        # log_loss → predict_proba 지원 (materiality-service에서 부정 확률 사용)
+        return SGDClassifier(loss='log_loss', alpha=1e-5, random_state=RANDOM_STATE)
+    return MultinomialNB(alpha=0.1)
+
+def new_state(kind: str) -> Dict[str, Any]:
+    return {
+        "pipeline": Pipeline([('hash', build_vectorizer()), ('clf', build_classifier(kind))]),
+        "classifier": kind,
+        "version": 0,
+        "n_seen": 0,
+        "class_counts": {label: 0 for label in LABELS},
+        "ingested": {},     # 파일 sha256 → {path, rows, at} (같은 파일 중복 학습 방지)
+        "created_at": datetime.now().isoformat(timespec='seconds'),
+        "updated_at": None,
+    }
+
+# ── 체크포인트 ─────────────────────────────────────────────────────────────────
+def atomic_dump(obj: Any, path: Path):
+    """임시 파일에 쓴 뒤 교체 → 읽는 쪽이 반쯤 쓰인 파일을 보지 않도록"""
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp = path.with_name(path.name + ".tmp")
+    joblib.dump(obj, tmp)
+    os.replace(tmp, path)
+
+def load_checkpoint(kind: str, reset: bool) -> Dict[str, Any]:
+    if reset or not CHECKPOINT_PATH.exists():
+        print(f"새 체크포인트 생성 (classifier={kind})")
+        return new_state(kind)
+    state = joblib.load(CHECKPOINT_PATH)
+    print(f"체크포인트 로드: {CHECKPOINT_PATH} "
+          f"(classifier={state['classifier']}, 누적 {state['n_seen']}건, 게시 버전 v{state['version']})")
+    if state["classifier"] != kind:
+        print(f"[경고] 체크포인트 분류기({state['classifier']})를 그대로 사용합니다. 바꾸려면 --reset")
+    return state
+
+def save_checkpoint(state: Dict[str, Any]):
+    state["updated_at"] = datetime.now().isoformat(timespec='seconds')
+    atomic_dump(state, CHECKPOINT_PATH)
+    print(f"체크포인트 저장: {CHECKPOINT_PATH}")
+
+def file_digest(path: Path) -> str:
+    h = hashlib.sha256()
+    with open(path, "rb") as f:
+        for block in iter(lambda: f.read(1 << 20), b""):
+            h.update(block)
+    return h.hexdigest()
+
+# ── 증분 학습 ──────────────────────────────────────────────────────────────────
+def partial_fit_batch(state: Dict[str, Any], texts: List[str], labels: List[str],
+                      chunk_size: int = CHUNK_SIZE) -> int:
+    """배치를 chunk 단위로 해싱 → partial_fit (누적 클래스 빈도 기준 balanced 가중치)"""
+    vectorizer = state["pipeline"].named_steps['hash']
+    clf = state["pipeline"].named_steps['clf']
+    counts = state["class_counts"]
+
+    for start in range(0, len(texts), chunk_size):
+        chunk_x = texts[start:start + chunk_size]
+        chunk_y = np.asarray(labels[start:start + chunk_size])
+
+        for label in chunk_y:
+            counts[label] = counts.get(label, 0) + 1
+        total = sum(counts.values())
+        weights = {c: total / (len(LABELS) * n) if n else 1.0 for c, n in counts.items()}
+        sample_weight = np.array([weights[label] for label in chunk_y])
+
+        X = vectorizer.transform(chunk_x)
+        clf.partial_fit(X, chunk_y, classes=LABELS, sample_weight=sample_weight)
+        state["n_seen"] += len(chunk_x)
+
+    return len(texts)
+
+def ingest_files(state: Dict[str, Any], paths: List[Path], label_col: str,
+                 chunk_size: int, force: bool) -> int:
+    absorbed = 0
+    for path in paths:
+        digest = file_digest(path)
+        if digest in state["ingested"] and not force:
+            print(f"[건너뜀] 이미 학습한 파일: {path}")
+            continue
+
+        t0 = time.perf_counter()
+        df = load_data(str(path), min_rows=1, label_col=label_col)
+        n = partial_fit_batch(state, df['text'].tolist(), df['judge'].tolist(), chunk_size)
+        state["ingested"][digest] = {
+            "path": str(path),
+            "rows": n,
+            "at": datetime.now().isoformat(timespec='seconds'),
+        }
+        absorbed += n
+        print(f"배치 학습 완료: {path} ({n}건, {time.perf_counter() - t0:.2f}초)")
+
+    print(f"\n누적 학습 건수: {state['n_seen']} / 클래스 분포: {state['class_counts']}")
+    return absorbed
+
+def evaluate(state: Dict[str, Any], path: Path, label_col: str) -> Dict[str, float]:
+    df = load_data(str(path), min_rows=1, label_col=label_col)
+    y_true = df['judge'].values
+    y_pred = state["pipeline"].predict(df['text'].tolist())
+    scores = {
+        "accuracy": float(accuracy_score(y_true, y_pred)),
+        "f1_negative": float(f1_score(y_true, y_pred, pos_label='negative', zero_division=0)),
+    }
+    print(f"\n평가 ({path}): Accuracy={scores['accuracy']:.4f}, F1(negative)={scores['f1_negative']:.4f}")
+    print(classification_report(y_true, y_pred, labels=LABELS, zero_division=0))
+    return scores
+
+# ── 게시 ───────────────────────────────────────────────────────────────────────
+def publish(state: Dict[str, Any], publish_dir: Path, keep: int,
+            scores: Dict[str, float] = None) -> Path:
+    """새 버전 모델 파일 → manifest 순서로 교체 (manifest가 가리키는 파일은 항상 완성본)"""
+    state["version"] += 1
+    version = state["version"]
+    model_file = f"model_incremental_v{version:04d}.joblib"
+    model_path = publish_dir / model_file
+    atomic_dump(state["pipeline"], model_path)
+
+    manifest = {
+        "version": version,
+        "model_file": model_file,
+        "classifier": state["classifier"],
+        "n_seen": state["n_seen"],
+        "class_counts": state["class_counts"],
+        "scores": scores or {},
+        "published_at": datetime.now().isoformat(timespec='seconds'),
+    }
+    manifest_path = publish_dir / MANIFEST_NAME
+    tmp = manifest_path.with_name(manifest_path.name + ".tmp")
+    tmp.write_text(json.dumps(manifest, ensure_ascii=False, indent=2), encoding='utf-8')
+    os.replace(tmp, manifest_path)
+    print(f"모델 게시: {model_path} (v{version})")
+
+    # 오래된 버전 정리 (최근 keep개 유지)
+    versions = sorted(
+        (int(m.group(1)), p) for p in publish_dir.iterdir()
+        if (m := MODEL_FILE_PATTERN.match(p.name))
+    )
+    for old_version, old_path in versions[:-keep] if keep > 0 else []:
+        if old_version != version:
+            old_path.unlink(missing_ok=True)
+            print(f"이전 버전 삭제: {old_path}")
+    return model_path
+
+# ── 메인 ────────────────────────────────────────────────────────────────────────
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="부정 분류 모델 증분 학습 (HashingVectorizer + partial_fit)")
+    parser.add_argument("paths", nargs="*", type=Path, help="새로 라벨링된 엑셀 파일들")
+    parser.add_argument("--label-col", default="judge", help="라벨 컬럼명 (negative.py 결과는 neg_label)")
+    parser.add_argument("--classifier", choices=["nb", "sgd"], default=CLASSIFIER,
+                        help="새 체크포인트에서 사용할 분류기")
+    parser.add_argument("--chunk-size", type=int, default=CHUNK_SIZE)
+    parser.add_argument("--reset", action="store_true", help="체크포인트를 버리고 처음부터 학습")
+    parser.add_argument("--force", action="store_true", help="이미 학습한 파일도 다시 학습")
+    parser.add_argument("--eval", type=Path, default=None, help="평가용 엑셀 (judge 라벨)")
+    parser.add_argument("--publish", action="store_true", help="materiality-service 모델 폴더에 새 버전 게시")
+    parser.add_argument("--publish-dir", type=Path, default=PUBLISH_DIR)
+    parser.add_argument("--keep", type=int, default=KEEP_VERSIONS)
+    return parser.parse_args()
+
+def main():
+    args = parse_args()
+    print("="*60); print("부정 분류 모델 증분 학습"); print("="*60)
+
+    state = load_checkpoint(args.classifier, args.reset)
+    absorbed = ingest_files(state, args.paths, args.label_col, args.chunk_size, args.force)
+
+    if state["n_seen"] == 0:
+        print("학습된 데이터가 없습니다. 엑셀 파일을 지정해주세요.")
+        return
+
+    save_checkpoint(state)
+
+    scores = evaluate(state, args.eval, 'judge') if args.eval else None
+
+    if args.publish:
+        if absorbed == 0 and not args.reset and state["version"] > 0:
+            print("새로 학습한 데이터가 없어 게시를 건너뜁니다.")
+        else:
+            publish(state, args.publish_dir, args.keep, scores)
+            save_checkpoint(state)
+
+    print("\n" + "="*60); print("완료"); print("="*60)
+
+if __name__ == "__main__":
+    main()
@@ -4,8 +4,22 @@
 한국어 뉴스 텍스트 이진 분류(부정만 판단) 학습 스크립트
 - 라벨: negative vs other
 - Guarded 옵션 제거(= False만 사용)
+- TF-IDF 캐시: Pipeline(memory=...)로 폴드별 벡터화 결과를 재사용
+  (같은 폴드는 파라미터 조합/모델이 달라도 TF-IDF를 한 번만 학습)
+- 탐색 방식: grid(전체 격자) 또는 halving(successive halving) + 시간 예산
+  (예산이 있으면 모델마다 기본 파라미터 1회 학습 시간으로 탐색 비용을 추정해서
+   예산 안에 들어가는 만큼만 후보를 무작위로 골라 탐색, 한 번도 안 되면 기본 파라미터로 학습)
+- 경량 모델: joblib과 함께 output/model_*.compact 저장 (compact_model.py 참고)
+
+사용 예:
+    python machine_learning.py                                  # 기존과 동일 (GridSearchCV)
+    python machine_learning.py --search halving --time-budget 600
+    python machine_learning.py --clear-cache                    # TF-IDF 캐시 비우고 시작
 """
 
+import argparse
+import os
+import time
 import pandas as pd
 import numpy as np
 import matplotlib.pyplot as plt
@@ -21,13 +35,21 @@ from sklearn.pipeline import Pipeline
 from sklearn.svm import LinearSVC
 from sklearn.linear_model import LogisticRegression
 from sklearn.naive_bayes import MultinomialNB
-from sklearn.model_selection import train_test_split, GridSearchCV, StratifiedKFold
+from sklearn.base import clone
+from sklearn.model_selection import (
+    train_test_split, GridSearchCV, RandomizedSearchCV, StratifiedKFold, ParameterGrid
+)
+from sklearn.experimental import enable_halving_search_cv  # noqa: F401  (Halving*SearchCV 활성화)
+from sklearn.model_selection import HalvingGridSearchCV, HalvingRandomSearchCV
+from joblib import Memory
 from sklearn.metrics import (
     accuracy_score, f1_score, classification_report,
     confusion_matrix, ConfusionMatrixDisplay, make_scorer
 )
 from sklearn.utils.class_weight import compute_class_weight
 
+from compact_model import export_compact
+
 # ── 설정 ───────────────────────────────────────────────────────────────────────
 warnings.filterwarnings('ignore')
 
@@ -42,6 +64,12 @@ LABELS = ['negative', 'other']  # 이진 고정
 OUTPUT_DIR = Path("./output")
 OUTPUT_DIR.mkdir(exist_ok=True, parents=True)
 
+# 폴드별 TF-IDF 결과 캐시 (텍스트/벡터라이저 설정이 같으면 재실행 시에도 재사용)
+CACHE_DIR = OUTPUT_DIR / "cache"
+SEARCH_MODE = "grid"       # grid | halving
+HALVING_FACTOR = 3         # 라운드마다 후보 1/3만 남기고 샘플 수 3배
+TIME_BUDGET_SEC = None     # 전체 탐색 시간 예산(초), None이면 제한 없음
+
 # ── 사전(lexicons) & 정규식 ─────────────────────────────────────────────────────
 # (참고) 현 버전에서는 Guarded 로직을 제거했으므로 아래 사전/정규식은 사용하지 않음.
 NEGATIVE_LEXICON = {
@@ -72,9 +100,12 @@ def extract_keywords(text: str, pattern: re.Pattern) -> List[str]:
     return sorted(set(pattern.findall(text)))
 
 # ── 데이터 로드 ─────────────────────────────────────────────────────────────────
-def load_data(path: str) -> pd.DataFrame:
+def load_data(path: str, min_rows: int = 50, label_col: str = 'judge') -> pd.DataFrame:
     print(f"데이터 로드 중: {path}")
     df = pd.read_excel(path)
+    # 라벨 컬럼 이름이 다른 파일(예: negative.py 결과의 neg_label)도 judge로 맞춰서 처리
+    if label_col != 'judge' and label_col in df.columns:
+        df = df.rename(columns={label_col: 'judge'})
     print(f"1. 원본 데이터: {df.shape}")
     print(f"원본 judge 분포:\n{df['judge'].value_counts()}")
 
@@ -133,7 +164,7 @@ def load_data(path: str) -> pd.DataFrame:
     print(f"\n5. 최종 데이터: {df_final.shape}")
     print(f"최종 클래스 분포:\n{df_final['judge'].value_counts()}")
 
-    if len(df_final) < 50:
+    if len(df_final) < min_rows:
         raise ValueError("전처리 후 데이터가 너무 적습니다. 전처리 과정을 확인해주세요.")
 
     return df_final
@@ -148,7 +179,7 @@ def get_class_weight(y: np.ndarray) -> Dict[str, float]:
     return cw
 
 # ── 파이프라인 & 그리드 ─────────────────────────────────────────────────────────
-def build_pipelines() -> Dict[str, Pipeline]:
+def build_pipelines(memory: Memory = None) -> Dict[str, Pipeline]:
     print("파이프라인 구성 중...")
     tfidf = TfidfVectorizer(
         token_pattern=r"[가-힣]{2,}",
@@ -157,10 +188,11 @@ def build_pipelines() -> Dict[str, Pipeline]:
         sublinear_tf=True,
         max_features=10000
     )
+    # memory가 있으면 tfidf 단계의 fit_transform 결과를 (설정, 폴드 데이터) 기준으로 캐시
     pipes = {
-        'LinearSVC': Pipeline([('tfidf', tfidf), ('clf', LinearSVC(random_state=RANDOM_STATE))]),
-        'LogisticRegression': Pipeline([('tfidf', tfidf), ('clf', LogisticRegression(random_state=RANDOM_STATE, max_iter=5000))]),
-        'MultinomialNB': Pipeline([('tfidf', tfidf), ('clf', MultinomialNB())])
+        'LinearSVC': Pipeline([('tfidf', tfidf), ('clf', LinearSVC(random_state=RANDOM_STATE))], memory=memory),
+        'LogisticRegression': Pipeline([('tfidf', tfidf), ('clf', LogisticRegression(random_state=RANDOM_STATE, max_iter=5000))], memory=memory),
+        'MultinomialNB': Pipeline([('tfidf', tfidf), ('clf', MultinomialNB())], memory=memory)
     }
     print("파이프라인 구성 완료")
     return pipes
@@ -183,22 +215,104 @@ def get_param_grids() -> Dict[str, Dict[str, list]]:
     }
 
 # ── 학습 & 선택 ─────────────────────────────────────────────────────────────────
+def build_search(name: str, pipe: Pipeline, param_grid: Dict[str, list],
+                 search: str, tight_budget: bool, n_candidates: int = None):
+    """n_candidates가 격자 크기보다 작으면 격자에서 그만큼만 무작위로 골라 탐색 (시간 예산)"""
+    scorer = make_scorer(f1_score, pos_label='negative')  # 부정 F1 기준
+    cv = StratifiedKFold(n_splits=CV_FOLDS, shuffle=True, random_state=RANDOM_STATE)
+    sampled = n_candidates is not None and n_candidates < len(ParameterGrid(param_grid))
+    if search == 'halving':
+        # 적은 샘플로 전체 후보를 평가하고 상위 1/factor만 더 많은 샘플로 재평가
+        common = dict(cv=cv, n_jobs=N_JOBS, scoring=scorer, factor=HALVING_FACTOR, resource='n_samples',
+                      aggressive_elimination=tight_budget,
+                      random_state=RANDOM_STATE, verbose=1, error_score='raise')
+        if sampled:
+            return HalvingRandomSearchCV(pipe, param_grid, n_candidates=n_candidates, **common)
+        return HalvingGridSearchCV(pipe, param_grid, **common)
+    if sampled:
+        return RandomizedSearchCV(pipe, param_grid, n_iter=n_candidates, cv=cv, n_jobs=N_JOBS,
+                                  scoring=scorer, random_state=RANDOM_STATE, verbose=1, error_score='raise')
+    return GridSearchCV(pipe, param_grid, cv=cv, n_jobs=N_JOBS,
+                        scoring=scorer, verbose=1, error_score='raise')
+
+def _parallel_slots() -> int:
+    return (os.cpu_count() or 1) if N_JOBS < 0 else max(1, N_JOBS)
+
+def search_cost_in_fits(n_candidates: int, search: str) -> float:
+    """후보 n개 탐색 비용을 '전체 학습 데이터로 1회 학습' 횟수로 환산 (CV 폴드 포함, refit 제외)"""
+    if search != 'halving' or n_candidates <= 1:
+        return n_candidates * CV_FOLDS
+    # successive halving(min_resources='exhaust'): 라운드마다 후보 수 × 샘플 비율이 거의 같음
+    # → 라운드 수 × (n / factor^(라운드 수 - 1)) × 폴드 수
+    rounds = 1
+    while HALVING_FACTOR ** rounds <= n_candidates:
+        rounds += 1
+    return rounds * n_candidates / HALVING_FACTOR ** (rounds - 1) * CV_FOLDS
+
+def estimate_search_sec(n_candidates: int, fit_sec: float, search: str) -> float:
+    """예상 탐색 시간 = 병렬 학습 + 최적 파라미터 refit"""
+    return fit_sec * (search_cost_in_fits(n_candidates, search) / _parallel_slots() + 1)
+
+def candidates_within_budget(n_grid: int, fit_sec: float, budget: float, search: str) -> int:
+    """예상 탐색 시간이 예산 안에 드는 최대 후보 수 (0 = 탐색 불가)"""
+    for n in range(n_grid, 0, -1):
+        if estimate_search_sec(n, fit_sec, search) <= budget:
+            return n
+    return 0
+
 def train_and_select(X_train: np.ndarray, y_train: np.ndarray,
                      pipelines: Dict[str, Pipeline],
-                     param_grids: Dict[str, Dict[str, list]]) -> Dict[str, Any]:
-    print("모델 학습 및 하이퍼파라미터 튜닝 중...")
+                     param_grids: Dict[str, Dict[str, list]],
+                     search: str = SEARCH_MODE,
+                     time_budget: float = TIME_BUDGET_SEC) -> Dict[str, Any]:
+    print(f"모델 학습 및 하이퍼파라미터 튜닝 중... (search={search}, time_budget={time_budget})")
     best = {}
-    scorer = make_scorer(f1_score, pos_label='negative')  # 부정 F1 기준
+    started = time.perf_counter()
+    names = list(pipelines.keys())
+    # 실제/예상 탐색 시간 비율 (병렬 워커 기동 등 고정 비용) → 다음 모델 추정에 반영
+    overrun = 1.0
 
-    for name, pipe in pipelines.items():
+    for i, name in enumerate(names):
+        pipe = pipelines[name]
         print(f"\n{name} 학습 중...")
         if name in ['LinearSVC', 'LogisticRegression']:
             pipe.named_steps['clf'].class_weight = get_class_weight(y_train)
 
-        cv = StratifiedKFold(n_splits=CV_FOLDS, shuffle=True, random_state=RANDOM_STATE)
-        gs = GridSearchCV(pipe, param_grids[name], cv=cv, n_jobs=N_JOBS,
-                          scoring=scorer, verbose=1, error_score='raise')
+        # 남은 예산을 남은 모델 수로 나눠 모델별 몫 계산
+        model_budget = None
+        n_candidates = None
+        n_grid = len(ParameterGrid(param_grids[name]))
+        if time_budget is not None:
+            remaining = time_budget - (time.perf_counter() - started)
+            model_budget = remaining / (len(names) - i)
+            n_candidates = 0
+            probe = None
+            if model_budget > 0:
+                # 기본 파라미터 1회 학습 시간으로 탐색 비용 추정 → 예산 안에 드는 후보 수만 탐색
+                t0 = time.perf_counter()
+                probe = clone(pipe).fit(X_train, y_train)
+                fit_sec = time.perf_counter() - t0
+                n_candidates = candidates_within_budget(n_grid, fit_sec * overrun, model_budget - fit_sec, search)
+                print(f"[예산] {name}: 몫 {model_budget:.1f}초, 1회 학습 {fit_sec:.2f}초 → "
+                      f"후보 {n_candidates}/{n_grid}개 탐색")
+            if n_candidates == 0:
+                # 예산 소진/부족: 탐색 없이 기본 파라미터로 한 번만 학습
+                print(f"[예산 소진] {name}: 탐색 생략, 기본 파라미터로 학습")
+                best[name] = {
+                    'best_estimator_': probe if probe is not None else pipe.fit(X_train, y_train),
+                    'best_cv_score': float('nan'),
+                    'best_params': {}
+                }
+                continue
+
+        t0 = time.perf_counter()
+        gs = build_search(name, pipe, param_grids[name], search,
+                          tight_budget=model_budget is not None and model_budget < 60,
+                          n_candidates=n_candidates)
         gs.fit(X_train, y_train)
+        elapsed = time.perf_counter() - t0
+        if n_candidates is not None:
+            overrun = max(overrun, elapsed / estimate_search_sec(n_candidates, fit_sec, search))
 
         best[name] = {
             'best_estimator_': gs.best_estimator_,
@@ -207,6 +321,7 @@ def train_and_select(X_train: np.ndarray, y_train: np.ndarray,
         }
         print(f"{name} 최적 CV(F1-neg): {gs.best_score_:.4f}")
         print(f"{name} 최적 파라미터: {gs.best_params_}")
+        print(f"{name} 탐색 시간: {elapsed:.1f}초" + (f" (몫 {model_budget:.1f}초)" if model_budget is not None else ""))
     return best
 
 # ── 평가 (Raw만) ────────────────────────────────────────────────────────────────
@@ -253,7 +368,8 @@ def evaluate(models: Dict[str, Any], X_test: np.ndarray, y_test: np.ndarray) ->
 
 # ── 결과 저장 (Raw만) ───────────────────────────────────────────────────────────
 def save_artifacts(models: Dict[str, Any], scores: pd.DataFrame,
-                   X_test: np.ndarray, y_test: np.ndarray, test_df: pd.DataFrame):
+                   X_test: np.ndarray, y_test: np.ndarray, test_df: pd.DataFrame,
+                   export_compact_model: bool = True):
     print("결과 저장 중...")
 
     # 모델 저장
@@ -262,6 +378,16 @@ def save_artifacts(models: Dict[str, Any], scores: pd.DataFrame,
         joblib.dump(info['best_estimator_'], p)
         print(f"모델 저장: {p}")
 
+        # 경량 아티팩트 (가중치 있는 어휘만, float32, mmap 로드) + 원본과 예측 일치 검증
+        if export_compact_model:
+            report = export_compact(info['best_estimator_'], p.with_suffix(".compact"),
+                                    check_texts=list(X_test))
+            print(f"경량 모델 저장: {report['path']} (특성 {report['n_features_original']} → {report['n_features']}, "
+                  f"{report['size_bytes'] / 1024:.0f}KB, 라벨 일치 {report['label_match']:.4f}, "
+                  f"최대 점수 차이 {report['max_score_diff']:.2e})")
+            if not report['parity_ok']:
+                print(f"[경고] {name}: 경량 모델 결과가 원본과 다릅니다. prune_tol을 낮춰 다시 내보내세요.")
+
     # 점수 저장
     scores.to_csv(OUTPUT_DIR / "model_scores.csv", index=False)
 
@@ -284,11 +410,24 @@ def save_artifacts(models: Dict[str, Any], scores: pd.DataFrame,
     print(f"예측 결과 저장: {OUTPUT_DIR / 'predictions_test.csv'}")
 
 # ── 메인 ────────────────────────────────────────────────────────────────────────
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="부정(negative vs other) 분류 모델 학습")
+    parser.add_argument("--data", default=DATA_PATH, help="학습 데이터 엑셀 경로")
+    parser.add_argument("--search", choices=["grid", "halving"], default=SEARCH_MODE,
+                        help="하이퍼파라미터 탐색 방식")
+    parser.add_argument("--time-budget", type=float, default=TIME_BUDGET_SEC,
+                        help="전체 탐색 시간 예산(초) - 1회 학습 시간으로 추정해서 후보 수를 줄임 (추정치라 약간 넘을 수 있음)")
+    parser.add_argument("--no-cache", action="store_true", help="TF-IDF 캐시 사용 안 함")
+    parser.add_argument("--clear-cache", action="store_true", help="시작 전에 TF-IDF 캐시 비우기")
+    parser.add_argument("--no-compact", action="store_true", help="경량 모델(.compact) 내보내기 생략")
+    return parser.parse_args()
+
 def main():
+    args = parse_args()
     print("="*60); print("부정만 판단(negative vs other) 모델 학습 시작"); print("="*60)
 
     # 1) 데이터 로드 및 전처리
-    df = load_data(DATA_PATH)
+    df = load_data(args.data)
 
     # 2) 데이터 준비
     X = df['text'].values  # 원본 텍스트 그대로 사용
@@ -306,18 +445,28 @@ def main():
     # 안전장치: X_train이 문장인지 확인
     assert isinstance(X_train[0], str), "X_train은 반드시 '문장'이어야 합니다. (벡터화를 제거하세요)"
 
-    # 4) 파이프라인/그리드
-    pipelines = build_pipelines()
+    # 4) 파이프라인/그리드 (TF-IDF 캐시)
+    memory = None
+    if not args.no_cache:
+        memory = Memory(location=str(CACHE_DIR), verbose=0)
+        if args.clear_cache:
+            memory.clear(warn=False)
+        print(f"TF-IDF 캐시 사용: {CACHE_DIR}")
+    pipelines = build_pipelines(memory)
     param_grids = get_param_grids()
 
     # 5) 학습/선정(부정 F1 최적화)
-    best_models = train_and_select(X_train, y_train, pipelines, param_grids)
+    t_search = time.perf_counter()
+    best_models = train_and_select(X_train, y_train, pipelines, param_grids,
+                                   search=args.search, time_budget=args.time_budget)
+    print(f"\n전체 탐색 시간: {time.perf_counter() - t_search:.1f}초")
 
     # 6) 평가 (Raw만)
     scores = evaluate(best_models, X_test, y_test)
 
     # 7) 저장
-    save_artifacts(best_models, scores, X_test, y_test, test_df)
+    save_artifacts(best_models, scores, X_test, y_test, test_df,
+                   export_compact_model=not args.no_compact)
 
     print("\n" + "="*60)
     print("완료! ./output 폴더 확인")
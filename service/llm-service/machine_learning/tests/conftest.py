@@ -0,0 +1,6 @@
+# -*- coding: utf-8 -*-
+"""machine_learning 스크립트들은 같은 디렉터리에서 실행되는 평면 모듈 → 테스트에서도 그대로 import"""
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
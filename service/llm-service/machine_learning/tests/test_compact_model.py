@@ -0,0 +1,143 @@
+# -*- coding: utf-8 -*-
+"""
+compact 모델 패리티 테스트 - 작은 TF-IDF + 선형 분류기 Pipeline을 메모리에서 학습 → 내보내기 → 원본과 비교
+실행: machine_learning 디렉터리에서 python -m pytest -q tests
+"""
+import numpy as np
+import pytest
+from sklearn.feature_extraction.text import TfidfVectorizer
+from sklearn.linear_model import LogisticRegression
+from sklearn.naive_bayes import MultinomialNB
+from sklearn.pipeline import Pipeline
+from sklearn.svm import LinearSVC
+
+from compact_model import MAX_PROBA_DIFF, CompactSentimentModel, check_parity, export_compact, is_compact_model
+
+TRAIN = [
+    ("삼성전자 공장 화재 사고 발생 근로자 부상", "negative"),
+    ("협력사 하도급 갑질 논란 공정위 과징금 부과", "negative"),
+    ("폐수 무단 방류 적발 환경부 고발 조치", "negative"),
+    ("개인정보 유출 사고 소비자 집단 소송 제기", "negative"),
+    ("배출가스 조작 의혹 검찰 압수수색 착수", "negative"),
+    ("임원 횡령 혐의 구속 기소 주가 급락", "negative"),
+    ("탄소중립 목표 달성 재생에너지 전환 확대", "positive"),
+    ("지역사회 상생 기부 장학금 전달 봉사활동", "positive"),
+    ("지배구조 개선 이사회 독립성 강화 발표", "positive"),
+    ("친환경 포장재 도입 플라스틱 사용 절감", "positive"),
+    ("협력사 동반성장 지원 상생 기금 출연", "positive"),
+    ("안전보건 경영 인증 획득 산업재해 감소", "positive"),
+    ("분기 실적 발표 매출 영업이익 시장 전망", "other"),
+    ("신제품 출시 행사 개최 신규 모델 공개", "other"),
+    ("대표이사 신년사 경영 방침 발표 행사", "other"),
+    ("주주총회 개최 안건 의결 정관 변경", "other"),
+    ("해외 법인 설립 현지 시장 진출 계획", "other"),
+    ("인사 발령 조직 개편 신임 임원 선임", "other"),
+]
+
+CHECK = [
+    "공장 화재 사고로 근로자 부상 공정위 과징금",
+    "재생에너지 전환 확대 상생 기부",
+    "주주총회 개최 신제품 출시",
+    "환경부 고발 조치 이후 친환경 포장재 도입",
+    "ENGLISH ONLY TEXT 123",      # 어휘에 없는 토큰만
+    "",                           # 빈 문자열
+    "화재 화재 화재 사고 사고",     # 반복 토큰 (tf 누적)
+]
+
+CLASSIFIERS = {
+    "multinomialnb": lambda: MultinomialNB(alpha=0.5),
+    "logisticregression": lambda: LogisticRegression(max_iter=1000),
+    "linearsvc": lambda: LinearSVC(),
+}
+
+
+def _train(clf_name: str, ngram_range=(1, 1), binary: bool = False, **tfidf_kwargs) -> Pipeline:
+    rows = [(t, y) for t, y in TRAIN if not binary or y != "other"]
+    texts, labels = zip(*rows)
+    pipe = Pipeline([
+        ("tfidf", TfidfVectorizer(token_pattern=r"[가-힣]{2,}", ngram_range=ngram_range, **tfidf_kwargs)),
+        ("clf", CLASSIFIERS[clf_name]()),
+    ])
+    return pipe.fit(list(texts), list(labels))
+
+
+def _scores(model, texts):
+    """softmax 계열은 확률, LinearSVC 계열은 결정 점수 (Pipeline/compact 모두 없는 메서드는 hasattr False)"""
+    return model.predict_proba(texts) if hasattr(model, "predict_proba") else model.decision_function(texts)
+
+
+@pytest.mark.parametrize("clf_name", sorted(CLASSIFIERS))
+@pytest.mark.parametrize("ngram_range", [(1, 1), (1, 2)])
+@pytest.mark.parametrize("binary", [False, True])
+def test_export_matches_pipeline(tmp_path, clf_name, ngram_range, binary):
+    pipe = _train(clf_name, ngram_range=ngram_range, binary=binary)
+    report = export_compact(pipe, tmp_path / "model.compact", model_version="test", check_texts=CHECK)
+
+    assert is_compact_model(report["path"])
+    assert report["parity_ok"], report
+    assert report["label_match"] == 1.0
+    assert report["max_score_diff"] <= MAX_PROBA_DIFF
+
+    compact = CompactSentimentModel(report["path"])
+    assert compact.version == "test"
+    assert list(compact.classes_) == [str(c) for c in pipe.classes_]
+    assert list(compact.predict(CHECK)) == list(pipe.predict(CHECK))
+    np.testing.assert_allclose(_scores(compact, CHECK), _scores(pipe, CHECK), atol=MAX_PROBA_DIFF)
+
+
+@pytest.mark.parametrize("clf_name", sorted(CLASSIFIERS))
+def test_none_and_empty_text(tmp_path, clf_name):
+    """None은 빈 문자열로 취급 (sklearn Pipeline은 None을 받지 못하므로 빈 문자열 결과와 비교)"""
+    pipe = _train(clf_name, ngram_range=(1, 2))
+    compact = CompactSentimentModel(export_compact(pipe, tmp_path / "model.compact")["path"])
+
+    assert list(compact.predict([None, ""])) == list(pipe.predict(["", ""]))
+    np.testing.assert_allclose(_scores(compact, [None, ""]), _scores(pipe, ["", ""]), atol=MAX_PROBA_DIFF)
+
+
+def test_empty_batch(tmp_path):
+    pipe = _train("multinomialnb")
+    compact = CompactSentimentModel(export_compact(pipe, tmp_path / "model.compact")["path"])
+
+    assert compact.predict([]).shape == (0,)
+    assert compact.predict_proba([]).shape == (0, len(pipe.classes_))
+    assert check_parity(pipe, tmp_path / "model.compact", [])["parity_ok"]
+
+
+def test_score_method_follows_kind(tmp_path):
+    nb = CompactSentimentModel(export_compact(_train("multinomialnb"), tmp_path / "nb.compact")["path"])
+    svc = CompactSentimentModel(export_compact(_train("linearsvc"), tmp_path / "svc.compact")["path"])
+
+    assert nb.kind == "softmax" and not hasattr(nb, "decision_function")
+    assert svc.kind == "decision" and not hasattr(svc, "predict_proba")
+
+
+def test_check_parity_reports_mismatch(tmp_path):
+    """다른 Pipeline과 비교하면 parity_ok가 False (검증이 실제로 차이를 잡는지)"""
+    compact_dir = export_compact(_train("multinomialnb"), tmp_path / "model.compact")["path"]
+    other = _train("multinomialnb", sublinear_tf=True)
+
+    result = check_parity(other, compact_dir, CHECK, max_proba_diff=1e-9)
+    assert not result["parity_ok"]
+    assert result["max_score_diff"] > 1e-9
+
+
+def test_export_replaces_existing_directory(tmp_path):
+    out_dir = tmp_path / "model.compact"
+    export_compact(_train("multinomialnb"), out_dir, model_version="v1")
+    export_compact(_train("logisticregression"), out_dir, model_version="v2")
+
+    compact = CompactSentimentModel(out_dir)
+    assert compact.version == "v2"
+    assert compact.meta["estimator"] == "LogisticRegression"
+    assert not (tmp_path / "model.compact.tmp").exists()
+
+
+def test_rejects_unsupported_vectorizer(tmp_path):
+    pipe = Pipeline([
+        ("tfidf", TfidfVectorizer(analyzer="char")),
+        ("clf", MultinomialNB()),
+    ]).fit([t for t, _ in TRAIN], [y for _, y in TRAIN])
+
+    with pytest.raises(ValueError):
+        export_compact(pipe, tmp_path / "model.compact")
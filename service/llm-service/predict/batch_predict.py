@@ -0,0 +1,178 @@
+# -*- coding: utf-8 -*-
+"""
+대용량 배치 예측 (predict.py의 스트리밍 + 멀티프로세스 버전)
+- 입력: CSV / JSONL / Parquet (엑셀도 가능하지만 한 번에 읽음)을 chunk 단위로 읽기
+- 처리: 프로세스 풀, 워커마다 모델을 한 번만 로드 (initializer)
+- 출력: Parquet에 chunk 순서대로 바로 기록 → 메모리는 (동시 처리 chunk 수 × chunk 크기)로 고정
+- 진행률: chunk마다 누적 처리 건수와 초당 처리 건수(rows/s) 출력
+
+예측/점수/가드 규칙은 predict.py의 score_frame을 그대로 사용하므로 결과 컬럼이 동일합니다.
+
+사용 예:
+    python batch_predict.py articles.csv -o 예측결과.parquet
+    python batch_predict.py articles.jsonl -o out.parquet --workers 8 --chunk-size 20000 --threshold 0.6
+"""
+
+import argparse
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+from typing import Iterator, Optional, Tuple
+
+import joblib
+import pandas as pd
+import pyarrow as pa
+import pyarrow.parquet as pq
+
+from predict import MODEL_PATH, NEGATIVE_THRESHOLD, build_text_column, resolve_classes, score_frame
+
+# ===== 옵션 =====
+CHUNK_SIZE = 10000
+WORKERS = max(1, (os.cpu_count() or 2) - 1)
+MAX_IN_FLIGHT_PER_WORKER = 2   # 워커당 대기 chunk 수 (메모리 상한)
+
+# ===== 입력 스트리밍 =====
+def detect_format(path: Path) -> str:
+    suffix = path.suffix.lower()
+    if suffix in (".csv", ".tsv"):
+        return "csv"
+    if suffix in (".jsonl", ".ndjson", ".json"):
+        return "jsonl"
+    if suffix in (".parquet", ".pq"):
+        return "parquet"
+    if suffix in (".xlsx", ".xls"):
+        return "excel"
+    raise ValueError(f"지원하지 않는 입력 형식입니다: {path}")
+
+def iter_chunks(path: Path, fmt: str, chunk_size: int) -> Iterator[pd.DataFrame]:
+    if fmt == "csv":
+        sep = "\t" if path.suffix.lower() == ".tsv" else ","
+        yield from pd.read_csv(path, sep=sep, chunksize=chunk_size, dtype=str, keep_default_na=False)
+    elif fmt == "jsonl":
+        yield from pd.read_json(path, lines=True, chunksize=chunk_size, dtype=False)
+    elif fmt == "parquet":
+        pf = pq.ParquetFile(path)
+        for batch in pf.iter_batches(batch_size=chunk_size):
+            yield batch.to_pandas()
+    else:
+        # 엑셀은 스트리밍 읽기가 없어 한 번에 읽고 나눠서 처리
+        df = pd.read_excel(path)
+        for start in range(0, len(df), chunk_size):
+            yield df.iloc[start:start + chunk_size]
+
+# ===== 워커 =====
+_PIPE = None
+_CLASSES = None
+_THRESHOLD = None
+
+def _init_worker(model_path: str, threshold: Optional[float]):
+    """워커 프로세스 시작 시 모델 1회 로드"""
+    global _PIPE, _CLASSES, _THRESHOLD
+    _PIPE = joblib.load(model_path)
+    _CLASSES = resolve_classes(_PIPE)
+    _THRESHOLD = threshold
+
+def _score_chunk(chunk_no: int, df: pd.DataFrame) -> Tuple[int, int, pd.DataFrame]:
+    n_input = len(df)
+    df = build_text_column(df)
+    if len(df):
+        df = score_frame(_PIPE, _CLASSES, df, _THRESHOLD)
+    return chunk_no, n_input, df.reset_index(drop=True)
+
+# ===== 출력 =====
+class ParquetSink:
+    """chunk를 받는 즉시 Parquet row group으로 기록 (스키마는 첫 chunk 기준)"""
+
+    def __init__(self, path: Path):
+        self.path = path
+        self.writer: Optional[pq.ParquetWriter] = None
+        self.rows = 0
+
+    def write(self, df: pd.DataFrame):
+        if df.empty:
+            return
+        if self.writer is None:
+            table = pa.Table.from_pandas(df, preserve_index=False)
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            self.writer = pq.ParquetWriter(self.path, table.schema, compression="zstd")
+        else:
+            # 이후 chunk는 첫 스키마에 맞춤 (빠진 컬럼은 null)
+            schema = self.writer.schema
+            for name in schema.names:
+                if name not in df.columns:
+                    df[name] = None
+            table = pa.Table.from_pandas(df[schema.names], schema=schema, preserve_index=False)
+        self.writer.write_table(table)
+        self.rows += len(df)
+
+    def close(self):
+        if self.writer is not None:
+            self.writer.close()
+
+# ===== 메인 =====
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="대용량 배치 부정 예측 (chunk 스트리밍 + 프로세스 풀)")
+    parser.add_argument("input", type=Path, help="입력 파일 (csv/tsv/jsonl/parquet/xlsx)")
+    parser.add_argument("-o", "--output", type=Path, default=None, help="출력 Parquet 경로")
+    parser.add_argument("--model", type=Path, default=MODEL_PATH)
+    parser.add_argument("--format", choices=["csv", "jsonl", "parquet", "excel"], default=None)
+    parser.add_argument("--chunk-size", type=int, default=CHUNK_SIZE)
+    parser.add_argument("--workers", type=int, default=WORKERS)
+    parser.add_argument("--threshold", type=float, default=NEGATIVE_THRESHOLD,
+                        help="부정 확률 임계값 (없으면 y_pred 기준)")
+    return parser.parse_args()
+
+def main():
+    args = parse_args()
+    fmt = args.format or detect_format(args.input)
+    output = args.output or args.input.with_name(args.input.stem + "_예측결과.parquet")
+    max_in_flight = max(1, args.workers * MAX_IN_FLIGHT_PER_WORKER)
+
+    print(f"[시작] 입력={args.input} ({fmt}), 출력={output}, workers={args.workers}, chunk={args.chunk_size}")
+    started = time.perf_counter()
+    sink = ParquetSink(output)
+    rows_in = 0
+    rows_negative = 0
+
+    # 완료된 chunk는 입력 순서대로 기록 (먼저 끝난 뒤쪽 chunk는 잠시 보관)
+    pending = {}
+    next_to_write = 0
+
+    def write_next():
+        """가장 앞 chunk 결과를 기다렸다가 기록"""
+        nonlocal next_to_write, rows_in, rows_negative
+        _, n_input, df = pending.pop(next_to_write).result()
+        sink.write(df)
+        rows_in += n_input
+        if "is_negative_final" in df.columns:
+            rows_negative += int(df["is_negative_final"].sum())
+        next_to_write += 1
+        elapsed = time.perf_counter() - started
+        print(f"  chunk {next_to_write}: 누적 {rows_in:,}건, 부정 {rows_negative:,}건, "
+              f"{rows_in / max(elapsed, 1e-9):,.0f} rows/s")
+
+    try:
+        with ProcessPoolExecutor(
+            max_workers=args.workers,
+            initializer=_init_worker,
+            initargs=(str(args.model), args.threshold),
+        ) as pool:
+            for chunk_no, chunk in enumerate(iter_chunks(args.input, fmt, args.chunk_size)):
+                pending[chunk_no] = pool.submit(_score_chunk, chunk_no, chunk)
+                while next_to_write in pending and pending[next_to_write].done():
+                    write_next()
+                # 대기 chunk가 너무 많으면 앞 chunk가 끝날 때까지 기다림 (메모리 상한)
+                while len(pending) >= max_in_flight:
+                    write_next()
+            while pending:
+                write_next()
+    finally:
+        sink.close()
+
+    elapsed = time.perf_counter() - started
+    print(f"[완료] {rows_in:,}건 → {sink.rows:,}건 저장 ({output}), 부정 {rows_negative:,}건")
+    print(f"        소요 {elapsed:.1f}초, {rows_in / max(elapsed, 1e-9):,.0f} rows/s")
+
+if __name__ == "__main__":
+    main()
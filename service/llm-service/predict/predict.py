@@ -76,13 +76,7 @@ def build_text_column(df: pd.DataFrame) -> pd.DataFrame:
         df["text"] = df[title_col or desc_col].astype(str)
     return df[df["text"].str.len() > 0].copy()
 
-def main():
-    # 1) 데이터 로드
-    df = pd.read_excel(INPUT_XLSX)
-    df = build_text_column(df)
-
-    # 2) 모델 로드
-    pipe = joblib.load(MODEL_PATH)
+def resolve_classes(pipe) -> np.ndarray:
     clf = pipe.named_steps["clf"]
     classes = getattr(clf, "classes_", None)
     if classes is None:
@@ -90,8 +84,10 @@ def main():
         classes = getattr(pipe, "classes_", None)
     if classes is None:
         raise RuntimeError("학습된 모델에서 classes_를 찾을 수 없습니다.")
-    classes = np.array(classes).astype(str)
+    return np.array(classes).astype(str)
 
+def score_frame(pipe, classes: np.ndarray, df: pd.DataFrame, threshold=NEGATIVE_THRESHOLD) -> pd.DataFrame:
+    """text 컬럼이 있는 DataFrame에 예측/점수/가드 결과 컬럼을 붙여 반환 (batch_predict.py와 공용)"""
     # 3) 예측 라벨
     df["y_pred"] = pipe.predict(df["text"]).astype(str)
 
@@ -111,7 +107,7 @@ def main():
         if negative_index is not None:
             df["proba_negative"] = proba[:, negative_index]
         # negative 점수로 확률 사용
-        df["score_negative"] = df.get("proba_negative", pd.Series([np.nan]*len(df)))
+        df["score_negative"] = df.get("proba_negative", pd.Series([np.nan]*len(df), index=df.index))
     else:
         scores = pipe.decision_function(df["text"])
         if scores.ndim == 1:
@@ -130,12 +126,12 @@ def main():
                 df["score_negative"] = scores[:, negative_index]
 
     # 5) 모델 기반 부정 플래그(임계값 옵션)
-    if NEGATIVE_THRESHOLD is not None:
+    if threshold is not None:
         if "proba_negative" in df.columns:
-            is_neg_model = df["proba_negative"] >= float(NEGATIVE_THRESHOLD)
+            is_neg_model = df["proba_negative"] >= float(threshold)
         elif "score_negative" in df.columns:
             # 주의: 점수 스케일은 모델마다 다름. 임계값 해석에 유의.
-            is_neg_model = df["score_negative"] >= float(NEGATIVE_THRESHOLD)
+            is_neg_model = df["score_negative"] >= float(threshold)
         else:
             is_neg_model = df["y_pred"].str.lower().eq("negative")
     else:
@@ -143,39 +139,36 @@ def main():
     df["is_negative_model"] = is_neg_model.astype(int)
 
     # 6) 가드 적용: 부정어+긍정어 동시 → other
-    neg_kws = []
-    pos_kws = []
-    guard_applied = []
-    final_label = []
-    final_basis = []
-
-    for txt, pred_is_neg in zip(df["text"], is_neg_model):
-        neg_list = extract_keywords(txt, _NEG_RE)
-        pos_list = extract_keywords(txt, _POS_RE)
-        both = (len(neg_list) > 0) and (len(pos_list) > 0)
-
-        neg_kws.append(", ".join(neg_list))
-        pos_kws.append(", ".join(pos_list))
-
-        if pred_is_neg and both:
-            guard_applied.append(True)
-            final_label.append("other")
-            final_basis.append("부정+긍정 동시 출현 → other")
-        elif pred_is_neg and not both:
-            guard_applied.append(False)
-            final_label.append("negative")
-            final_basis.append("모델 부정 예측 유지")
-        else:
-            guard_applied.append(False)
-            final_label.append("other")
-            final_basis.append("모델 other 예측")
-
-    df["neg_keywords"] = neg_kws
-    df["pos_keywords"] = pos_kws
-    df["guard_applied"] = guard_applied
-    df["final_label"] = final_label
+    #    (키워드 추출만 행 단위, 라벨/근거 결정은 배열 연산)
+    neg_lists = [extract_keywords(txt, _NEG_RE) for txt in df["text"]]
+    pos_lists = [extract_keywords(txt, _POS_RE) for txt in df["text"]]
+    both = np.array([bool(n) and bool(p) for n, p in zip(neg_lists, pos_lists)], dtype=bool)
+    pred_is_neg = is_neg_model.to_numpy(dtype=bool)
+    guard = pred_is_neg & both
+
+    df["neg_keywords"] = [", ".join(n) for n in neg_lists]
+    df["pos_keywords"] = [", ".join(p) for p in pos_lists]
+    df["guard_applied"] = guard
+    df["final_label"] = np.where(pred_is_neg & ~both, "negative", "other")
     df["is_negative_final"] = (df["final_label"] == "negative").astype(int)
-    df["final_basis"] = final_basis
+    df["final_basis"] = np.select(
+        [guard, pred_is_neg],
+        ["부정+긍정 동시 출현 → other", "모델 부정 예측 유지"],
+        default="모델 other 예측"
+    )
+    return df
+
+def main():
+    # 1) 데이터 로드
+    df = pd.read_excel(INPUT_XLSX)
+    df = build_text_column(df)
+
+    # 2) 모델 로드
+    pipe = joblib.load(MODEL_PATH)
+    classes = resolve_classes(pipe)
+
+    # 3)~6) 예측/점수/가드
+    df = score_frame(pipe, classes, df, NEGATIVE_THRESHOLD)
 
     # 7) 저장
     df.to_excel(OUTPUT_XLSX, index=False)
@@ -7,6 +7,8 @@ from sqlalchemy.ext.asyncio import create_async_engine, AsyncSession
 from sqlalchemy.orm import sessionmaker, declarative_base
 from sqlalchemy import text
 
+from app.common.tracing import instrument_engine
+
 logger = logging.getLogger("materiality_service_issuepool_db")
 
 # Railway PostgreSQL 연결 설정 (필수)
@@ -33,6 +35,9 @@ engine = create_async_engine(
     max_overflow=20
 )
 
+# 요청 추적(span)에 쿼리 수/시간 기록
+instrument_engine(engine)
+
 # 비동기 세션 팩토리
 AsyncSessionLocal = sessionmaker(
     engine,
@@ -0,0 +1,308 @@
+"""
+Materiality Service Tracing - 요청 단위 단계별 시간 측정 (span)
+- span(name): 컨텍스트 매니저, traced(name): 동기/비동기 함수 데코레이터
+- 같은 요청 안의 span은 contextvar로 부모-자식 관계를 자동 연결 (asyncio task에도 전파)
+- DB 엔진에 instrument_engine()을 걸면 span마다 쿼리 수/쿼리 시간도 기록
+- 추적 중인 요청이 없으면 span은 시간만 재고 아무 데도 붙지 않음 (오버헤드 최소)
+
+요청 추적은 main.py 미들웨어에서 시작 (TRACE_ENABLED=true일 때만, debug 라우터도 이때만 등록):
+    X-Debug-Trace: 1 헤더 (또는 TRACE_ALL_REQUESTS=true) → 응답에 Server-Timing / X-Trace-Id 헤더
+    GET /materiality-service/debug/traces/{trace_id} → Chrome trace(JSON) 내보내기 (chrome://tracing, Perfetto)
+    TRACE_EXPORT_DIR 설정 시 추적한 요청마다 {trace_id}.json 파일도 저장
+"""
+import functools
+import inspect
+import json
+import logging
+import os
+import time
+import uuid
+from collections import OrderedDict
+from contextlib import contextmanager
+from contextvars import ContextVar
+from datetime import datetime
+from typing import Any, Callable, Dict, Iterator, List, Optional
+
+logger = logging.getLogger("materiality_service_tracing")
+
+# 헤더로 요청별 추적 허용 여부 (기본 꺼짐, 켜면 /debug/* 엔드포인트도 함께 노출)
+TRACE_ENABLED = os.getenv("TRACE_ENABLED", "false").lower() == "true"
+# 헤더 없이 모든 요청 추적
+TRACE_ALL_REQUESTS = os.getenv("TRACE_ALL_REQUESTS", "false").lower() == "true"
+# 추적 결과 파일 저장 경로 (없으면 메모리에만 보관)
+TRACE_EXPORT_DIR = os.getenv("TRACE_EXPORT_DIR")
+# 메모리에 보관할 최근 추적 수
+TRACE_KEEP = int(os.getenv("TRACE_KEEP", "20"))
+# Server-Timing 헤더에 펼칠 span 깊이 (루트 제외)
+SERVER_TIMING_DEPTH = int(os.getenv("TRACE_SERVER_TIMING_DEPTH", "2"))
+
+TRACE_REQUEST_HEADER = "x-debug-trace"
+TRACE_ID_HEADER = "X-Trace-Id"
+SERVER_TIMING_HEADER = "Server-Timing"
+
+
+class Span:
+    """단계 하나의 실행 구간"""
+
+    __slots__ = ("name", "attrs", "start", "end", "children", "db_queries", "db_seconds", "error")
+
+    def __init__(self, name: str, attrs: Optional[Dict[str, Any]] = None):
+        self.name = name
+        self.attrs = attrs or {}
+        self.start = time.perf_counter()
+        self.end: Optional[float] = None
+        self.children: List["Span"] = []
+        self.db_queries = 0
+        self.db_seconds = 0.0
+        self.error: Optional[str] = None
+
+    def finish(self) -> None:
+        if self.end is None:
+            self.end = time.perf_counter()
+
+    @property
+    def duration(self) -> float:
+        """실행 시간 (초, 진행 중이면 현재까지)"""
+        return (self.end if self.end is not None else time.perf_counter()) - self.start
+
+    def total_db_queries(self) -> int:
+        return self.db_queries + sum(c.total_db_queries() for c in self.children)
+
+    def total_db_seconds(self) -> float:
+        return self.db_seconds + sum(c.total_db_seconds() for c in self.children)
+
+    def set(self, **attrs: Any) -> None:
+        """실행 중에 알게 된 값(건수 등) 추가"""
+        self.attrs.update(attrs)
+
+    def to_dict(self, origin: float) -> Dict[str, Any]:
+        data = {
+            "name": self.name,
+            "start_ms": round((self.start - origin) * 1000, 3),
+            "duration_ms": round(self.duration * 1000, 3),
+            "db_queries": self.total_db_queries(),
+            "db_ms": round(self.total_db_seconds() * 1000, 3),
+        }
+        if self.attrs:
+            data["attrs"] = self.attrs
+        if self.error:
+            data["error"] = self.error
+        if self.children:
+            data["children"] = [c.to_dict(origin) for c in self.children]
+        return data
+
+
+class Trace:
+    """요청 하나의 span 트리"""
+
+    def __init__(self, name: str, attrs: Optional[Dict[str, Any]] = None):
+        self.trace_id = uuid.uuid4().hex[:16]
+        self.created_at = datetime.now().isoformat(timespec="milliseconds")
+        self.root = Span(name, attrs)
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "trace_id": self.trace_id,
+            "created_at": self.created_at,
+            "root": self.root.to_dict(self.root.start),
+        }
+
+    def server_timing(self, max_depth: int = SERVER_TIMING_DEPTH) -> str:
+        """Server-Timing 헤더 값 (브라우저 개발자도구 Timing 탭에 표시)"""
+        entries = [f'total;dur={self.root.duration * 1000:.1f}',
+                   f'db;dur={self.root.total_db_seconds() * 1000:.1f};desc="{self.root.total_db_queries()} queries"']
+
+        def walk(spans: List[Span], prefix: str, depth: int):
+            if depth > max_depth:
+                return
+            # 같은 이름의 형제 span(반복 호출되는 리포지토리 메서드 등)은 합쳐서 한 항목으로
+            groups: "OrderedDict[str, List[Span]]" = OrderedDict()
+            for child in spans:
+                groups.setdefault(child.name, []).append(child)
+            for child_name, group in groups.items():
+                name = f"{prefix}{_timing_token(child_name)}"
+                entry = f"{name};dur={sum(c.duration for c in group) * 1000:.1f}"
+                if len(group) > 1:
+                    entry += f';desc="x{len(group)}"'
+                entries.append(entry)
+                walk([gc for c in group for gc in c.children], f"{name}.", depth + 1)
+
+        walk(self.root.children, "", 1)
+        return ", ".join(entries)
+
+    def to_chrome_trace(self) -> Dict[str, Any]:
+        """Chrome trace event 형식 (chrome://tracing, ui.perfetto.dev 에서 열기)"""
+        events = []
+        origin = self.root.start
+
+        def walk(span: Span):
+            args = dict(span.attrs)
+            args["db_queries"] = span.db_queries
+            args["db_ms"] = round(span.db_seconds * 1000, 3)
+            if span.error:
+                args["error"] = span.error
+            events.append({
+                "name": span.name, "ph": "X", "pid": 1, "tid": 1,
+                "ts": round((span.start - origin) * 1e6, 1),
+                "dur": round(span.duration * 1e6, 1),
+                "args": args,
+            })
+            for child in span.children:
+                walk(child)
+
+        walk(self.root)
+        return {"traceEvents": events, "displayTimeUnit": "ms",
+                "otherData": {"trace_id": self.trace_id, "created_at": self.created_at}}
+
+
+def _timing_token(name: str) -> str:
+    # Server-Timing 메트릭 이름은 token 문자만 허용
+    return "".join(ch if ch.isalnum() or ch in "._-" else "_" for ch in name)
+
+
+_current_span: ContextVar[Optional[Span]] = ContextVar("materiality_current_span", default=None)
+
+
+def current_span() -> Optional[Span]:
+    return _current_span.get()
+
+
+@contextmanager
+def start_trace(name: str, **attrs: Any) -> Iterator[Trace]:
+    """요청 추적 시작 - 이 블록 안에서 만든 span이 모두 trace에 기록됨"""
+    trace = Trace(name, attrs)
+    token = _current_span.set(trace.root)
+    try:
+        yield trace
+    except BaseException as e:
+        trace.root.error = type(e).__name__
+        raise
+    finally:
+        trace.root.finish()
+        _current_span.reset(token)
+
+
+@contextmanager
+def span(name: str, **attrs: Any) -> Iterator[Span]:
+    """단계 측정 - 추적 중이면 현재 span의 자식으로 기록, 아니면 시간만 측정"""
+    parent = _current_span.get()
+    s = Span(name, attrs)
+    if parent is None:
+        try:
+            yield s
+        finally:
+            s.finish()
+        return
+    parent.children.append(s)
+    token = _current_span.set(s)
+    try:
+        yield s
+    except BaseException as e:
+        s.error = type(e).__name__
+        raise
+    finally:
+        s.finish()
+        _current_span.reset(token)
+
+
+def traced(name: Optional[str] = None) -> Callable:
+    """함수 전체를 span으로 측정하는 데코레이터 (동기/비동기 모두 지원)"""
+    def decorator(fn: Callable) -> Callable:
+        span_name = name or fn.__qualname__
+        if inspect.iscoroutinefunction(fn):
+            @functools.wraps(fn)
+            async def async_wrapper(*args, **kwargs):
+                if _current_span.get() is None:
+                    return await fn(*args, **kwargs)
+                with span(span_name):
+                    return await fn(*args, **kwargs)
+            return async_wrapper
+
+        @functools.wraps(fn)
+        def wrapper(*args, **kwargs):
+            if _current_span.get() is None:
+                return fn(*args, **kwargs)
+            with span(span_name):
+                return fn(*args, **kwargs)
+        return wrapper
+    return decorator
+
+
+# ──────────────────────────────────────────────────────────────────────────────
+# DB 쿼리 수/시간 기록
+# ──────────────────────────────────────────────────────────────────────────────
+
+def _before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    if context is not None:
+        context._trace_started = time.perf_counter()
+
+
+def _after_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    current = _current_span.get()
+    if current is None:
+        return
+    current.db_queries += 1
+    started = getattr(context, "_trace_started", None)
+    if started is not None:
+        current.db_seconds += time.perf_counter() - started
+
+
+def instrument_engine(engine) -> None:
+    """비동기 엔진에 쿼리 카운터 연결 (SQLAlchemy가 greenlet으로 contextvar를 넘겨주므로 현재 span에 기록됨)"""
+    from sqlalchemy import event
+
+    sync_engine = getattr(engine, "sync_engine", engine)
+    event.listen(sync_engine, "before_cursor_execute", _before_cursor_execute)
+    event.listen(sync_engine, "after_cursor_execute", _after_cursor_execute)
+
+
+# ──────────────────────────────────────────────────────────────────────────────
+# 요청 추적 보관 / 내보내기
+# ──────────────────────────────────────────────────────────────────────────────
+
+_recent_traces: "OrderedDict[str, Trace]" = OrderedDict()
+
+
+def should_trace(headers) -> bool:
+    if not TRACE_ENABLED:
+        return False
+    return TRACE_ALL_REQUESTS or (headers.get(TRACE_REQUEST_HEADER) or "").lower() in ("1", "true", "yes")
+
+
+def store_trace(trace: Trace) -> None:
+    """최근 추적 보관 + (설정 시) 파일로 내보내기"""
+    _recent_traces[trace.trace_id] = trace
+    while len(_recent_traces) > TRACE_KEEP:
+        _recent_traces.popitem(last=False)
+    if TRACE_EXPORT_DIR:
+        try:
+            export_trace(trace, os.path.join(TRACE_EXPORT_DIR, f"{trace.trace_id}.json"))
+        except Exception as e:
+            logger.warning(f"⚠️ 추적 파일 저장 실패: {e}")
+
+
+def get_trace(trace_id: str) -> Optional[Trace]:
+    return _recent_traces.get(trace_id)
+
+
+def list_traces() -> List[Dict[str, Any]]:
+    return [
+        {
+            "trace_id": t.trace_id,
+            "created_at": t.created_at,
+            "name": t.root.name,
+            "duration_ms": round(t.root.duration * 1000, 1),
+            "db_queries": t.root.total_db_queries(),
+        }
+        for t in reversed(_recent_traces.values())
+    ]
+
+
+def export_trace(trace: Trace, path: str) -> str:
+    """Chrome trace 형식 + span 트리를 JSON 파일로 저장"""
+    os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+    data = trace.to_chrome_trace()
+    data["otherData"]["spans"] = trace.to_dict()["root"]
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(data, f, ensure_ascii=False, default=str)
+    return path
@@ -2,107 +2,145 @@
 Category Repository - BaseModel을 받아서 데이터베이스 작업을 수행하는 계층
 데이터베이스 연결을 담당하며, BaseModel과 Entity 간의 변환을 처리
 """
-from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy import select, text
-from app.common.database.issuepool_db import get_db
+from app.common.database.unit_of_work import UnitOfWork, session_scope
+from typing import Optional, List, Dict, Any, Tuple
 import logging
 
 logger = logging.getLogger(__name__)
 
+# 프로젝션 가능한 카테고리 필드
+CATEGORY_FIELDS = ("id", "category_name", "esg_classification", "base_issue_pools")
+
 class CategoryRepository:
     """카테고리 리포지토리 - 데이터베이스에서 카테고리 정보 조회"""
-    
-    def __init__(self):
-        pass
-    
-    async def get_all_categories(self, include_base_issue_pools: bool = True, 
+
+    def __init__(self, uow: Optional[UnitOfWork] = None):
+        # 요청 단위 세션 (없으면 호출마다 새 세션)
+        self.uow = uow
+
+    async def get_all_categories(self, include_base_issue_pools: bool = True,
                                 include_esg_classification: bool = True,
                                 limit: int = None, offset: int = None):
         """모든 카테고리 정보 조회 - ESG 분류와 base issue pool 정보 포함"""
+        categories, _ = await self.get_category_tree(
+            include_base_issue_pools=include_base_issue_pools,
+            include_esg_classification=include_esg_classification,
+            limit=limit,
+            offset=offset
+        )
+        return categories
+
+    async def get_category_tree(
+        self,
+        include_base_issue_pools: bool = True,
+        include_esg_classification: bool = True,
+        limit: Optional[int] = None,
+        offset: Optional[int] = None,
+        cursor: Optional[int] = None,
+        fields: Optional[List[str]] = None,
+    ) -> Tuple[List[Dict[str, Any]], Optional[int]]:
+        """
+        카테고리 + ESG 분류 + base issue pool 트리를 쿼리 1회로 조회
+
+        Args:
+            cursor: 키셋 페이지네이션 커서 (이전 페이지 마지막 카테고리 ID, 이 ID 초과부터 조회)
+            fields: 반환할 필드 목록 (None이면 전체, 예: ["category_name"])
+
+        Returns:
+            (카테고리 목록, 다음 페이지 커서 - 마지막 페이지면 None)
+        """
         try:
-            logger.info("🔍 리포지토리: 모든 카테고리 정보 조회")
-            
-            # 데이터베이스 연결
-            async for db in get_db():
-                # 기본 카테고리 조회 쿼리
-                base_query = """
-                    SELECT 
-                        mc.id,
-                        mc.category_name,
-                        ec.id as esg_id,
-                        ec.esg as esg_name
-                    FROM materiality_category mc
-                    LEFT JOIN esg_classification ec ON mc.esg_classification_id = ec.id
-                    ORDER BY mc.id
-                """
-                
-                # LIMIT과 OFFSET 적용
-                if limit:
-                    base_query += f" LIMIT {limit}"
-                if offset:
-                    base_query += f" OFFSET {offset}"
-                
-                # 카테고리 기본 정보 조회
-                result = await db.execute(text(base_query))
-                categories_data = result.fetchall()
-                
-                logger.info(f"✅ 리포지토리: {len(categories_data)}개 카테고리 기본 정보 조회 완료")
-                
-                # 각 카테고리에 대해 base issue pool 정보 조회
-                categories = []
-                for cat_data in categories_data:
-                    category = {
-                        "id": cat_data.id,
-                        "category_name": cat_data.category_name,
-                        "esg_classification": {
-                            "id": cat_data.esg_id,
-                            "esg": cat_data.esg_name
-                        } if cat_data.esg_id and include_esg_classification else None
-                    }
-                    
-                    # Base issue pool 정보 조회 (요청된 경우에만)
-                    if include_base_issue_pools:
-                        base_issue_pools = await self._get_base_issue_pools(db, cat_data.id)
-                        category["base_issue_pools"] = base_issue_pools
-                    
-                    categories.append(category)
-                
-                logger.info(f"✅ 리포지토리: 모든 카테고리 정보 조회 완료 - {len(categories)}개 카테고리")
-                return categories
-                    
+            logger.info("🔍 리포지토리: 카테고리 트리 조회")
+
+            selected = set(fields) if fields else set(CATEGORY_FIELDS)
+            with_esg = include_esg_classification and "esg_classification" in selected
+            with_pools = include_base_issue_pools and "base_issue_pools" in selected
+
+            # 페이지 범위는 카테고리 기준 서브쿼리에서 자르고, 이슈풀은 같은 쿼리에서 JOIN
+            # (SQL 조각은 고정 문자열만 사용, 값은 모두 바인드 파라미터)
+            params: Dict[str, Any] = {}
+            page_where = ""
+            if cursor is not None:
+                page_where = "WHERE id > :cursor"
+                params["cursor"] = cursor
+            page_limit = ""
+            if limit:
+                page_limit += " LIMIT :limit"
+                params["limit"] = limit
+            if offset:
+                page_limit += " OFFSET :offset"
+                params["offset"] = offset
+
+            esg_columns = """,
+                    ec.id AS esg_id,
+                    ec.esg AS esg_name""" if with_esg else ""
+            esg_join = "LEFT JOIN esg_classification ec ON mc.esg_classification_id = ec.id" if with_esg else ""
+
+            pool_columns = """,
+                    ip.id AS pool_id,
+                    ip.base_issue_pool,
+                    ip.issue_pool,
+                    ip.ranking,
+                    ip.publish_year""" if with_pools else ""
+            pool_join = "LEFT JOIN issuepool ip ON ip.category_id = mc.id" if with_pools else ""
+            pool_order = ", ip.ranking, ip.id" if with_pools else ""
+
+            query = f"""
+                SELECT
+                    mc.id,
+                    mc.category_name{esg_columns}{pool_columns}
+                FROM (
+                    SELECT id, category_name, esg_classification_id
+                    FROM materiality_category
+                    {page_where}
+                    ORDER BY id{page_limit}
+                ) mc
+                {esg_join}
+                {pool_join}
+                ORDER BY mc.id{pool_order}
+            """
+
+            async with session_scope(self.uow) as db:
+                result = await db.execute(text(query), params)
+                rows = result.fetchall()
+
+            # 카테고리 ID 기준으로 묶기 (정렬되어 있으므로 한 번 순회)
+            categories: List[Dict[str, Any]] = []
+            last_id = None
+            current: Optional[Dict[str, Any]] = None
+            for row in rows:
+                if row.id != last_id:
+                    last_id = row.id
+                    current = {}
+                    if "id" in selected:
+                        current["id"] = row.id
+                    if "category_name" in selected:
+                        current["category_name"] = row.category_name
+                    if "esg_classification" in selected:
+                        current["esg_classification"] = {
+                            "id": row.esg_id,
+                            "esg": row.esg_name
+                        } if with_esg and row.esg_id else None
+                    if with_pools:
+                        current["base_issue_pools"] = []
+                    categories.append(current)
+
+                if with_pools and row.pool_id is not None:
+                    current["base_issue_pools"].append({
+                        "id": row.pool_id,
+                        "base_issue_pool": row.base_issue_pool,
+                        "issue_pool": row.issue_pool,
+                        "ranking": row.ranking,
+                        "publish_year": row.publish_year
+                    })
+
+            # 페이지가 가득 찼으면 다음 페이지가 있을 수 있음
+            next_cursor = last_id if limit and len(categories) == limit else None
+
+            logger.info(f"✅ 리포지토리: 카테고리 트리 조회 완료 - {len(categories)}개 카테고리 (next_cursor={next_cursor})")
+            return categories, next_cursor
+
         except Exception as e:
             logger.error(f"❌ 리포지토리: 모든 카테고리 정보 조회 중 오류 - {str(e)}")
             raise
-    
-    async def _get_base_issue_pools(self, db: AsyncSession, category_id: int):
-        """특정 카테고리의 base issue pool 정보 조회"""
-        try:
-            query = """
-                SELECT 
-                    id,
-                    base_issue_pool,
-                    issue_pool,
-                    ranking,
-                    publish_year
-                FROM issuepool 
-                WHERE category_id = :category_id
-                ORDER BY ranking, id
-            """
-            
-            result = await db.execute(text(query), {"category_id": category_id})
-            base_issue_pools = result.fetchall()
-            
-            return [
-                {
-                    "id": item.id,
-                    "base_issue_pool": item.base_issue_pool,
-                    "issue_pool": item.issue_pool,
-                    "ranking": item.ranking,
-                    "publish_year": item.publish_year
-                }
-                for item in base_issue_pools
-            ]
-            
-        except Exception as e:
-            logger.error(f"❌ 리포지토리: base issue pool 조회 중 오류 - {str(e)}")
-            return []
@@ -10,6 +10,8 @@ class CategoryRequest(BaseModel):
     include_esg_classification: bool = True
     limit: Optional[int] = None
     offset: Optional[int] = None
+    cursor: Optional[int] = None  # 키셋 페이지네이션 - 이전 응답의 next_cursor
+    fields: Optional[List[str]] = None  # 필드 프로젝션 - 예: ["category_name"]
 
 class BaseIssuePool(BaseModel):
     """Base Issue Pool 모델"""
@@ -25,9 +27,9 @@ class ESGClassification(BaseModel):
     esg: str
 
 class Category(BaseModel):
-    """카테고리 모델"""
-    id: int
-    category_name: str
+    """카테고리 모델 (fields 프로젝션 시 요청한 필드만 포함)"""
+    id: Optional[int] = None
+    category_name: Optional[str] = None
     esg_classification: Optional[ESGClassification] = None
     base_issue_pools: Optional[List[BaseIssuePool]] = None
 
@@ -37,3 +39,4 @@ class CategoryResponse(BaseModel):
     message: str
     categories: List[Category]
     total_count: int
+    next_cursor: Optional[int] = None
@@ -3,7 +3,9 @@ Category Service - 카테고리 관련 모든 서비스 통합
 BaseModel을 받아서 Repository로 전달하는 중간 계층
 """
 import logging
+from typing import Optional
 from app.domain.category.repository import CategoryRepository
+from app.common.database.unit_of_work import UnitOfWork
 from app.domain.category.schema import CategoryRequest
 
 logger = logging.getLogger("category_service")
@@ -14,17 +16,23 @@ class CategoryService:
     def __init__(self):
         self.category_repository = CategoryRepository()
     
-    async def get_all_categories(self, request: CategoryRequest) -> dict:
+    def _get_repository(self, uow: Optional[UnitOfWork] = None) -> CategoryRepository:
+        """요청 단위 세션이 있으면 해당 세션을 쓰는 리포지토리 반환"""
+        return CategoryRepository(uow) if uow is not None else self.category_repository
+    
+    async def get_all_categories(self, request: CategoryRequest, uow: Optional[UnitOfWork] = None) -> dict:
         """전체 카테고리 목록 조회 - Repository를 통해 데이터베이스에서 가져옴"""
         try:
             logger.info("🔍 서비스: 전체 카테고리 목록 조회 요청을 Repository로 전달")
             
             # Repository를 통해 모든 카테고리 정보 조회 (데이터베이스 연결 없음)
-            categories = await self.category_repository.get_all_categories(
+            categories, next_cursor = await self._get_repository(uow).get_category_tree(
                 include_base_issue_pools=request.include_base_issue_pools,
                 include_esg_classification=request.include_esg_classification,
                 limit=request.limit,
-                offset=request.offset
+                offset=request.offset,
+                cursor=request.cursor,
+                fields=request.fields
             )
             
             if categories:
@@ -33,7 +41,8 @@ class CategoryService:
                     "success": True,
                     "message": f"{len(categories)}개 카테고리를 찾았습니다.",
                     "categories": categories,
-                    "total_count": len(categories)
+                    "total_count": len(categories),
+                    "next_cursor": next_cursor
                 }
             else:
                 logger.info("❌ 서비스: 카테고리 목록이 비어있음")
@@ -41,7 +50,8 @@ class CategoryService:
                     "success": False,
                     "message": "등록된 카테고리가 없습니다.",
                     "categories": [],
-                    "total_count": 0
+                    "total_count": 0,
+                    "next_cursor": None
                 }
                 
         except Exception as e:
@@ -5,18 +5,20 @@ import logging
 from typing import Dict, Any, Optional
 from app.domain.issuepool.schema import IssuePoolListRequest
 from app.domain.issuepool.service import issuepool_service
+from app.common.database.unit_of_work import UnitOfWork
 
 logger = logging.getLogger(__name__)
 
 class IssuePoolController:
     """이슈풀 컨트롤러"""
     
-    async def get_issuepool_list(self, request: IssuePoolListRequest) -> Dict[str, Any]:
+    async def get_issuepool_list(self, request: IssuePoolListRequest, uow: Optional[UnitOfWork] = None) -> Dict[str, Any]:
         """
         지난 중대성 평가 목록 조회
         
         Args:
             request: 이슈풀 목록 조회 요청
+            uow: 요청 단위 세션
             
         Returns:
             Dict[str, Any]: 응답 데이터
@@ -25,7 +27,7 @@ class IssuePoolController:
             logger.info(f"📊 컨트롤러: 이슈풀 목록 조회 시작 - 기업: {request.company_id}")
             
             # 서비스 계층으로 요청 전달
-            result = await issuepool_service.get_issuepool_list(request)
+            result = await issuepool_service.get_issuepool_list(request, uow)
             
             logger.info(f"✅ 컨트롤러: 이슈풀 목록 조회 완료 - {result.get('data', {}).get('total_count', 0)}개 항목")
             return result
@@ -37,12 +39,13 @@ class IssuePoolController:
                 "message": f"이슈풀 목록 조회 중 오류가 발생했습니다: {str(e)}"
             }
     
-    async def get_issuepool_by_id(self, issuepool_id: int) -> Dict[str, Any]:
+    async def get_issuepool_by_id(self, issuepool_id: int, uow: Optional[UnitOfWork] = None) -> Dict[str, Any]:
         """
         특정 이슈풀 조회
         
         Args:
             issuepool_id: 이슈풀 ID
+            uow: 요청 단위 세션
             
         Returns:
             Dict[str, Any]: 응답 데이터
@@ -51,7 +54,7 @@ class IssuePoolController:
             logger.info(f"🔍 컨트롤러: 이슈풀 ID 조회 시작 - ID: {issuepool_id}")
             
             # 서비스 계층으로 요청 전달
-            result = await issuepool_service.get_issuepool_by_id(issuepool_id)
+            result = await issuepool_service.get_issuepool_by_id(issuepool_id, uow)
             
             logger.info(f"✅ 컨트롤러: 이슈풀 ID 조회 완료 - ID: {issuepool_id}")
             return result
@@ -66,7 +69,8 @@ class IssuePoolController:
     async def get_issuepools_by_corporation(
         self, 
         corporation_name: str, 
-        publish_year: Optional[int] = None
+        publish_year: Optional[int] = None,
+        uow: Optional[UnitOfWork] = None
     ) -> Dict[str, Any]:
         """
         기업별 이슈풀 목록 조회
@@ -74,6 +78,7 @@ class IssuePoolController:
         Args:
             corporation_name: 기업명
             publish_year: 발행년도 (선택적)
+            uow: 요청 단위 세션
             
         Returns:
             Dict[str, Any]: 응답 데이터
@@ -84,7 +89,8 @@ class IssuePoolController:
             # 서비스 계층으로 요청 전달
             result = await issuepool_service.get_issuepools_by_corporation(
                 corporation_name=corporation_name,
-                publish_year=publish_year
+                publish_year=publish_year,
+                uow=uow
             )
             
             logger.info(f"✅ 컨트롤러: 기업별 이슈풀 조회 완료 - 기업: {corporation_name}")
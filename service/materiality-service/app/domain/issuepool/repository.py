@@ -6,7 +6,8 @@ from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy import select, text, bindparam, Integer, String
 from app.domain.issuepool.schema import IssuePoolResponse
 from app.domain.issuepool.entity import IssuePoolEntity
-from app.common.database.issuepool_db import get_db
+from app.common.database.unit_of_work import UnitOfWork, session_scope
+from typing import Optional, List, Dict, Iterable
 import logging
 
 logger = logging.getLogger(__name__)
@@ -26,8 +27,9 @@ def get_esg_classification_name(esg_id: int) -> str:
 class IssuePoolRepository:
     """이슈풀 리포지토리 - 이슈풀 관련 데이터베이스 작업"""
     
-    def __init__(self):
-        pass
+    def __init__(self, uow: Optional[UnitOfWork] = None):
+        # 요청 단위 세션 (없으면 호출마다 새 세션)
+        self.uow = uow
     
     def _to_int(self, name: str, value) -> int:
         """값을 정수로 강제 캐스팅"""
@@ -42,7 +44,7 @@ class IssuePoolRepository:
             logger.info("🔍 리포지토리: 모든 이슈풀 조회")
             
             # 데이터베이스 연결
-            async for db in get_db():
+            async with session_scope(self.uow) as db:
                 query = text("""
                     SELECT id, corporation_id, publish_year, ranking, 
                            base_issue_pool, issue_pool, category_id, esg_classification_id
@@ -83,7 +85,7 @@ class IssuePoolRepository:
             logger.info(f"🔍 리포지토리: 기업명으로 이슈풀 조회 - corporation_name: {corporation_name}, publish_year: {publish_year}")
             
             # 데이터베이스 연결
-            async for db in get_db():
+            async with session_scope(self.uow) as db:
                 # 1단계: 기업명으로 corporation_id 조회
                 corp_query = text("SELECT id FROM corporation WHERE companyname = :companyname")
                 corp_result = await db.execute(corp_query, {"companyname": corporation_name})
@@ -154,6 +156,65 @@ class IssuePoolRepository:
             logger.error(f"❌ 리포지토리: 기업별 이슈풀 조회 중 오류 - {str(e)}")
             raise
     
+    async def get_issuepools_by_corporation_years(
+        self,
+        corporation_name: str,
+        publish_years: Iterable[int]
+    ) -> Dict[int, List[IssuePoolResponse]]:
+        """
+        기업명 + 여러 발행년도 이슈풀을 쿼리 1회로 조회
+        기업 조회는 JOIN으로, ranking 숫자 정렬은 SQL에서 처리
+        
+        Returns:
+            {발행년도: 이슈풀 리스트} (요청한 연도는 데이터가 없어도 빈 리스트로 포함)
+        """
+        try:
+            years = sorted({self._to_int("publish_year", y) for y in publish_years})
+            logger.info(f"🔍 리포지토리: 기업 다년도 이슈풀 조회 - corporation_name: {corporation_name}, publish_years: {years}")
+            
+            grouped: Dict[int, List[IssuePoolResponse]] = {year: [] for year in years}
+            if not years:
+                return grouped
+            
+            async with session_scope(self.uow) as db:
+                query = text("""
+                    SELECT ip.id, ip.corporation_id, ip.publish_year, ip.ranking, 
+                           ip.base_issue_pool, ip.issue_pool, ip.category_id, ip.esg_classification_id
+                    FROM issuepool ip
+                    JOIN corporation c ON c.id = ip.corporation_id
+                    WHERE c.companyname = :companyname
+                    AND ip.publish_year IN :pub_years
+                    ORDER BY ip.publish_year, CAST(ip.ranking AS INTEGER), ip.id
+                """).bindparams(
+                    bindparam("companyname", type_=String),
+                    bindparam("pub_years", type_=String, expanding=True)  # publish_year는 TEXT로 비교
+                )
+                result = await db.execute(query, {
+                    "companyname": corporation_name,
+                    "pub_years": [str(y) for y in years]
+                })
+                rows = result.fetchall()
+                
+                for row in rows:
+                    grouped[int(row[2])].append(IssuePoolResponse(
+                        id=row[0],
+                        corporation_id=row[1],
+                        publish_year=row[2],
+                        ranking=row[3],
+                        base_issue_pool=row[4],
+                        issue_pool=row[5],
+                        category_id=row[6],
+                        esg_classification_id=row[7],
+                        esg_classification_name=get_esg_classification_name(row[7])
+                    ))
+                
+                logger.info(f"✅ 리포지토리: 기업 다년도 이슈풀 조회 완료 - {len(rows)}개 이슈풀")
+                return grouped
+                    
+        except Exception as e:
+            logger.error(f"❌ 리포지토리: 기업 다년도 이슈풀 조회 중 오류 - {str(e)}")
+            raise
+    
     async def get_issuepools_by_year(self, publish_year: int):
         """연도별 이슈풀 조회 - BaseModel 리스트 반환"""
         try:
@@ -163,7 +224,7 @@ class IssuePoolRepository:
             pub_year_str = str(self._to_int("publish_year", publish_year))
             
             # 데이터베이스 연결
-            async for db in get_db():
+            async with session_scope(self.uow) as db:
                 query = text("""
                     SELECT id, corporation_id, publish_year, ranking, 
                            base_issue_pool, issue_pool, category_id, esg_classification_id
@@ -210,7 +271,7 @@ class IssuePoolRepository:
             id_int = self._to_int("issuepool_id", issuepool_id)
             
             # 데이터베이스 연결
-            async for db in get_db():
+            async with session_scope(self.uow) as db:
                 query = text("""
                     SELECT id, corporation_id, publish_year, ranking, 
                            base_issue_pool, issue_pool, category_id, esg_classification_id
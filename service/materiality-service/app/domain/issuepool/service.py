@@ -2,24 +2,73 @@
 Issue Pool Service - 비즈니스 로직 및 데이터 처리
 """
 import logging
-from typing import Dict, Any, Optional
-from app.domain.issuepool.schema import IssuePoolListRequest
+import os
+import time
+from typing import Dict, Any, Optional, List, Tuple
+from app.domain.issuepool.schema import IssuePoolListRequest, IssuePoolResponse
 from app.domain.issuepool.repository import IssuePoolRepository
+from app.domain.middleissue.reference_data import reference_data_store
+from app.common.database.unit_of_work import UnitOfWork
 
 logger = logging.getLogger(__name__)
 
+# (기업명, 연도들) 단위 이슈풀 캐시 설정
+ISSUEPOOL_CACHE_TTL = float(os.getenv("ISSUEPOOL_CACHE_TTL", "600"))
+ISSUEPOOL_CACHE_MAX_ENTRIES = int(os.getenv("ISSUEPOOL_CACHE_MAX_ENTRIES", "256"))
+
 class IssuePoolService:
     """이슈풀 서비스"""
     
     def __init__(self):
         self.repository = IssuePoolRepository()
+        # {(기업명, 연도 튜플): (기준 데이터 버전, 만료 시각, {연도: 이슈풀 리스트})}
+        self._year_cache: Dict[Tuple[str, Tuple[int, ...]], Tuple[Optional[str], float, Dict[int, List[IssuePoolResponse]]]] = {}
+    
+    def _get_repository(self, uow: Optional[UnitOfWork] = None) -> IssuePoolRepository:
+        """요청 단위 세션이 있으면 해당 세션을 쓰는 리포지토리 반환"""
+        return IssuePoolRepository(uow) if uow is not None else self.repository
     
-    async def get_issuepool_list(self, request: IssuePoolListRequest) -> Dict[str, Any]:
+    async def _get_issuepools_by_years(
+        self,
+        corporation_name: str,
+        years: List[int],
+        uow: Optional[UnitOfWork] = None
+    ) -> Dict[int, List[IssuePoolResponse]]:
+        """
+        기업 다년도 이슈풀 조회 (캐시 우선)
+        issuepool 데이터가 바뀌면 기준 데이터 스냅샷 버전이 바뀌므로 버전 불일치 시 다시 조회
+        """
+        key = (corporation_name, tuple(sorted(set(years))))
+        snapshot = reference_data_store.snapshot
+        version = snapshot.version if snapshot is not None else None
+        now = time.monotonic()
+        
+        cached = self._year_cache.get(key)
+        if cached is not None:
+            cached_version, expires_at, data = cached
+            if cached_version == version and expires_at > now:
+                logger.info(f"✅ 서비스: 이슈풀 캐시 적중 - {key}")
+                return data
+        
+        data = await self._get_repository(uow).get_issuepools_by_corporation_years(
+            corporation_name=corporation_name,
+            publish_years=key[1]
+        )
+        
+        # 가장 오래된 항목부터 제거 (dict 삽입 순서)
+        self._year_cache.pop(key, None)
+        while len(self._year_cache) >= ISSUEPOOL_CACHE_MAX_ENTRIES:
+            self._year_cache.pop(next(iter(self._year_cache)))
+        self._year_cache[key] = (version, now + ISSUEPOOL_CACHE_TTL, data)
+        return data
+    
+    async def get_issuepool_list(self, request: IssuePoolListRequest, uow: Optional[UnitOfWork] = None) -> Dict[str, Any]:
         """
         지난 중대성 평가 목록 조회
         
         Args:
             request: 이슈풀 목록 조회 요청
+            uow: 요청 단위 세션
             
         Returns:
             Dict[str, Any]: 응답 데이터
@@ -43,21 +92,14 @@ class IssuePoolService:
             logger.info(f"🔍 서비스: 기업명: {request.company_id}, 기준연도: {base_year}")
             logger.info(f"🔍 서비스: year-2년: {year_minus_2}, year-1년: {year_minus_1}")
             
-            # year-2년 데이터 조회 (첫 번째 섹션)
-            issuepools_year_minus_2 = await self.repository.get_issuepools_by_corporation(
-                corporation_name=request.company_id,  # 기업명으로 검색
-                publish_year=year_minus_2
-            )
-            
-            # year-1년 데이터 조회 (두 번째 섹션)
-            issuepools_year_minus_1 = await self.repository.get_issuepools_by_corporation(
+            # year-2년, year-1년 데이터를 한 번에 조회 (ranking 숫자 정렬은 SQL에서 처리)
+            issuepools_by_year = await self._get_issuepools_by_years(
                 corporation_name=request.company_id,  # 기업명으로 검색
-                publish_year=year_minus_1
+                years=[year_minus_2, year_minus_1],
+                uow=uow
             )
-            
-            # ranking 순서대로 정렬
-            sorted_issuepools_year_minus_2 = sorted(issuepools_year_minus_2, key=lambda x: x.ranking)
-            sorted_issuepools_year_minus_1 = sorted(issuepools_year_minus_1, key=lambda x: x.ranking)
+            sorted_issuepools_year_minus_2 = issuepools_by_year.get(year_minus_2, [])  # 첫 번째 섹션
+            sorted_issuepools_year_minus_1 = issuepools_by_year.get(year_minus_1, [])  # 두 번째 섹션
             
             # ESG 분포 계산 함수
             def calculate_esg_distribution(issuepools):
@@ -150,12 +192,13 @@ class IssuePoolService:
                 "message": f"이슈풀 목록 조회 중 오류가 발생했습니다: {str(e)}"
             }
     
-    async def get_issuepool_by_id(self, issuepool_id: int) -> Dict[str, Any]:
+    async def get_issuepool_by_id(self, issuepool_id: int, uow: Optional[UnitOfWork] = None) -> Dict[str, Any]:
         """
         특정 이슈풀 조회
         
         Args:
             issuepool_id: 이슈풀 ID
+            uow: 요청 단위 세션
             
         Returns:
             Dict[str, Any]: 응답 데이터
@@ -163,7 +206,7 @@ class IssuePoolService:
         try:
             logger.info(f"🔍 서비스: 이슈풀 ID 조회 시작 - ID: {issuepool_id}")
             
-            issuepool = await self.repository.find_issuepool_by_id(issuepool_id)
+            issuepool = await self._get_repository(uow).find_issuepool_by_id(issuepool_id)
             
             if not issuepool:
                 return {
@@ -200,7 +243,8 @@ class IssuePoolService:
     async def get_issuepools_by_corporation(
         self, 
         corporation_name: str, 
-        publish_year: Optional[int] = None
+        publish_year: Optional[int] = None,
+        uow: Optional[UnitOfWork] = None
     ) -> Dict[str, Any]:
         """
         기업별 이슈풀 목록 조회
@@ -208,6 +252,7 @@ class IssuePoolService:
         Args:
             corporation_name: 기업명
             publish_year: 발행년도 (선택적)
+            uow: 요청 단위 세션
             
         Returns:
             Dict[str, Any]: 응답 데이터
@@ -215,8 +260,8 @@ class IssuePoolService:
         try:
             logger.info(f"🔍 서비스: 기업별 이슈풀 조회 시작 - 기업: {corporation_name}, 연도: {publish_year}")
             
-            issuepools = await self.repository.get_issuepools_by_corporation(
-                corporation_id=corporation_name,
+            issuepools = await self._get_repository(uow).get_issuepools_by_corporation(
+                corporation_name=corporation_name,
                 publish_year=publish_year
             )
             
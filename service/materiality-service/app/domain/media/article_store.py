@@ -0,0 +1,81 @@
+"""
+Article Result Store - 미디어 검색 결과(정규화된 기사 목록)를 서버 메모리에 result_id로 보관 (TTL)
+프론트가 기사 전체를 /middleissue/assessment로 다시 올리는 대신 result_id만 보내도록 하기 위함
+(브라우저 ↔ gateway ↔ 서비스 왕복 전송과 기사별 pydantic 검증 제거)
+
+기사는 평가에 필요한 필드만 필드별 리스트(컬럼)로 저장 → 객체 수가 적어 메모리/평가 워커 전송 모두 가벼움
+"""
+import logging
+import os
+import time
+import uuid
+from collections import OrderedDict
+from datetime import datetime, timedelta
+from typing import Any, Dict, List, Optional
+
+logger = logging.getLogger("materiality.article_store")
+
+ARTICLE_RESULT_TTL_SECONDS = int(os.getenv("ARTICLE_RESULT_TTL_SECONDS", "3600"))
+# 보관 개수 상한 (초과 시 오래된 결과부터 삭제)
+ARTICLE_RESULT_MAX_ENTRIES = int(os.getenv("ARTICLE_RESULT_MAX_ENTRIES", "50"))
+
+# 평가(analyze_sentiment / 라벨 / 점수)에 쓰는 Article 필드
+ARTICLE_FIELDS = ("title", "description", "original_category", "issue", "pubDate", "originallink", "company")
+
+
+def normalize_columns(items: List[Dict[str, Any]], company_id: str) -> Dict[str, List[Any]]:
+    """검색 결과 dict 목록 → 필드별 리스트 (프론트가 Article로 보내던 것과 같은 기본값 적용)"""
+    columns: Dict[str, List[Any]] = {field: [] for field in ARTICLE_FIELDS}
+    for it in items:
+        for field in ARTICLE_FIELDS:
+            value = it.get(field) or ""
+            if field == "company" and not value:
+                value = company_id
+            columns[field].append(str(value))
+    return columns
+
+
+class ArticleResultStore:
+    """result_id → 기사 컬럼 (프로세스 메모리, TTL + 개수 상한)"""
+
+    def __init__(self, ttl_seconds: int = ARTICLE_RESULT_TTL_SECONDS, max_entries: int = ARTICLE_RESULT_MAX_ENTRIES):
+        self.ttl_seconds = ttl_seconds
+        self.max_entries = max_entries
+        self._entries: "OrderedDict[str, Dict[str, Any]]" = OrderedDict()
+
+    def _purge(self) -> None:
+        now = time.monotonic()
+        expired = [rid for rid, e in self._entries.items() if e["expires"] <= now]
+        for rid in expired:
+            del self._entries[rid]
+        while len(self._entries) > self.max_entries:
+            rid, _ = self._entries.popitem(last=False)
+            logger.info(f"🧹 검색 결과 보관 개수 초과로 삭제: {rid}")
+
+    def put(self, company_id: str, search_period: Dict[str, Any], items: List[Dict[str, Any]]) -> Dict[str, Any]:
+        """검색 결과 저장 → {"result_id", "expires_at"}"""
+        result_id = uuid.uuid4().hex
+        columns = normalize_columns(items, company_id)
+        self._entries[result_id] = {
+            "company_id": company_id,
+            "search_period": search_period,
+            "columns": columns,
+            "count": len(items),
+            "expires": time.monotonic() + self.ttl_seconds,
+        }
+        self._purge()
+        expires_at = (datetime.now() + timedelta(seconds=self.ttl_seconds)).isoformat(timespec="seconds")
+        logger.info(f"✅ 검색 결과 저장: {result_id} ({len(items)}건, 만료 {expires_at})")
+        return {"result_id": result_id, "expires_at": expires_at}
+
+    def get(self, result_id: str) -> Optional[Dict[str, Any]]:
+        """저장된 결과 (없거나 만료면 None)"""
+        self._purge()
+        return self._entries.get(result_id)
+
+    def delete(self, result_id: str) -> bool:
+        return self._entries.pop(result_id, None) is not None
+
+
+# 싱글톤
+article_result_store = ArticleResultStore()
@@ -3,7 +3,9 @@ Media Controller - MVC 구조에서 BaseModel을 MediaService로 전달하는 
 데이터베이스 연결은 하지 않고, Service를 거쳐 Repository까지 BaseModel을 전달
 """
 import logging
+from typing import Optional
 from app.domain.media.service import search_media
+from app.common.database.unit_of_work import UnitOfWork
 
 logger = logging.getLogger(__name__)
 
@@ -13,18 +15,19 @@ class MediaController:
     def __init__(self):
         pass
     
-    async def search_media(self, search_data: dict):
+    async def search_media(self, search_data: dict, uow: Optional[UnitOfWork] = None):
         """
         미디어 검색 요청을 MediaService로 전달
         
         Args:
             search_data: 미디어 검색 요청 데이터 딕셔너리
+            uow: 요청 단위 세션
         """
         try:
             logger.info(f"🔍 컨트롤러: 미디어 검색 요청을 Service로 전달 - {search_data.get('company_id', 'Unknown')}")
             
             # 딕셔너리를 Service로 전달 (데이터베이스 연결 없음)
-            result = await search_media(search_data)
+            result = await search_media(search_data, uow)
             
             logger.info(f"✅ 컨트롤러: Service 응답 수신 - {result.get('success', False)}")
             return result
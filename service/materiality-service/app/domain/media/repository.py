@@ -6,7 +6,9 @@ from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy import select
 from app.domain.media.schema import MaterialityCategoryRequest
 from app.domain.media.entity import MaterialityCategoryEntity
-from app.common.database.materiality_category_db import get_db
+from app.common.database.unit_of_work import UnitOfWork, session_scope
+from app.common.tracing import traced
+from typing import Optional
 import logging
 
 logger = logging.getLogger(__name__)
@@ -14,16 +16,18 @@ logger = logging.getLogger(__name__)
 class MediaRepository:
     """미디어 리포지토리 - 중대성 카테고리 관련 데이터베이스 작업"""
     
-    def __init__(self):
-        pass
+    def __init__(self, uow: Optional[UnitOfWork] = None):
+        # 요청 단위 세션 (없으면 호출마다 새 세션)
+        self.uow = uow
     
+    @traced()
     async def get_all_materiality_categories(self):
         """모든 중대성 카테고리 조회 - BaseModel 리스트 반환"""
         try:
             logger.info("🔍 리포지토리: 모든 중대성 카테고리 조회")
             
             # 데이터베이스 연결
-            async for db in get_db():
+            async with session_scope(self.uow) as db:
                 query = select(MaterialityCategoryEntity)
                 result = await db.execute(query)
                 category_entities = result.scalars().all()
@@ -50,13 +54,14 @@ class MediaRepository:
             logger.error(f"❌ 리포지토리: 중대성 카테고리 조회 중 오류 - {str(e)}")
             raise
     
+    @traced()
     async def find_materiality_category_by_name(self, category_name: str):
         """카테고리명으로 중대성 카테고리 조회 - BaseModel 반환"""
         try:
             logger.info(f"🔍 리포지토리: 카테고리명으로 중대성 카테고리 조회 - {category_name}")
             
             # 데이터베이스 연결
-            async for db in get_db():
+            async with session_scope(self.uow) as db:
                 query = select(MaterialityCategoryEntity).where(MaterialityCategoryEntity.category_name == category_name)
                 result = await db.execute(query)
                 category_entity = result.scalar_one_or_none()
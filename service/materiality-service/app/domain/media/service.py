@@ -10,14 +10,18 @@ import re
 import html
 import io
 import base64
+import asyncio
 from datetime import datetime, timezone, date, timedelta
-from typing import Any, Dict, List, Optional, Tuple
+from typing import Any, Callable, Dict, List, Optional, Tuple
 from urllib.parse import urlparse, urlunparse, parse_qsl, urlencode
 from functools import partial
 
 import httpx
 import pandas as pd
 from app.domain.media.repository import MediaRepository
+from app.domain.media.article_store import article_result_store
+from app.common.database.unit_of_work import UnitOfWork
+from app.common.tracing import span, traced
 
 logger = logging.getLogger("materiality.service")
 
@@ -146,12 +150,23 @@ def process_materiality_categories(categories: List[Any]) -> Tuple[List[str], Di
 # 네이버 뉴스 API 클라이언트 (동기)  — service에서 to_thread로 실행
 # ──────────────────────────────────────────────────────────────────────────────
 
-BASE_URL = "https://openapi.naver.com/v1/search/news.json"
+# 로컬 부하 테스트 시 benchmarks/fake_naver.py 서버로 교체 가능
+BASE_URL = os.getenv("NAVER_API_BASE_URL", "https://openapi.naver.com/v1/search/news.json")
 MAX_DISPLAY = 100  # 네이버 API 최대값 유지
 MAX_START_LIMIT = 500
 JITTER_RANGE = (0.0001, 0.0002)  # 지터 범위를 줄여서 더 빠르게
 
 
+def _parse_retry_after(value: Optional[str]) -> Optional[float]:
+    """Retry-After 헤더(초, 소수 허용) → 대기 초 (HTTP-date 등 해석 불가면 None)"""
+    if not value:
+        return None
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        return None
+
+
 class NaverNewsClient:
     def __init__(
         self,
@@ -167,7 +182,7 @@ class NaverNewsClient:
 
         self.min_interval = float(os.getenv("NAVER_API_MIN_INTERVAL", "0.4") if min_interval is None else min_interval)  # 0.8 → 0.4초로 단축
         self.per_keyword_pause = float(os.getenv("NAVER_API_PER_KEYWORD_PAUSE", "0.0") if per_keyword_pause is None else per_keyword_pause)  # 1.0 → 0.0초로 단축 (키워드 간 대기 제거)
-        self.max_retries = int(os.getenv("NAVER_API_MAX_RETRIES", "3") if per_keyword_pause is None else per_keyword_pause)
+        self.max_retries = int(os.getenv("NAVER_API_MAX_RETRIES", "3") if max_retries is None else max_retries)
 
         self._last_request_ts = 0.0
 
@@ -197,14 +212,22 @@ class NaverNewsClient:
                 
                 # 429 처리: Retry-After 헤더 존중
                 if resp.status_code == 429:
-                    ra = resp.headers.get("Retry-After")
-                    wait = float(ra) if ra and ra.isdigit() else (self.min_interval * (2 ** (attempt - 1)))
+                    wait = _parse_retry_after(resp.headers.get("Retry-After"))
+                    if wait is None:
+                        wait = self.min_interval * (2 ** (attempt - 1))
                     logger.warning("429 Too Many Requests → %.2fs 대기 후 재시도", wait)
                     time.sleep(wait + random.uniform(*JITTER_RANGE))
                     continue
                 
+                # 5xx는 일시 장애로 보고 백오프 후 재시도
                 if 500 <= resp.status_code < 600:
-                    raise httpx.HTTPStatusError(f"HTTP {resp.status_code}: {resp.text[:160]}")
+                    last_exc = httpx.HTTPStatusError(
+                        f"HTTP {resp.status_code}: {resp.text[:160]}", request=resp.request, response=resp
+                    )
+                    backoff = (self.min_interval * (2 ** (attempt - 1))) + random.uniform(*JITTER_RANGE)
+                    logger.warning("네이버 API 서버 오류(%s/%s): HTTP %s → %.2fs 후 재시도", attempt, self.max_retries, resp.status_code, backoff)
+                    time.sleep(backoff)
+                    continue
                 resp.raise_for_status()
                 return resp.json()
             except httpx.RequestError as e:
@@ -226,8 +249,12 @@ class NaverNewsClient:
         start_date: str,
         end_date: str,
         max_results: int = 300,
+        on_page: Optional[Callable[[List[Dict[str, Any]]], None]] = None,
     ) -> Dict[str, Any]:
-        """pubDate가 start_date~end_date 내인 기사만 수집 (동기)"""
+        """
+        pubDate가 start_date~end_date 내인 기사만 수집 (동기)
+        on_page: 페이지를 받을 때마다 그 페이지에서 수집된 기사로 호출 (파이프라인 평가용, 호출 스레드에서 실행)
+        """
         start_dt = datetime.strptime(start_date, "%Y-%m-%d").replace(tzinfo=timezone.utc)
         end_dt = datetime.strptime(end_date, "%Y-%m-%d").replace(tzinfo=timezone.utc) + timedelta(days=1)
         if start_dt > end_dt:
@@ -243,6 +270,7 @@ class NaverNewsClient:
             if not items:
                 break
 
+            page_start = len(collected)
             for item in items:
                 try:
                     pub_dt = email.utils.parsedate_to_datetime(item.get("pubDate", ""))
@@ -256,6 +284,11 @@ class NaverNewsClient:
                     item["원본링크"] = origin
                     collected.append(item)
 
+            if on_page is not None and page_start < max_results:
+                page_items = collected[page_start:max_results]
+                if page_items:
+                    on_page(page_items)
+
             start += display
             if start > MAX_START_LIMIT:
                 break
@@ -298,6 +331,23 @@ def _split_category_tokens(raw: str | None) -> List[str]:
     return [p.strip() for p in s.split("/") if p and p.strip()]
 
 
+def dedupe_key(it: Dict[str, Any]) -> Tuple[str, str, str]:
+    """중복 제거 키 (company, issue_group, canonical_url) - 파이프라인 평가에서도 배치마다 같은 키로 검사"""
+    company = (it.get("company") or "").strip()
+
+    # issue_group 결정: 기존코드의 issue_original이 있으면 그걸 쓰고,
+    # 없으면 신규코드의 original_category, 그것도 없으면 issue를 사용
+    issue_group = (
+        (it.get("issue_original") or "").strip()
+        or (it.get("original_category") or "").strip()
+        or (it.get("issue") or "").strip()
+    )
+
+    url_raw = it.get("originallink") or it.get("원본링크") or ""
+    url_key = NaverNewsClient.canonicalize_url(url_raw)
+    return company, issue_group, url_key
+
+
 def _dedupe_by_issue_group_url(items: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
     """
     기존코드와 동일한 철학:
@@ -308,20 +358,7 @@ def _dedupe_by_issue_group_url(items: List[Dict[str, Any]]) -> List[Dict[str, An
     out: List[Dict[str, Any]] = []
 
     for it in items:
-        company = (it.get("company") or "").strip()
-
-        # issue_group 결정: 기존코드의 issue_original이 있으면 그걸 쓰고,
-        # 없으면 신규코드의 original_category, 그것도 없으면 issue를 사용
-        issue_group = (
-            (it.get("issue_original") or "").strip()
-            or (it.get("original_category") or "").strip()
-            or (it.get("issue") or "").strip()
-        )
-
-        url_raw = it.get("originallink") or it.get("원본링크") or ""
-        url_key = NaverNewsClient.canonicalize_url(url_raw)
-
-        key = (company, issue_group, url_key)
+        key = dedupe_key(it)
         if key in seen:
             continue
         seen.add(key)
@@ -508,54 +545,23 @@ def _make_excel_bytes(items: List[Dict[str, Any]], company_id: str) -> Tuple[str
 # 서비스 엔트리포인트 (비동기)
 # ──────────────────────────────────────────────────────────────────────────────
 
-async def search_media(payload: Dict[str, Any]) -> Dict[str, Any]:
-    """
-    프론트에서 전달한 JSON(payload)을 받아, 회사×이슈 조합으로
-    네이버 뉴스 API를 검색한 뒤 JSON 결과를 반환한다.
+@traced("search_media")
+async def load_search_queries(
+    company_id: str, uow: Optional[UnitOfWork] = None
+) -> Tuple[List[Dict[str, Any]], Dict[str, str]]:
+    """materiality_category → 네이버 검색 질의 목록 (회사명+이슈, 회사명 단독)과 이슈 → 원본 카테고리 매핑"""
+    tokens, issue_to_category = await load_search_tokens(uow)
+    return build_search_queries(company_id, tokens), issue_to_category
 
-    반환 형식:
-    {
-        "success": True,
-        "message": "...",
-        "data": {
-            "company_id": "...",
-            "search_period": {"start_date": "...", "end_date": "..."},
-            "search_type": "...",
-            "total_results": int,
-            "articles": [...],  # title, description, pubDate, originallink, 네이버링크, company, issue, keyword, query_kind
-        },
-        "timestamp": "...(요청에서 받은 값 그대로 반환)"
-    }
-    """
-    # 요청 데이터 파싱
-    company_id: str = payload.get("company_id") or payload.get("companyname") or ""
-    if not company_id:
-        raise ValueError("company_id 가 필요합니다.")
-
-    rp: Dict[str, Any] = payload.get("report_period") or {}
-    start_date: str = rp.get("start_date")
-    if not start_date:
-        raise ValueError("report_period.start_date 가 필요합니다.")
-
-    # end_date는 프론트엔드에서 전달받은 값 우선, 없으면 '검색 당일'로 유동 적용
-    end_date: str = rp.get("end_date") or date.today().isoformat()
-
-    search_type: str = payload.get("search_type", "materiality_assessment")
-    timestamp: Optional[str] = payload.get("timestamp")
-
-    logger.info("🔍 매체검색: company_id=%s, start=%s, end=%s, type=%s", company_id, start_date, end_date, search_type)
 
+async def load_search_tokens(uow: Optional[UnitOfWork] = None) -> Tuple[List[str], Dict[str, str]]:
+    """materiality_category → 검색 토큰과 이슈 → 원본 카테고리 매핑 (기업과 무관 - 여러 기업 평가는 한 번만 조회)"""
     # materiality_category 테이블에서 카테고리 가져오기 (리포지토리 사용)
     try:
-        repository = MediaRepository()
-        # 동기 함수에서 비동기 리포지토리 호출을 위해 더 안전한 방식 사용
-        import asyncio
-        import concurrent.futures
-        
-        # 새 스레드에서 비동기 함수 실행
-        with concurrent.futures.ThreadPoolExecutor() as executor:
-            future = executor.submit(asyncio.run, repository.get_all_materiality_categories())
-            categories = future.result()
+        # 요청 단위 세션을 그대로 사용 (세션은 이벤트 루프에 묶이므로 같은 루프에서 await)
+        repository = MediaRepository(uow)
+        with span("media.categories"):
+            categories = await repository.get_all_materiality_categories()
         
         # 카테고리 데이터 처리
         logger.info(f"🔍 DB에서 가져온 카테고리 데이터: {len(categories)}개")
@@ -567,23 +573,15 @@ async def search_media(payload: Dict[str, Any]) -> Dict[str, Any]:
         # 기본 토큰 사용
         tokens = ["ESG", "지속가능성", "중대성"]
         issue_to_category = {token: token for token in tokens}
+    return tokens, issue_to_category
+
 
+def build_search_queries(company_id: str, tokens: List[str]) -> List[Dict[str, Any]]:
+    """기업 하나의 검색 질의 목록: (회사명 + 토큰) + 회사명 단독"""
     # 토큰이 없으면 회사명 단독 검색만 수행
     if not tokens:
         logger.warning("카테고리 토큰이 없어 회사명 단독 검색만 수행합니다. company=%s", company_id)
 
-    # 네이버 API 클라이언트
-    try:
-        # 동기 클라이언트 초기화를 비동기로 실행
-        import asyncio
-        loop = asyncio.get_event_loop()
-        client = await loop.run_in_executor(None, NaverNewsClient)
-        logger.info("✅ NaverNewsClient 초기화 성공")
-    except Exception as e:
-        logger.error(f"❌ NaverNewsClient 초기화 실패: {str(e)}")
-        logger.error(f"상세 오류: {traceback.format_exc()}")
-        raise ValueError(f"네이버 API 클라이언트 초기화 실패: {str(e)}")
-
     # 질의 목록 구성: (회사명 + 토큰) + 회사명 단독
     queries: List[Dict[str, Any]] = []
     max_results_per_keyword = int(os.getenv("NAVER_MAX_RESULTS_PER_KEYWORD", "500"))  # 300 → 500으로 증가
@@ -612,52 +610,85 @@ async def search_media(payload: Dict[str, Any]) -> Dict[str, Any]:
             "max_results": unique_company_max_results,
         }
     )
+    return queries
+
+
+def _tag_items(items: List[Dict[str, Any]], q: Dict[str, Any], issue_to_category: Dict[str, str]) -> None:
+    """검색 결과에 질의 정보와 원본 카테고리 추가 (제자리 수정)"""
+    issue = q["issue"]
+    for it in items:
+        it["company"] = q["company"]
+        it["issue"] = issue
+        it["keyword"] = q["keyword"]
+        it["query_kind"] = q["query_kind"]
+        # 원본 카테고리 정보 추가
+        it["original_category"] = issue_to_category.get(issue, issue)
+
+
+async def run_search_queries(
+    queries: List[Dict[str, Any]],
+    start_date: str,
+    end_date: str,
+    issue_to_category: Dict[str, str],
+    on_page: Optional[Callable[[List[Dict[str, Any]]], None]] = None,
+    on_query_done: Optional[Callable[[Dict[str, Any], List[Dict[str, Any]]], None]] = None,
+) -> List[Dict[str, Any]]:
+    """
+    질의를 동시에 실행해서 수집한 기사 전체 반환 (완료된 질의 순서)
+    on_page: 페이지 단위로 (질의 정보가 붙은) 기사를 받는 콜백 - 검색 스레드에서 호출됨
+    on_query_done: 질의 하나가 끝날 때마다 (질의, 수집 기사)로 호출 - 이벤트 루프에서 호출됨 (실패한 질의는 빈 목록)
+    """
+    # 네이버 API 클라이언트
+    try:
+        # 동기 클라이언트 초기화를 비동기로 실행
+        loop = asyncio.get_event_loop()
+        client = await loop.run_in_executor(None, NaverNewsClient)
+        logger.info("✅ NaverNewsClient 초기화 성공")
+    except Exception as e:
+        logger.error(f"❌ NaverNewsClient 초기화 실패: {str(e)}")
+        logger.error(f"상세 오류: {traceback.format_exc()}")
+        raise ValueError(f"네이버 API 클라이언트 초기화 실패: {str(e)}")
 
-    # 실행
     all_items: List[Dict[str, Any]] = []
     
     # 병렬 처리를 위한 함수 정의
     async def run_one_search(q: Dict[str, Any]) -> List[Dict[str, Any]]:
         """단일 검색 실행"""
         kw = q["keyword"]
-        company = q["company"]
-        issue = q["issue"]
         query_kind = q["query_kind"]
         per_kw_limit = int(q["max_results"])
         
         logger.info("▶︎ 네이버 검색 시작 [%s]: %s (%s~%s, limit=%d)", query_kind, kw, start_date, end_date, per_kw_limit)
+
+        def tag_page(page_items: List[Dict[str, Any]]) -> None:
+            _tag_items(page_items, q, issue_to_category)
+            if on_page is not None:
+                on_page(page_items)
         
         try:
-            # 동기 함수를 비동기로 실행
-            result = await loop.run_in_executor(
-                None,
-                partial(
-                    client.search_by_date_range,
-                    keyword=kw,
-                    start_date=start_date,
-                    end_date=end_date,
-                    max_results=per_kw_limit,
-                ),
-            )
-            
-            items = []
-            for it in result.get("items", []):
-                it["company"] = company
-                it["issue"] = issue
-                it["keyword"] = kw
-                it["query_kind"] = query_kind
-                # 원본 카테고리 정보 추가
-                if issue in issue_to_category:
-                    it["original_category"] = issue_to_category[issue]
-                else:
-                    it["original_category"] = issue
-                items.append(it)
-            
-            return items
+            # 동기 함수를 비동기로 실행 (executor 스레드에는 contextvar가 전달되지 않으므로 여기서 측정)
+            with span("media.naver_query", keyword=kw, query_kind=query_kind) as query_span:
+                result = await loop.run_in_executor(
+                    None,
+                    partial(
+                        client.search_by_date_range,
+                        keyword=kw,
+                        start_date=start_date,
+                        end_date=end_date,
+                        max_results=per_kw_limit,
+                        on_page=tag_page,
+                    ),
+                )
+            query_span.set(items=len(result.get("items", [])))
+            # 페이지 콜백에서 이미 질의 정보가 붙음
+            items = result.get("items", [])
             
         except Exception as e:
             logger.error("검색 실패 [%s] %s: %s", query_kind, kw, e)
-            return []
+            items = []
+        if on_query_done is not None:
+            on_query_done(q, items)
+        return items
     
     # 동시 실행 개수 제한 (과도한 메모리/후처리 겹침 방지)
     max_concurrency = int(os.getenv("NAVER_KEYWORD_CONCURRENCY", "4"))
@@ -668,16 +699,65 @@ async def search_media(payload: Dict[str, Any]) -> Dict[str, Any]:
         async with semaphore:
             return await run_one_search(q)
     
-    # 모든 검색을 동시에 시작
-    tasks = [asyncio.create_task(guarded_search(q)) for q in queries]
-    
-    # 완료된 순서대로 결과 수집
-    for completed_task in asyncio.as_completed(tasks):
-        try:
-            items = await completed_task
-            all_items.extend(items)
-        except Exception as e:
-            logger.error(f"검색 작업 실행 중 오류: {e}")
+    with span("media.naver_search", queries=len(queries), concurrency=max_concurrency) as search_span:
+        # 모든 검색을 동시에 시작
+        tasks = [asyncio.create_task(guarded_search(q)) for q in queries]
+
+        # 완료된 순서대로 결과 수집
+        for completed_task in asyncio.as_completed(tasks):
+            try:
+                items = await completed_task
+                all_items.extend(items)
+            except Exception as e:
+                logger.error(f"검색 작업 실행 중 오류: {e}")
+    search_span.set(items=len(all_items))
+    return all_items
+
+
+async def search_media(payload: Dict[str, Any], uow: Optional[UnitOfWork] = None) -> Dict[str, Any]:
+    """
+    프론트에서 전달한 JSON(payload)을 받아, 회사×이슈 조합으로
+    네이버 뉴스 API를 검색한 뒤 JSON 결과를 반환한다.
+
+    반환 형식:
+    {
+        "success": True,
+        "message": "...",
+        "data": {
+            "company_id": "...",
+            "search_period": {"start_date": "...", "end_date": "..."},
+            "search_type": "...",
+            "total_results": int,
+            "articles": [...],  # title, description, pubDate, originallink, 네이버링크, company, issue, keyword, query_kind
+        },
+        "timestamp": "...(요청에서 받은 값 그대로 반환)"
+    }
+    """
+    # 요청 데이터 파싱
+    company_id: str = payload.get("company_id") or payload.get("companyname") or ""
+    if not company_id:
+        raise ValueError("company_id 가 필요합니다.")
+
+    rp: Dict[str, Any] = payload.get("report_period") or {}
+    start_date: str = rp.get("start_date")
+    if not start_date:
+        raise ValueError("report_period.start_date 가 필요합니다.")
+
+    # end_date는 프론트엔드에서 전달받은 값 우선, 없으면 '검색 당일'로 유동 적용
+    end_date: str = rp.get("end_date") or date.today().isoformat()
+
+    search_type: str = payload.get("search_type", "materiality_assessment")
+    timestamp: Optional[str] = payload.get("timestamp")
+
+    logger.info("🔍 매체검색: company_id=%s, start=%s, end=%s, type=%s", company_id, start_date, end_date, search_type)
+
+    queries, issue_to_category = await load_search_queries(company_id, uow)
+    # 크롤링 동안 DB 커넥션을 잡고 있지 않도록 반납
+    if uow is not None:
+        await uow.release()
+
+    # 실행
+    all_items = await run_search_queries(queries, start_date, end_date, issue_to_category)
 
     if not all_items:
         logger.warning("수집된 뉴스가 없습니다. company=%s", company_id)
@@ -693,7 +773,8 @@ async def search_media(payload: Dict[str, Any]) -> Dict[str, Any]:
 
     # URL 기준 중복 제거(기업 범위 내)
     try:
-        all_items = _dedupe_by_issue_group_url(all_items)
+        with span("media.dedupe"):
+            all_items = _dedupe_by_issue_group_url(all_items)
         logger.info(f"✅ 중복 제거 완료: {len(all_items)}개 기사")
     except Exception as e:
         logger.warning("중복 제거 중 오류(무시하고 계속): %s", e)
@@ -701,12 +782,18 @@ async def search_media(payload: Dict[str, Any]) -> Dict[str, Any]:
     # 데이터 정제
     try:
         original_count = len(all_items)
-        all_items = filter_news_items(all_items, company_id)
+        with span("media.filter"):
+            all_items = filter_news_items(all_items, company_id)
         filtered_count = len(all_items)
         logger.info(f"✅ 데이터 정제 완료: {original_count}개 → {filtered_count}개 기사")
     except Exception as e:
         logger.warning("데이터 정제 중 오류(무시하고 계속): %s", e)
 
+    # 정제된 기사 목록을 서버에 보관 → 평가 요청은 result_id만 전달
+    stored = article_result_store.put(
+        company_id, {"start_date": start_date, "end_date": end_date}, all_items
+    )
+
     # 엑셀 생성 (메모리에서)
     excel_filename = None
     excel_base64 = None
@@ -715,12 +802,13 @@ async def search_media(payload: Dict[str, Any]) -> Dict[str, Any]:
             # 동기 엑셀 생성 함수를 비동기로 실행
             import asyncio
             loop = asyncio.get_event_loop()
-            filename, excel_bytes = await loop.run_in_executor(
-                None, 
-                _make_excel_bytes, 
-                all_items, 
-                company_id
-            )
+            with span("media.excel", items=len(all_items)):
+                filename, excel_bytes = await loop.run_in_executor(
+                    None,
+                    _make_excel_bytes,
+                    all_items,
+                    company_id
+                )
             excel_filename = filename
             excel_base64 = base64.b64encode(excel_bytes).decode("ascii")
             logger.info(f"✅ 엑셀 생성 완료: {filename} (Base64 길이: {len(excel_base64)})")
@@ -739,6 +827,9 @@ async def search_media(payload: Dict[str, Any]) -> Dict[str, Any]:
             "search_type": search_type,
             "total_results": len(all_items),
             "articles": all_items,  # 그대로 반환 (title/description/pubDate/originallink/네이버링크 등 포함)
+            # /middleissue/assessment에 articles 대신 보낼 수 있는 서버 보관 결과 ID
+            "result_id": stored["result_id"],
+            "result_expires_at": stored["expires_at"],
         },
         "timestamp": timestamp,
         "excel_filename": excel_filename,
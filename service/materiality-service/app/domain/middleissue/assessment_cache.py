@@ -0,0 +1,153 @@
+"""
+Assessment Result Cache - 같은 기업/보고기간을 다시 평가할 때 이전 평가 상태 재사용 (프로세스 메모리)
+- 키: (기업, 보고기간 시작일, 종료일)
+- 항목: 기사 지문 개수(Counter), 기사 요약(개수/샘플), 카테고리 누적기(CategoryScoreAccumulator),
+        라벨 기준(이전년도/공통 카테고리, 카테고리 ID, 평가 시각), 마지막 응답
+- 같은 기사 집합으로 다시 요청 → 저장된 응답 바로 반환 (감성 분석/라벨/DB 조회/점수 계산 생략)
+- 기사가 추가만 됐으면 → 새 기사만 감성 분석/라벨 후 누적기에 더함 (O(새 기사 수) + O(카테고리 수))
+- what-if 재계산(/middleissue/assessment/rescore)은 저장된 누적기로 가중치/최근성 기준만 바꿔 순위 재계산
+- 기사가 빠졌거나, 모델이 바뀌었거나, 기준 데이터가 다시 로드됐거나(ESG/이슈풀 매칭, /reference-data/reload),
+  날짜가 바뀌었거나(최근성 라벨 기준), TTL이 지나면 처음부터 다시 평가
+  (TTL = 이전년도/공통 카테고리 DB 변경이 평가에 반영되기까지 최대 지연)
+
+환경변수:
+    ASSESSMENT_CACHE_ENABLED (기본 true)
+    ASSESSMENT_CACHE_TTL_SECONDS (기본 1800)
+    ASSESSMENT_CACHE_MAX_ENTRIES (기본 20)
+"""
+import asyncio
+import hashlib
+import logging
+import os
+import time
+from collections import Counter, OrderedDict
+from datetime import date
+from typing import Any, Dict, List, Optional, Tuple
+
+from app.domain.media.article_store import ARTICLE_FIELDS
+
+logger = logging.getLogger(__name__)
+
+ASSESSMENT_CACHE_ENABLED = os.getenv("ASSESSMENT_CACHE_ENABLED", "true").lower() == "true"
+ASSESSMENT_CACHE_TTL_SECONDS = int(os.getenv("ASSESSMENT_CACHE_TTL_SECONDS", "1800"))
+ASSESSMENT_CACHE_MAX_ENTRIES = int(os.getenv("ASSESSMENT_CACHE_MAX_ENTRIES", "20"))
+
+CacheKey = Tuple[str, str, str]
+
+
+def cache_key(company_id: str, report_period: Optional[Dict[str, Any]]) -> CacheKey:
+    period = report_period or {}
+    return company_id, str(period.get("start_date") or ""), str(period.get("end_date") or "")
+
+
+def article_fingerprints(columns: Dict[str, List[Any]]) -> List[str]:
+    """기사마다 평가에 쓰는 필드 전체의 해시 (같은 지문 = 같은 평가 결과)"""
+    return [
+        hashlib.sha1("\0".join(str(v or "") for v in row).encode("utf-8")).hexdigest()
+        for row in zip(*(columns[field] for field in ARTICLE_FIELDS))
+    ]
+
+
+def new_article_indices(cached_counts: Counter, fingerprints: List[str]) -> Optional[List[int]]:
+    """
+    요청 기사 중 캐시에 없는 기사의 위치 (중복 기사는 개수까지 비교)
+    캐시에 있던 기사가 요청에서 빠졌으면 None → 누적값에서 뺄 수 없으므로 전체 재평가
+    """
+    remaining = cached_counts.copy()
+    new_indices: List[int] = []
+    for i, fp in enumerate(fingerprints):
+        if remaining[fp] > 0:
+            remaining[fp] -= 1
+        else:
+            new_indices.append(i)
+    if any(n > 0 for n in remaining.values()):
+        return None
+    return new_indices
+
+
+class AssessmentCache:
+    """(기업, 보고기간) → 평가 상태 (TTL + 개수 상한, 키마다 asyncio.Lock으로 갱신 직렬화)"""
+
+    def __init__(self, ttl_seconds: int = ASSESSMENT_CACHE_TTL_SECONDS,
+                 max_entries: int = ASSESSMENT_CACHE_MAX_ENTRIES, enabled: bool = ASSESSMENT_CACHE_ENABLED):
+        self.ttl_seconds = ttl_seconds
+        self.max_entries = max_entries
+        self.enabled = enabled
+        self._entries: "OrderedDict[CacheKey, Dict[str, Any]]" = OrderedDict()
+        self._locks: Dict[CacheKey, asyncio.Lock] = {}
+        self.hits = 0
+        self.incremental = 0
+        self.misses = 0
+
+    def lock(self, key: CacheKey) -> asyncio.Lock:
+        """같은 키의 평가는 하나씩 (동시에 같은 누적기에 기사를 더하지 않도록)"""
+        return self._locks.setdefault(key, asyncio.Lock())
+
+    def _purge(self) -> None:
+        now = time.monotonic()
+        for key in [k for k, e in self._entries.items() if e["expires"] <= now]:
+            del self._entries[key]
+        while len(self._entries) > self.max_entries:
+            key, _ = self._entries.popitem(last=False)
+            logger.info(f"🧹 평가 결과 캐시 개수 초과로 삭제: {key}")
+        # 대기 중인 평가가 없는 키의 락 정리
+        for key in [k for k, lock in self._locks.items() if k not in self._entries and not lock.locked()]:
+            del self._locks[key]
+
+    def get(self, key: CacheKey, model_signature: Optional[str],
+            reference_version: Optional[str] = None) -> Optional[Dict[str, Any]]:
+        """재사용 가능한 평가 상태 (없음/만료/모델 변경/기준 데이터 변경/날짜 변경이면 None)"""
+        if not self.enabled:
+            return None
+        self._purge()
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        if model_signature is None or entry["model_signature"] != model_signature:
+            logger.info(f"🔄 모델 변경으로 평가 결과 캐시 무효화: {key}")
+            del self._entries[key]
+            return None
+        if entry.get("reference_version") != reference_version:
+            logger.info(f"🔄 기준 데이터 변경으로 평가 결과 캐시 무효화 (ESG/이슈풀 매칭): {key}")
+            del self._entries[key]
+            return None
+        if entry["search_date"].date() != date.today():
+            logger.info(f"🔄 날짜 변경으로 평가 결과 캐시 무효화 (최근성 라벨 기준일): {key}")
+            del self._entries[key]
+            return None
+        self._entries.move_to_end(key)
+        return entry
+
+    def peek(self, key: CacheKey) -> Optional[Dict[str, Any]]:
+        """저장된 평가 상태 (TTL만 확인 - what-if 재계산은 모델/날짜가 바뀌어도 마지막 평가 기준으로 계산)"""
+        if not self.enabled:
+            return None
+        self._purge()
+        return self._entries.get(key)
+
+    def put(self, key: CacheKey, entry: Dict[str, Any]) -> None:
+        """평가 상태 저장 (TTL은 처음 평가한 시점부터 - 증분 갱신으로 연장하지 않음)"""
+        if not self.enabled:
+            return
+        entry.setdefault("expires", time.monotonic() + self.ttl_seconds)
+        self._entries[key] = entry
+        self._entries.move_to_end(key)
+        self._purge()
+
+    def delete(self, key: CacheKey) -> bool:
+        return self._entries.pop(key, None) is not None
+
+    def stats(self) -> Dict[str, Any]:
+        total = self.hits + self.incremental + self.misses
+        return {
+            "enabled": self.enabled,
+            "entries": len(self._entries),
+            "hits": self.hits,
+            "incremental": self.incremental,
+            "misses": self.misses,
+            "reuse_ratio": round((self.hits + self.incremental) / total, 4) if total else 0.0,
+        }
+
+
+# 싱글톤
+assessment_cache = AssessmentCache()
@@ -0,0 +1,393 @@
+"""
+Batch Assessment - 같은 보고기간의 여러 기업(동종 업계 등)을 한 번에 검색 + 중대성 평가
+- 검색 질의: 카테고리 토큰은 한 번만 조회 → 기업 × 토큰 질의를 토큰 순서로 기업끼리 번갈아 배치 (모든 기업이 고르게 진행)
+- 크롤링: 네이버 클라이언트(요청 간격 제한)와 동시 실행 제한을 전체 질의가 공유
+- 감성 분석: 기업별 중복 제거/정제 후, 여러 기업 기사에 함께 나온 같은 제목+본문은 한 번만 추론 → 기업별로 결과 분배
+- 라벨/점수/랭킹/ESG 매칭: 기업별 (이전년도/공통 카테고리가 기업마다 다름)
+- 백그라운드 작업으로 실행 → 작업 ID로 기업별 진행 상황/결과 조회
+- 기업별 결과는 검색 결과 보관소/평가 결과 캐시에도 저장 → 기업 하나 재평가(result_id)나 what-if 재계산 가능
+
+환경변수:
+    BATCH_MAX_COMPANIES (한 번에 평가할 최대 기업 수, 기본 30)
+    BATCH_TIMEOUT_SECONDS (작업 전체 타임아웃, 기본 3600)
+    BATCH_JOB_TTL_SECONDS (끝난 작업 보관 시간, 기본 3600)
+    BATCH_MAX_FINISHED_JOBS (보관할 끝난 작업 수 상한, 기본 10 - 작업마다 기업별 전체 응답을 들고 있으므로)
+"""
+import asyncio
+import contextvars
+import itertools
+import logging
+import os
+import time
+import uuid
+from collections import Counter
+from datetime import date, datetime
+from typing import Any, Dict, List, Optional, Set, Tuple
+
+from app.common.database.unit_of_work import UnitOfWork
+from app.common.tracing import span
+from app.domain.media.article_store import ARTICLE_FIELDS, article_result_store, normalize_columns
+from app.domain.media.service import (
+    build_search_queries, dedupe_key, filter_news_items, load_search_tokens, run_search_queries,
+)
+from app.domain.middleissue.assessment_cache import article_fingerprints, assessment_cache, cache_key
+from app.domain.middleissue.executor import assessment_executor, from_columns
+from app.domain.middleissue.repository import MiddleIssueRepository
+from app.domain.middleissue.schema import BatchAssessmentRequest
+from app.domain.middleissue.service import (
+    CategoryScoreAccumulator, apply_relevance_labels, build_assessment_response, current_model_signature,
+    current_reference_version,
+    load_sentiment_model, match_categories_with_esg_and_issuepool, rank_categories_by_score, resolve_category_ids,
+    summarize_articles,
+)
+
+logger = logging.getLogger(__name__)
+
+BATCH_MAX_COMPANIES = int(os.getenv("BATCH_MAX_COMPANIES", "30"))
+BATCH_TIMEOUT_SECONDS = int(os.getenv("BATCH_TIMEOUT_SECONDS", "3600"))
+BATCH_JOB_TTL_SECONDS = int(os.getenv("BATCH_JOB_TTL_SECONDS", "3600"))
+BATCH_MAX_FINISHED_JOBS = int(os.getenv("BATCH_MAX_FINISHED_JOBS", "10"))
+
+# analyze_sentiment 결과 중 제목+본문만으로 정해지는 필드 (기업 간 공유)
+_SENTIMENT_FIELDS = ("sentiment", "sentiment_confidence", "neg_keywords", "pos_keywords", "sentiment_basis")
+
+# 작업 상태 (메모리 기반, 미디어 검색 작업과 같은 방식)
+_batch_jobs: Dict[str, Dict[str, Any]] = {}
+# 실행 중인 작업 태스크 참조 유지 (GC 방지)
+_running_tasks: Set[asyncio.Task] = set()
+
+
+def _cleanup_jobs() -> None:
+    """끝난 지 BATCH_JOB_TTL_SECONDS가 지난 작업 + 보관 개수를 넘은 오래된 끝난 작업 정리 (실행 중인 작업은 유지)"""
+    now = time.monotonic()
+    finished = sorted(
+        (job["finished"], job_id) for job_id, job in _batch_jobs.items() if job["finished"] is not None
+    )
+    overflow = max(0, len(finished) - BATCH_MAX_FINISHED_JOBS)
+    for i, (finished_at, job_id) in enumerate(finished):
+        if i < overflow or now - finished_at > BATCH_JOB_TTL_SECONDS:
+            del _batch_jobs[job_id]
+            logger.info(f"🧹 오래된 일괄 평가 작업 정리: {job_id}")
+
+
+async def start_batch_assessment(request: BatchAssessmentRequest) -> Dict[str, Any]:
+    """일괄 평가 작업 시작 - 즉시 job_id 반환 (진행 상황은 get_batch_status)"""
+    companies = list(dict.fromkeys(c.strip() for c in request.company_ids if c and c.strip()))
+    if not companies:
+        return {"success": False, "message": "❌ 평가할 기업이 없습니다.", "data": None}
+    if len(companies) > BATCH_MAX_COMPANIES:
+        return {
+            "success": False,
+            "message": f"❌ 한 번에 평가할 수 있는 기업은 최대 {BATCH_MAX_COMPANIES}개입니다. (요청 {len(companies)}개)",
+            "data": None,
+        }
+    start_date = (request.report_period or {}).get("start_date")
+    if not start_date:
+        return {"success": False, "message": "❌ report_period.start_date 가 필요합니다.", "data": None}
+    end_date = request.report_period.get("end_date") or date.today().isoformat()
+
+    _cleanup_jobs()
+    job_id = uuid.uuid4().hex
+    job = {
+        "job_id": job_id,
+        "status": "running",
+        "stage": "prepare",
+        "message": "검색 질의를 준비하고 있습니다",
+        "report_period": request.report_period,
+        "search_period": {"start_date": start_date, "end_date": end_date},
+        "start_time": datetime.now().isoformat(),
+        "end_time": None,
+        "finished": None,
+        "companies": {
+            c: {"status": "queued", "queries_done": 0, "queries_total": 0, "crawled": 0} for c in companies
+        },
+        "stats": {},
+        "results": {},
+        "error": None,
+    }
+    _batch_jobs[job_id] = job
+    # 요청의 추적(span) 컨텍스트와 분리해서 실행 (응답 후에도 계속 도는 작업)
+    task = asyncio.create_task(_run_batch_job(job, companies), context=contextvars.Context())
+    _running_tasks.add(task)
+    task.add_done_callback(_running_tasks.discard)
+    logger.warning(f"🚀 일괄 평가 작업 시작: {job_id} ({len(companies)}개 기업, {start_date}~{end_date})")
+    return {
+        "success": True,
+        "message": "일괄 평가가 시작되었습니다",
+        "data": {"job_id": job_id, "status": "started", "companies": companies},
+    }
+
+
+def get_batch_status(job_id: str, company: Optional[str] = None) -> Dict[str, Any]:
+    """작업 상태 + 기업별 진행 상황 (company를 주면 그 기업의 평가 결과 전체 - /middleissue/assessment 응답 형식)"""
+    _cleanup_jobs()
+    job = _batch_jobs.get(job_id)
+    if job is None:
+        return {"success": False, "message": "❌ 작업을 찾을 수 없습니다 (만료 또는 잘못된 ID)", "data": None}
+
+    if company is not None:
+        result = job["results"].get(company)
+        if result is not None:
+            return result
+        progress = job["companies"].get(company)
+        if progress is None:
+            return {"success": False, "message": f"❌ 작업에 없는 기업입니다: {company}", "data": None}
+        return {"success": False, "message": f"⏳ 아직 결과가 없습니다 ({progress['status']})", "data": None}
+
+    finished = sum(1 for p in job["companies"].values() if p["status"] in ("completed", "failed"))
+    return {
+        "success": True,
+        "message": job["message"],
+        "data": {
+            "job_id": job_id,
+            "status": job["status"],
+            "stage": job["stage"],
+            "report_period": job["report_period"],
+            "start_time": job["start_time"],
+            "end_time": job["end_time"],
+            "companies_total": len(job["companies"]),
+            "companies_finished": finished,
+            "companies": job["companies"],
+            "stats": job["stats"],
+            "error": job["error"],
+        },
+    }
+
+
+async def _run_batch_job(job: Dict[str, Any], companies: List[str]) -> None:
+    try:
+        with span("batch_assessment", companies=len(companies)) as total_span:
+            await asyncio.wait_for(_run_batch(job, companies), timeout=BATCH_TIMEOUT_SECONDS)
+        completed = sum(1 for p in job["companies"].values() if p["status"] == "completed")
+        job["stats"]["total_seconds"] = round(total_span.duration, 3)
+        job.update(
+            status="completed", stage="done",
+            message=f"일괄 평가가 완료되었습니다 ({completed}/{len(companies)}개 기업)",
+        )
+        logger.warning(f"✅ 일괄 평가 완료: {job['job_id']} {completed}/{len(companies)}개 기업, {total_span.duration:.1f}초")
+    except asyncio.TimeoutError:
+        _fail_job(job, f"타임아웃 ({BATCH_TIMEOUT_SECONDS}초 초과)")
+    except Exception as e:
+        _fail_job(job, str(e))
+    finally:
+        job["end_time"] = datetime.now().isoformat()
+        job["finished"] = time.monotonic()
+        # 새 요청이 없어도 끝날 때마다 정리 → 끝난 작업 결과가 보관 상한 이상 쌓이지 않음
+        _cleanup_jobs()
+
+
+def _fail_job(job: Dict[str, Any], error: str) -> None:
+    logger.error(f"❌ 일괄 평가 실패: {job['job_id']} - {error}")
+    job.update(status="failed", message=f"일괄 평가에 실패했습니다: {error}", error=error)
+    # 이미 끝난 기업 결과는 그대로 조회 가능
+    for progress in job["companies"].values():
+        if progress["status"] != "completed":
+            progress.update(status="failed", error=progress.get("error") or error)
+
+
+async def _run_batch(job: Dict[str, Any], companies: List[str]) -> None:
+    search_period = job["search_period"]
+    start_date, end_date = search_period["start_date"], search_period["end_date"]
+    try:
+        search_year = int(end_date[:4])
+    except ValueError:
+        search_year = datetime.now().year
+        logger.warning(f"⚠️ 연도 파싱 실패 → 기본값 사용: {search_year}년")
+    progress = job["companies"]
+    stats = job["stats"]
+
+    loop = asyncio.get_running_loop()
+    # 모델 로드는 준비/크롤링과 겹쳐서 실행
+    model_ready = loop.run_in_executor(None, load_sentiment_model)
+
+    # 1) 준비: 토큰/카테고리 ID는 한 번만, 이전년도/공통 카테고리는 기업별 (크롤링 동안 DB 커넥션을 잡지 않도록 세션 분리)
+    uow = UnitOfWork()
+    try:
+        with span("batch.prepare") as prepare_span:
+            tokens, issue_to_category = await load_search_tokens(uow)
+            per_company = {c: build_search_queries(c, tokens) for c in companies}
+            repository = MiddleIssueRepository(uow)
+            # 기사의 original_category는 질의의 이슈에서 정해지고 토큰은 기업과 무관
+            category_ids = await resolve_category_ids(
+                {issue_to_category.get(q["issue"], q["issue"]) for q in per_company[companies[0]]}, repository
+            )
+            corp_categories: Dict[str, Tuple[Set[str], Set[str]]] = {}
+            for c in companies:
+                issues = await repository.get_corporation_issues(corporation_name=c, year=search_year)
+                corp_categories[c] = (
+                    {str(issue.category_id) for issue in issues.year_issues},
+                    {str(issue.category_id) for issue in issues.common_issues},
+                )
+    finally:
+        await uow.close()
+
+    # 기업끼리 번갈아 배치 → 공유 크롤러에서 모든 기업이 고르게 진행
+    queries = [q for group in itertools.zip_longest(*per_company.values()) for q in group if q is not None]
+    for c in companies:
+        progress[c].update(status="crawling", queries_total=len(per_company[c]))
+    stats.update(queries=len(queries), prepare_seconds=round(prepare_span.duration, 3))
+
+    # 2) 크롤링 (네이버 클라이언트/동시 실행 제한을 모든 기업이 공유)
+    job.update(stage="crawl", message=f"{len(companies)}개 기업 {len(queries)}개 검색 질의 실행 중")
+
+    def on_query_done(q: Dict[str, Any], items: List[Dict[str, Any]]) -> None:
+        p = progress[q["company"]]
+        p["queries_done"] += 1
+        p["crawled"] += len(items)
+        if p["queries_done"] == p["queries_total"]:
+            p["status"] = "crawled"
+
+    with span("batch.crawl", queries=len(queries)) as crawl_span:
+        all_items = await run_search_queries(
+            queries, start_date, end_date, issue_to_category, on_query_done=on_query_done
+        )
+    stats.update(crawled=len(all_items), crawl_seconds=round(crawl_span.duration, 3))
+
+    # 3) 기업별 중복 제거(키에 기업 포함) + 정제
+    items_by_company: Dict[str, List[Dict[str, Any]]] = {c: [] for c in companies}
+    seen: Set[Any] = set()
+    for it in all_items:
+        key = dedupe_key(it)
+        if key in seen:
+            continue
+        seen.add(key)
+        items_by_company[it["company"]].append(it)
+    columns_by_company: Dict[str, Dict[str, List[Any]]] = {}
+    for c in companies:
+        items_by_company[c] = filter_news_items(items_by_company[c], c)
+        columns_by_company[c] = normalize_columns(items_by_company[c], c)
+        progress[c]["kept"] = len(items_by_company[c])
+
+    # 4) 감성 분석: 기업 간 같은 제목+본문은 한 번만
+    union: Dict[Tuple[str, str], int] = {}
+    union_columns: Dict[str, List[Any]] = {field: [] for field in ARTICLE_FIELDS}
+    for c in companies:
+        cols = columns_by_company[c]
+        for i, text_key in enumerate(zip(cols["title"], cols["description"])):
+            if text_key in union:
+                continue
+            union[text_key] = len(union)
+            for field in ARTICLE_FIELDS:
+                union_columns[field].append(cols[field][i])
+    kept_total = sum(progress[c]["kept"] for c in companies)
+    job.update(stage="sentiment", message=f"감성 분석 중 ({len(union)}건, 기업 간 중복 {kept_total - len(union)}건 제외)")
+    for c in companies:
+        progress[c]["status"] = "scoring"
+
+    if not await model_ready:
+        raise Exception("감성 분석 모델 로드 실패")
+    with span("batch.sentiment", articles=len(union)) as sentiment_span:
+        analyzed = await assessment_executor.run_sentiment(union_columns) if union else []
+    sentiment_by_text = {(a["title"], a["description"]): {f: a[f] for f in _SENTIMENT_FIELDS} for a in analyzed}
+    stats.update(
+        kept=kept_total, unique_articles=len(union), shared_articles=kept_total - len(union),
+        sentiment_seconds=round(sentiment_span.duration, 3),
+    )
+
+    # 5) 기업별 라벨/점수/랭킹 → ESG 매칭 → 결과 저장
+    job.update(stage="scoring", message="기업별 점수 계산 및 ESG 매칭 중")
+    search_date = datetime.now()
+    model_signature = current_model_signature()
+    with span("batch.scoring", companies=len(companies)) as scoring_span:
+        for c in companies:
+            # 기업마다 세션 분리 → 한 기업의 DB 오류(중단된 트랜잭션)가 다음 기업 조회로 이어지지 않음
+            uow = UnitOfWork()
+            try:
+                await _finish_company(
+                    job, c, items_by_company[c], columns_by_company[c], sentiment_by_text,
+                    search_date, corp_categories[c], category_ids, model_signature, MiddleIssueRepository(uow),
+                )
+            except Exception as e:
+                # 기업 하나가 실패해도 나머지 기업은 계속
+                logger.error(f"❌ 일괄 평가 중 기업 평가 실패: {c} - {e}")
+                progress[c].update(status="failed", error=str(e))
+            finally:
+                await uow.close()
+    stats["scoring_seconds"] = round(scoring_span.duration, 3)
+
+
+async def _finish_company(
+    job: Dict[str, Any],
+    company_id: str,
+    items: List[Dict[str, Any]],
+    columns: Dict[str, List[Any]],
+    sentiment_by_text: Dict[Tuple[str, str], Dict[str, Any]],
+    search_date: datetime,
+    corp_categories: Tuple[Set[str], Set[str]],
+    category_ids: Dict[str, Optional[int]],
+    model_signature: Optional[str],
+    repository: MiddleIssueRepository,
+) -> None:
+    prev_year_categories, reference_categories = corp_categories
+    loop = asyncio.get_running_loop()
+    labeled, accumulator, category_scores, ranked = await loop.run_in_executor(
+        None, _score_company, columns, sentiment_by_text, company_id, search_date,
+        prev_year_categories, reference_categories, category_ids,
+    )
+    matched = await match_categories_with_esg_and_issuepool(ranked, repository=repository)
+
+    search_period = job["search_period"]
+    stored = article_result_store.put(company_id, search_period, items)
+    article_summary = summarize_articles(labeled)
+    response = build_assessment_response(
+        company_id, job["report_period"], article_summary, category_scores, ranked, matched,
+    )
+    if model_signature is not None:
+        assessment_cache.put(cache_key(company_id, search_period), {
+            "article_summary": article_summary,
+            "accumulator": accumulator,
+            "search_date": search_date,
+            "prev_year_categories": prev_year_categories,
+            "reference_categories": reference_categories,
+            "category_ids": dict(category_ids),
+            "model_signature": model_signature,
+            "reference_version": current_reference_version(),
+            "counts": Counter(article_fingerprints(columns)),
+            # 일반 평가 응답 형식으로 저장 (아래 result_id 제외)
+            "response": {**response, "data": dict(response["data"])},
+        })
+    response["data"].update(result_id=stored["result_id"], result_expires_at=stored["expires_at"])
+    job["results"][company_id] = response
+    job["companies"][company_id].update(
+        status="completed",
+        total_articles=response["data"]["total_articles"],
+        negative_articles=response["data"]["negative_articles"],
+        top_categories=[row["category"] for row in ranked[:5]],
+        result_id=stored["result_id"],
+    )
+
+
+def _score_company(
+    columns: Dict[str, List[Any]],
+    sentiment_by_text: Dict[Tuple[str, str], Dict[str, Any]],
+    company_id: str,
+    search_date: datetime,
+    prev_year_categories: Set[str],
+    reference_categories: Set[str],
+    category_ids: Dict[str, Optional[int]],
+) -> Tuple[List[Dict[str, Any]], CategoryScoreAccumulator, Dict[str, Dict[str, Any]], List[Dict[str, Any]]]:
+    """기업 하나의 기사에 공유 감성 결과를 붙여 라벨 → 점수 → 랭킹 (스레드에서 실행, DB 조회 없음)"""
+    analyzed: List[Dict[str, Any]] = []
+    for row in from_columns(columns):
+        sentiment = sentiment_by_text.get((row.title, row.description))
+        if sentiment is None:
+            # 감성 분석 중 오류로 빠진 기사 (단일 평가와 같이 제외)
+            continue
+        analyzed.append({
+            "title": row.title,
+            "description": row.description,
+            **sentiment,
+            "original_category": row.original_category,
+            "issue": row.issue,
+            "pubDate": row.pubDate,
+            "originallink": row.originallink,
+            "company": row.company,
+        })
+    labeled = apply_relevance_labels(
+        analyzed, company_id, search_date, prev_year_categories, reference_categories, category_ids
+    )
+    accumulator = CategoryScoreAccumulator()
+    for a in labeled:
+        accumulator.add(a)
+    category_scores = accumulator.results()
+    return labeled, accumulator, category_scores, rank_categories_by_score(category_scores)
@@ -0,0 +1,144 @@
+"""
+Compact Sentiment Model - 경량 감성 분석 모델 로더
+llm-service/machine_learning/compact_model.py의 export_compact가 만든 디렉터리(model_xxx.compact)를 읽음
+- 어휘(vocab.txt)만 dict로 만들고 가중치/idf는 float32 .npy를 mmap으로 연결 → joblib Pipeline보다 로드가 빠르고 메모리가 적음
+- predict / predict_proba / classes_ / named_steps["clf"]를 sklearn Pipeline과 같은 방식으로 제공
+"""
+import json
+import re
+from pathlib import Path
+from typing import Dict, Iterable, Tuple
+
+import numpy as np
+
+FORMAT_VERSION = 1
+
+
+class CompactSentimentModel:
+    """
+    compact 디렉터리를 읽어 sklearn Pipeline처럼 사용하는 모델
+    - predict / predict_proba(softmax 계열) / decision_function(LinearSVC 계열)
+    - classes_, named_steps["clf"] 제공 → 기존 호출 코드(predict.py, materiality-service) 그대로 사용
+    """
+
+    def __init__(self, path):
+        path = Path(path)
+        self.path = path
+        self.meta = json.loads((path / "meta.json").read_text(encoding="utf-8"))
+        if self.meta.get("format_version") != FORMAT_VERSION:
+            raise ValueError(f"지원하지 않는 compact 형식 버전: {self.meta.get('format_version')}")
+
+        self.version = self.meta.get("model_version")
+        self.kind = self.meta["kind"]
+        self.classes_ = np.array(self.meta["classes"])
+
+        tfidf = self.meta["tfidf"]
+        self._token_re = re.compile(tfidf["token_pattern"])
+        self._min_n, self._max_n = tfidf["ngram_range"]
+        self._lowercase = tfidf["lowercase"]
+        self._sublinear_tf = tfidf["sublinear_tf"]
+        self._use_idf = tfidf["use_idf"]
+        self._norm = tfidf["norm"]
+
+        vocab_text = (path / "vocab.txt").read_text(encoding="utf-8")
+        terms = vocab_text.split("\n") if vocab_text else []
+        self.vocabulary_ = dict(zip(terms, range(len(terms))))
+
+        self.idf_ = np.load(path / "idf.npy", mmap_mode="r")
+        self.weights_ = np.load(path / "weights.npy", mmap_mode="r")
+        self.bias_ = np.load(path / "bias.npy").astype(np.float64)
+
+        self.named_steps = {"clf": self}
+
+    # TF-IDF 재현 (TfidfVectorizer analyzer='word' 규칙)
+    def _term_counts(self, text: str) -> Dict[int, int]:
+        if not isinstance(text, str):
+            text = "" if text is None else str(text)
+        if self._lowercase:
+            text = text.lower()
+        tokens = self._token_re.findall(text)
+
+        vocab = self.vocabulary_
+        counts: Dict[int, int] = {}
+        for n in range(self._min_n, self._max_n + 1):
+            for i in range(len(tokens) - n + 1):
+                term = tokens[i] if n == 1 else " ".join(tokens[i:i + n])
+                j = vocab.get(term)
+                if j is not None:
+                    counts[j] = counts.get(j, 0) + 1
+        return counts
+
+    def _transform(self, texts: Iterable[str]) -> Tuple[int, np.ndarray, np.ndarray, np.ndarray]:
+        """
+        배치 전체를 COO 형태 (행 번호, 특성 번호, 값)로 변환
+        - 토큰화/어휘 조회만 문서 단위, tf/idf/정규화는 배치 전체에 대해 배열 연산
+        """
+        lengths, indices, counts = [], [], []
+        for text in texts:
+            doc = self._term_counts(text)
+            lengths.append(len(doc))
+            indices.extend(doc.keys())
+            counts.extend(doc.values())
+
+        n_docs = len(lengths)
+        rows = np.repeat(np.arange(n_docs), lengths)
+        indices = np.asarray(indices, dtype=np.int64)
+        data = np.asarray(counts, dtype=np.float64)
+        if not len(data):
+            return n_docs, rows, indices, data
+
+        if self._sublinear_tf:
+            data = np.log(data) + 1.0
+        if self._use_idf:
+            data *= self.idf_[indices]
+        if self._norm in ("l1", "l2"):
+            weights = data * data if self._norm == "l2" else np.abs(data)
+            norms = np.bincount(rows, weights=weights, minlength=n_docs)
+            if self._norm == "l2":
+                norms = np.sqrt(norms)
+            norms[norms == 0] = 1.0
+            data /= norms[rows]
+        return n_docs, rows, indices, data
+
+    def _scores(self, texts: Iterable[str]) -> np.ndarray:
+        """배치 점수 (n_docs, n_classes) = 희소 X · weights + bias (sklearn 입력 검증/희소 행렬 생성 없음)"""
+        n_docs, rows, indices, data = self._transform(texts)
+        scores = np.tile(self.bias_, (n_docs, 1))
+        if len(data):
+            contrib = data[:, None] * self.weights_[indices]
+            for k in range(scores.shape[1]):
+                scores[:, k] += np.bincount(rows, weights=contrib[:, k], minlength=n_docs)
+        return scores
+
+    def _predict_proba(self, texts: Iterable[str]) -> np.ndarray:
+        scores = self._scores(texts)
+        scores -= scores.max(axis=1, keepdims=True)
+        np.exp(scores, out=scores)
+        scores /= scores.sum(axis=1, keepdims=True)
+        return scores
+
+    def _decision_function(self, texts: Iterable[str]) -> np.ndarray:
+        scores = self._scores(texts)
+        # 이진 분류: sklearn처럼 classes_[1]에 대한 1차원 점수
+        if scores.shape[1] == 2:
+            return scores[:, 1] - scores[:, 0]
+        return scores
+
+    @property
+    def predict_proba(self):
+        if self.kind != "softmax":
+            raise AttributeError("이 모델은 predict_proba를 지원하지 않습니다 (decision_function 사용)")
+        return self._predict_proba
+
+    @property
+    def decision_function(self):
+        if self.kind != "decision":
+            raise AttributeError("이 모델은 decision_function을 지원하지 않습니다 (predict_proba 사용)")
+        return self._decision_function
+
+    def predict(self, texts: Iterable[str]) -> np.ndarray:
+        return self.classes_[self._scores(texts).argmax(axis=1)]
+
+
+def is_compact_model(path) -> bool:
+    return Path(path).is_dir() and (Path(path) / "meta.json").exists()
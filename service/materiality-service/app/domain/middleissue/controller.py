@@ -3,8 +3,14 @@ Middleissue Controller - MVC 구조에서 BaseModel을 MiddleissueService로 전
 데이터베이스 연결은 하지 않고, Service를 거쳐 Repository까지 BaseModel을 전달
 """
 import logging
-from app.domain.middleissue.schema import MiddleIssueRequest, MiddleIssueResponse
-from app.domain.middleissue.service import start_assessment_with_timeout
+from typing import Optional
+from app.common.database.unit_of_work import UnitOfWork
+from app.domain.middleissue.schema import (
+    BatchAssessmentRequest, MiddleIssueRequest, MiddleIssueResponse, RescoreRequest,
+)
+from app.domain.middleissue.service import rescore_assessment, start_assessment_with_timeout
+from app.domain.middleissue.pipeline import start_pipelined_assessment
+from app.domain.middleissue.batch import get_batch_status, start_batch_assessment
 
 logger = logging.getLogger(__name__)
 
@@ -14,12 +20,13 @@ class MiddleIssueController:
     def __init__(self):
         pass
     
-    async def start_assessment(self, request: MiddleIssueRequest) -> MiddleIssueResponse:
+    async def start_assessment(self, request: MiddleIssueRequest, uow: Optional[UnitOfWork] = None) -> MiddleIssueResponse:
         """
         중대성 평가 시작 요청을 MiddleissueService로 전달 (타임아웃 적용)
         
         Args:
             request: 중대성 평가 시작 요청 데이터 (MiddleIssueRequest)
+            uow: 요청 단위 세션
             
         Returns:
             MiddleIssueResponse: 중대성 평가 시작 응답
@@ -28,7 +35,7 @@ class MiddleIssueController:
             logger.info(f"🔍 컨트롤러: 중대성 평가 시작 요청을 Service로 전달 - 기업: {request.company_id}")
             
             # Service로 요청 전달 (타임아웃 5분 적용)
-            result = await start_assessment_with_timeout(request, timeout_seconds=300)
+            result = await start_assessment_with_timeout(request, timeout_seconds=300, uow=uow)
             
             logger.info(f"✅ 컨트롤러: Service 응답 수신 - {result.get('success', False)}")
             return result
@@ -37,5 +44,91 @@ class MiddleIssueController:
             logger.error(f"❌ 컨트롤러: Service 호출 중 오류 - {str(e)}")
             raise
 
+    async def start_pipelined_assessment(self, request: MiddleIssueRequest, uow: Optional[UnitOfWork] = None) -> MiddleIssueResponse:
+        """
+        크롤링과 평가를 겹쳐 실행하는 파이프라인 평가 요청을 Service로 전달 (타임아웃 적용)
+        
+        Args:
+            request: 중대성 평가 요청 (articles 없이 company_id, report_period만 사용)
+            uow: 요청 단위 세션
+            
+        Returns:
+            MiddleIssueResponse: 중대성 평가 응답 (data.result_id, data.pipeline 포함)
+        """
+        try:
+            logger.info(f"🔍 컨트롤러: 파이프라인 평가 요청을 Service로 전달 - 기업: {request.company_id}")
+            
+            # 크롤링 시간이 포함되므로 일반 평가보다 길게 (10분)
+            result = await start_pipelined_assessment(request, timeout_seconds=600, uow=uow)
+            
+            logger.info(f"✅ 컨트롤러: Service 응답 수신 - {result.get('success', False)}")
+            return result
+            
+        except Exception as e:
+            logger.error(f"❌ 컨트롤러: Service 호출 중 오류 - {str(e)}")
+            raise
+
+    async def rescore_assessment(self, request: RescoreRequest) -> MiddleIssueResponse:
+        """
+        완료된 평가의 what-if 가중치 재계산 요청을 Service로 전달
+        
+        Args:
+            request: 기업/보고기간 + 가중치/최근성 기준 (RescoreRequest)
+            
+        Returns:
+            MiddleIssueResponse: 재계산된 카테고리 순위 (data.ranked_categories)
+        """
+        try:
+            logger.info(f"🔍 컨트롤러: 가중치 재계산 요청을 Service로 전달 - 기업: {request.company_id}")
+            
+            result = rescore_assessment(request)
+            
+            logger.info(f"✅ 컨트롤러: Service 응답 수신 - {result.get('success', False)}")
+            return result
+            
+        except Exception as e:
+            logger.error(f"❌ 컨트롤러: Service 호출 중 오류 - {str(e)}")
+            raise
+
+    async def start_batch_assessment(self, request: BatchAssessmentRequest) -> MiddleIssueResponse:
+        """
+        여러 기업 일괄 평가 작업 시작 요청을 Service로 전달 (작업은 백그라운드에서 실행)
+        
+        Args:
+            request: 기업 목록 + 보고기간 (BatchAssessmentRequest)
+            
+        Returns:
+            MiddleIssueResponse: 작업 ID (data.job_id)
+        """
+        try:
+            logger.info(f"🔍 컨트롤러: 일괄 평가 요청을 Service로 전달 - 기업 {len(request.company_ids)}개")
+            
+            result = await start_batch_assessment(request)
+            
+            logger.info(f"✅ 컨트롤러: Service 응답 수신 - {result.get('success', False)}")
+            return result
+            
+        except Exception as e:
+            logger.error(f"❌ 컨트롤러: Service 호출 중 오류 - {str(e)}")
+            raise
+
+    async def get_batch_status(self, job_id: str, company: Optional[str] = None) -> MiddleIssueResponse:
+        """
+        일괄 평가 작업의 기업별 진행 상황 (company를 주면 그 기업의 평가 결과) 조회
+        
+        Args:
+            job_id: 일괄 평가 작업 ID
+            company: 결과를 받을 기업명 (없으면 진행 상황)
+            
+        Returns:
+            MiddleIssueResponse: 진행 상황 또는 기업 평가 결과
+        """
+        try:
+            return get_batch_status(job_id, company)
+            
+        except Exception as e:
+            logger.error(f"❌ 컨트롤러: Service 호출 중 오류 - {str(e)}")
+            raise
+
 # 컨트롤러 인스턴스 생성
 middleissue_controller = MiddleIssueController()
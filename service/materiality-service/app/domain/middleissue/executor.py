@@ -0,0 +1,268 @@
+"""
+Assessment Executor - 중대성 평가의 CPU 작업(감성 분석/라벨/점수/랭킹)을 프로세스 풀에서 실행
+- 이벤트 루프는 DB 조회와 응답만 담당 → 큰 평가 중에도 헬스체크/issuepool 조회가 바로 응답
+- 워커는 시작 시 모델을 미리 로드 (warm pool), 이후 평가마다 모델 변경 여부만 확인 (load_sentiment_model 캐시)
+- 기사는 pydantic 객체 대신 필드별 리스트(컬럼 배치)로 전달해서 pickle 비용을 줄임
+- 평가 하나 = 작업 하나 → 여러 평가가 서로 다른 코어에서 동시에 실행
+
+환경변수:
+    ASSESSMENT_WORKERS (기본 min(4, CPU-1), 0이면 프로세스 풀 없이 스레드에서 실행)
+    ASSESSMENT_POOL_MIN_ARTICLES (이보다 적은 기사는 전송 비용이 더 커서 스레드에서 실행, 기본 300)
+    ASSESSMENT_MP_START (워커 시작 방식, 기본 spawn - 스레드가 있는 서버 프로세스를 fork하지 않음)
+    ASSESSMENT_THREADS (스레드 실행용 전용 풀 크기, 기본 4 - 기본 executor와 분리해서
+                        검색 스레드가 기본 풀을 모두 차지해도 평가는 계속 진행 → 파이프라인 교착 방지)
+"""
+import asyncio
+import logging
+import multiprocessing
+import os
+import time
+from collections import namedtuple
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from datetime import datetime
+from typing import Any, Dict, List, Optional, Set, Tuple
+
+from app.domain.media.article_store import ARTICLE_FIELDS
+
+logger = logging.getLogger(__name__)
+
+ASSESSMENT_WORKERS = int(os.getenv("ASSESSMENT_WORKERS", str(max(1, min(4, (os.cpu_count() or 2) - 1)))))
+ASSESSMENT_POOL_MIN_ARTICLES = int(os.getenv("ASSESSMENT_POOL_MIN_ARTICLES", "300"))
+ASSESSMENT_MP_START = os.getenv("ASSESSMENT_MP_START", "spawn")
+ASSESSMENT_THREADS = int(os.getenv("ASSESSMENT_THREADS", "4"))
+
+# analyze_sentiment가 읽는 Article 필드만 전달 (검색 결과 보관 형식과 동일)
+ArticleRow = namedtuple("ArticleRow", ARTICLE_FIELDS)
+
+
+def to_columns(articles: List[Any]) -> Dict[str, List[Any]]:
+    """Article 목록 → 필드별 리스트"""
+    return {field: [getattr(a, field, None) for a in articles] for field in ARTICLE_FIELDS}
+
+
+def from_columns(columns: Dict[str, List[Any]]) -> List[ArticleRow]:
+    return [ArticleRow(*values) for values in zip(*(columns[field] for field in ARTICLE_FIELDS))]
+
+
+# ──────────────────────────────────────────────────────────────────────────────
+# 워커 프로세스에서 실행되는 함수 (service는 워커 안에서 import → 순환 import 방지)
+# ──────────────────────────────────────────────────────────────────────────────
+
+def _init_worker():
+    """워커 시작 시 모델 1회 로드"""
+    from app.domain.middleissue import service
+    if service.load_sentiment_model() is None:
+        logger.error("❌ 워커 모델 로드 실패 (평가 요청 시 다시 시도)")
+
+
+def _warmup() -> int:
+    return os.getpid()
+
+
+def run_cpu_stages(
+    columns: Dict[str, List[Any]],
+    company_id: str,
+    search_date: datetime,
+    prev_year_categories: Set[str],
+    reference_categories: Set[str],
+    category_ids: Dict[str, Optional[int]],
+) -> Dict[str, Any]:
+    """모델 로드 → 감성 분석 → 라벨 부여 → 점수 계산 → 랭킹 (DB 조회 없음)"""
+    from app.domain.middleissue import service
+
+    timings: Dict[str, float] = {}
+
+    started = time.perf_counter()
+    model = service.load_sentiment_model()
+    timings["model_load"] = time.perf_counter() - started
+    if not model:
+        raise Exception("감성 분석 모델 로드 실패")
+
+    started = time.perf_counter()
+    analyzed = service.analyze_sentiment(model, from_columns(columns))
+    timings["sentiment"] = time.perf_counter() - started
+
+    started = time.perf_counter()
+    labeled = service.apply_relevance_labels(
+        analyzed, company_id, search_date, prev_year_categories, reference_categories, category_ids
+    )
+    timings["labeling"] = time.perf_counter() - started
+
+    # 누적기는 결과에 포함 → 평가 결과 캐시가 이후 추가 기사만 더해서 점수 갱신
+    started = time.perf_counter()
+    accumulator = service.CategoryScoreAccumulator()
+    for a in labeled:
+        accumulator.add(a)
+    category_scores = accumulator.results()
+    timings["scoring"] = time.perf_counter() - started
+
+    # 🔍 디버깅: 라벨링 결과 분석 (DEBUG 로그일 때만)
+    service.debug_labeling_results(labeled, category_scores)
+
+    started = time.perf_counter()
+    ranked = service.rank_categories_by_score(category_scores)
+    timings["ranking"] = time.perf_counter() - started
+
+    # 기사 목록 대신 응답에 필요한 요약만 반환
+    # (기사 자체는 category_scores/누적기가 같은 객체를 참조 → pickle 시 한 번만 직렬화)
+    return {
+        "article_summary": service.summarize_articles(labeled),
+        "category_scores": category_scores,
+        "accumulator": accumulator,
+        "ranked_categories": ranked,
+        "model_type": type(model).__name__,
+        "timings": timings,
+        "worker_pid": os.getpid(),
+    }
+
+
+def run_label_stages(
+    columns: Dict[str, List[Any]],
+    company_id: str,
+    search_date: datetime,
+    prev_year_categories: Set[str],
+    reference_categories: Set[str],
+    category_ids: Dict[str, Optional[int]],
+) -> List[Dict[str, Any]]:
+    """기사 배치 하나의 감성 분석 → 라벨 부여 (파이프라인 평가용, 점수/랭킹은 호출 쪽에서 누적)"""
+    from app.domain.middleissue import service
+
+    model = service.load_sentiment_model()
+    if not model:
+        raise Exception("감성 분석 모델 로드 실패")
+    analyzed = service.analyze_sentiment(model, from_columns(columns))
+    return service.apply_relevance_labels(
+        analyzed, company_id, search_date, prev_year_categories, reference_categories, category_ids
+    )
+
+
+def run_sentiment_stage(columns: Dict[str, List[Any]]) -> List[Dict[str, Any]]:
+    """감성 분석만 (여러 기업 평가: 기업 간 중복을 제거한 기사 전체를 한 번에, 라벨은 기업별로 호출 쪽에서)"""
+    from app.domain.middleissue import service
+
+    model = service.load_sentiment_model()
+    if not model:
+        raise Exception("감성 분석 모델 로드 실패")
+    return service.analyze_sentiment(model, from_columns(columns))
+
+
+# ──────────────────────────────────────────────────────────────────────────────
+# 이벤트 루프 쪽
+# ──────────────────────────────────────────────────────────────────────────────
+
+class AssessmentExecutor:
+    """CPU 단계 실행기 - 프로세스 풀(기본) 또는 스레드(풀 비활성/작은 요청/풀 장애 시)"""
+
+    def __init__(self, workers: int = ASSESSMENT_WORKERS, min_articles: int = ASSESSMENT_POOL_MIN_ARTICLES,
+                 threads: int = ASSESSMENT_THREADS):
+        self.workers = workers
+        self.min_articles = min_articles
+        self.threads = max(1, threads)
+        self._pool: Optional[ProcessPoolExecutor] = None
+        self._thread_pool: Optional[ThreadPoolExecutor] = None
+        self._warm_task: Optional[asyncio.Task] = None
+
+    def _create_pool(self) -> ProcessPoolExecutor:
+        return ProcessPoolExecutor(
+            max_workers=self.workers,
+            mp_context=multiprocessing.get_context(ASSESSMENT_MP_START),
+            initializer=_init_worker,
+        )
+
+    def _threads(self) -> ThreadPoolExecutor:
+        """스레드 실행용 전용 풀 (처음 사용할 때 생성)"""
+        if self._thread_pool is None:
+            self._thread_pool = ThreadPoolExecutor(max_workers=self.threads, thread_name_prefix="assessment")
+        return self._thread_pool
+
+    async def start(self):
+        """서비스 시작 시 풀 생성 + 백그라운드로 워커 모두 기동 (시작 자체는 기다리지 않음)"""
+        if self.workers <= 0 or self._pool is not None:
+            return
+        self._pool = self._create_pool()
+        self._warm_task = asyncio.create_task(self._warm())
+        logger.info(f"✅ 평가 프로세스 풀 생성: workers={self.workers}, start={ASSESSMENT_MP_START}")
+
+    async def _warm(self):
+        loop = asyncio.get_running_loop()
+        started = time.perf_counter()
+        try:
+            pids = await asyncio.gather(*[
+                loop.run_in_executor(self._pool, _warmup) for _ in range(self.workers)
+            ])
+            logger.info(f"✅ 평가 워커 준비 완료: {len(set(pids))}개, {time.perf_counter() - started:.1f}초")
+        except Exception as e:
+            logger.error(f"❌ 평가 워커 준비 실패: {e}")
+
+    async def stop(self):
+        if self._warm_task is not None:
+            self._warm_task.cancel()
+            self._warm_task = None
+        if self._pool is not None:
+            self._pool.shutdown(wait=False, cancel_futures=True)
+            self._pool = None
+        if self._thread_pool is not None:
+            self._thread_pool.shutdown(wait=False, cancel_futures=True)
+            self._thread_pool = None
+
+    def mode_for(self, article_count: int) -> str:
+        return "process" if self._pool is not None and article_count >= self.min_articles else "thread"
+
+    async def run(
+        self,
+        columns: Dict[str, List[Any]],
+        company_id: str,
+        search_date: datetime,
+        prev_year_categories: Set[str],
+        reference_categories: Set[str],
+        category_ids: Dict[str, Optional[int]],
+    ) -> Dict[str, Any]:
+        """감성 분석 → 라벨 → 점수 → 랭킹 전체 (결과에 실행 방식 mode 포함)"""
+        mode, result = await self._dispatch(
+            run_cpu_stages, len(columns[ARTICLE_FIELDS[0]]),
+            columns, company_id, search_date,
+            prev_year_categories, reference_categories, category_ids,
+        )
+        result["mode"] = mode
+        return result
+
+    async def run_batch(
+        self,
+        columns: Dict[str, List[Any]],
+        company_id: str,
+        search_date: datetime,
+        prev_year_categories: Set[str],
+        reference_categories: Set[str],
+        category_ids: Dict[str, Optional[int]],
+    ) -> List[Dict[str, Any]]:
+        """기사 배치의 감성 분석 → 라벨 (라벨이 붙은 기사 목록)"""
+        _, labeled = await self._dispatch(
+            run_label_stages, len(columns[ARTICLE_FIELDS[0]]),
+            columns, company_id, search_date,
+            prev_year_categories, reference_categories, category_ids,
+        )
+        return labeled
+
+    async def run_sentiment(self, columns: Dict[str, List[Any]]) -> List[Dict[str, Any]]:
+        """기사 컬럼의 감성 분석 결과 목록"""
+        _, analyzed = await self._dispatch(run_sentiment_stage, len(columns[ARTICLE_FIELDS[0]]), columns)
+        return analyzed
+
+    async def _dispatch(self, fn, article_count: int, *args) -> Tuple[str, Any]:
+        loop = asyncio.get_running_loop()
+        if self.mode_for(article_count) == "process":
+            try:
+                return "process", await loop.run_in_executor(self._pool, fn, *args)
+            except BrokenProcessPool as e:
+                # 워커가 죽으면(OOM 등) 풀을 새로 만들고 이번 요청은 스레드에서 처리
+                logger.error(f"❌ 평가 프로세스 풀 장애 → 풀 재생성, 이번 요청은 스레드에서 실행: {e}")
+                pool, self._pool = self._pool, self._create_pool()
+                pool.shutdown(wait=False, cancel_futures=True)
+        # 스레드에서도 루프를 막지 않음 (GIL은 주기적으로 양보됨)
+        # 기본 executor가 아닌 전용 풀 → 페이지 큐에서 대기 중인 검색 스레드와 스레드를 나눠 쓰지 않음
+        return "thread", await loop.run_in_executor(self._threads(), fn, *args)
+
+
+# 싱글톤
+assessment_executor = AssessmentExecutor()
@@ -0,0 +1,72 @@
+"""
+Sentiment Lexicon - 부정/긍정 키워드 사전과 어휘 규칙 1단계 판정 (cascade)
+- extract_keywords: 기사 텍스트에서 사전 키워드 추출 (analyze_sentiment가 사용)
+- cascade_decision: 키워드만으로 결과가 분명한 기사는 바로 판정 → 모호한 기사만 모델로
+  규칙별 정확도/절감률은 llm-service/machine_learning/cascade_eval.py로 라벨 데이터에서 측정 후 켤 것
+표준 라이브러리만 사용 (오프라인 평가 도구가 서비스 의존성 없이 이 파일을 그대로 읽음)
+
+환경변수:
+    SENTIMENT_CASCADE_ENABLED (기본 false)
+    SENTIMENT_CASCADE_RULES (쉼표 구분, 기본 "neg_only,no_hits")
+        neg_only: 부정 키워드 MIN_NEG개 이상 + 긍정 없음 → negative
+        pos_only: 긍정 키워드 MIN_POS개 이상 + 부정 없음 → other
+        no_hits : 키워드 없음 → other
+    SENTIMENT_CASCADE_MIN_NEG (기본 2), SENTIMENT_CASCADE_MIN_POS (기본 2)
+"""
+import os
+import re
+from typing import Iterable, List, Optional, Tuple
+
+NEGATIVE_LEXICON = {
+    "감소","하락","부진","악화","오염","위반","담합","부패","뇌물","횡령","배임","사기",
+    "과징금","벌금","사고","사망","파업","분쟁","갈등","논란","소송","리콜","결함","불량",
+    "누출","유출","화재","적자","파산","구조조정","정리해고","중단","차질","실패","불법",
+    "철수","퇴출","부정","불공정","갑질","직장괴롭힘","폭언","횡포","환불","회수","손실",
+    "경고","제재","해지","취소","낙제","부과","징계","중징계","부정청탁","경영권분쟁","위기","청산"
+}
+
+POSITIVE_LEXICON = {
+    "성장","확대","증가","개선","호조","흑자","최고","선정","수상","포상","산업포장",
+    "강화","상생","협력","도입","출시","선도","인증","확보","우수","도약","확장","회복",
+    "고도화","최적화","안정화","신설","채용","증설","증산","확충","공급","수주","모범",
+    "달성","신기술","개시","증빙","성과","매출증가","고성장","선도기업","수출확대",
+    "해외진출","파트너십","리더","평판","재생에너지","감축","이행","혁신","개발","역대",
+    "순항","껑충","기증","기부","전달","지원","캠페인","후원"
+}
+
+# 정규식 패턴 컴파일 (긴 키워드 우선)
+NEG_RE = re.compile("|".join(map(re.escape, sorted(NEGATIVE_LEXICON, key=len, reverse=True))))
+POS_RE = re.compile("|".join(map(re.escape, sorted(POSITIVE_LEXICON, key=len, reverse=True))))
+
+CASCADE_RULES = ("neg_only", "pos_only", "no_hits")
+
+SENTIMENT_CASCADE_ENABLED = os.getenv("SENTIMENT_CASCADE_ENABLED", "false").lower() == "true"
+SENTIMENT_CASCADE_RULES = frozenset(
+    r.strip() for r in os.getenv("SENTIMENT_CASCADE_RULES", "neg_only,no_hits").split(",") if r.strip()
+)
+SENTIMENT_CASCADE_MIN_NEG = int(os.getenv("SENTIMENT_CASCADE_MIN_NEG", "2"))
+SENTIMENT_CASCADE_MIN_POS = int(os.getenv("SENTIMENT_CASCADE_MIN_POS", "2"))
+
+
+def extract_keywords(text: str, patt: re.Pattern) -> List[str]:
+    if not isinstance(text, str):
+        return []
+    return sorted(set(patt.findall(text)))
+
+
+def cascade_decision(
+    neg_keywords: List[str],
+    pos_keywords: List[str],
+    rules: Iterable[str] = SENTIMENT_CASCADE_RULES,
+    min_neg: int = SENTIMENT_CASCADE_MIN_NEG,
+    min_pos: int = SENTIMENT_CASCADE_MIN_POS,
+) -> Optional[Tuple[str, str]]:
+    """키워드만으로 판정 가능하면 (라벨, 규칙 이름), 모호하면 None (→ 모델)"""
+    n_neg, n_pos = len(neg_keywords), len(pos_keywords)
+    if "neg_only" in rules and n_neg >= min_neg and n_pos == 0:
+        return "negative", "neg_only"
+    if "pos_only" in rules and n_pos >= min_pos and n_neg == 0:
+        return "other", "pos_only"
+    if "no_hits" in rules and n_neg == 0 and n_pos == 0:
+        return "other", "no_hits"
+    return None
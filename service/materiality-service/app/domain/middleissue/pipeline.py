@@ -0,0 +1,225 @@
+"""
+Pipelined Assessment - 미디어 검색(크롤링)과 중대성 평가를 한 요청 안에서 겹쳐 실행
+- 네이버 검색 스레드가 페이지를 받을 때마다 제한된 큐에 넣음 (큐가 차면 검색 스레드가 대기 → 메모리 상한)
+- 평가 워커가 큐에서 배치를 꺼내 중복 제거 → 정제 → 감성 분석/라벨 → 카테고리 누적 (CategoryScoreAccumulator)
+- 마지막 페이지가 도착하면 남은 배치만 처리하고 바로 점수/랭킹 → 전체 시간 ≈ max(크롤링, 평가)
+- 수집한 기사는 검색 결과 보관소에 저장 (응답의 result_id로 /middleissue/assessment 재평가 가능)
+- 평가 상태는 평가 결과 캐시에도 저장 → result_id 재평가는 캐시 적중, what-if 재계산(rescore)도 바로 가능
+
+환경변수:
+    PIPELINE_QUEUE_SIZE (대기 가능한 페이지 배치 수, 기본 32)
+    PIPELINE_WORKERS (평가 워커 수, 기본 2)
+"""
+import asyncio
+import logging
+import os
+import time
+from collections import Counter
+from datetime import date, datetime
+from typing import Any, Dict, List, Optional, Set
+
+from app.common.database.unit_of_work import UnitOfWork
+from app.common.tracing import span
+from app.domain.media.article_store import article_result_store, normalize_columns
+from app.domain.media.service import dedupe_key, filter_news_items, load_search_queries, run_search_queries
+from app.domain.middleissue.assessment_cache import article_fingerprints, assessment_cache, cache_key
+from app.domain.middleissue.executor import assessment_executor
+from app.domain.middleissue.repository import MiddleIssueRepository
+from app.domain.middleissue.schema import MiddleIssueRequest
+from app.domain.middleissue.service import (
+    CategoryScoreAccumulator, build_assessment_response, current_model_signature, current_reference_version,
+    debug_labeling_results,
+    load_sentiment_model, match_categories_with_esg_and_issuepool,
+    rank_categories_by_score, resolve_category_ids, summarize_articles,
+)
+
+logger = logging.getLogger(__name__)
+
+PIPELINE_QUEUE_SIZE = int(os.getenv("PIPELINE_QUEUE_SIZE", "32"))
+PIPELINE_WORKERS = int(os.getenv("PIPELINE_WORKERS", "2"))
+
+# 큐 종료 신호
+_DONE = None
+
+
+async def start_pipelined_assessment(
+    request: MiddleIssueRequest,
+    timeout_seconds: int = 300,
+    uow: Optional[UnitOfWork] = None,
+) -> Dict[str, Any]:
+    """
+    크롤링 + 중대성 평가 (request.articles / result_id 대신 report_period로 직접 검색)
+    응답 형식은 /middleissue/assessment와 같고 data에 result_id, pipeline(단계별 통계)이 추가됨
+    """
+    try:
+        with span("pipelined_assessment", company=request.company_id) as total_span:
+            return await asyncio.wait_for(_run_pipeline(request, uow, total_span), timeout=timeout_seconds)
+    except asyncio.TimeoutError:
+        error_msg = f"❌ 파이프라인 평가 타임아웃 ({timeout_seconds}초 초과)"
+        logger.error(error_msg)
+        return {"success": False, "message": error_msg, "data": None, "timeout": True}
+    except Exception as e:
+        error_msg = f"❌ 파이프라인 평가 중 오류 발생: {str(e)}"
+        logger.error(error_msg)
+        return {"success": False, "message": error_msg, "data": None, "error_type": type(e).__name__}
+
+
+async def _run_pipeline(request: MiddleIssueRequest, uow: Optional[UnitOfWork], total_span) -> Dict[str, Any]:
+    company_id = request.company_id
+    start_date = (request.report_period or {}).get("start_date")
+    if not start_date:
+        raise ValueError("report_period.start_date 가 필요합니다.")
+    end_date = request.report_period.get("end_date") or date.today().isoformat()
+    try:
+        search_year = int(end_date[:4])
+    except ValueError:
+        search_year = datetime.now().year
+        logger.warning(f"⚠️ 연도 파싱 실패 → 기본값 사용: {search_year}년")
+
+    loop = asyncio.get_running_loop()
+    # 모델 로드는 준비 단계(DB 조회)와 겹쳐서 실행
+    model_ready = loop.run_in_executor(None, load_sentiment_model)
+
+    # 1) 준비: 검색 질의, 이전년도/공통 카테고리, 카테고리 이름 → ID (DB 작업은 이벤트 루프에서 순서대로)
+    repository = MiddleIssueRepository(uow)
+    with span("pipeline.prepare"):
+        queries, issue_to_category = await load_search_queries(company_id, uow)
+        corp_issues_prev = await repository.get_corporation_issues(corporation_name=company_id, year=search_year)
+        # 기사의 original_category는 질의의 이슈에서 정해지므로 미리 전부 알 수 있음
+        category_ids = await resolve_category_ids(
+            {issue_to_category.get(q["issue"], q["issue"]) for q in queries}, repository
+        )
+    prev_year_categories = {str(issue.category_id) for issue in corp_issues_prev.year_issues}
+    reference_categories = {str(issue.category_id) for issue in corp_issues_prev.common_issues}
+    search_date = datetime.now()
+    reference_version = current_reference_version()
+    # 크롤링/평가 동안 DB 커넥션 반납 (ESG 매칭에서 새로 체크아웃)
+    if uow is not None:
+        await uow.release()
+
+    queue: asyncio.Queue = asyncio.Queue(maxsize=PIPELINE_QUEUE_SIZE)
+    closed = False
+    seen: Set[Any] = set()
+    kept_items: List[Dict[str, Any]] = []
+    # 평가까지 끝난 기사만 (평가 결과 캐시 지문용 - 실패한 배치 기사는 다음 평가에서 증분으로 다시 평가)
+    scored_items: List[Dict[str, Any]] = []
+    labeled_articles: List[Dict[str, Any]] = []
+    accumulator = CategoryScoreAccumulator()
+    stats = {"pages": 0, "crawled": 0, "duplicates": 0, "filtered_out": 0, "max_queue": 0, "failed_batches": 0}
+
+    def on_page(page_items: List[Dict[str, Any]]) -> None:
+        # 검색 스레드에서 호출 → 큐가 차 있으면 평가가 따라잡을 때까지 여기서 대기
+        # (평가는 assessment_executor 전용 스레드/프로세스 풀에서 실행 → 기본 풀이 검색 스레드로 차도 진행됨)
+        if closed:
+            return
+        asyncio.run_coroutine_threadsafe(queue.put(list(page_items)), loop).result()
+
+    async def score_batch(batch: List[Dict[str, Any]]) -> None:
+        stats["pages"] += 1
+        stats["crawled"] += len(batch)
+        stats["max_queue"] = max(stats["max_queue"], queue.qsize() + 1)
+        fresh = []
+        for it in batch:
+            key = dedupe_key(it)
+            if key in seen:
+                stats["duplicates"] += 1
+                continue
+            seen.add(key)
+            fresh.append(it)
+        items = filter_news_items(fresh, company_id)
+        stats["filtered_out"] += len(fresh) - len(items)
+        if not items:
+            return
+        kept_items.extend(items)
+        labeled = await assessment_executor.run_batch(
+            normalize_columns(items, company_id), company_id, search_date,
+            prev_year_categories, reference_categories, category_ids,
+        )
+        scored_items.extend(items)
+        labeled_articles.extend(labeled)
+        for a in labeled:
+            accumulator.add(a)
+
+    async def worker() -> None:
+        while True:
+            batch = await queue.get()
+            if batch is _DONE:
+                return
+            try:
+                await score_batch(batch)
+            except Exception as e:
+                # 배치 하나가 실패해도 나머지 평가는 계속
+                stats["failed_batches"] += 1
+                logger.error(f"❌ 파이프라인 배치 평가 실패 ({len(batch)}건): {e}")
+
+    if not await model_ready:
+        raise Exception("감성 분석 모델 로드 실패")
+
+    # 2) 크롤링 + 평가 동시 실행
+    workers = [asyncio.create_task(worker()) for _ in range(max(1, PIPELINE_WORKERS))]
+    try:
+        with span("pipeline.crawl", queries=len(queries)) as crawl_span:
+            await run_search_queries(queries, start_date, end_date, issue_to_category, on_page=on_page)
+        crawl_done = time.perf_counter()
+        for _ in workers:
+            await queue.put(_DONE)
+        with span("pipeline.drain"):
+            await asyncio.gather(*workers)
+    finally:
+        closed = True
+        for task in workers:
+            task.cancel()
+        # 대기 중인 검색 스레드가 멈춰 있지 않도록 큐 비우기
+        while not queue.empty():
+            queue.get_nowait()
+
+    # 3) 점수/랭킹 (누적값에서 바로 계산)
+    with span("pipeline.rank", articles=len(labeled_articles)):
+        category_scores = accumulator.results()
+        ranked_categories = rank_categories_by_score(category_scores)
+    tail_seconds = time.perf_counter() - crawl_done
+    debug_labeling_results(labeled_articles, category_scores)
+
+    # 4) ESG 분류 및 이슈풀 매칭
+    with span("esg_matching", categories=len(ranked_categories)):
+        matched_categories = await match_categories_with_esg_and_issuepool(ranked_categories, repository=repository)
+
+    search_period = {"start_date": start_date, "end_date": end_date}
+    stored = article_result_store.put(company_id, search_period, kept_items)
+    article_summary = summarize_articles(labeled_articles)
+    response = build_assessment_response(
+        company_id, request.report_period,
+        article_summary, category_scores, ranked_categories, matched_categories,
+    )
+    model_signature = current_model_signature()
+    if model_signature is not None:
+        assessment_cache.put(cache_key(company_id, search_period), {
+            "article_summary": article_summary,
+            "accumulator": accumulator,
+            "search_date": search_date,
+            "prev_year_categories": prev_year_categories,
+            "reference_categories": reference_categories,
+            "category_ids": category_ids,
+            "model_signature": model_signature,
+            "reference_version": reference_version,
+            "counts": Counter(article_fingerprints(normalize_columns(scored_items, company_id))),
+            # 일반 평가 응답 형식으로 저장 (아래 result_id/pipeline 통계 제외)
+            "response": {**response, "data": dict(response["data"])},
+        })
+    response["data"].update(
+        result_id=stored["result_id"],
+        result_expires_at=stored["expires_at"],
+        pipeline={
+            **stats,
+            "kept": len(kept_items),
+            "crawl_seconds": round(crawl_span.duration, 3),
+            # 마지막 페이지 도착 → 랭킹 완료까지 (평가가 크롤링을 따라잡았으면 거의 0)
+            "tail_seconds": round(tail_seconds, 3),
+            "total_seconds": round(total_span.duration, 3),
+        },
+    )
+    logger.info(
+        f"✅ 파이프라인 평가 완료: {company_id} 수집 {stats['crawled']}건 → 평가 {len(labeled_articles)}건, "
+        f"크롤링 {crawl_span.duration:.2f}초 + 마무리 {tail_seconds:.2f}초"
+    )
+    return response
@@ -0,0 +1,173 @@
+"""
+Reference Data Snapshot - 카테고리/ESG 분류/base 이슈풀 인메모리 스냅샷
+upload_materiality.py 실행 시에만 바뀌는 기준 데이터를 시작 시 메모리에 올려두고,
+버전 비교(주기적 폴링 또는 reload 엔드포인트)로만 새 스냅샷을 만들어 통째로 교체한다.
+"""
+import asyncio
+import logging
+import os
+import time
+from typing import Dict, Iterable, List, Optional
+
+from app.domain.middleissue.repository import MiddleIssueRepository
+from app.common.tracing import traced
+from app.domain.middleissue.schema import (
+    BaseIssuePool, CategoryDetailsResponse, CategoryWithESG, IssuePoolRow
+)
+
+logger = logging.getLogger(__name__)
+
+# 버전 확인 주기 (초, 0 이하면 폴링 비활성화 → reload 엔드포인트로만 갱신)
+REFERENCE_DATA_POLL_INTERVAL = float(os.getenv("REFERENCE_DATA_POLL_INTERVAL", "300"))
+
+
+class ReferenceSnapshot:
+    """
+    한 시점의 기준 데이터 (생성 후 변경하지 않음)
+    - id / 이름 인덱스와 카테고리별 상세(CategoryDetailsResponse)를 미리 계산
+    """
+
+    def __init__(self, version: str, categories: List[CategoryWithESG], issuepools: List[IssuePoolRow]):
+        self.version = version
+        self.loaded_at = time.time()
+        self.categories = categories
+        self.issuepools = issuepools
+
+        self.category_by_id: Dict[int, CategoryWithESG] = {c.id: c for c in categories}
+        self.category_by_name: Dict[str, CategoryWithESG] = {c.category_name: c for c in categories}
+
+        self.issuepools_by_category: Dict[int, List[IssuePoolRow]] = {}
+        for pool in issuepools:
+            self.issuepools_by_category.setdefault(pool.category_id, []).append(pool)
+
+        # get_categories_by_names_batch와 같은 규칙으로 미리 조합
+        self.details_by_name: Dict[str, CategoryDetailsResponse] = {
+            c.category_name: self._build_details(c) for c in categories
+        }
+
+    def _build_details(self, category: CategoryWithESG) -> CategoryDetailsResponse:
+        base_issuepools = []
+        # 중복 제거는 공백을 포함한 문자 그대로 비교
+        seen_pools = set()
+        for pool in self.issuepools_by_category.get(category.id, []):
+            pool_key = (pool.base_issue_pool, pool.issue_pool)
+            if pool_key in seen_pools:
+                continue
+            seen_pools.add(pool_key)
+            base_issuepools.append(BaseIssuePool(
+                id=pool.id,
+                base_issue_pool=pool.base_issue_pool,
+                issue_pool=pool.issue_pool,
+                ranking=pool.ranking,
+                esg_classification_id=category.esg_classification_id
+            ))
+
+        return CategoryDetailsResponse(
+            category_id=str(category.id),
+            normalized_category_id=category.id,
+            esg_classification_id=category.esg_classification_id,
+            esg_classification_name=category.esg_classification_name or '미분류',
+            base_issuepools=base_issuepools,
+            total_count=len(base_issuepools)
+        )
+
+    def get_category_id(self, category_name: str) -> Optional[int]:
+        category = self.category_by_name.get(category_name)
+        return category.id if category else None
+
+    def get_category_esg(self, category_name: str) -> Optional[str]:
+        category = self.category_by_name.get(category_name)
+        return category.esg_classification_name if category else None
+
+    def get_categories_details(self, category_names: Iterable[str]) -> Dict[str, CategoryDetailsResponse]:
+        """이름 목록 → {이름: 상세} (없는 이름은 제외, 반환 객체는 공유되므로 수정 금지)"""
+        return {
+            name: self.details_by_name[name]
+            for name in category_names
+            if name in self.details_by_name
+        }
+
+
+class ReferenceDataStore:
+    """기준 데이터 스냅샷 보관소 - 로드는 한 번에 하나만, 교체는 참조 대입 한 번으로"""
+
+    def __init__(self):
+        self._snapshot: Optional[ReferenceSnapshot] = None
+        self._lock = asyncio.Lock()
+        self._poll_task: Optional[asyncio.Task] = None
+
+    @property
+    def snapshot(self) -> Optional[ReferenceSnapshot]:
+        return self._snapshot
+
+    async def get_snapshot(self) -> Optional[ReferenceSnapshot]:
+        """현재 스냅샷 반환 (아직 없으면 로드 시도, 실패 시 None → 호출측이 DB 조회로 fallback)"""
+        if self._snapshot is None:
+            await self.reload(force=False)
+        return self._snapshot
+
+    @traced("reference_data.reload")
+    async def reload(self, force: bool = True) -> Optional[ReferenceSnapshot]:
+        """
+        버전이 바뀌었거나 force면 새 스냅샷을 만들어 교체
+        로드 중 오류가 나면 기존 스냅샷을 그대로 유지
+        """
+        async with self._lock:
+            current = self._snapshot
+            if current is not None and not force:
+                return current
+            try:
+                repository = MiddleIssueRepository()
+                version = await repository.get_reference_data_version()
+                if current is not None and version is not None and version == current.version:
+                    logger.info(f"✅ 기준 데이터 변경 없음 (version={version[:12]})")
+                    return current
+
+                categories = await repository.get_all_categories_with_esg()
+                issuepools = await repository.get_all_base_issuepools()
+                new_snapshot = ReferenceSnapshot(version or f"t{time.time():.0f}", categories, issuepools)
+                self._snapshot = new_snapshot
+                logger.info(
+                    f"✅ 기준 데이터 스냅샷 로드 완료: 카테고리 {len(categories)}개, "
+                    f"issuepool {len(issuepools)}개 (version={new_snapshot.version[:12]})"
+                )
+                return new_snapshot
+            except Exception as e:
+                logger.error(f"❌ 기준 데이터 스냅샷 로드 실패: {str(e)}")
+                return current
+
+    async def check_version(self) -> bool:
+        """DB 버전과 비교해서 다르면 다시 로드 (변경되었으면 True)"""
+        current = self._snapshot
+        version = await MiddleIssueRepository().get_reference_data_version()
+        if version is None or (current is not None and version == current.version):
+            return False
+        await self.reload(force=True)
+        return self._snapshot is not current
+
+    async def _poll_loop(self):
+        while True:
+            await asyncio.sleep(REFERENCE_DATA_POLL_INTERVAL)
+            try:
+                if await self.check_version():
+                    logger.info("🔄 기준 데이터 변경 감지 → 스냅샷 교체")
+            except Exception as e:
+                logger.error(f"❌ 기준 데이터 버전 확인 중 오류: {str(e)}")
+
+    async def start(self):
+        """서비스 시작 시 로드 + 버전 폴링 시작"""
+        await self.reload(force=True)
+        if REFERENCE_DATA_POLL_INTERVAL > 0 and self._poll_task is None:
+            self._poll_task = asyncio.create_task(self._poll_loop())
+
+    async def stop(self):
+        if self._poll_task is not None:
+            self._poll_task.cancel()
+            try:
+                await self._poll_task
+            except asyncio.CancelledError:
+                pass
+            self._poll_task = None
+
+
+reference_data_store = ReferenceDataStore()
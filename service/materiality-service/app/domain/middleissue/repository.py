@@ -3,6 +3,7 @@ Middleissue Repository - BaseModel을 받아서 데이터베이스 작업을 수
 데이터베이스 연결을 담당하며, BaseModel과 Entity 간의 변환을 처리
 """
 import re
+from contextlib import asynccontextmanager
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy import select, and_, or_, cast, Integer, func, text, join
 from sqlalchemy.exc import ProgrammingError, DBAPIError
@@ -10,10 +11,11 @@ from typing import List, Optional, Dict, Union
 from app.domain.middleissue.schema import (
     MiddleIssueBase, IssueItem, CorporationIssueResponse, 
     CorporationBase, ESGClassificationBase, CategoryBase, CrawledArticleBase,
-    CategoryDetailsResponse, BaseIssuePool
+    CategoryDetailsResponse, BaseIssuePool, CategoryWithESG, IssuePoolRow
 )
 from app.domain.middleissue.entity import MiddleIssueEntity, CorporationEntity, CategoryEntity, ESGClassificationEntity
-from app.common.database.issuepool_db import get_db
+from app.common.database.unit_of_work import UnitOfWork, session_scope
+from app.common.tracing import traced
 import logging
 
 logger = logging.getLogger(__name__)
@@ -57,12 +59,31 @@ async def _safe_scalar(session, stmt, log_ctx: str) -> Optional[int]:
             logger.error(f"❌ 롤백 중 오류: {rb_e}")
         return None
 
+@asynccontextmanager
+async def _savepoint_with_timeout(session, timeout_ms: int):
+    """
+    savepoint 안에서만 statement_timeout 적용
+    - 실패 시 savepoint까지만 롤백 → 요청 세션(UnitOfWork 공유)의 트랜잭션은 계속 사용 가능 (fallback 조회 등)
+    - 성공 시 이전 값 복원 → 같은 요청의 이후 쿼리에는 타임아웃이 남지 않음
+    """
+    async with session.begin_nested():
+        previous = await session.scalar(text("SELECT current_setting('statement_timeout')"))
+        await session.execute(
+            text("SELECT set_config('statement_timeout', :value, true)"), {"value": f"{timeout_ms}ms"}
+        )
+        yield session
+        await session.execute(
+            text("SELECT set_config('statement_timeout', :value, true)"), {"value": previous}
+        )
+
 class MiddleIssueRepository:
     """중간 이슈 리포지토리 - 이슈풀 관련 데이터베이스 작업"""
     
-    def __init__(self):
-        pass
+    def __init__(self, uow: Optional[UnitOfWork] = None):
+        # 요청 단위 세션 (없으면 호출마다 새 세션)
+        self.uow = uow
     
+    @traced()
     async def get_corporation_issues(self, corporation_name: str, year: int) -> CorporationIssueResponse:
         """
         기업명과 연도로 이슈 조회
@@ -73,7 +94,7 @@ class MiddleIssueRepository:
             target_year = year - 1  # 입력받은 연도에서 1을 뺀 값
             logger.info(f"🔍 리포지토리: 기업 '{corporation_name}'의 {target_year}년도 이슈 및 공통 이슈 조회 시작")
             
-            async for db in get_db():
+            async with session_scope(self.uow) as db:
                 # 1. 먼저 기업명으로 corporation_id 조회
                 corp_query = select(CorporationEntity).where(
                     CorporationEntity.companyname == corporation_name
@@ -144,6 +165,7 @@ class MiddleIssueRepository:
             logger.error(f"❌ 리포지토리: 기업 이슈 조회 중 오류 - {str(e)}")
             raise
 
+    @traced()
     async def get_category_details(self, corporation_name: str = "", category_id: str = "", year: int = 0) -> Optional[CategoryDetailsResponse]:
         """
         특정 카테고리의 ESG 분류와 base_issuepool 상세 정보 조회
@@ -161,7 +183,7 @@ class MiddleIssueRepository:
             logger.info(f"🔍 파라미터: 기업명={corporation_name}, 카테고리ID={category_id}, 연도={year}")
             logger.info(f"🔍 카테고리 타입: {type(category_id)}")
             
-            async for db in get_db():
+            async with session_scope(self.uow) as db:
                 logger.info(f"🔍 데이터베이스 연결 성공")
                 
                 # 1. 기업명으로 corporation_id 조회 (빈 문자열이면 건너뛰기)
@@ -296,10 +318,11 @@ class MiddleIssueRepository:
             logger.error(f"❌ 스택 트레이스: {traceback.format_exc()}")
             return None
 
+    @traced()
     async def get_corporation_by_name(self, corporation_name: str) -> Optional[CorporationBase]:
         """기업명으로 기업 정보 조회"""
         try:
-            async for db in get_db():
+            async with session_scope(self.uow) as db:
                 query = select(CorporationEntity).where(
                     CorporationEntity.companyname == corporation_name
                 )
@@ -319,10 +342,11 @@ class MiddleIssueRepository:
             logger.error(f"❌ 기업 정보 조회 중 오류: {str(e)}")
             return None
 
+    @traced()
     async def get_category_by_id(self, category_id: int) -> Optional[CategoryBase]:
         """카테고리 ID로 카테고리 정보 조회"""
         try:
-            async for db in get_db():
+            async with session_scope(self.uow) as db:
                 query = select(CategoryEntity).where(CategoryEntity.id == category_id)
                 result = await db.execute(query)
                 category = result.scalar_one_or_none()
@@ -338,10 +362,11 @@ class MiddleIssueRepository:
             logger.error(f"❌ 카테고리 정보 조회 중 오류: {str(e)}")
             return None
 
+    @traced()
     async def get_esg_classification_by_id(self, esg_id: int) -> Optional[ESGClassificationBase]:
         """ESG 분류 ID로 ESG 분류 정보 조회"""
         try:
-            async for db in get_db():
+            async with session_scope(self.uow) as db:
                 query = select(ESGClassificationEntity).where(ESGClassificationEntity.id == esg_id)
                 result = await db.execute(query)
                 esg = result.scalar_one_or_none()
@@ -356,10 +381,11 @@ class MiddleIssueRepository:
             logger.error(f"❌ ESG 분류 정보 조회 중 오류: {str(e)}")
             return None
 
+    @traced()
     async def get_category_id_by_name(self, category_name: str) -> Optional[int]:
         """카테고리 이름으로 카테고리 ID 조회 (라벨링용)"""
         try:
-            async for db in get_db():
+            async with session_scope(self.uow) as db:
                 query = select(CategoryEntity.id).where(CategoryEntity.category_name == category_name)
                 result = await db.execute(query)
                 category_id = result.scalar_one_or_none()
@@ -368,13 +394,14 @@ class MiddleIssueRepository:
             logger.error(f"❌ 카테고리 이름으로 ID 조회 중 오류: {str(e)}")
             return None
 
+    @traced()
     async def get_category_esg_direct(self, category_name: str) -> Optional[str]:
         """
         카테고리 이름으로 직접 ESG 분류 조회 (materiality_category DB 사용)
         기업과 무관하게 카테고리 자체의 ESG 분류를 반환
         """
         try:
-            async for db in get_db():
+            async with session_scope(self.uow) as db:
                 # CategoryEntity와 ESGClassificationEntity를 JOIN하여 ESG 분류 조회
                 query = select(ESGClassificationEntity.esg).join(
                     CategoryEntity,
@@ -397,6 +424,7 @@ class MiddleIssueRepository:
             logger.error(f"❌ 카테고리 '{category_name}' ESG 분류 조회 중 오류: {str(e)}")
             return None
 
+    @traced()
     async def get_categories_details_batch(
         self,
         corporation_name: str,
@@ -417,9 +445,8 @@ class MiddleIssueRepository:
             return {}
 
         try:
-            async for db in get_db():
-                # (0) statement_timeout 설정 (15초)
-                await db.execute(text("SET LOCAL statement_timeout = '15000ms'"))
+            async with session_scope(self.uow) as session, _savepoint_with_timeout(session, 15000) as db:
+                # (0) statement_timeout 15초 (savepoint 범위)
 
                 # (1) 기업 ID
                 corp = await db.scalar(
@@ -533,10 +560,11 @@ class MiddleIssueRepository:
             logger.error(f"❌ 스택 트레이스: {traceback.format_exc()}")
             return {}
 
+    @traced()
     async def get_middle_issue_with_relations(self, issue_id: int) -> Optional[MiddleIssueBase]:
         """이슈 ID로 이슈 정보와 관련 정보를 함께 조회"""
         try:
-            async for db in get_db():
+            async with session_scope(self.uow) as db:
                 # JOIN을 사용하여 관련 정보를 함께 가져오기
                 query = select(
                     MiddleIssueEntity,
@@ -580,6 +608,7 @@ class MiddleIssueRepository:
             logger.error(f"❌ 이슈 정보 조회 중 오류: {str(e)}")
             return None
 
+    @traced()
     async def get_category_by_name_direct(
         self, 
         corporation_name: str = "", 
@@ -593,7 +622,7 @@ class MiddleIssueRepository:
         try:
             logger.info(f"🔍 카테고리 이름으로 직접 조회: '{category_name}' (기업: {corporation_name}, 연도: {year})")
             
-            async for db in get_db():
+            async with session_scope(self.uow) as db:
                 # 1. 기업명으로 corporation_id 조회 (빈 문자열이면 건너뛰기)
                 corp_id = None
                 if corporation_name and corporation_name.strip():
@@ -691,6 +720,7 @@ class MiddleIssueRepository:
             logger.error(f"❌ 스택 트레이스: {traceback.format_exc()}")
             return None
 
+    @traced()
     async def get_categories_by_names_batch(
         self, 
         category_names: List[str]
@@ -701,9 +731,8 @@ class MiddleIssueRepository:
         - issuepool DB에서 base_issue_pool 조회 (카테고리 기준, 중복 제거)
         """
         try:
-            async for db in get_db():
-                # 성능 최적화를 위한 설정 (SET LOCAL 제거 - 500 에러 방지)
-                # await db.execute(text("SET LOCAL statement_timeout = '30000ms'"))
+            async with session_scope(self.uow) as session, _savepoint_with_timeout(session, 30000) as db:
+                # statement_timeout 30초 (savepoint 범위 - 실패/타임아웃이 요청 트랜잭션을 중단시키지 않음)
                 # await db.execute(text("SET LOCAL work_mem = '256MB'"))
                 
                 logger.warning(f"🔍 배치 쿼리 실행 시작: {len(category_names)}개 카테고리")
@@ -826,4 +855,97 @@ class MiddleIssueRepository:
             logger.error(f"❌ 배치 카테고리 조회 실패: {str(e)}")
             import traceback
             logger.error(f"❌ 스택 트레이스: {traceback.format_exc()}")
-            return {}
\ No newline at end of file
+            return {}
+
+    @traced()
+    async def get_all_categories_with_esg(self) -> List[CategoryWithESG]:
+        """전체 카테고리 + ESG 분류명 조회 (LEFT JOIN 1회)"""
+        try:
+            async with session_scope(self.uow) as db:
+                query = (
+                    select(
+                        CategoryEntity.id,
+                        CategoryEntity.category_name,
+                        CategoryEntity.esg_classification_id,
+                        ESGClassificationEntity.esg.label('esg_classification_name')
+                    )
+                    .select_from(CategoryEntity)
+                    .outerjoin(ESGClassificationEntity, CategoryEntity.esg_classification_id == ESGClassificationEntity.id)
+                    .order_by(CategoryEntity.id)
+                )
+                result = await db.execute(query)
+                return [
+                    CategoryWithESG(
+                        id=row.id,
+                        category_name=row.category_name,
+                        esg_classification_id=row.esg_classification_id,
+                        esg_classification_name=row.esg_classification_name
+                    )
+                    for row in result.all()
+                ]
+        except Exception as e:
+            logger.error(f"❌ 전체 카테고리 조회 중 오류: {str(e)}")
+            raise
+
+    @traced()
+    async def get_all_base_issuepools(self) -> List[IssuePoolRow]:
+        """issuepool 테이블 전체 조회 (카테고리, 랭킹 순)"""
+        try:
+            async with session_scope(self.uow) as db:
+                query = select(
+                    MiddleIssueEntity.id,
+                    MiddleIssueEntity.corporation_id,
+                    MiddleIssueEntity.publish_year,
+                    MiddleIssueEntity.ranking,
+                    MiddleIssueEntity.base_issue_pool,
+                    MiddleIssueEntity.issue_pool,
+                    MiddleIssueEntity.category_id,
+                    MiddleIssueEntity.esg_classification_id
+                ).order_by(MiddleIssueEntity.category_id, MiddleIssueEntity.ranking, MiddleIssueEntity.id)
+                result = await db.execute(query)
+                return [
+                    IssuePoolRow(
+                        id=row.id,
+                        corporation_id=row.corporation_id,
+                        publish_year=row.publish_year,
+                        ranking=row.ranking,
+                        base_issue_pool=row.base_issue_pool,
+                        issue_pool=row.issue_pool,
+                        category_id=row.category_id,
+                        esg_classification_id=row.esg_classification_id
+                    )
+                    for row in result.all()
+                ]
+        except Exception as e:
+            logger.error(f"❌ 전체 base issue pool 조회 중 오류: {str(e)}")
+            raise
+
+    @traced()
+    async def get_reference_data_version(self) -> Optional[str]:
+        """
+        기준 데이터(카테고리/ESG 분류/issuepool) 버전 조회 - 쿼리 1회
+        updated_at 컬럼이 없으므로 테이블마다 스냅샷에 쓰는 컬럼 전체의 내용 해시로 버전을 만든다
+        (행 수/최대 ID만으로는 제자리 UPDATE를 감지하지 못함, NULL 컬럼은 빈 문자열로 바꿔 행이 빠지지 않게 함)
+        """
+        try:
+            async with session_scope(self.uow) as db:
+                query = text("""
+                    SELECT
+                        (SELECT md5(COALESCE(string_agg(
+                                    id || ':' || category_name || ':' || COALESCE(esg_classification_id::text, ''),
+                                    '|' ORDER BY id), ''))
+                           FROM materiality_category) AS category_hash,
+                        (SELECT md5(COALESCE(string_agg(id || ':' || COALESCE(esg, ''), '|' ORDER BY id), ''))
+                           FROM esg_classification) AS esg_hash,
+                        (SELECT md5(COALESCE(string_agg(
+                                    id || ':' || category_id || ':' || corporation_id || ':'
+                                    || COALESCE(esg_classification_id::text, '') || ':' || COALESCE(publish_year, '') || ':'
+                                    || COALESCE(ranking, '') || ':' || base_issue_pool || ':' || issue_pool,
+                                    '|' ORDER BY id), ''))
+                           FROM issuepool) AS issuepool_hash
+                """)
+                row = (await db.execute(query)).one()
+                return f"{row.category_hash}:{row.esg_hash}:{row.issuepool_hash}"
+        except Exception as e:
+            logger.error(f"❌ 기준 데이터 버전 조회 중 오류: {str(e)}")
+            return None
@@ -29,6 +29,33 @@ class MiddleIssueRequest(BaseModel):
     timestamp: str = datetime.now().isoformat()
     articles: List[Article] = Field(default_factory=list)
     total_results: int = 0
+    # /search-media 응답의 result_id (있으면 articles 대신 서버에 보관된 검색 결과 사용)
+    result_id: Optional[str] = None
+
+class ScoreWeights(BaseModel):
+    """카테고리 최종 점수 가중치 (생략한 항목은 기본 가중치 사용)"""
+    frequency: Optional[float] = Field(None, ge=0)
+    relevance: Optional[float] = Field(None, ge=0)
+    recent: Optional[float] = Field(None, ge=0)
+    rank: Optional[float] = Field(None, ge=0)
+    reference: Optional[float] = Field(None, ge=0)
+    negative: Optional[float] = Field(None, ge=0)
+    negative_frequency_boost: Optional[float] = Field(None, ge=0)
+    negative_relevance_boost: Optional[float] = Field(None, ge=0)
+
+class RescoreRequest(BaseModel):
+    """what-if 재계산 요청 - 완료된 평가(같은 기업/보고기간)의 카테고리 합계로 순위만 다시 계산"""
+    company_id: str
+    report_period: dict
+    weights: ScoreWeights = Field(default_factory=ScoreWeights)
+    # 최근성 기준 (발행 후 개월 수): full 이내 1.0, half 이내 0.5
+    recent_full_months: float = Field(3, ge=0)
+    recent_half_months: float = Field(6, ge=0)
+
+class BatchAssessmentRequest(BaseModel):
+    """여러 기업(동종 업계 등) 일괄 평가 요청 - 같은 보고기간으로 검색부터 평가까지 한 번에"""
+    company_ids: List[str]
+    report_period: dict
 
 class MiddleIssueResponse(BaseModel):
     """중간 이슈 응답 스키마"""
@@ -120,6 +147,24 @@ class CategoryDetailsResponse(BaseModel):
     base_issuepools: List[BaseIssuePool]  # List[dict] → List[BaseIssuePool]로 변경
     total_count: int
 
+class CategoryWithESG(BaseModel):
+    """카테고리 + ESG 분류명 스키마 (기준 데이터 스냅샷용)"""
+    id: int
+    category_name: str
+    esg_classification_id: Optional[int] = None
+    esg_classification_name: Optional[str] = None
+
+class IssuePoolRow(BaseModel):
+    """issuepool 테이블 행 스키마 (기준 데이터 스냅샷용)"""
+    id: int
+    corporation_id: Optional[int] = None
+    publish_year: Optional[str] = None
+    ranking: Optional[str] = None
+    base_issue_pool: str
+    issue_pool: str
+    category_id: int
+    esg_classification_id: Optional[int] = None
+
 # ===== 서비스 응답용 스키마 =====
 class BaseIssuePool(BaseModel):
     """Base 이슈풀 상세 정보 스키마"""
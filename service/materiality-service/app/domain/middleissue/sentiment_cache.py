@@ -0,0 +1,174 @@
+"""
+Sentiment Cache - 기사 감성 분석 결과 캐시 (SQLite 파일, 평가/기업 간 공유)
+- 키: 모델 태그 + 정규화한 제목/본문 해시 → 같은 기사(여러 기업이 함께 나오는 통신사 기사 등)는 한 번만 추론
+- 값: 모델 라벨, 부정 확률, 부정/긍정 키워드
+- analyze_sentiment가 배치 단위로 먼저 조회하고, 캐시에 없는 기사만 모델에 넣음
+- 최대 개수를 넘으면 가장 오래 안 쓰인 항목부터 최대 개수의 90%까지 삭제 (LRU)
+  (개수는 프로세스마다 추정치로 누적하고, 상한을 넘었을 때와 일정 저장 횟수마다만 COUNT(*)로 다시 셈)
+- 프로세스 풀 워커들도 같은 파일을 공유 (WAL 모드, 프로세스마다 연결 하나)
+
+환경변수:
+    SENTIMENT_CACHE_ENABLED (기본 true)
+    SENTIMENT_CACHE_PATH (기본 models/sentiment_cache.sqlite3)
+    SENTIMENT_CACHE_MAX_ENTRIES (기본 200000)
+"""
+import hashlib
+import logging
+import os
+import re
+import sqlite3
+import threading
+import time
+from typing import Any, Dict, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+SENTIMENT_CACHE_ENABLED = os.getenv("SENTIMENT_CACHE_ENABLED", "true").lower() == "true"
+SENTIMENT_CACHE_PATH = os.getenv(
+    "SENTIMENT_CACHE_PATH",
+    os.path.join(os.path.dirname(os.path.dirname(os.path.dirname(__file__))), "models", "sentiment_cache.sqlite3"),
+)
+SENTIMENT_CACHE_MAX_ENTRIES = int(os.getenv("SENTIMENT_CACHE_MAX_ENTRIES", "200000"))
+# SQLite IN (...) 파라미터 수 제한보다 작게
+_CHUNK = 500
+# 정리 시 최대 개수의 이 비율까지 삭제 (매 저장마다 정리하지 않도록 여유 확보)
+_TRIM_RATIO = 0.9
+# 다른 프로세스의 저장분을 반영하기 위해 이 횟수마다 실제 개수를 다시 셈
+_RECOUNT_EVERY = 100
+
+_WS_RE = re.compile(r"\s+")
+
+# (label, neg_proba, neg_keywords, pos_keywords)
+CachedSentiment = Tuple[str, float, List[str], List[str]]
+
+
+def content_key(model_tag: str, title: str, description: str) -> str:
+    """모델 태그 + 정규화한 제목/본문 해시 (공백 차이는 같은 기사로 봄)"""
+    text = f"{_WS_RE.sub(' ', title or '').strip()}\n{_WS_RE.sub(' ', description or '').strip()}"
+    return hashlib.sha1(f"{model_tag}\0{text}".encode("utf-8")).hexdigest()
+
+
+def _split_keywords(value: str) -> List[str]:
+    return value.split(",") if value else []
+
+
+class SentimentCache:
+    """감성 분석 결과 LRU 캐시 (SQLite)"""
+
+    def __init__(self, path: str = SENTIMENT_CACHE_PATH, max_entries: int = SENTIMENT_CACHE_MAX_ENTRIES,
+                 enabled: bool = SENTIMENT_CACHE_ENABLED):
+        self.path = path
+        self.max_entries = max_entries
+        self.enabled = enabled
+        self._conn: Optional[sqlite3.Connection] = None
+        self._pid: Optional[int] = None
+        self._lock = threading.Lock()
+        # 이 프로세스가 아는 항목 수 추정치 (저장한 개수만큼 더함, INSERT OR REPLACE 덮어쓰기는 과대 추정)
+        self._count_estimate = 0
+        self._puts_since_count = 0
+        self.hits = 0
+        self.misses = 0
+
+    def _connection(self) -> sqlite3.Connection:
+        # fork/spawn된 워커는 부모의 연결을 쓰지 않고 새로 연결
+        if self._conn is None or self._pid != os.getpid():
+            os.makedirs(os.path.dirname(os.path.abspath(self.path)), exist_ok=True)
+            conn = sqlite3.connect(self.path, timeout=5, check_same_thread=False)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS sentiment_cache ("
+                " key TEXT PRIMARY KEY, model_tag TEXT NOT NULL, label TEXT NOT NULL,"
+                " neg_proba REAL NOT NULL, neg_keywords TEXT NOT NULL, pos_keywords TEXT NOT NULL,"
+                " last_used REAL NOT NULL)"
+            )
+            conn.execute("CREATE INDEX IF NOT EXISTS idx_sentiment_cache_last_used ON sentiment_cache(last_used)")
+            conn.commit()
+            self._conn, self._pid = conn, os.getpid()
+            self._count_estimate = conn.execute("SELECT COUNT(*) FROM sentiment_cache").fetchone()[0]
+            self._puts_since_count = 0
+        return self._conn
+
+    def get_many(self, keys: List[str]) -> Dict[str, CachedSentiment]:
+        """캐시에 있는 키만 반환 (조회된 항목은 last_used 갱신)"""
+        if not self.enabled or not keys:
+            return {}
+        found: Dict[str, CachedSentiment] = {}
+        try:
+            with self._lock:
+                conn = self._connection()
+                unique = list(dict.fromkeys(keys))
+                for i in range(0, len(unique), _CHUNK):
+                    chunk = unique[i:i + _CHUNK]
+                    rows = conn.execute(
+                        "SELECT key, label, neg_proba, neg_keywords, pos_keywords FROM sentiment_cache"
+                        f" WHERE key IN ({','.join('?' * len(chunk))})",
+                        chunk,
+                    ).fetchall()
+                    for key, label, neg_proba, neg_kw, pos_kw in rows:
+                        found[key] = (label, neg_proba, _split_keywords(neg_kw), _split_keywords(pos_kw))
+                if found:
+                    now = time.time()
+                    conn.executemany("UPDATE sentiment_cache SET last_used = ? WHERE key = ?",
+                                     [(now, k) for k in found])
+                    conn.commit()
+        except sqlite3.Error as e:
+            logger.warning(f"⚠️ 감성 캐시 조회 실패 (모델로 계속): {e}")
+            return {}
+        self.hits += sum(1 for k in keys if k in found)
+        self.misses += sum(1 for k in keys if k not in found)
+        return found
+
+    def put_many(self, model_tag: str, entries: Dict[str, CachedSentiment]) -> None:
+        """새 결과 저장 후 최대 개수를 넘으면 오래 안 쓰인 항목 삭제"""
+        if not self.enabled or not entries:
+            return
+        now = time.time()
+        try:
+            with self._lock:
+                conn = self._connection()
+                conn.executemany(
+                    "INSERT OR REPLACE INTO sentiment_cache"
+                    " (key, model_tag, label, neg_proba, neg_keywords, pos_keywords, last_used)"
+                    " VALUES (?, ?, ?, ?, ?, ?, ?)",
+                    [
+                        (key, model_tag, label, float(neg_proba), ",".join(neg_kw), ",".join(pos_kw), now)
+                        for key, (label, neg_proba, neg_kw, pos_kw) in entries.items()
+                    ],
+                )
+                self._count_estimate += len(entries)
+                self._puts_since_count += 1
+                if self._count_estimate > self.max_entries or self._puts_since_count >= _RECOUNT_EVERY:
+                    self._trim(conn)
+                conn.commit()
+        except sqlite3.Error as e:
+            logger.warning(f"⚠️ 감성 캐시 저장 실패 (무시): {e}")
+
+    def _trim(self, conn: sqlite3.Connection) -> None:
+        """실제 개수를 세고 최대 개수를 넘었으면 오래 안 쓰인 항목부터 _TRIM_RATIO까지 삭제"""
+        (count,) = conn.execute("SELECT COUNT(*) FROM sentiment_cache").fetchone()
+        if count > self.max_entries:
+            excess = count - int(self.max_entries * _TRIM_RATIO)
+            conn.execute(
+                "DELETE FROM sentiment_cache WHERE key IN"
+                " (SELECT key FROM sentiment_cache ORDER BY last_used LIMIT ?)",
+                (excess,),
+            )
+            logger.info(f"🧹 감성 캐시 정리: {excess}개 삭제")
+            count -= excess
+        self._count_estimate = count
+        self._puts_since_count = 0
+
+    def stats(self) -> Dict[str, Any]:
+        total = self.hits + self.misses
+        return {
+            "enabled": self.enabled,
+            "path": self.path,
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_ratio": round(self.hits / total, 4) if total else 0.0,
+        }
+
+
+# 싱글톤 (프로세스마다 하나)
+sentiment_cache = SentimentCache()
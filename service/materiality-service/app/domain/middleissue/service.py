@@ -10,19 +10,34 @@ Middleissue Service - 중대성 평가 관련 비즈니스 로직 처리
 
 import logging
 import os
-import re
 import json
+import time
+import bisect
 import joblib
 import numpy as np
+from collections import Counter
 from datetime import datetime
-from typing import Dict, Any, List, Set, Tuple
+from typing import Dict, Any, List, Set, Tuple, Optional
 
 from dateutil import parser
 from app.domain.middleissue.schema import (
-    MiddleIssueRequest, MiddleIssueResponse, Article,
+    MiddleIssueRequest, MiddleIssueResponse, Article, RescoreRequest,
     CategoryDetailsResponse, BaseIssuePool
 )
 from app.domain.middleissue.repository import MiddleIssueRepository
+from app.domain.middleissue.reference_data import reference_data_store
+from app.domain.middleissue.compact_model import CompactSentimentModel, is_compact_model
+from app.domain.middleissue.sentiment_cache import content_key, sentiment_cache
+from app.domain.middleissue.lexicon import (
+    NEG_RE as _NEG_RE, POS_RE as _POS_RE, SENTIMENT_CASCADE_ENABLED, cascade_decision, extract_keywords,
+)
+from app.domain.middleissue.executor import assessment_executor, to_columns
+from app.domain.middleissue.assessment_cache import (
+    CacheKey, article_fingerprints, assessment_cache, cache_key, new_article_indices,
+)
+from app.domain.media.article_store import ARTICLE_FIELDS, article_result_store
+from app.common.database.unit_of_work import UnitOfWork
+from app.common.tracing import span, traced
 
 # Railway 환경에서 로그 레이트 리밋 방지를 위한 로깅 설정
 if os.getenv('RAILWAY_ENVIRONMENT') or True:  # 즉시 적용을 위해 True로 설정
@@ -36,33 +51,35 @@ logger = logging.getLogger(__name__)
 # 로깅 레벨 강제 설정 (즉시 적용)
 logger.setLevel(logging.WARNING)
 
-NEGATIVE_LEXICON = {
-    "감소","하락","부진","악화","오염","위반","담합","부패","뇌물","횡령","배임","사기",
-    "과징금","벌금","사고","사망","파업","분쟁","갈등","논란","소송","리콜","결함","불량",
-    "누출","유출","화재","적자","파산","구조조정","정리해고","중단","차질","실패","불법",
-    "철수","퇴출","부정","불공정","갑질","직장괴롭힘","폭언","횡포","환불","회수","손실",
-    "경고","제재","해지","취소","낙제","부과","징계","중징계","부정청탁","경영권분쟁","위기","청산"
-}
-
-POSITIVE_LEXICON = {
-    "성장","확대","증가","개선","호조","흑자","최고","선정","수상","포상","산업포장",
-    "강화","상생","협력","도입","출시","선도","인증","확보","우수","도약","확장","회복",
-    "고도화","최적화","안정화","신설","채용","증설","증산","확충","공급","수주","모범",
-    "달성","신기술","개시","증빙","성과","매출증가","고성장","선도기업","수출확대",
-    "해외진출","파트너십","리더","평판","재생에너지","감축","이행","혁신","개발","역대",
-    "순항","껑충","기증","기부","전달","지원","캠페인","후원"
-}
-
 # 모델 경로 설정
-MODEL_PATH = os.path.join(
+MODEL_DIR = os.path.join(
     os.path.dirname(os.path.dirname(os.path.dirname(__file__))),
-    'models',
-    'model_multinomialnb.joblib'
+    'models'
 )
+MODEL_PATH = os.path.join(MODEL_DIR, 'model_multinomialnb.joblib')
+# 경량 아티팩트(export_compact 결과)가 있으면 joblib보다 우선 사용
+COMPACT_MODEL_PATH = os.path.join(MODEL_DIR, 'model_multinomialnb.compact')
+# 증분 학습(llm-service/machine_learning/incremental_learning.py --publish)이 게시한 최신 버전 정보
+MODEL_MANIFEST_PATH = os.path.join(MODEL_DIR, 'model_manifest.json')
+
+# 최근성 라벨 기준 (발행 후 개월 수, 1개월 = 30일): FULL 이내 1.0, HALF 이내 0.5
+RECENT_FULL_MONTHS = 3
+RECENT_HALF_MONTHS = 6
+
+# 카테고리 최종 점수 가중치 (what-if 재계산 요청은 이 기본값을 덮어씀)
+DEFAULT_SCORE_WEIGHTS: Dict[str, float] = {
+    "frequency": 0.4,
+    "relevance": 0.6,
+    "recent": 0.2,
+    "rank": 0.4,
+    "reference": 0.6,
+    "negative": 0.8,
+    "negative_frequency_boost": 0.5,
+    "negative_relevance_boost": 0.5,
+}
 
-# 정규식 패턴 컴파일
-_NEG_RE = re.compile("|".join(map(re.escape, sorted(NEGATIVE_LEXICON, key=len, reverse=True))))
-_POS_RE = re.compile("|".join(map(re.escape, sorted(POSITIVE_LEXICON, key=len, reverse=True))))
+# 로드한 모델 캐시: (모델 파일 경로, 수정 시각)이 같으면 재사용
+_sentiment_model_cache: Dict[str, Any] = {"key": None, "model": None, "version": None}
 
 def parse_pubdate(date_str: str) -> datetime:
     """다양한 형식의 날짜 문자열을 datetime으로 파싱"""
@@ -84,54 +101,174 @@ def parse_pubdate(date_str: str) -> datetime:
         logger.warning(f"⚠️ 날짜 파싱 실패 ({date_str}): {str(e)}")
         return datetime.now()  # 파싱 실패 시 현재 시간 반환
 
-def extract_keywords(text: str, patt: re.Pattern) -> List[str]:
-    if not isinstance(text, str):
-        return []
-    return sorted(set(patt.findall(text)))
+def _resolve_model_path() -> Tuple[str, str]:
+    """manifest가 있으면 게시된 최신 버전, 없으면 기본 모델 경로 (경로, 버전)"""
+    try:
+        if os.path.exists(MODEL_MANIFEST_PATH):
+            with open(MODEL_MANIFEST_PATH, encoding='utf-8') as f:
+                manifest = json.load(f)
+            path = os.path.join(MODEL_DIR, os.path.basename(manifest["model_file"]))
+            if os.path.exists(path):
+                return path, f"v{manifest.get('version')}"
+            logger.warning(f"⚠️ manifest의 모델 파일 없음: {path} → 기본 모델 사용")
+    except Exception as e:
+        logger.warning(f"⚠️ 모델 manifest 읽기 실패: {str(e)} → 기본 모델 사용")
+    if is_compact_model(COMPACT_MODEL_PATH):
+        return COMPACT_MODEL_PATH, "base-compact"
+    return MODEL_PATH, "base"
+
+def _model_file_key(path: str) -> Tuple[str, float]:
+    """(모델 경로, 수정 시각) - compact 디렉터리는 마지막에 쓰이는 meta.json 기준으로 변경 감지"""
+    return path, os.path.getmtime(os.path.join(path, 'meta.json') if is_compact_model(path) else path)
+
+def current_model_signature() -> Optional[str]:
+    """지금 게시된 모델 식별자 (모델을 로드하지 않고 파일 정보만 확인 - 평가 결과 캐시 무효화용)"""
+    try:
+        path, version = _resolve_model_path()
+        _, mtime = _model_file_key(path)
+        return f"{version}:{os.path.basename(path)}:{mtime:.0f}"
+    except OSError as e:
+        logger.warning(f"⚠️ 모델 파일 정보 확인 실패: {str(e)}")
+        return None
+
+def current_reference_version() -> Optional[str]:
+    """지금 기준 데이터 스냅샷 버전 (ESG/이슈풀 매칭 기준 - 평가 결과 캐시 무효화용, 스냅샷이 없으면 None)"""
+    snapshot = reference_data_store.snapshot
+    return snapshot.version if snapshot is not None else None
 
 def load_sentiment_model():
-    """감성 분석 모델 로드"""
+    """감성 분석 모델 로드 (게시된 새 버전이 있으면 교체, 같으면 캐시 재사용)"""
     try:
-        logger.info(f"🤖 감성 분석 모델 로드 시도: {MODEL_PATH}")
-        model = joblib.load(MODEL_PATH)
-        logger.info("✅ 감성 분석 모델 로드 성공")
+        path, version = _resolve_model_path()
+        key = _model_file_key(path)
+        if _sentiment_model_cache["key"] == key:
+            return _sentiment_model_cache["model"]
+
+        logger.info(f"🤖 감성 분석 모델 로드 시도: {path} ({version})")
+        model = CompactSentimentModel(path) if is_compact_model(path) else joblib.load(path)
+        _sentiment_model_cache.update(key=key, model=model, version=version)
+        logger.info(f"✅ 감성 분석 모델 로드 성공 ({version})")
         return model
     except Exception as e:
         logger.error(f"❌ 감성 분석 모델 로드 실패: {str(e)}")
+        # 새 버전 로드에 실패하면 이전에 로드한 모델 유지
+        return _sentiment_model_cache["model"]
+
+def _predict_negative_batch(model, texts: List[str]) -> Optional[Tuple[List[str], List[float]]]:
+    """
+    전체 기사를 한 번의 predict_proba 호출로 예측 → (라벨 목록, 부정 확률 목록)
+    (기사마다 predict + predict_proba 두 번 호출하던 오버헤드 제거, 실패 시 None → 기사별 처리)
+    """
+    if model is None or not texts:
+        return None
+    try:
+        probas = model.predict_proba(texts)
+        classes = getattr(model.named_steps.get("clf", model), "classes_", None)
+        if classes is None:
+            classes = getattr(model, "classes_", None)
+        classes = np.asarray(classes)
+
+        labels = classes[probas.argmax(axis=1)].tolist()
+        if "negative" in classes:
+            neg_idx = int(np.where(classes == "negative")[0][0])
+            neg_probas = probas[:, neg_idx].astype(float).tolist()
+        else:
+            neg_probas = [0.0] * len(texts)
+        return labels, neg_probas
+    except Exception as e:
+        logger.warning(f"⚠️ 배치 감성 예측 실패 → 기사별 예측으로 전환: {str(e)}")
         return None
 
+def _model_cache_tag(model) -> Optional[str]:
+    """감성 캐시 키에 쓰는 모델 식별자 (load_sentiment_model로 로드한 모델만, 다른 모델이면 None → 캐시 안 씀)"""
+    key = _sentiment_model_cache["key"]
+    if model is None or key is None or model is not _sentiment_model_cache["model"]:
+        return None
+    # 같은 버전 이름으로 다시 게시해도 구분되도록 파일 수정 시각 포함
+    return f"{_sentiment_model_cache['version']}:{os.path.basename(key[0])}:{key[1]:.0f}"
+
 def analyze_sentiment(model, articles: List[Article]) -> List[Dict[str, Any]]:
-    """기사 감성 분석 수행"""
+    """기사 감성 분석 수행 (감성 캐시 적중/어휘 규칙으로 정해진 기사는 추론 생략, 나머지만 한 번에 예측)"""
     try:
         analyzed_articles: List[Dict[str, Any]] = []
-        for article in articles:
+        model_tag = _model_cache_tag(model)
+        cache_keys: List[Optional[str]] = [None] * len(articles)
+        cached: Dict[str, Any] = {}
+        if model_tag is not None:
+            cache_keys = [content_key(model_tag, a.title, a.description) for a in articles]
+            cached = sentiment_cache.get_many(cache_keys)
+            logger.info(f"🔍 감성 캐시 적중: {sum(1 for k in cache_keys if k in cached)}/{len(articles)}건")
+        hits = [cached.get(key) if key is not None else None for key in cache_keys]
+
+        # 키워드 추출 + 어휘 규칙(cascade)으로 분명한 기사는 모델 생략
+        keywords: List[Tuple[List[str], List[str]]] = []
+        decided: Dict[int, Tuple[str, str]] = {}
+        for i, article in enumerate(articles):
+            if hits[i] is not None:
+                keywords.append((hits[i][2], hits[i][3]))
+                continue
+            full_text = f"{article.title} {article.description}"
+            neg_keywords = extract_keywords(full_text, _NEG_RE)
+            pos_keywords = extract_keywords(full_text, _POS_RE)
+            keywords.append((neg_keywords, pos_keywords))
+            if SENTIMENT_CASCADE_ENABLED and model is not None:
+                decision = cascade_decision(neg_keywords, pos_keywords)
+                if decision is not None:
+                    decided[i] = decision
+        if decided:
+            logger.info(f"🔍 어휘 규칙으로 판정: {len(decided)}/{len(articles)}건 (모델 생략)")
+
+        # 캐시/규칙으로 정해지지 않은 기사만 모델에 (miss_pos: 기사 인덱스 → 배치 내 위치)
+        miss_pos: Dict[int, int] = {}
+        for i in range(len(articles)):
+            if hits[i] is None and i not in decided:
+                miss_pos[i] = len(miss_pos)
+        batch = _predict_negative_batch(
+            model, [f"{articles[i].title} {articles[i].description}" for i in miss_pos]
+        )
+        new_entries: Dict[str, Any] = {}
+        for i, article in enumerate(articles):
             try:
                 title_text = article.title
                 desc_text = article.description
                 full_text = f"{title_text} {desc_text}"
+                hit = hits[i]
 
                 # 키워드 기반
-                neg_keywords = extract_keywords(full_text, _NEG_RE)
-                pos_keywords = extract_keywords(full_text, _POS_RE)
+                neg_keywords, pos_keywords = keywords[i]
                 has_both = len(neg_keywords) > 0 and len(pos_keywords) > 0
 
                 # 모델 기반
                 if model is not None:
                     try:
-                        y_pred = model.predict([full_text])[0]
-                        probas = model.predict_proba([full_text])[0]
+                        if i in decided:
+                            y_pred = decided[i][0]
+                            neg_proba = 1.0 if y_pred == "negative" else 0.0
+                        elif hit is not None:
+                            y_pred, neg_proba = hit[0], hit[1]
+                        elif batch is not None:
+                            y_pred, neg_proba = batch[0][miss_pos[i]], batch[1][miss_pos[i]]
+                        else:
+                            y_pred = model.predict([full_text])[0]
+                            probas = model.predict_proba([full_text])[0]
 
-                        classes = getattr(model.named_steps.get("clf", model), "classes_", None)
-                        if classes is None:
-                            classes = getattr(model, "classes_", None)
+                            classes = getattr(model.named_steps.get("clf", model), "classes_", None)
+                            if classes is None:
+                                classes = getattr(model, "classes_", None)
 
-                        if classes is not None and "negative" in classes:
-                            neg_idx = int(np.where(classes == "negative")[0][0])
-                            neg_proba = float(probas[neg_idx])
-                        else:
-                            neg_proba = 0.0
+                            if classes is not None and "negative" in classes:
+                                neg_idx = int(np.where(classes == "negative")[0][0])
+                                neg_proba = float(probas[neg_idx])
+                            else:
+                                neg_proba = 0.0
+
+                        if hit is None and i not in decided and cache_keys[i] is not None:
+                            new_entries[cache_keys[i]] = (y_pred, float(neg_proba), neg_keywords, pos_keywords)
 
-                        if y_pred == "negative" and has_both:
+                        if i in decided:
+                            final_sentiment = y_pred
+                            final_basis = f"어휘 규칙 판정 ({decided[i][1]})"
+                        elif y_pred == "negative" and has_both:
                             final_sentiment = "other"
                             final_basis = "부정+긍정 동시 출현 → other"
                         else:
@@ -166,34 +303,52 @@ def analyze_sentiment(model, articles: List[Article]) -> List[Dict[str, Any]]:
                 logger.error(f"❌ 기사 감성 분석 중 오류: {str(e)}; 제목: {getattr(article, 'title', '')}")
                 continue
 
+        if model_tag is not None:
+            sentiment_cache.put_many(model_tag, new_entries)
         return analyzed_articles
     except Exception as e:
         logger.error(f"❌ 감성 분석 중 오류 발생: {str(e)}")
         return []
 
-async def add_relevance_labels(
+async def resolve_category_ids(
+    category_names: Set[str],
+    repository: Optional[MiddleIssueRepository] = None,
+) -> Dict[str, Optional[int]]:
+    """카테고리 이름 → ID (스냅샷이 있으면 쿼리 없이, 없으면 이름마다 한 번만 조회)"""
+    snapshot = await reference_data_store.get_snapshot()
+    if snapshot is not None:
+        return {name: snapshot.get_category_id(name) for name in category_names}
+    repository = repository or MiddleIssueRepository()
+    category_ids: Dict[str, Optional[int]] = {}
+    for name in category_names:
+        try:
+            category_ids[name] = await repository.get_category_id_by_name(name)
+        except Exception as e:
+            logger.warning(f"⚠️ 카테고리 ID 변환 중 오류: {e}")
+            category_ids[name] = None
+    return category_ids
+
+def apply_relevance_labels(
     articles: List[Dict[str, Any]],
     company_id: str,
     search_date: datetime,
-    prev_year_categories: Set[str],   # (검색 기준연도 - 1)의 category id 집합
-    reference_categories: Set[str],   # publish_year = NULL/''/'0' 의 category id 집합
+    prev_year_categories: Set[str],
+    reference_categories: Set[str],
+    category_ids: Dict[str, Optional[int]],
 ) -> List[Dict[str, Any]]:
     """
-    라벨 정의:
-    - relevance : 제목에 기업명 포함이면 '++' (True)
-    - recent    : 3개월 이내=1.0, 3~6개월=0.5, 그 외=0.0
-    - rank      : original_category ∈ prev_year_categories → True
-    - reference : original_category ∈ reference_categories → True
+    라벨 부여 (DB 조회 없는 순수 계산 - 프로세스 풀 워커에서도 실행)
+    category_ids: resolve_category_ids 결과 (original_category 이름 → ID)
     """
     try:
-        repository = MiddleIssueRepository()
-        
         for a in articles:
             a["relevance_label"] = False
             a["recent_value"] = 0.0
             a["rank_label"] = False
             a["reference_label"] = False
             a["label_reasons"] = []
+            # 발행 후 경과 일수 (what-if 재계산에서 최근성 기준을 바꿀 때 사용, 날짜를 모르면 None)
+            a["age_days"] = None
 
             # relevance
             title = a.get("title") or ""
@@ -206,155 +361,196 @@ async def add_relevance_labels(
             if pub_str:
                 try:
                     pub_dt = parse_pubdate(pub_str)
-                    months_diff = (search_date - pub_dt).days / 30
-                    if months_diff <= 3:
+                    age_days = (search_date - pub_dt).days
+                    a["age_days"] = age_days
+                    months_diff = age_days / 30
+                    if months_diff <= RECENT_FULL_MONTHS:
                         a["recent_value"] = 1.0
-                        a["label_reasons"].append("최근 3개월 이내")
-                    elif months_diff <= 6:
+                        a["label_reasons"].append(f"최근 {RECENT_FULL_MONTHS}개월 이내")
+                    elif months_diff <= RECENT_HALF_MONTHS:
                         a["recent_value"] = 0.5
-                        a["label_reasons"].append("최근 3~6개월")
+                        a["label_reasons"].append(f"최근 {RECENT_FULL_MONTHS}~{RECENT_HALF_MONTHS}개월")
                 except Exception as e:
                     logger.warning(f"⚠️ recent 계산 중 날짜 파싱 실패: {e}")
 
             # rank/reference (카테고리 이름을 ID로 변환하여 비교)
             oc = a.get("original_category")
             if oc is not None:
-                try:
-                    # 카테고리 이름을 ID로 변환
-                    category_id = await repository.get_category_id_by_name(str(oc))
-                    if category_id is not None:
-                        oc_key = str(category_id)
-                        
-                        if oc_key in prev_year_categories:
-                            a["rank_label"] = True
-                            a["label_reasons"].append("이전년도 카테고리 매칭")
+                category_id = category_ids.get(str(oc))
+                if category_id is not None:
+                    oc_key = str(category_id)
 
-                        if oc_key in reference_categories:
-                            a["reference_label"] = True
-                            a["label_reasons"].append("공통 카테고리 매칭")
-                    else:
-                        logger.warning(f"⚠️ 카테고리 이름 '{oc}'을 ID로 변환할 수 없음")
-                except Exception as e:
-                    logger.warning(f"⚠️ 카테고리 ID 변환 중 오류: {e}")
+                    if oc_key in prev_year_categories:
+                        a["rank_label"] = True
+                        a["label_reasons"].append("이전년도 카테고리 매칭")
+
+                    if oc_key in reference_categories:
+                        a["reference_label"] = True
+                        a["label_reasons"].append("공통 카테고리 매칭")
+                else:
+                    logger.warning(f"⚠️ 카테고리 이름 '{oc}'을 ID로 변환할 수 없음")
 
         return articles
     except Exception as e:
         logger.error(f"❌ 라벨 부여 중 오류: {e}")
         return articles
 
-def calculate_category_scores(articles: List[Dict[str, Any]]) -> Dict[str, Dict[str, Any]]:
+async def add_relevance_labels(
+    articles: List[Dict[str, Any]],
+    company_id: str,
+    search_date: datetime,
+    prev_year_categories: Set[str],   # (검색 기준연도 - 1)의 category id 집합
+    reference_categories: Set[str],   # publish_year = NULL/''/'0' 의 category id 집합
+    repository: Optional[MiddleIssueRepository] = None,
+) -> List[Dict[str, Any]]:
     """
-    카테고리별 점수 계산
-
-    점수 체계:
-    - frequency_score: 해당 카테고리 빈도 (0~1)
-    - relevance_score: 카테고리 기사들의 relevance_label 평균 (True=1, False=0)
-    - recent_score   : 카테고리 기사들의 recent_value 평균 (1/0.5/0)
-    - rank_score     : 카테고리 내 rank_label 존재 여부(0/1)  ※ 전부 동일하다는 가정
-    - negative_score : 카테고리 내 부정 기사 비율 (0~1)
-    - reference_score: 카테고리 내 reference_label 존재 여부(0/1)
-
-    최종 점수:
-    final = 0.4*frequency
-          + 0.6*relevance
-          + 0.2*recent
-          + 0.4*rank
-          + 0.6*reference
-          + 0.8*negative*(1 + 0.5*frequency + 0.5*relevance)
+    라벨 정의:
+    - relevance : 제목에 기업명 포함이면 '++' (True)
+    - recent    : 3개월 이내=1.0, 3~6개월=0.5, 그 외=0.0
+    - rank      : original_category ∈ prev_year_categories → True
+    - reference : original_category ∈ reference_categories → True
     """
     try:
-        total_articles = len(articles)
-        if total_articles == 0:
-            return {}
+        category_ids = await resolve_category_ids(
+            {str(a["original_category"]) for a in articles if a.get("original_category") is not None},
+            repository,
+        )
+    except Exception as e:
+        logger.error(f"❌ 라벨 부여 중 오류: {e}")
+        return articles
+    return apply_relevance_labels(
+        articles, company_id, search_date, prev_year_categories, reference_categories, category_ids
+    )
+
+def compute_final_score(
+    frequency: float,
+    relevance: float,
+    recent: float,
+    rank: float,
+    reference: float,
+    negative: float,
+    weights: Dict[str, float] = DEFAULT_SCORE_WEIGHTS,
+) -> float:
+    """카테고리 최종 점수 (weights 키는 DEFAULT_SCORE_WEIGHTS와 동일)"""
+    return (
+        weights["frequency"] * frequency
+        + weights["relevance"] * relevance
+        + weights["recent"] * recent
+        + weights["rank"] * rank
+        + weights["reference"] * reference
+        + weights["negative"] * negative * (
+            1 + weights["negative_frequency_boost"] * frequency + weights["negative_relevance_boost"] * relevance
+        )
+    )
 
-        buckets: Dict[str, Dict[str, Any]] = {}
-        empty_category_count = 0
-        missing_category_count = 0
-        
-        for a in articles:
-            cat = a.get("original_category")
-            if cat is None:
-                missing_category_count += 1
-                logger.warning(f"🚨 original_category가 None인 기사 발견 - 기사 제목: '{a.get('title', 'N/A')[:50]}...'")
-                continue
-            
-            # 빈 카테고리 체크 (데이터 품질 문제)
-            key = str(cat).strip()
-            if not key:  # 빈 문자열이거나 공백만 있는 경우
-                empty_category_count += 1
-                logger.warning(f"🚨 빈 카테고리 발견 - 기사 제목: '{a.get('title', 'N/A')[:50]}...', original_category: '{cat}'")
-                # 빈 카테고리도 포함하여 분석 (크롤링 데이터는 이미 매핑되어야 함)
-                key = f"빈카테고리_{empty_category_count}"  # 임시 식별자
-            
-            b = buckets.setdefault(key, {
-                "count": 0,
-                "relevance_sum": 0.0,
-                "recent_sum": 0.0,
-                "negative_count": 0,
-                "rank_sum": 0.0,        # rank_label 합계로 변경
-                "reference_sum": 0.0,   # reference_label 합계로 변경
-                "articles": []
-            })
+class CategoryScoreAccumulator:
+    """
+    카테고리별 점수 누적기 - 기사가 도착하는 대로 add(), 필요할 때 results()로 점수 계산
+    (빈도 점수가 전체 기사 수 기준이라 최종 점수는 results() 시점에 계산)
+    카테고리별 합계 + 기사 경과 일수를 갖고 있어서 rescore()로 가중치/최근성 기준만 바꿔 재계산 가능
+    """
 
-            b["count"] += 1
-            b["articles"].append(a)
-            b["relevance_sum"] += 1.0 if a.get("relevance_label") else 0.0
-            b["recent_sum"] += float(a.get("recent_value", 0.0))
-            
-            # 안전한 부정점수 계산
-            sentiment = a.get("sentiment")
-            if sentiment is not None:
-                # 대소문자 구분 없이 비교
-                if str(sentiment).lower() == "negative":
-                    b["negative_count"] += 1
-                    logger.debug(f"🔍 부정 기사 감지: {sentiment}")
-                elif str(sentiment).lower() not in ["positive", "other"]:
-                    logger.warning(f"⚠️ 예상치 못한 sentiment 값: '{sentiment}'")
-            else:
-                logger.warning(f"⚠️ sentiment 값이 None인 기사 발견")
-            
-            # rank와 reference를 합계로 누적
-            rank_label = a.get("rank_label")
-            reference_label = a.get("reference_label")
-            
-            # 안전한 rank_label 처리
-            if rank_label is not None:
-                if isinstance(rank_label, bool):
-                    b["rank_sum"] += 1.0 if rank_label else 0.0
-                elif isinstance(rank_label, (int, float)):
-                    b["rank_sum"] += float(rank_label)
-                else:
-                    logger.warning(f"⚠️ 예상치 못한 rank_label 타입: {type(rank_label)}, 값: {rank_label}")
-                    b["rank_sum"] += 0.0
+    def __init__(self):
+        self.total_articles = 0
+        self.buckets: Dict[str, Dict[str, Any]] = {}
+        self.empty_category_count = 0
+        self.missing_category_count = 0
+
+    def add(self, a: Dict[str, Any]) -> None:
+        self.total_articles += 1
+        cat = a.get("original_category")
+        if cat is None:
+            self.missing_category_count += 1
+            logger.warning(f"🚨 original_category가 None인 기사 발견 - 기사 제목: '{a.get('title', 'N/A')[:50]}...'")
+            return
+
+        # 빈 카테고리 체크 (데이터 품질 문제)
+        key = str(cat).strip()
+        if not key:  # 빈 문자열이거나 공백만 있는 경우
+            self.empty_category_count += 1
+            logger.warning(f"🚨 빈 카테고리 발견 - 기사 제목: '{a.get('title', 'N/A')[:50]}...', original_category: '{cat}'")
+            # 빈 카테고리도 포함하여 분석 (크롤링 데이터는 이미 매핑되어야 함)
+            key = f"빈카테고리_{self.empty_category_count}"  # 임시 식별자
+
+        b = self.buckets.setdefault(key, {
+            "count": 0,
+            "relevance_sum": 0.0,
+            "recent_sum": 0.0,
+            "negative_count": 0,
+            "rank_sum": 0.0,        # rank_label 합계로 변경
+            "reference_sum": 0.0,   # reference_label 합계로 변경
+            "ages": [],             # 기사 경과 일수 (rescore의 최근성 기준 변경용)
+            "ages_sorted": True,
+            "articles": []
+        })
+
+        b["count"] += 1
+        b["articles"].append(a)
+        b["relevance_sum"] += 1.0 if a.get("relevance_label") else 0.0
+        b["recent_sum"] += float(a.get("recent_value", 0.0))
+        if a.get("age_days") is not None:
+            b["ages"].append(a["age_days"])
+            b["ages_sorted"] = False
+
+        # 안전한 부정점수 계산
+        sentiment = a.get("sentiment")
+        if sentiment is not None:
+            # 대소문자 구분 없이 비교
+            if str(sentiment).lower() == "negative":
+                b["negative_count"] += 1
+                logger.debug(f"🔍 부정 기사 감지: {sentiment}")
+            elif str(sentiment).lower() not in ["positive", "other"]:
+                logger.warning(f"⚠️ 예상치 못한 sentiment 값: '{sentiment}'")
+        else:
+            logger.warning(f"⚠️ sentiment 값이 None인 기사 발견")
+
+        # rank와 reference를 합계로 누적
+        rank_label = a.get("rank_label")
+        reference_label = a.get("reference_label")
+
+        # 안전한 rank_label 처리
+        if rank_label is not None:
+            if isinstance(rank_label, bool):
+                b["rank_sum"] += 1.0 if rank_label else 0.0
+            elif isinstance(rank_label, (int, float)):
+                b["rank_sum"] += float(rank_label)
             else:
+                logger.warning(f"⚠️ 예상치 못한 rank_label 타입: {type(rank_label)}, 값: {rank_label}")
                 b["rank_sum"] += 0.0
-            
-            # 안전한 reference_label 처리
-            if reference_label is not None:
-                if isinstance(reference_label, bool):
-                    b["reference_sum"] += 1.0 if reference_label else 0.0
-                elif isinstance(reference_label, (int, float)):
-                    b["reference_sum"] += float(reference_label)
-                else:
-                    logger.warning(f"⚠️ 예상치 못한 reference_label 타입: {type(reference_label)}, 값: {reference_label}")
-                    b["reference_sum"] += 0.0
+        else:
+            b["rank_sum"] += 0.0
+
+        # 안전한 reference_label 처리
+        if reference_label is not None:
+            if isinstance(reference_label, bool):
+                b["reference_sum"] += 1.0 if reference_label else 0.0
+            elif isinstance(reference_label, (int, float)):
+                b["reference_sum"] += float(reference_label)
             else:
+                logger.warning(f"⚠️ 예상치 못한 reference_label 타입: {type(reference_label)}, 값: {reference_label}")
                 b["reference_sum"] += 0.0
+        else:
+            b["reference_sum"] += 0.0
+
+    def results(self) -> Dict[str, Dict[str, Any]]:
+        """누적된 기사로 카테고리별 점수 계산"""
+        if self.total_articles == 0:
+            return {}
 
         # 카테고리 데이터 품질 통계 로깅
-        if missing_category_count > 0:
-            logger.warning(f"🚨 original_category가 None인 기사: {missing_category_count}개")
-        if empty_category_count > 0:
-            logger.warning(f"🚨 빈 카테고리 기사: {empty_category_count}개 (데이터 품질 문제)")
+        if self.missing_category_count > 0:
+            logger.warning(f"🚨 original_category가 None인 기사: {self.missing_category_count}개")
+        if self.empty_category_count > 0:
+            logger.warning(f"🚨 빈 카테고리 기사: {self.empty_category_count}개 (데이터 품질 문제)")
             logger.warning(f"🚨 이는 크롤링 단계에서 카테고리 매핑이 제대로 되지 않았음을 의미합니다.")
         
         results: Dict[str, Dict[str, Any]] = {}
-        for key, b in buckets.items():
+        for key, b in self.buckets.items():
             c = b["count"]
             
             # 안전한 빈도점수 계산
             try:
-                frequency = c / total_articles if total_articles > 0 else 0.0
+                frequency = c / self.total_articles if self.total_articles > 0 else 0.0
                 # 논리적 검증: 빈도가 1을 초과할 수 없음
                 if frequency > 1.0:
                     logger.warning(f"⚠️ 카테고리 '{key}' 빈도점수 비정상: {frequency:.4f} > 1.0, 1.0으로 조정")
@@ -372,14 +568,7 @@ def calculate_category_scores(articles: List[Dict[str, Any]]) -> Dict[str, Dict[
 
             # 안전한 최종 점수 계산
             try:
-                final_score = (
-                    0.4 * frequency
-                    + 0.6 * relevance
-                    + 0.2 * recent
-                    + 0.4 * rank
-                    + 0.6 * reference
-                    + 0.8 * negative * (1 + 0.5 * frequency + 0.5 * relevance)
-                )
+                final_score = compute_final_score(frequency, relevance, recent, rank, reference, negative)
                 
                 # 점수 범위 검증 (0~10 범위로 가정)
                 if final_score < 0:
@@ -406,6 +595,78 @@ def calculate_category_scores(articles: List[Dict[str, Any]]) -> Dict[str, Dict[
             }
 
         return results
+
+    def rescore(
+        self,
+        weights: Optional[Dict[str, float]] = None,
+        recent_full_months: float = RECENT_FULL_MONTHS,
+        recent_half_months: float = RECENT_HALF_MONTHS,
+    ) -> List[Dict[str, Any]]:
+        """
+        what-if 재계산: 누적된 카테고리별 합계로 가중치/최근성 기준만 바꿔 점수 → 순위 목록 (기사 목록 제외)
+        카테고리마다 합계 몇 개 + 경과 일수 이진 탐색 → 감성 분석/라벨/DB 조회 없음
+        기본값으로 호출하면 results()와 같은 점수
+        """
+        weights = {**DEFAULT_SCORE_WEIGHTS, **(weights or {})}
+        full_days = recent_full_months * 30
+        half_days = max(recent_half_months, recent_full_months) * 30
+        rows: List[Dict[str, Any]] = []
+        for key, b in self.buckets.items():
+            c = b["count"]
+            if not b["ages_sorted"]:
+                b["ages"].sort()
+                b["ages_sorted"] = True
+            n_full = bisect.bisect_right(b["ages"], full_days)
+            n_half = bisect.bisect_right(b["ages"], half_days) - n_full
+
+            frequency = min(c / self.total_articles, 1.0) if self.total_articles > 0 else 0.0
+            relevance = b["relevance_sum"] / c
+            recent = (n_full + 0.5 * n_half) / c
+            rank = b["rank_sum"] / c
+            reference = b["reference_sum"] / c
+            negative = b["negative_count"] / c
+            final_score = compute_final_score(frequency, relevance, recent, rank, reference, negative, weights)
+            rows.append({
+                "category": key,
+                "count": c,
+                "frequency_score": round(frequency, 6),
+                "relevance_score": round(relevance, 6),
+                "recent_score": round(recent, 6),
+                "rank_score": round(rank, 6),
+                "reference_score": round(reference, 6),
+                "negative_score": round(negative, 6),
+                "final_score": round(final_score, 6),
+            })
+        rows.sort(key=lambda r: r["final_score"], reverse=True)
+        for idx, row in enumerate(rows, start=1):
+            row["rank"] = idx
+        return rows
+
+def calculate_category_scores(articles: List[Dict[str, Any]]) -> Dict[str, Dict[str, Any]]:
+    """
+    카테고리별 점수 계산
+
+    점수 체계:
+    - frequency_score: 해당 카테고리 빈도 (0~1)
+    - relevance_score: 카테고리 기사들의 relevance_label 평균 (True=1, False=0)
+    - recent_score   : 카테고리 기사들의 recent_value 평균 (1/0.5/0)
+    - rank_score     : 카테고리 내 rank_label 존재 여부(0/1)  ※ 전부 동일하다는 가정
+    - negative_score : 카테고리 내 부정 기사 비율 (0~1)
+    - reference_score: 카테고리 내 reference_label 존재 여부(0/1)
+
+    최종 점수 (가중치는 DEFAULT_SCORE_WEIGHTS, compute_final_score):
+    final = 0.4*frequency
+          + 0.6*relevance
+          + 0.2*recent
+          + 0.4*rank
+          + 0.6*reference
+          + 0.8*negative*(1 + 0.5*frequency + 0.5*relevance)
+    """
+    try:
+        accumulator = CategoryScoreAccumulator()
+        for a in articles:
+            accumulator.add(a)
+        return accumulator.results()
     except Exception as e:
         logger.error(f"❌ 카테고리 점수 계산 중 오류 발생: {str(e)}")
         return {}
@@ -446,7 +707,8 @@ def rank_categories_by_score(category_scores: Dict[str, Dict[str, Any]]) -> List
         return []
 
 async def match_categories_with_esg_and_issuepool(
-    ranked_categories: List[Dict[str, Any]]
+    ranked_categories: List[Dict[str, Any]],
+    repository: Optional[MiddleIssueRepository] = None,
 ) -> List[Dict[str, Any]]:
     """
     카테고리별로 ESG 분류와 base_issuepool을 배치 쿼리로 매칭
@@ -457,7 +719,7 @@ async def match_categories_with_esg_and_issuepool(
     3. 카테고리 하나당 ESG 분류는 하나, base_issuepool은 여러 개
     """
     try:
-        repository = MiddleIssueRepository()
+        repository = repository or MiddleIssueRepository()
         
         logger.warning(f"🔍 배치 카테고리 매칭 시작")
         logger.warning(f"🔍 매칭할 카테고리 수: {len(ranked_categories)}")
@@ -469,12 +731,17 @@ async def match_categories_with_esg_and_issuepool(
         logger.warning(f"🔍 배치 카테고리 조회 시작: {len(category_keys)}개 카테고리")
         
         try:
-            # 새로운 배치 조회 메서드 사용 (company_id, 연도 조건 없음)
-            details_map = await repository.get_categories_by_names_batch(
-                category_names=category_keys
-            )
-            
-            logger.warning(f"✅ 배치 카테고리 조회 완료: {len(details_map)}개 카테고리")
+            snapshot = await reference_data_store.get_snapshot()
+            if snapshot is not None:
+                # 기준 데이터 스냅샷에서 바로 조회 (쿼리 없음)
+                details_map = snapshot.get_categories_details(category_keys)
+                logger.warning(f"✅ 스냅샷 카테고리 조회 완료: {len(details_map)}개 카테고리 (version={snapshot.version[:12]})")
+            else:
+                # 새로운 배치 조회 메서드 사용 (company_id, 연도 조건 없음)
+                details_map = await repository.get_categories_by_names_batch(
+                    category_names=category_keys
+                )
+                logger.warning(f"✅ 배치 카테고리 조회 완료: {len(details_map)}개 카테고리")
             
         except Exception as e:
             logger.error(f"❌ 배치 카테고리 조회 실패: {str(e)}")
@@ -581,17 +848,19 @@ async def match_categories_with_esg_and_issuepool(
         
         # 오류 발생 시 기존 개별 처리 방식으로 fallback
         logger.info(f"🔄 기존 개별 처리 방식으로 fallback")
-        return await _fallback_individual_matching(ranked_categories)
+        return await _fallback_individual_matching(ranked_categories, repository)
 
 
+@traced()
 async def _fallback_individual_matching(
-    ranked_categories: List[Dict[str, Any]]
+    ranked_categories: List[Dict[str, Any]],
+    repository: Optional[MiddleIssueRepository] = None,
 ) -> List[Dict[str, Any]]:
     """
     Fallback: 기존 개별 처리 방식 (배치 처리 실패 시 사용)
     """
     try:
-        repository = MiddleIssueRepository()
+        repository = repository or MiddleIssueRepository()
         matched_categories = []
         
         logger.info(f"🔄 Fallback 개별 처리 시작: {len(ranked_categories)}개 카테고리")
@@ -673,42 +942,269 @@ async def _fallback_individual_matching(
         # 최후 수단: 원본 카테고리 정보만 반환
         return ranked_categories
 
-async def start_assessment(request: MiddleIssueRequest) -> Dict[str, Any]:
+ANALYZED_SAMPLE_COUNT = 3
+
+def summarize_articles(
+    labeled_articles: List[Dict[str, Any]], summary: Optional[Dict[str, Any]] = None
+) -> Dict[str, Any]:
+    """
+    응답에 필요한 기사 요약 (전체/부정 기사 수 + 앞쪽 샘플)
+    summary를 주면 그 위에 이어서 누적 (증분 평가/파이프라인 배치)
+    """
+    if summary is None:
+        summary = {"total": 0, "negative": 0, "samples": []}
+    summary["total"] += len(labeled_articles)
+    summary["negative"] += sum(1 for a in labeled_articles if a["sentiment"] == "negative")
+    summary["samples"].extend(labeled_articles[:max(0, ANALYZED_SAMPLE_COUNT - len(summary["samples"]))])
+    return summary
+
+def build_assessment_response(
+    company_id: str,
+    report_period: dict,
+    article_summary: Dict[str, Any],
+    category_scores: Dict[str, Dict[str, Any]],
+    ranked_categories: List[Dict[str, Any]],
+    matched_categories: List[Dict[str, Any]],
+) -> Dict[str, Any]:
+    """평가 결과 → 응답 (일반 평가/파이프라인 평가 공통, 기사는 summarize_articles 요약만 사용)"""
+    total_count = article_summary["total"]
+    negative_count = article_summary["negative"]
+    return {
+        "success": True,
+        "message": "중대성 평가 데이터 분석이 완료되었습니다.",
+        "data": {
+            "company_id": company_id,
+            "report_period": report_period,
+            "assessment_status": "analyzed",
+            "total_articles": total_count,
+            "negative_articles": negative_count,
+            "negative_ratio": (negative_count / total_count)*100 if total_count else 0.0,
+            "total_categories": len(category_scores),
+            "matched_categories": matched_categories,  # ESG 분류 및 이슈풀 매칭된 카테고리
+            "ranked_categories": ranked_categories[:20],  # 상위 20개 (원본)
+            # 필요 시 프론트 디버깅/리뷰용 원자료
+            "category_scores": category_scores,
+            "analyzed_samples": list(article_summary["samples"]),
+        }
+    }
+
+async def start_assessment(request: MiddleIssueRequest, uow: Optional[UnitOfWork] = None) -> Dict[str, Any]:
     """
     중대성 평가 시작 - 크롤링 데이터 처리 및 분석 시작
+    uow: 요청 단위 세션 (모든 조회가 하나의 커넥션/스냅샷 공유)
+    단계별 시간/DB 쿼리 수는 span으로 기록 (X-Debug-Trace 요청이면 Server-Timing 헤더로 반환)
+    같은 기업/보고기간 재요청은 평가 결과 캐시 사용 (같은 기사 → 저장된 응답, 기사 추가 → 새 기사만 평가)
+    """
+    columns = _request_article_columns(request)
+    if columns is None:
+        error_msg = "❌ 검색 결과가 만료되었거나 없습니다. 미디어 검색을 다시 실행해주세요."
+        logger.error(f"{error_msg} (result_id={request.result_id})")
+        # 응답 스키마(MiddleIssueResponse)는 success/message/data만 통과 → 플래그는 data 안에
+        return {"success": False, "message": error_msg, "data": {"result_expired": True, "result_id": request.result_id}}
+    with span("start_assessment", company=request.company_id, articles=len(columns[ARTICLE_FIELDS[0]])) as total_span:
+        if not assessment_cache.enabled:
+            return await _run_assessment(request, columns, uow, total_span)
+        key = cache_key(request.company_id, request.report_period)
+        async with assessment_cache.lock(key):
+            return await _run_cached_assessment(request, columns, uow, total_span, key)
+
+
+async def _run_cached_assessment(
+    request: MiddleIssueRequest,
+    columns: Dict[str, List[Any]],
+    uow: Optional[UnitOfWork],
+    total_span,
+    key: CacheKey,
+) -> Dict[str, Any]:
+    """평가 결과 캐시 확인 → 적중(저장된 응답) / 증분(새 기사만 평가) / 미적중(전체 평가 후 저장)"""
+    fingerprints = article_fingerprints(columns)
+    model_signature = current_model_signature()
+    reference_version = current_reference_version()
+    entry = assessment_cache.get(key, model_signature, reference_version)
+    new_indices = new_article_indices(entry["counts"], fingerprints) if entry is not None else None
+    if entry is not None and new_indices is None:
+        logger.info(f"🔄 이전 평가에 있던 기사가 빠짐 → 전체 재평가: {key}")
+
+    if new_indices == [] and entry["response"] is not None:
+        assessment_cache.hits += 1
+        total_span.set(cache="hit")
+        logger.warning(f"✅ 평가 결과 캐시 적중: {request.company_id} ({len(fingerprints)}건, 재평가 생략)")
+        return _with_cache_info(entry["response"], "hit", 0)
+
+    if new_indices is not None:
+        assessment_cache.incremental += 1
+        total_span.set(cache="incremental", new_articles=len(new_indices))
+        try:
+            return await _update_cached_assessment(request, columns, new_indices, fingerprints, entry, uow)
+        except Exception as e:
+            assessment_cache.delete(key)
+            error_msg = f"❌ 증분 평가 중 오류 발생: {str(e)}"
+            logger.error(error_msg)
+            return {"success": False, "message": error_msg, "data": None}
+
+    assessment_cache.misses += 1
+    total_span.set(cache="miss")
+    state: Dict[str, Any] = {}
+    response = await _run_assessment(request, columns, uow, total_span, cache_state=state)
+    if not response.get("success"):
+        return response
+    if state and model_signature is not None:
+        assessment_cache.put(key, {
+            **state,
+            "model_signature": model_signature,
+            "reference_version": reference_version,
+            "counts": Counter(fingerprints),
+            "response": response,
+        })
+    return _with_cache_info(response, "miss", len(fingerprints))
+
+
+async def _update_cached_assessment(
+    request: MiddleIssueRequest,
+    columns: Dict[str, List[Any]],
+    new_indices: List[int],
+    fingerprints: List[str],
+    entry: Dict[str, Any],
+    uow: Optional[UnitOfWork],
+) -> Dict[str, Any]:
+    """캐시된 평가에 새 기사만 더해서 점수/랭킹 갱신 (라벨 기준은 처음 평가와 동일)"""
+    repository = MiddleIssueRepository(uow)
+    labeled_new: List[Dict[str, Any]] = []
+    if new_indices:
+        new_columns = {field: [columns[field][i] for i in new_indices] for field in ARTICLE_FIELDS}
+        with span("incremental_labels", articles=len(new_indices)):
+            # 처음 평가에 없던 카테고리 이름만 ID로 변환
+            unknown = {str(c) for c in new_columns["original_category"] if c is not None} - entry["category_ids"].keys()
+            if unknown:
+                entry["category_ids"].update(await resolve_category_ids(unknown, repository))
+            if uow is not None:
+                await uow.release()
+            labeled_new = await assessment_executor.run_batch(
+                new_columns,
+                request.company_id,
+                entry["search_date"],
+                entry["prev_year_categories"],
+                entry["reference_categories"],
+                entry["category_ids"],
+            )
+
+    # 누적기/기사 목록/지문은 await 없이 한 번에 갱신 → 이후 단계가 실패/취소돼도 캐시 상태는 일관됨
+    entry["response"] = None
+    for a in labeled_new:
+        entry["accumulator"].add(a)
+    summarize_articles(labeled_new, entry["article_summary"])
+    entry["counts"].update(fingerprints[i] for i in new_indices)
+
+    with span("incremental_rank", articles=entry["article_summary"]["total"]):
+        category_scores = entry["accumulator"].results()
+        ranked_categories = rank_categories_by_score(category_scores)
+    with span("esg_matching", categories=len(ranked_categories)):
+        matched_categories = await match_categories_with_esg_and_issuepool(ranked_categories, repository=repository)
+
+    response = build_assessment_response(
+        request.company_id, request.report_period,
+        entry["article_summary"], category_scores, ranked_categories, matched_categories,
+    )
+    entry["response"] = response
+    logger.warning(
+        f"✅ 증분 평가 완료: {request.company_id} 새 기사 {len(new_indices)}건 → 전체 {entry['article_summary']['total']}건"
+    )
+    return _with_cache_info(response, "incremental", len(new_indices))
+
+
+def rescore_assessment(request: RescoreRequest) -> Dict[str, Any]:
+    """
+    what-if 재계산 - 평가 결과 캐시에 남아 있는 같은 기업/보고기간 평가의 카테고리 합계로 순위만 다시 계산
+    (크롤링/모델/DB 조회 없음, ESG 분류/이슈풀 수는 원래 평가의 매칭 결과 재사용)
+    """
+    entry = assessment_cache.peek(cache_key(request.company_id, request.report_period))
+    if entry is None:
+        error_msg = "❌ 재계산할 평가 결과가 없습니다 (만료 또는 미실행). 중대성 평가를 먼저 실행해주세요."
+        logger.warning(f"{error_msg} ({request.company_id}, {request.report_period})")
+        # 플래그는 data 안에 (응답 스키마가 최상위 추가 필드를 버림) → 클라이언트가 /assessment부터 다시 실행
+        return {"success": False, "message": error_msg, "data": {"result_expired": True}}
+
+    started = time.perf_counter()
+    weights = {**DEFAULT_SCORE_WEIGHTS, **request.weights.model_dump(exclude_none=True)}
+    ranked = entry["accumulator"].rescore(weights, request.recent_full_months, request.recent_half_months)
+    elapsed = time.perf_counter() - started
+
+    matched = (entry["response"] or {"data": {}})["data"].get("matched_categories") or []
+    esg_by_category = {str(c["category"]): c for c in matched}
+    for row in ranked:
+        info = esg_by_category.get(str(row["category"]))
+        if info is not None:
+            row["esg_classification"] = info.get("esg_classification")
+            row["esg_classification_id"] = info.get("esg_classification_id")
+            row["total_issuepools"] = info.get("total_issuepools", 0)
+
+    return {
+        "success": True,
+        "message": "가중치 재계산이 완료되었습니다.",
+        "data": {
+            "company_id": request.company_id,
+            "report_period": request.report_period,
+            "weights": weights,
+            "recent_full_months": request.recent_full_months,
+            "recent_half_months": request.recent_half_months,
+            "total_articles": entry["accumulator"].total_articles,
+            "total_categories": len(ranked),
+            "ranked_categories": ranked,
+            "elapsed_ms": round(elapsed * 1000, 3),
+        }
+    }
+
+
+def _with_cache_info(response: Dict[str, Any], status: str, evaluated_articles: int) -> Dict[str, Any]:
+    """응답에 캐시 사용 정보 추가 (캐시에 저장된 응답은 그대로 두고 복사본에 추가)"""
+    return {**response, "data": {**response["data"], "cache": {"status": status, "evaluated_articles": evaluated_articles}}}
+
+
+def _request_article_columns(request: MiddleIssueRequest) -> Optional[Dict[str, List[Any]]]:
+    """
+    평가할 기사 (필드별 리스트)
+    - result_id가 있으면 /search-media가 서버에 보관한 결과 사용 (같은 기업일 때만)
+    - 없거나 만료됐으면 요청에 담긴 articles 사용, 둘 다 없으면 None
+    """
+    if request.result_id:
+        stored = article_result_store.get(request.result_id)
+        if stored is not None and stored["company_id"] == request.company_id:
+            return stored["columns"]
+        logger.warning(f"⚠️ 보관된 검색 결과 없음/만료: {request.result_id}")
+        if not request.articles:
+            return None
+    return to_columns(request.articles)
+
+
+def _article_count(request: MiddleIssueRequest) -> int:
+    return len(request.articles) or request.total_results
+
+
+async def _run_assessment(
+    request: MiddleIssueRequest,
+    columns: Dict[str, List[Any]],
+    uow: Optional[UnitOfWork],
+    total_span,
+    cache_state: Optional[Dict[str, Any]] = None,
+) -> Dict[str, Any]:
+    """
+    전체 평가 (DB 조회 → CPU 단계 → ESG 매칭)
+    cache_state: 주어지면 평가 결과 캐시에 저장할 상태(라벨된 기사, 누적기, 라벨 기준)를 채움
     """
     try:
         # 1) 요청 로깅
-        start_time = datetime.now()
         logger.warning("🚀 start_assessment 함수 시작")
         logger.warning("="*50)
         logger.warning("🚀 새로운 중대성 평가 시작")
         logger.warning(f"기업명: {request.company_id}")
         logger.warning(f"보고기간: {request.report_period}")
         logger.warning(f"요청 타입: {request.request_type}")
-        logger.warning(f"총 크롤링 기사 수: {request.total_results}")
+        logger.warning(f"총 크롤링 기사 수: {len(columns[ARTICLE_FIELDS[0]])} (result_id: {request.result_id})")
         logger.warning("-"*50)
 
-        # 2) 모델 로드
-        model_start = datetime.now()
-        logger.info("🔥 크롤링 데이터 감성 분석 시작")
-        model = load_sentiment_model()
-        if not model:
-            raise Exception("감성 분석 모델 로드 실패")
-        model_load_time = (datetime.now() - model_start).total_seconds()
-        logger.info(f"⏱️ 모델 로드 완료: {model_load_time:.2f}초")
-
-        # 3) 감성 분석
-        sentiment_start = datetime.now()
-        logger.info("🔥 크롤링 데이터 감성 분석 시작")
-        analyzed_articles = analyze_sentiment(model, request.articles)
-        sentiment_time = (datetime.now() - sentiment_start).total_seconds()
-        logger.info(f"⏱️ 감성 분석 완료: {sentiment_time:.2f}초 ({len(analyzed_articles)}개 기사)")
-
-        # 4) (검색 기준연도 - 1) & 공통(NULL) 카테고리 조회
-        db_query_start = datetime.now()
-        repository = MiddleIssueRepository()
-        
+        # 2) (검색 기준연도 - 1) & 공통(NULL) 카테고리 조회 - DB 작업은 이벤트 루프에서
+        repository = MiddleIssueRepository(uow)
+
         # 안전한 연도 파싱
         try:
             search_year = int(request.report_period["end_date"][:4])  # 검색 기준연도 (YYYY)
@@ -718,66 +1214,66 @@ async def start_assessment(request: MiddleIssueRequest) -> Dict[str, Any]:
             # 기본값으로 현재 연도 사용
             search_year = datetime.now().year
             logger.warning(f"⚠️ 기본값 사용: {search_year}년")
-        
+
         # repository 내부에서 -1 처리하므로 search_year를 그대로 전달
-        corp_issues_prev = await repository.get_corporation_issues(
-            corporation_name=request.company_id,
-            year=search_year  # repository 내부에서 -1 처리
-        )
-        # 2. prev_year_categories와 reference_categories 수집
+        with span("corporation_issues", year=search_year) as db_span:
+            corp_issues_prev = await repository.get_corporation_issues(
+                corporation_name=request.company_id,
+                year=search_year  # repository 내부에서 -1 처리
+            )
+            # 라벨 부여에 필요한 카테고리 이름 → ID도 미리 변환 (워커는 DB 접근 없음)
+            category_ids = await resolve_category_ids(
+                {str(c) for c in columns["original_category"] if c is not None},
+                repository,
+            )
         # prev_year 기준 카테고리와 공통(NULL/빈문자열/'0') 카테고리 세트
         prev_year_categories = {str(issue.category_id) for issue in corp_issues_prev.year_issues}
         reference_categories = {str(issue.category_id) for issue in corp_issues_prev.common_issues}
-        
+
         logger.info(f"🔍 prev_year_categories: {len(prev_year_categories)}개, reference_categories: {len(reference_categories)}개")
-        db_query_time = (datetime.now() - db_query_start).total_seconds()
-        logger.info(f"⏱️ DB 조회 완료: {db_query_time:.2f}초")
+        logger.info(f"⏱️ DB 조회 완료: {db_span.duration:.2f}초")
 
-        # 5) 라벨 부여
-        labeling_start = datetime.now()
-        logger.info("🏷️ 라벨(relevance/recent/rank/reference) 부여 시작")
+        # 3~7) 감성 분석 → 라벨 부여 → 점수 계산 → 랭킹 (CPU 작업은 프로세스 풀에서)
+        # CPU 단계 동안 DB 커넥션 반납 (ESG 매칭에서 새로 체크아웃)
+        if uow is not None:
+            await uow.release()
+        logger.info("🔥 감성 분석/라벨/점수/랭킹 시작")
         search_date = datetime.now()
-        labeled_articles = await add_relevance_labels(
-            analyzed_articles,
-            request.company_id,
-            search_date,
-            prev_year_categories,
-            reference_categories
+        with span("cpu_stages", mode=assessment_executor.mode_for(len(columns[ARTICLE_FIELDS[0]]))) as cpu_span:
+            cpu_result = await assessment_executor.run(
+                columns,
+                request.company_id,
+                search_date,
+                prev_year_categories,
+                reference_categories,
+                category_ids,
+            )
+        article_summary = cpu_result["article_summary"]
+        category_scores = cpu_result["category_scores"]
+        ranked_categories = cpu_result["ranked_categories"]
+        stage_times = cpu_result["timings"]
+        cpu_span.set(
+            model_type=cpu_result["model_type"], worker_pid=cpu_result["worker_pid"],
+            **{f"{stage}_ms": round(sec * 1000, 1) for stage, sec in stage_times.items()},
+        )
+        logger.info(
+            f"⏱️ CPU 단계 완료 ({cpu_result['mode']}): {cpu_span.duration:.2f}초 "
+            f"({article_summary['total']}개 기사, {len(category_scores)}개 카테고리)"
         )
-        labeling_time = (datetime.now() - labeling_start).total_seconds()
-        logger.info(f"⏱️ 라벨 부여 완료: {labeling_time:.2f}초")
-
-        # 6) 카테고리별 점수 계산
-        scoring_start = datetime.now()
-        logger.info("📊 카테고리별 점수 계산 시작")
-        category_scores = calculate_category_scores(labeled_articles)
-        scoring_time = (datetime.now() - scoring_start).total_seconds()
-        logger.info(f"⏱️ 점수 계산 완료: {scoring_time:.2f}초")
-
-        # 🔍 디버깅: 라벨링 결과 분석
-        debug_labeling_results(labeled_articles, category_scores)
-
-        # 7) 카테고리 랭킹
-        ranking_start = datetime.now()
-        logger.info("🏆 카테고리 순위 매기기 시작")
-        ranked_categories = rank_categories_by_score(category_scores)
-        ranking_time = (datetime.now() - ranking_start).total_seconds()
-        logger.info(f"⏱️ 카테고리 랭킹 완료: {ranking_time:.2f}초")
 
         # 8) 카테고리별 ESG 분류 및 이슈풀 매칭 (배치 처리로 성능 향상)
-        matching_start = datetime.now()
         logger.info("🔗 카테고리별 ESG 분류 및 이슈풀 매칭 시작 (배치 처리)")
-        matched_categories = await match_categories_with_esg_and_issuepool(
-            ranked_categories
-        )
-        matching_time = (datetime.now() - matching_start).total_seconds()
-        logger.info(f"⏱️ ESG/이슈풀 매칭 완료: {matching_time:.2f}초")
+        with span("esg_matching", categories=len(ranked_categories)) as matching_span:
+            matched_categories = await match_categories_with_esg_and_issuepool(
+                ranked_categories,
+                repository=repository,
+            )
+        logger.info(f"⏱️ ESG/이슈풀 매칭 완료: {matching_span.duration:.2f}초")
 
         # 9) 통계/로깅
-        negative_count = sum(1 for a in labeled_articles if a["sentiment"] == "negative")
         logger.info(f"📊 분석 완료 통계:")
-        logger.info(f"   - 분석된 기사 수: {len(labeled_articles)}")
-        logger.info(f"   - 부정적 기사 수: {negative_count}")
+        logger.info(f"   - 분석된 기사 수: {article_summary['total']}")
+        logger.info(f"   - 부정적 기사 수: {article_summary['negative']}")
         logger.info(f"   - 분석된 카테고리 수: {len(category_scores)}")
         logger.info(f"   - 매칭된 카테고리 수: {len(matched_categories)}")
 
@@ -816,38 +1312,34 @@ async def start_assessment(request: MiddleIssueRequest) -> Dict[str, Any]:
             logger.info(f"✅ 모든 카테고리가 유효함: {len(valid_categories)}개")
         
         # ⏱️ 전체 처리 시간 요약
-        total_time = (datetime.now() - start_time).total_seconds()
         logger.info("="*50)
         logger.info(f"⏱️ 전체 처리 시간 요약:")
-        logger.info(f"   - 모델 로드: {model_load_time:.2f}초")
-        logger.info(f"   - 감성 분석: {sentiment_time:.2f}초")
-        logger.info(f"   - DB 조회: {db_query_time:.2f}초")
-        logger.info(f"   - 라벨 부여: {labeling_time:.2f}초")
-        logger.info(f"   - 점수 계산: {scoring_time:.2f}초")
-        logger.info(f"   - 카테고리 랭킹: {ranking_time:.2f}초")
-        logger.info(f"   - ESG/이슈풀 매칭: {matching_time:.2f}초")
-        logger.info(f"   - 총 처리 시간: {total_time:.2f}초")
+        logger.info(f"   - DB 조회: {db_span.duration:.2f}초")
+        logger.info(f"   - 모델 로드: {stage_times['model_load']:.2f}초")
+        logger.info(f"   - 감성 분석: {stage_times['sentiment']:.2f}초")
+        logger.info(f"   - 라벨 부여: {stage_times['labeling']:.2f}초")
+        logger.info(f"   - 점수 계산: {stage_times['scoring']:.2f}초")
+        logger.info(f"   - 카테고리 랭킹: {stage_times['ranking']:.2f}초")
+        logger.info(f"   - CPU 단계 전체 (전송 포함, {cpu_result['mode']}): {cpu_span.duration:.2f}초")
+        logger.info(f"   - ESG/이슈풀 매칭: {matching_span.duration:.2f}초")
+        logger.info(f"   - 총 처리 시간: {total_span.duration:.2f}초 (DB 쿼리 {total_span.total_db_queries()}회)")
         logger.info("="*50)
 
+        if cache_state is not None:
+            cache_state.update(
+                article_summary=article_summary,
+                accumulator=cpu_result["accumulator"],
+                search_date=search_date,
+                prev_year_categories=prev_year_categories,
+                reference_categories=reference_categories,
+                category_ids=category_ids,
+            )
+
         # 9) 응답
-        response_data = {
-            "success": True,
-            "message": "중대성 평가 데이터 분석이 완료되었습니다.",
-            "data": {
-                "company_id": request.company_id,
-                "report_period": request.report_period,
-                "assessment_status": "analyzed",
-                "total_articles": len(labeled_articles),
-                "negative_articles": negative_count,
-                "negative_ratio": (negative_count / len(labeled_articles))*100 if labeled_articles else 0.0,
-                "total_categories": len(category_scores),
-                "matched_categories": matched_categories,  # ESG 분류 및 이슈풀 매칭된 카테고리
-                "ranked_categories": ranked_categories[:20],  # 상위 20개 (원본)
-                # 필요 시 프론트 디버깅/리뷰용 원자료
-                "category_scores": category_scores,
-                "analyzed_samples": labeled_articles[:3],
-            }
-        }
+        response_data = build_assessment_response(
+            request.company_id, request.report_period,
+            article_summary, category_scores, ranked_categories, matched_categories,
+        )
 
         logger.info("✅ 데이터 분석 완료")
         logger.info("="*50)
@@ -864,13 +1356,18 @@ async def start_assessment(request: MiddleIssueRequest) -> Dict[str, Any]:
 # 🚧 성능 향상을 위한 타임아웃 래퍼 함수
 # ============================================================================
 
-async def start_assessment_with_timeout(request: MiddleIssueRequest, timeout_seconds: int = 1000) -> Dict[str, Any]:
+async def start_assessment_with_timeout(
+    request: MiddleIssueRequest,
+    timeout_seconds: int = 1000,
+    uow: Optional[UnitOfWork] = None,
+) -> Dict[str, Any]:
     """
     중대성 평가를 타임아웃과 함께 실행 (500 에러 방지)
     
     Args:
         request: 중대성 평가 요청
         timeout_seconds: 타임아웃 시간 (초), 기본값 5분
+        uow: 요청 단위 세션
     
     Returns:
         Dict[str, Any]: 중대성 평가 결과 또는 타임아웃 에러
@@ -880,7 +1377,7 @@ async def start_assessment_with_timeout(request: MiddleIssueRequest, timeout_sec
         
         logger.warning(f"⏰ 중대성 평가 타임아웃 설정: {timeout_seconds}초")
         logger.warning(f"🚀 배치 처리 방식으로 성능 향상 적용됨")
-        logger.warning(f"🔍 요청 정보: 기업={request.company_id}, 기사수={len(request.articles)}")
+        logger.warning(f"🔍 요청 정보: 기업={request.company_id}, 기사수={_article_count(request)}")
         
         # Service로 요청 전달 (타임아웃 5분 적용)
         logger.warning("🚀 start_assessment 함수 호출 시작")
@@ -888,7 +1385,7 @@ async def start_assessment_with_timeout(request: MiddleIssueRequest, timeout_sec
         try:
             # 타임아웃과 함께 중대성 평가 실행
             result = await asyncio.wait_for(
-                start_assessment(request), 
+                start_assessment(request, uow), 
                 timeout=timeout_seconds
             )
             
@@ -901,7 +1398,7 @@ async def start_assessment_with_timeout(request: MiddleIssueRequest, timeout_sec
             logger.error(error_msg)
             logger.error(f"🔍 타임아웃 발생 요청 정보:")
             logger.error(f"   - 기업: {request.company_id}")
-            logger.error(f"   - 기사 수: {len(request.articles)}")
+            logger.error(f"   - 기사 수: {_article_count(request)}")
             logger.error(f"   - 요청 크기: {len(str(request))} bytes")
             logger.error("💡 배치 처리 방식 적용 후에도 타임아웃 발생 - 추가 성능 최적화 필요")
             logger.error("="*50)
@@ -912,7 +1409,7 @@ async def start_assessment_with_timeout(request: MiddleIssueRequest, timeout_sec
                 "timeout": True,
                 "request_info": {
                     "company_id": request.company_id,
-                    "article_count": len(request.articles),
+                    "article_count": _article_count(request),
                     "timeout_seconds": timeout_seconds
                 }
             }
@@ -921,7 +1418,7 @@ async def start_assessment_with_timeout(request: MiddleIssueRequest, timeout_sec
             logger.error(error_msg)
             logger.error(f"🔍 오류 발생 요청 정보:")
             logger.error(f"   - 기업: {request.company_id}")
-            logger.error(f"   - 기사 수: {len(request.articles)}")
+            logger.error(f"   - 기사 수: {_article_count(request)}")
             logger.error(f"   - 오류 타입: {type(e).__name__}")
             logger.error("="*50)
             return {
@@ -931,7 +1428,7 @@ async def start_assessment_with_timeout(request: MiddleIssueRequest, timeout_sec
                 "error_type": type(e).__name__,
                 "request_info": {
                     "company_id": request.company_id,
-                    "article_count": len(request.articles)
+                    "article_count": _article_count(request)
                 }
             }
     
@@ -964,8 +1461,10 @@ async def start_assessment_with_timeout(request: MiddleIssueRequest, timeout_sec
 
 def debug_labeling_results(labeled_articles: List[Dict[str, Any]], category_scores: Dict[str, Dict[str, Any]]):
     """
-    라벨링 결과를 디버깅하기 위한 간단한 분석 함수
+    라벨링 결과를 디버깅하기 위한 간단한 분석 함수 (DEBUG 로그가 켜져 있을 때만 실행)
     """
+    if not logger.isEnabledFor(logging.DEBUG):
+        return
     try:
         logger.info("🔍 라벨링 결과 디버깅 시작")
         
@@ -1036,138 +1535,127 @@ def debug_labeling_results(labeled_articles: List[Dict[str, Any]], category_scor
 # 🚧 디버깅 함수 끝
 # ============================================================================
 
-async def get_all_issuepool_data() -> Dict[str, Any]:
+# issuepool 전체 데이터 응답 캐시 - 기준 데이터 버전 태그 + 한 번 직렬화한 JSON
+_issuepool_data_cache: Dict[str, Any] = {"version": None, "result": None, "body": None}
+
+def _build_issuepool_data(all_categories: List[Any], all_base_issuepools: List[Any]) -> Dict[str, Any]:
+    """
+    카테고리 dict 인덱스로 한 번만 순회하며 구조화 + 중복 제거 (O(카테고리 + 이슈풀))
+    """
+    category_by_id: Dict[int, Any] = {}
+    categories: List[Dict[str, Any]] = []
+    esg_classifications: Dict[Any, Dict[str, Any]] = {}
+    for cat in all_categories:
+        category_by_id[cat.id] = cat
+        esg_name = getattr(cat, 'esg_classification_name', None)
+        categories.append({
+            "id": cat.id,
+            "category_name": cat.category_name,
+            "esg_classification_id": cat.esg_classification_id,
+            "esg_classification_name": esg_name,
+            "created_at": None,
+            "updated_at": None
+        })
+        if cat.esg_classification_id is not None and cat.esg_classification_id not in esg_classifications:
+            esg_classifications[cat.esg_classification_id] = {
+                "id": cat.esg_classification_id,
+                "esg": esg_name
+            }
+    
+    base_issuepools: List[Dict[str, Any]] = []
+    matched_rows: List[Dict[str, Any]] = []
+    esg_counts: Dict[str, int] = {}
+    # base_issue_pool 기준 중복 제거 (앞뒤 공백 제거 후 정확히 일치)
+    seen_base_issue_pools: Set[str] = set()
+    
+    for pool in all_base_issuepools:
+        pool_info = {
+            "id": pool.id,
+            "base_issue_pool": pool.base_issue_pool,
+            "issue_pool": pool.issue_pool,
+            "category_id": pool.category_id,
+            "ranking": pool.ranking,
+            "corporation_id": pool.corporation_id,
+            "publish_year": pool.publish_year,
+            "created_at": None,
+            "updated_at": None
+        }
+        base_issuepools.append(pool_info)
+        
+        base_issue_pool_value = pool.base_issue_pool.strip() if pool.base_issue_pool else ""
+        if base_issue_pool_value in seen_base_issue_pools:
+            continue
+        seen_base_issue_pools.add(base_issue_pool_value)
+        
+        category_info = category_by_id.get(pool.category_id)
+        esg_classification_name = "미분류"
+        if category_info is not None:
+            esg_classification_name = getattr(category_info, 'esg_classification_name', None) or "미분류"
+        
+        matched_rows.append({
+            **pool_info,
+            "base_issue_pool": base_issue_pool_value,
+            "category_name": category_info.category_name if category_info else "미분류",
+            "esg_classification_id": category_info.esg_classification_id if category_info else None,
+            "esg_classification_name": esg_classification_name
+        })
+        esg_counts[esg_classification_name] = esg_counts.get(esg_classification_name, 0) + 1
+    
+    return {
+        "matched_data": matched_rows,  # 행 단위로 매칭된 데이터
+        "categories": categories,
+        "base_issuepools": base_issuepools,
+        "esg_classifications": list(esg_classifications.values()),
+        "summary": {
+            "total_categories": len(categories),
+            "total_base_issuepools": len(base_issuepools),
+            "total_matched_rows": len(matched_rows),
+            "esg_distribution": esg_counts
+        }
+    }
+
+@traced()
+async def get_all_issuepool_data(uow: Optional[UnitOfWork] = None) -> Dict[str, Any]:
     """
     issuepool DB에서 모든 데이터를 가져오는 함수
+    기준 데이터 스냅샷이 있으면 버전별로 한 번만 만들어 캐시 (이후 호출은 O(1))
     
     Returns:
         Dict[str, Any]: issuepool DB의 모든 데이터 (중복 제거, 행 단위 매칭)
     """
     try:
-        repository = MiddleIssueRepository()
-        logger.warning("🔍 issuepool DB 전체 데이터 조회 시작")
-        
-        # 1. 모든 카테고리와 ESG 분류 정보 조회
-        all_categories = await repository.get_all_categories_with_esg()
+        snapshot = await reference_data_store.get_snapshot()
+        if snapshot is not None and _issuepool_data_cache["version"] == snapshot.version:
+            return _issuepool_data_cache["result"]
         
-        # 2. 모든 base issue pool 정보 조회
-        all_base_issuepools = await repository.get_all_base_issuepools()
-        
-        # 3. 데이터 구조화 및 중복 제거
-        structured_data = {
-            "matched_data": [],  # 행 단위로 매칭된 데이터
-            "categories": [],
-            "base_issuepools": [],
-            "esg_classifications": [],
-            "summary": {
-                "total_categories": len(all_categories),
-                "total_base_issuepools": len(all_base_issuepools),
-                "total_matched_rows": 0,
-                "esg_distribution": {}
-            }
-        }
-        
-        # 카테고리 데이터 구조화
-        for cat in all_categories:
-            category_info = {
-                "id": cat.id,
-                "category_name": cat.category_name,
-                "esg_classification_id": cat.esg_classification_id,
-                "esg_classification_name": cat.esg_classification_name if hasattr(cat, 'esg_classification_name') else None,
-                "created_at": str(cat.created_at) if hasattr(cat, 'created_at') else None,
-                "updated_at": str(cat.updated_at) if hasattr(cat, 'updated_at') else None
-            }
-            structured_data["categories"].append(category_info)
-        
-        # Base issue pool 데이터 구조화
-        for pool in all_base_issuepools:
-            pool_info = {
-                "id": pool.id,
-                "base_issue_pool": pool.base_issue_pool,
-                "issue_pool": pool.issue_pool,
-                "category_id": pool.category_id,
-                "ranking": pool.ranking,
-                "corporation_id": pool.corporation_id,
-                "publish_year": pool.publish_year,
-                "created_at": str(pool.created_at) if hasattr(pool, 'created_at') else None,
-                "updated_at": str(pool.updated_at) if hasattr(pool, 'updated_at') else None
-            }
-            structured_data["base_issuepools"].append(pool_info)
-        
-        # 4. 🔥 핵심: 행 단위로 매칭하고 중복 제거
-        logger.warning("🔍 행 단위 매칭 및 중복 제거 시작")
-        
-        # base_issue_pool 기준으로 중복 제거를 위한 set
-        seen_base_issue_pools = set()
-        matched_rows = []
-        
-        for pool in all_base_issuepools:
-            # base_issue_pool 값 (공백 포함)
-            base_issue_pool_value = pool.base_issue_pool.strip() if pool.base_issue_pool else ""
-            
-            # 중복 체크 (공백을 포함한 정확한 값으로)
-            if base_issue_pool_value in seen_base_issue_pools:
-                logger.debug(f"🔍 중복 제거: {base_issue_pool_value}")
-                continue
-            
-            # 중복이 아닌 경우 set에 추가
-            seen_base_issue_pools.add(base_issue_pool_value)
-            
-            # 해당 pool의 category_id로 카테고리 정보 찾기
-            category_info = None
-            for cat in all_categories:
-                if cat.id == pool.category_id:
-                    category_info = cat
-                    break
-            
-            # ESG 분류 정보
-            esg_classification_name = "미분류"
-            if category_info and hasattr(category_info, 'esg_classification_name'):
-                esg_classification_name = category_info.esg_classification_name or "미분류"
-            
-            # 행 단위로 매칭된 데이터 생성
-            matched_row = {
-                "id": pool.id,
-                "base_issue_pool": base_issue_pool_value,
-                "issue_pool": pool.issue_pool,
-                "category_id": pool.category_id,
-                "category_name": category_info.category_name if category_info else "미분류",
-                "esg_classification_id": category_info.esg_classification_id if category_info else None,
-                "esg_classification_name": esg_classification_name,
-                "ranking": pool.ranking,
-                "corporation_id": pool.corporation_id,
-                "publish_year": pool.publish_year,
-                "created_at": str(pool.created_at) if hasattr(pool, 'created_at') else None,
-                "updated_at": str(pool.updated_at) if hasattr(pool, 'updated_at') else None
-            }
-            
-            matched_rows.append(matched_row)
-        
-        # 매칭된 데이터를 structured_data에 추가
-        structured_data["matched_data"] = matched_rows
-        structured_data["summary"]["total_matched_rows"] = len(matched_rows)
-        
-        # 5. ESG 분포 계산 (중복 제거 후)
-        esg_counts = {}
-        for row in matched_rows:
-            esg_name = row.get('esg_classification_name', '미분류')
-            esg_counts[esg_name] = esg_counts.get(esg_name, 0) + 1
+        logger.warning("🔍 issuepool DB 전체 데이터 조회 시작")
+        if snapshot is not None:
+            # 기준 데이터 스냅샷 사용 (쿼리 없음)
+            all_categories = snapshot.categories
+            all_base_issuepools = snapshot.issuepools
+        else:
+            repository = MiddleIssueRepository(uow)
+            all_categories = await repository.get_all_categories_with_esg()
+            all_base_issuepools = await repository.get_all_base_issuepools()
         
-        structured_data["summary"]["esg_distribution"] = esg_counts
+        structured_data = _build_issuepool_data(all_categories, all_base_issuepools)
+        summary = structured_data["summary"]
         
-        # 6. 로깅
         logger.warning(f"✅ issuepool DB 전체 데이터 조회 완료:")
-        logger.warning(f"   - 총 카테고리: {len(all_categories)}개")
-        logger.warning(f"   - 총 Base Issue Pool: {len(all_base_issuepools)}개")
-        logger.warning(f"   - 중복 제거 후 매칭된 행: {len(matched_rows)}개")
-        logger.warning(f"   - 중복 제거된 행: {len(all_base_issuepools) - len(matched_rows)}개")
-        logger.warning(f"   - ESG 분포: {esg_counts}")
+        logger.warning(f"   - 총 카테고리: {summary['total_categories']}개")
+        logger.warning(f"   - 총 Base Issue Pool: {summary['total_base_issuepools']}개")
+        logger.warning(f"   - 중복 제거 후 매칭된 행: {summary['total_matched_rows']}개")
+        logger.warning(f"   - 중복 제거된 행: {summary['total_base_issuepools'] - summary['total_matched_rows']}개")
+        logger.warning(f"   - ESG 분포: {summary['esg_distribution']}")
         
-        return {
+        result = {
             "success": True,
             "message": "issuepool DB 전체 데이터 조회 완료 (중복 제거, 행 단위 매칭)",
             "data": structured_data
         }
+        if snapshot is not None:
+            _issuepool_data_cache.update(version=snapshot.version, result=result, body=None)
+        return result
         
     except Exception as e:
         error_msg = f"❌ issuepool DB 전체 데이터 조회 중 오류 발생: {str(e)}"
@@ -1182,3 +1670,21 @@ async def get_all_issuepool_data() -> Dict[str, Any]:
             "data": None,
             "error": str(e)
         }
+
+async def get_all_issuepool_data_json(uow: Optional[UnitOfWork] = None) -> Tuple[bool, bytes]:
+    """
+    get_all_issuepool_data 결과를 JSON 바이트로 반환 (같은 버전이면 직렬화도 한 번만)
+    
+    Returns:
+        (성공 여부, JSON 바이트)
+    """
+    result = await get_all_issuepool_data(uow)
+    if not result.get("success"):
+        return False, json.dumps(result, ensure_ascii=False).encode("utf-8")
+    
+    # 캐시된 결과와 같은 객체면 직렬화 결과 재사용
+    if _issuepool_data_cache["result"] is result:
+        if _issuepool_data_cache["body"] is None:
+            _issuepool_data_cache["body"] = json.dumps(result, ensure_ascii=False).encode("utf-8")
+        return True, _issuepool_data_cache["body"]
+    return True, json.dumps(result, ensure_ascii=False).encode("utf-8")
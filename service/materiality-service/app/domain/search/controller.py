@@ -3,7 +3,9 @@ Search Controller - MVC 구조에서 BaseModel을 SearchService로 전달하는
 데이터베이스 연결은 하지 않고, Service를 거쳐 Repository까지 BaseModel을 전달
 """
 import logging
+from typing import Optional
 from app.domain.search.service import SearchService
+from app.common.database.unit_of_work import UnitOfWork
 from app.domain.search.schema import CompanySearchRequest
 
 logger = logging.getLogger(__name__)
@@ -14,13 +16,13 @@ class SearchController:
     def __init__(self):
         self.search_service = SearchService()
     
-    async def get_all_companies(self):
+    async def get_all_companies(self, uow: Optional[UnitOfWork] = None):
         """모든 기업 목록 조회"""
         try:
             logger.info("🔍 컨트롤러: 모든 기업 목록 조회 요청을 Service로 전달")
             
             # Service를 통해 Repository 호출 (데이터베이스 연결 없음)
-            result = await self.search_service.get_all_companies()
+            result = await self.search_service.get_all_companies(uow)
             
             logger.info(f"✅ 컨트롤러: Service 응답 수신 - {result.get('success', False)}")
             return result
@@ -29,18 +31,39 @@ class SearchController:
             logger.error(f"❌ 컨트롤러: Service 호출 중 오류 - {str(e)}")
             raise
 
-    async def search_company(self, search_data: CompanySearchRequest):
+    async def search_company(self, search_data: CompanySearchRequest, uow: Optional[UnitOfWork] = None):
         """
         기업 검색 BaseModel을 SearchService로 전달
         
         Args:
             search_data: CompanySearchRequest BaseModel
+            uow: 요청 단위 세션
         """
         try:
             logger.info(f"🔍 컨트롤러: 기업 검색 요청을 Service로 전달 - {search_data.companyname}")
             
             # BaseModel을 Service로 전달 (데이터베이스 연결 없음)
-            result = await self.search_service.search_company_by_name(search_data.companyname)
+            result = await self.search_service.search_company_by_name(search_data.companyname, uow)
+            
+            logger.info(f"✅ 컨트롤러: Service 응답 수신 - {result.get('success', False)}")
+            return result
+            
+        except Exception as e:
+            logger.error(f"❌ 컨트롤러: Service 호출 중 오류 - {str(e)}")
+            raise
+
+    async def suggest_companies(self, query: str, limit: int = 10):
+        """
+        기업명 자동완성 요청을 SearchService로 전달
+        
+        Args:
+            query: 검색어 (초성 가능, 예: ㅅㅅ)
+            limit: 최대 결과 수
+        """
+        try:
+            logger.info(f"🔍 컨트롤러: 기업 자동완성 요청을 Service로 전달 - {query}")
+            
+            result = await self.search_service.suggest_companies(query, limit)
             
             logger.info(f"✅ 컨트롤러: Service 응답 수신 - {result.get('success', False)}")
             return result
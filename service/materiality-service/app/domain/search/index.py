@@ -0,0 +1,320 @@
+"""
+Company Search Index - 기업명 자동완성용 인메모리 인덱스
+corporation 테이블로 만든 인덱스에서 접두어 / 부분 문자열 / 트라이그램 / 초성 검색을 수행
+주기적 갱신: 신규 ID만 추가한 뒤 DB 체크섬과 비교 → 이름 변경/삭제가 있으면 전체 재구성
+"""
+import asyncio
+import hashlib
+import heapq
+import logging
+import os
+import re
+from bisect import bisect_left, insort
+from typing import Dict, Iterable, List, Optional, Set, Tuple
+
+from app.domain.search.repository import SearchRepository
+
+logger = logging.getLogger(__name__)
+
+# 증분 갱신 주기 (초, 0 이하면 폴링 비활성화)
+SEARCH_INDEX_REFRESH_INTERVAL = float(os.getenv("SEARCH_INDEX_REFRESH_INTERVAL", "300"))
+
+# 한글 초성 (유니코드 음절 순서)
+CHOSUNG = [
+    "ㄱ", "ㄲ", "ㄴ", "ㄷ", "ㄸ", "ㄹ", "ㅁ", "ㅂ", "ㅃ", "ㅅ",
+    "ㅆ", "ㅇ", "ㅈ", "ㅉ", "ㅊ", "ㅋ", "ㅌ", "ㅍ", "ㅎ",
+]
+_CHOSUNG_SET = set(CHOSUNG)
+_HANGUL_BASE = 0xAC00
+_HANGUL_LAST = 0xD7A3
+_CHOSUNG_STRIDE = 21 * 28
+
+# 검색에 의미 없는 법인 표기 제거
+_CORP_SUFFIX_RE = re.compile(r"\(주\)|㈜|주식회사|\(유\)|유한회사|\s+")
+
+# 매칭 종류별 기본 점수 (높을수록 상위)
+MATCH_SCORES = {
+    "exact": 100.0,
+    "prefix": 80.0,
+    "chosung_prefix": 70.0,
+    "substring": 60.0,
+    "chosung_substring": 50.0,
+    "similar": 40.0,
+}
+
+# 오타 허용 검색 최소 유사도
+SIMILARITY_THRESHOLD = 0.3
+
+
+def normalize_name(name: str) -> str:
+    """기업명 정규화 - 법인 표기/공백 제거, 소문자"""
+    return _CORP_SUFFIX_RE.sub("", name or "").lower()
+
+
+def to_chosung(text: str) -> str:
+    """한글 음절은 초성으로, 나머지 문자는 그대로 변환 (예: 삼성전자 → ㅅㅅㅈㅈ)"""
+    out = []
+    for ch in text:
+        code = ord(ch)
+        if _HANGUL_BASE <= code <= _HANGUL_LAST:
+            out.append(CHOSUNG[(code - _HANGUL_BASE) // _CHOSUNG_STRIDE])
+        else:
+            out.append(ch)
+    return "".join(out)
+
+
+def _ngrams(text: str, n: int) -> Set[str]:
+    if len(text) < n:
+        return set()
+    return {text[i:i + n] for i in range(len(text) - n + 1)}
+
+
+class CompanyDoc:
+    """인덱스에 들어가는 기업 한 건"""
+    __slots__ = ("id", "companyname", "market", "normalized", "chosung")
+
+    def __init__(self, id: int, companyname: str, market: Optional[str] = None):
+        self.id = id
+        self.companyname = companyname
+        self.market = market
+        self.normalized = normalize_name(companyname)
+        self.chosung = to_chosung(self.normalized)
+
+
+class CompanySearchIndex:
+    """
+    기업명 인덱스
+    - 정렬 리스트 + bisect: 접두어 / 초성 접두어
+    - n-gram(1~3) 역색인: 부분 문자열 후보(트라이그램 교집합) + 오타 허용 유사도
+    모든 변경은 동기 코드라 이벤트 루프 안에서 원자적으로 반영됨
+    """
+
+    def __init__(self):
+        self.docs: Dict[int, CompanyDoc] = {}
+        self._by_name: List[Tuple[str, int]] = []
+        self._by_chosung: List[Tuple[str, int]] = []
+        self._grams: Dict[str, Set[int]] = {}
+        self._chosung_grams: Dict[str, Set[int]] = {}
+        self.max_id = 0
+        self._lock = asyncio.Lock()
+        self._refresh_task: Optional[asyncio.Task] = None
+
+    def __len__(self) -> int:
+        return len(self.docs)
+
+    # ── 인덱스 변경 ─────────────────────────────────────────────
+
+    @staticmethod
+    def _index_grams(index: Dict[str, Set[int]], text: str, doc_id: int, add: bool):
+        for n in (1, 2, 3):
+            for gram in _ngrams(text, n):
+                if add:
+                    index.setdefault(gram, set()).add(doc_id)
+                else:
+                    ids = index.get(gram)
+                    if ids is not None:
+                        ids.discard(doc_id)
+                        if not ids:
+                            del index[gram]
+
+    @staticmethod
+    def _remove_sorted(entries: List[Tuple[str, int]], key: Tuple[str, int]):
+        pos = bisect_left(entries, key)
+        if pos < len(entries) and entries[pos] == key:
+            entries.pop(pos)
+
+    def remove(self, doc_id: int):
+        doc = self.docs.pop(doc_id, None)
+        if doc is None:
+            return
+        self._remove_sorted(self._by_name, (doc.normalized, doc.id))
+        self._remove_sorted(self._by_chosung, (doc.chosung, doc.id))
+        self._index_grams(self._grams, doc.normalized, doc.id, add=False)
+        self._index_grams(self._chosung_grams, doc.chosung, doc.id, add=False)
+
+    def upsert(self, doc: CompanyDoc):
+        """추가 또는 갱신 (같은 ID가 있으면 먼저 제거)"""
+        if doc.id in self.docs:
+            self.remove(doc.id)
+        self.docs[doc.id] = doc
+        insort(self._by_name, (doc.normalized, doc.id))
+        insort(self._by_chosung, (doc.chosung, doc.id))
+        self._index_grams(self._grams, doc.normalized, doc.id, add=True)
+        self._index_grams(self._chosung_grams, doc.chosung, doc.id, add=True)
+        self.max_id = max(self.max_id, doc.id)
+
+    def rebuild(self, docs: Iterable[CompanyDoc]):
+        """전체 재구성 - 새 구조를 만든 뒤 한 번에 교체"""
+        fresh = CompanySearchIndex()
+        doc_list = list(docs)
+        fresh.docs = {d.id: d for d in doc_list}
+        fresh._by_name = sorted((d.normalized, d.id) for d in doc_list)
+        fresh._by_chosung = sorted((d.chosung, d.id) for d in doc_list)
+        for d in doc_list:
+            fresh._index_grams(fresh._grams, d.normalized, d.id, add=True)
+            fresh._index_grams(fresh._chosung_grams, d.chosung, d.id, add=True)
+        self.docs, self._by_name, self._by_chosung = fresh.docs, fresh._by_name, fresh._by_chosung
+        self._grams, self._chosung_grams = fresh._grams, fresh._chosung_grams
+        self.max_id = max(fresh.docs, default=0)
+
+    # ── 검색 ───────────────────────────────────────────────────
+
+    @staticmethod
+    def _prefix_ids(entries: List[Tuple[str, int]], prefix: str, limit: int) -> List[int]:
+        out = []
+        pos = bisect_left(entries, (prefix, -1))
+        while pos < len(entries) and entries[pos][0].startswith(prefix) and len(out) < limit:
+            out.append(entries[pos][1])
+            pos += 1
+        return out
+
+    @staticmethod
+    def _substring_candidates(index: Dict[str, Set[int]], query: str) -> Set[int]:
+        """부분 문자열 후보 - 3글자 이하는 n-gram 그대로, 그 이상은 트라이그램 교집합"""
+        if len(query) <= 3:
+            return set(index.get(query, ()))
+        sets = sorted((index.get(g, set()) for g in _ngrams(query, 3)), key=len)
+        if not sets or not sets[0]:
+            return set()
+        result = set(sets[0])
+        for s in sets[1:]:
+            result &= s
+            if not result:
+                break
+        return result
+
+    def search(self, query: str, limit: int = 10) -> List[Dict[str, object]]:
+        """
+        순위가 매겨진 상위 limit개 기업 반환
+        - 초성만(또는 초성 섞인) 입력이면 초성 인덱스 사용 (예: ㅅㅅ → 삼성)
+        - 부분 문자열 결과가 부족하면 n-gram 유사도로 보충
+        """
+        q = normalize_name(query)
+        if not q or limit <= 0:
+            return []
+
+        # 문서별 최고 점수 / 매칭 종류
+        scores: Dict[int, Tuple[float, str]] = {}
+
+        def hit(doc_id: int, kind: str, bonus: float = 0.0):
+            score = MATCH_SCORES[kind] + bonus
+            prev = scores.get(doc_id)
+            if prev is None or prev[0] < score:
+                scores[doc_id] = (score, kind)
+
+        # 후보 수 상한 (짧은 질의에서 전체 스캔 방지)
+        cap = max(limit * 20, 200)
+
+        if any(ch in _CHOSUNG_SET for ch in q):
+            cq = to_chosung(q)
+            for doc_id in self._prefix_ids(self._by_chosung, cq, cap):
+                hit(doc_id, "chosung_prefix")
+            if len(scores) < limit:
+                for doc_id in list(self._substring_candidates(self._chosung_grams, cq))[:cap]:
+                    if cq in self.docs[doc_id].chosung:
+                        hit(doc_id, "chosung_substring")
+        else:
+            for doc_id in self._prefix_ids(self._by_name, q, cap):
+                hit(doc_id, "exact" if self.docs[doc_id].normalized == q else "prefix")
+            if len(scores) < limit:
+                for doc_id in list(self._substring_candidates(self._grams, q))[:cap]:
+                    if q in self.docs[doc_id].normalized:
+                        hit(doc_id, "substring")
+            if len(scores) < limit and len(q) >= 3:
+                # 오타 허용: n-gram 자카드 유사도 (한글은 음절 밀도가 높아 바이그램 기준)
+                q_grams = _ngrams(q, 2)
+                overlap: Dict[int, int] = {}
+                for gram in q_grams:
+                    for doc_id in self._grams.get(gram, ()):
+                        overlap[doc_id] = overlap.get(doc_id, 0) + 1
+                for doc_id, shared in overlap.items():
+                    if doc_id in scores:
+                        continue
+                    doc_grams = len(_ngrams(self.docs[doc_id].normalized, 2))
+                    similarity = shared / (len(q_grams) + doc_grams - shared)
+                    if similarity >= SIMILARITY_THRESHOLD:
+                        hit(doc_id, "similar", bonus=similarity * 10)
+
+        # 점수 내림차순 → 짧은 이름 → 이름순
+        top = heapq.nsmallest(
+            limit,
+            scores.items(),
+            key=lambda item: (-item[1][0], len(self.docs[item[0]].normalized), self.docs[item[0]].companyname),
+        )
+        return [
+            {
+                "id": doc_id,
+                "companyname": self.docs[doc_id].companyname,
+                "market": self.docs[doc_id].market,
+                "score": round(score, 3),
+                "match": kind,
+            }
+            for doc_id, (score, kind) in top
+        ]
+
+    def all_docs(self) -> List[CompanyDoc]:
+        """ID 순 전체 기업"""
+        return [self.docs[i] for i in sorted(self.docs)]
+
+    def signature(self) -> str:
+        """인덱스 내용 체크섬 (SearchRepository.get_corporations_signature와 같은 형식)"""
+        payload = "|".join(f"{d.id}:{d.companyname}:{d.market or ''}" for d in self.all_docs())
+        return hashlib.md5(payload.encode("utf-8")).hexdigest()
+
+    # ── DB 동기화 ──────────────────────────────────────────────
+
+    async def load(self, full: bool = False) -> int:
+        """
+        DB와 동기화 - 처음이거나 full이면 전체 재구성, 아니면 max_id 이후 신규 기업만 추가
+        증분 갱신 후에도 DB 체크섬과 다르면(이름/시장 변경, 삭제) 전체 재구성
+        반환: 반영된 기업 수
+        """
+        async with self._lock:
+            repository = SearchRepository()
+            if full or not self.docs:
+                corporations = await repository.get_all_corporations()
+                self.rebuild(CompanyDoc(c.id, c.companyname, c.market) for c in corporations)
+                logger.info(f"✅ 기업 검색 인덱스 구성 완료: {len(self.docs)}개 기업")
+                return len(self.docs)
+
+            corporations = await repository.get_corporations_after(self.max_id)
+            for c in corporations:
+                self.upsert(CompanyDoc(c.id, c.companyname, c.market))
+            if corporations:
+                logger.info(f"✅ 기업 검색 인덱스 증분 갱신: {len(corporations)}개 기업 추가")
+
+            if await repository.get_corporations_signature() != self.signature():
+                corporations = await repository.get_all_corporations()
+                self.rebuild(CompanyDoc(c.id, c.companyname, c.market) for c in corporations)
+                logger.info(f"🔄 기업 정보 변경/삭제 감지 → 검색 인덱스 전체 재구성: {len(self.docs)}개 기업")
+                return len(self.docs)
+            return len(corporations)
+
+    async def _refresh_loop(self):
+        while True:
+            await asyncio.sleep(SEARCH_INDEX_REFRESH_INTERVAL)
+            try:
+                await self.load()
+            except Exception as e:
+                logger.error(f"❌ 기업 검색 인덱스 갱신 중 오류: {str(e)}")
+
+    async def start(self):
+        """서비스 시작 시 전체 로드 + 증분 갱신 시작"""
+        try:
+            await self.load(full=True)
+        except Exception as e:
+            logger.error(f"❌ 기업 검색 인덱스 초기 로드 실패: {str(e)}")
+        if SEARCH_INDEX_REFRESH_INTERVAL > 0 and self._refresh_task is None:
+            self._refresh_task = asyncio.create_task(self._refresh_loop())
+
+    async def stop(self):
+        if self._refresh_task is not None:
+            self._refresh_task.cancel()
+            try:
+                await self._refresh_task
+            except asyncio.CancelledError:
+                pass
+            self._refresh_task = None
+
+
+company_search_index = CompanySearchIndex()
@@ -3,9 +3,10 @@ Search Repository - BaseModel을 받아서 데이터베이스 작업을 수행
 데이터베이스 연결을 담당하며, BaseModel과 Entity 간의 변환을 처리
 """
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select
+from sqlalchemy import select, text
 from app.domain.search.entity import CorporationEntity
-from app.common.database.corporation_db import get_db
+from app.common.database.unit_of_work import UnitOfWork, session_scope
+from typing import Optional
 import logging
 
 logger = logging.getLogger(__name__)
@@ -13,8 +14,9 @@ logger = logging.getLogger(__name__)
 class SearchRepository:
     """검색 리포지토리 - 기업명으로만 검색"""
     
-    def __init__(self):
-        pass
+    def __init__(self, uow: Optional[UnitOfWork] = None):
+        # 요청 단위 세션 (없으면 호출마다 새 세션)
+        self.uow = uow
     
     async def get_all_corporations(self):
         """모든 기업 정보 조회 - CorporationEntity 리스트 반환"""
@@ -22,7 +24,7 @@ class SearchRepository:
             logger.info("🔍 리포지토리: 모든 기업 정보 조회")
             
             # 데이터베이스 연결
-            async for db in get_db():
+            async with session_scope(self.uow) as db:
                 query = select(CorporationEntity)
                 result = await db.execute(query)
                 corp_entities = result.scalars().all()
@@ -34,13 +36,46 @@ class SearchRepository:
             logger.error(f"❌ 리포지토리: 모든 기업 정보 조회 중 오류 - {str(e)}")
             raise
     
+    async def get_corporations_after(self, last_id: int):
+        """ID가 last_id보다 큰 기업만 조회 (검색 인덱스 증분 갱신용)"""
+        try:
+            async with session_scope(self.uow) as db:
+                query = (
+                    select(CorporationEntity)
+                    .where(CorporationEntity.id > last_id)
+                    .order_by(CorporationEntity.id)
+                )
+                result = await db.execute(query)
+                return result.scalars().all()
+                    
+        except Exception as e:
+            logger.error(f"❌ 리포지토리: 신규 기업 조회 중 오류 - {str(e)}")
+            raise
+    
+    async def get_corporations_signature(self) -> str:
+        """
+        기업 전체의 (ID, 기업명, 시장) 체크섬 - 검색 인덱스가 이름 변경/삭제를 감지하는 용도
+        CompanySearchIndex.signature()와 같은 형식 (ID 순, md5)
+        """
+        try:
+            async with session_scope(self.uow) as db:
+                return await db.scalar(text(
+                    "SELECT md5(coalesce(string_agg("
+                    "id::text || ':' || companyname || ':' || coalesce(market, ''), '|' ORDER BY id), ''))"
+                    " FROM corporation"
+                ))
+
+        except Exception as e:
+            logger.error(f"❌ 리포지토리: 기업 체크섬 조회 중 오류 - {str(e)}")
+            raise
+    
     async def find_corporation_by_name(self, companyname: str):
         """기업명으로 기업 정보 조회 - CorporationEntity 반환"""
         try:
             logger.info(f"🔍 리포지토리: 기업명으로 기업 정보 조회 - {companyname}")
             
             # 데이터베이스 연결
-            async for db in get_db():
+            async with session_scope(self.uow) as db:
                 query = select(CorporationEntity).where(CorporationEntity.companyname == companyname)
                 result = await db.execute(query)
                 corp_entity = result.scalar_one_or_none()
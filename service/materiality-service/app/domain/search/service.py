@@ -4,8 +4,11 @@ BaseModel을 받아서 Repository로 전달하는 중간 계층
 데이터베이스 연결은 하지 않음
 """
 import logging
+from typing import Optional
 from app.domain.search.repository import SearchRepository
+from app.common.database.unit_of_work import UnitOfWork
 from app.domain.search.schema import CompanySearchRequest
+from app.domain.search.index import company_search_index
 
 logger = logging.getLogger("search_service")
 
@@ -15,13 +18,20 @@ class SearchService:
     def __init__(self):
         self.search_repository = SearchRepository()
     
-    async def get_all_companies(self) -> dict:
+    def _get_repository(self, uow: Optional[UnitOfWork] = None) -> SearchRepository:
+        """요청 단위 세션이 있으면 해당 세션을 쓰는 리포지토리 반환"""
+        return SearchRepository(uow) if uow is not None else self.search_repository
+    
+    async def get_all_companies(self, uow: Optional[UnitOfWork] = None) -> dict:
         """모든 기업 목록 조회 - Repository를 통해 데이터베이스에서 가져옴"""
         try:
             logger.info("🔍 서비스: 모든 기업 목록 조회 요청을 Repository로 전달")
             
-            # Repository를 통해 모든 기업 정보 조회 (데이터베이스 연결 없음)
-            companies = await self.search_repository.get_all_corporations()
+            # 검색 인덱스가 있으면 메모리에서, 없으면 Repository를 통해 조회
+            if len(company_search_index) > 0:
+                companies = company_search_index.all_docs()
+            else:
+                companies = await self._get_repository(uow).get_all_corporations()
             
             if companies:
                 logger.info(f"✅ 서비스: 기업 목록 조회 성공 - {len(companies)}개 기업")
@@ -51,7 +61,7 @@ class SearchService:
                 "companies": []
             }
     
-    async def search_company_by_name(self, companyname: str) -> dict:
+    async def search_company_by_name(self, companyname: str, uow: Optional[UnitOfWork] = None) -> dict:
         """기업명으로 기업 검색 - BaseModel을 Repository로 전달"""
         try:
             logger.info(f"🔍 서비스: 기업 검색 요청을 Repository로 전달 - {companyname}")
@@ -65,7 +75,7 @@ class SearchService:
                 }
             
             # BaseModel을 Repository로 전달 (데이터베이스 연결 없음)
-            company = await self.search_repository.find_corporation_by_name(companyname.strip())
+            company = await self._get_repository(uow).find_corporation_by_name(companyname.strip())
             
             if company:
                 logger.info(f"✅ 서비스: 기업 검색 성공 - {company.companyname}")
@@ -90,6 +100,36 @@ class SearchService:
                 "message": f"기업 검색 처리 중 오류가 발생했습니다: {str(e)}"
             }
     
+    async def suggest_companies(self, query: str, limit: int = 10) -> dict:
+        """기업명 자동완성 - 접두어/부분 문자열/초성/유사도 검색 (인메모리 인덱스)"""
+        try:
+            if not query or query.strip() == "":
+                return {
+                    "success": False,
+                    "message": "검색어를 입력해주세요.",
+                    "companies": []
+                }
+            
+            # 시작 시 로드가 실패했으면 여기서 한 번 더 시도
+            if len(company_search_index) == 0:
+                await company_search_index.load(full=True)
+            
+            companies = company_search_index.search(query.strip(), limit=limit)
+            return {
+                "success": True,
+                "message": f"{len(companies)}개 기업을 찾았습니다.",
+                "query": query,
+                "companies": companies
+            }
+                
+        except Exception as e:
+            logger.error(f"❌ 서비스: 기업 자동완성 처리 중 오류 - {str(e)}")
+            return {
+                "success": False,
+                "message": f"기업 자동완성 처리 중 오류가 발생했습니다: {str(e)}",
+                "companies": []
+            }
+    
     async def validate_company_search(self, search_data: dict) -> dict:
         """기업 검색 데이터 검증 - BaseModel 생성 및 검증"""
         try:
@@ -16,6 +16,13 @@ from app.router.search_router import search_router
 from app.router.issuepool_router import issuepool_router
 from app.router.middleissue_router import middleissue_router
 from app.router.category_router import category_router
+from app.router.debug_router import debug_router
+
+from app.domain.middleissue.reference_data import reference_data_store
+from app.domain.middleissue.executor import assessment_executor
+from app.domain.search.index import company_search_index
+from app.common import tracing
+from app.common.loop_monitor import install_loop_monitor
 
 # 환경 변수 로드 (Railway 환경에서는 건너뛰기)
 if os.getenv("RAILWAY_ENVIRONMENT") != "true":
@@ -48,6 +55,8 @@ app.add_middleware(
     allow_credentials=False,
     allow_methods=["GET", "POST", "PUT", "DELETE", "OPTIONS", "PATCH"],
     allow_headers=["*"],
+    # 프론트에서 단계별 시간(Server-Timing)/추적 ID를 읽을 수 있도록 노출
+    expose_headers=[tracing.SERVER_TIMING_HEADER, tracing.TRACE_ID_HEADER],
 )
 
 # TrustedHost 미들웨어 설정
@@ -64,6 +73,12 @@ app.include_router(search_router, prefix="/materiality-service", tags=["search"]
 app.include_router(issuepool_router, prefix="/materiality-service", tags=["issuepool"])
 app.include_router(middleissue_router, prefix="/materiality-service", tags=["middleissue"])
 app.include_router(category_router, prefix="/materiality-service", tags=["category"])
+# 디버그 엔드포인트(추적/캐시 조회)는 추적을 켠 환경에서만 노출
+if tracing.TRACE_ENABLED:
+    app.include_router(debug_router, prefix="/materiality-service", tags=["debug"])
+
+# 이벤트 루프 블로킹 감시 (GET /materiality-service/debug/loop-lag)
+install_loop_monitor(app, "materiality-service", path="/materiality-service/debug/loop-lag")
 
 @app.get("/")
 async def root():
@@ -98,6 +113,19 @@ async def log_requests(request: Request, call_next):
         logger.error(traceback.format_exc())
         raise
 
+@app.middleware("http")
+async def trace_requests(request: Request, call_next):
+    """요청 추적 미들웨어 - X-Debug-Trace: 1 요청이면 단계별 시간을 Server-Timing 헤더로 반환"""
+    if not tracing.should_trace(request.headers):
+        return await call_next(request)
+    with tracing.start_trace(f"{request.method} {request.url.path}") as trace:
+        response = await call_next(request)
+    response.headers[tracing.SERVER_TIMING_HEADER] = trace.server_timing()
+    response.headers[tracing.TRACE_ID_HEADER] = trace.trace_id
+    tracing.store_trace(trace)
+    logger.info(f"⏱️ 추적 {trace.trace_id}: {trace.root.duration * 1000:.1f}ms, DB 쿼리 {trace.root.total_db_queries()}회")
+    return response
+
 @app.on_event("startup")
 async def startup_event():
     """서비스 시작 시 실행되는 이벤트"""
@@ -110,11 +138,25 @@ async def startup_event():
     logger.info("   - POST /materiality-service/middleissue/create")
     logger.info("   - GET  /materiality-service/issuepool/all (신규: issuepool DB 전체 데이터)")
     logger.info("   - POST /materiality-service/category/categories/all (신규: 전체 카테고리 목록)")
+    logger.info("   - POST /materiality-service/reference-data/reload (기준 데이터 스냅샷 갱신)")
+    logger.info("   - GET  /materiality-service/search/companies/suggest (기업명 자동완성)")
+    logger.info("   - GET  /materiality-service/debug/traces/{trace_id} (X-Debug-Trace 요청 추적 내보내기)")
+    logger.info("   - GET  /materiality-service/debug/loop-lag (이벤트 루프 지연/블로킹 스택)")
     logger.info("   - (search_router 내 엔드포인트들도 /materiality-service/* 로 노출)")
+    
+    # 기준 데이터(카테고리/ESG/issuepool) 스냅샷 로드 + 버전 폴링 시작
+    await reference_data_store.start()
+    # 기업명 자동완성 인덱스 로드 + 증분 갱신 시작
+    await company_search_index.start()
+    # 평가 CPU 단계용 프로세스 풀 (워커 기동/모델 로드는 백그라운드)
+    await assessment_executor.start()
 
 @app.on_event("shutdown")
 async def shutdown_event():
     """서비스 종료 시 실행되는 이벤트"""
+    await reference_data_store.stop()
+    await company_search_index.stop()
+    await assessment_executor.stop()
     logger.info("🛑 Materiality Service 종료됨")
 
 if __name__ == "__main__":
@@ -0,0 +1,49 @@
+"""
+Debug Router - 요청 추적(span) 조회/내보내기 엔드포인트
+X-Debug-Trace: 1 헤더로 요청하면 응답 X-Trace-Id로 받은 ID를 여기서 조회
+"""
+from fastapi import APIRouter, HTTPException
+from fastapi.responses import JSONResponse
+from app.common import tracing
+from app.domain.middleissue.sentiment_cache import sentiment_cache
+from app.domain.middleissue.assessment_cache import assessment_cache
+import logging
+
+logger = logging.getLogger(__name__)
+
+debug_router = APIRouter(prefix="/debug", tags=["Debug"])
+
+@debug_router.get("/traces", summary="최근 요청 추적 목록")
+async def list_traces():
+    """메모리에 보관 중인 최근 추적 (최신순)"""
+    if not tracing.TRACE_ENABLED:
+        raise HTTPException(status_code=404, detail="요청 추적이 비활성화되어 있습니다")
+    return {"success": True, "traces": tracing.list_traces()}
+
+@debug_router.get("/traces/{trace_id}", summary="요청 추적 내보내기")
+async def get_trace(trace_id: str, format: str = "chrome"):
+    """
+    format=chrome: Chrome trace event JSON (chrome://tracing, ui.perfetto.dev 에서 열기)
+    format=tree: 단계별 span 트리 (시간/DB 쿼리 수)
+    """
+    if not tracing.TRACE_ENABLED:
+        raise HTTPException(status_code=404, detail="요청 추적이 비활성화되어 있습니다")
+    trace = tracing.get_trace(trace_id)
+    if trace is None:
+        raise HTTPException(status_code=404, detail="추적을 찾을 수 없습니다 (보관 기간 만료 또는 잘못된 ID)")
+    if format == "tree":
+        return trace.to_dict()
+    return JSONResponse(
+        content=trace.to_chrome_trace(),
+        headers={"Content-Disposition": f'attachment; filename="trace_{trace_id}.json"'},
+    )
+
+@debug_router.get("/sentiment-cache", summary="감성 분석 캐시 적중률")
+async def sentiment_cache_stats():
+    """이 프로세스의 감성 캐시 적중/미적중 수 (프로세스 풀 워커의 적중은 워커 로그에 기록)"""
+    return {"success": True, "cache": sentiment_cache.stats()}
+
+@debug_router.get("/assessment-cache", summary="평가 결과 캐시 재사용률")
+async def assessment_cache_stats():
+    """평가 결과 캐시 적중(저장된 응답)/증분(새 기사만 평가)/미적중(전체 평가) 수"""
+    return {"success": True, "cache": assessment_cache.stats()}
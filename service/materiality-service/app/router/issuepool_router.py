@@ -1,7 +1,7 @@
 """
 Issue Pool Router - FastAPI 라우터
 """
-from fastapi import APIRouter, HTTPException, Request
+from fastapi import APIRouter, HTTPException, Request, Depends
 from fastapi.responses import JSONResponse
 import logging
 
@@ -10,12 +10,13 @@ logger = logging.getLogger(__name__)
 
 from app.domain.issuepool.schema import IssuePoolListRequest
 from app.domain.issuepool.controller import issuepool_controller
+from app.common.database.unit_of_work import UnitOfWork, get_unit_of_work
 
 # 라우터 생성
 issuepool_router = APIRouter(prefix="/issuepool", tags=["IssuePool"])
 
 @issuepool_router.post("/list", summary="지난 중대성 평가 목록 조회")
-async def get_issuepool_list(request: Request):
+async def get_issuepool_list(request: Request, uow: UnitOfWork = Depends(get_unit_of_work)):
     """
     지난 중대성 평가 목록 조회
     
@@ -69,7 +70,7 @@ async def get_issuepool_list(request: Request):
             logger.info(f"✅ 지난 중대성 평가 목록 조회 데이터 검증 성공: {issuepool_request.company_id}")
             
             # issuepool_controller로 BaseModel 전달
-            result = await issuepool_controller.get_issuepool_list(issuepool_request)
+            result = await issuepool_controller.get_issuepool_list(issuepool_request, uow)
             return JSONResponse(result)
                 
         except Exception as validation_error:
@@ -87,7 +88,7 @@ async def get_issuepool_list(request: Request):
         })
 
 @issuepool_router.get("/{issuepool_id}", summary="특정 이슈풀 조회")
-async def get_issuepool_by_id(issuepool_id: int):
+async def get_issuepool_by_id(issuepool_id: int, uow: UnitOfWork = Depends(get_unit_of_work)):
     """
     특정 이슈풀 조회
     
@@ -99,7 +100,7 @@ async def get_issuepool_by_id(issuepool_id: int):
     """
     logger.info(f"🔍 IssuePool ID 조회: {issuepool_id}")
     try:
-        result = await issuepool_controller.get_issuepool_by_id(issuepool_id)
+        result = await issuepool_controller.get_issuepool_by_id(issuepool_id, uow)
         return JSONResponse(result)
     except Exception as e:
         logger.error(f"❌ IssuePool ID 조회 중 오류: {str(e)}")
@@ -111,7 +112,8 @@ async def get_issuepool_by_id(issuepool_id: int):
 @issuepool_router.get("/corporation/{corporation_name}", summary="기업별 이슈풀 목록 조회")
 async def get_issuepools_by_corporation(
     corporation_name: str,
-    publish_year: int = None
+    publish_year: int = None,
+    uow: UnitOfWork = Depends(get_unit_of_work)
 ):
     """
     기업별 이슈풀 목록 조회
@@ -127,7 +129,8 @@ async def get_issuepools_by_corporation(
     try:
         result = await issuepool_controller.get_issuepools_by_corporation(
             corporation_name=corporation_name,
-            publish_year=publish_year
+            publish_year=publish_year,
+            uow=uow
         )
         return JSONResponse(result)
     except Exception as e:
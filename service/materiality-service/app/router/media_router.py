@@ -1,6 +1,7 @@
-from fastapi import APIRouter, Request, HTTPException
+from fastapi import APIRouter, Request, HTTPException, Depends
 from fastapi.responses import FileResponse
 from app.domain.media.controller import media_controller
+from app.common.database.unit_of_work import UnitOfWork, get_unit_of_work
 import logging
 import traceback
 import os
@@ -12,7 +13,7 @@ logger = logging.getLogger(__name__)
 media_router = APIRouter(tags=["Media"])
 
 @media_router.post("/search-media", summary="미디어 검색")
-async def search_media(request: Request):
+async def search_media(request: Request, uow: UnitOfWork = Depends(get_unit_of_work)):
     """
     gateway에서 넘어온 미디어 검색 요청을 처리하는 엔드포인트
     최종 경로: /materiality-service/search-media
@@ -41,7 +42,7 @@ async def search_media(request: Request):
             return {"success": False, "message": "end_date가 필요합니다"}
 
         # Controller를 통해 Service 호출
-        result = await media_controller.search_media(body)
+        result = await media_controller.search_media(body, uow)
         
         logger.info(f"✅ 미디어 검색 요청 처리 완료: {body.get('company_id')}")
         return result
@@ -1,15 +1,20 @@
 """
 중대성 평가 중간 이슈 관련 라우터
 """
-from fastapi import APIRouter, HTTPException
-from typing import List
+from fastapi import APIRouter, HTTPException, Depends
+from fastapi.responses import Response
+from typing import List, Optional
 from app.domain.middleissue.schema import (
     MiddleIssueRequest,
     MiddleIssueResponse,
-    MiddleIssueAssessmentResponse
+    MiddleIssueAssessmentResponse,
+    RescoreRequest,
+    BatchAssessmentRequest
 )
 from app.domain.middleissue.controller import middleissue_controller
-from app.domain.middleissue.service import get_all_issuepool_data
+from app.common.database.unit_of_work import UnitOfWork, get_unit_of_work
+from app.domain.middleissue.service import get_all_issuepool_data_json
+from app.domain.middleissue.reference_data import reference_data_store
 import logging
 
 # 로거 설정
@@ -20,13 +25,13 @@ middleissue_router = APIRouter()
 
 # 엔드포인트
 @middleissue_router.post("/middleissue/assessment", response_model=MiddleIssueResponse)
-async def start_middleissue_assessment(request: MiddleIssueRequest):
+async def start_middleissue_assessment(request: MiddleIssueRequest, uow: UnitOfWork = Depends(get_unit_of_work)):
     """새로운 중대성 평가 시작"""
     try:
         logger.info(f"📊 중대성 평가 시작 요청 받음 - 기업: {request.company_id}")
         
         # 컨트롤러로 요청 전달
-        result = await middleissue_controller.start_assessment(request)
+        result = await middleissue_controller.start_assessment(request, uow)
         
         logger.info(f"✅ 중대성 평가 시작 응답 전송 - {result.get('success', False)}")
         
@@ -36,6 +41,59 @@ async def start_middleissue_assessment(request: MiddleIssueRequest):
         logger.error(f"❌ 중대성 평가 시작 처리 중 오류: {str(e)}")
         raise HTTPException(status_code=500, detail=str(e))
 
+@middleissue_router.post("/middleissue/assessment/pipelined", response_model=MiddleIssueResponse)
+async def start_pipelined_middleissue_assessment(request: MiddleIssueRequest, uow: UnitOfWork = Depends(get_unit_of_work)):
+    """미디어 검색 + 중대성 평가를 한 번에 (기사가 도착하는 대로 평가, articles/result_id 불필요)"""
+    try:
+        logger.info(f"📊 파이프라인 평가 요청 받음 - 기업: {request.company_id}")
+        
+        result = await middleissue_controller.start_pipelined_assessment(request, uow)
+        
+        logger.info(f"✅ 파이프라인 평가 응답 전송 - {result.get('success', False)}")
+        
+        return result
+        
+    except Exception as e:
+        logger.error(f"❌ 파이프라인 평가 처리 중 오류: {str(e)}")
+        raise HTTPException(status_code=500, detail=str(e))
+
+@middleissue_router.post("/middleissue/assessment/rescore", response_model=MiddleIssueResponse)
+async def rescore_middleissue_assessment(request: RescoreRequest):
+    """완료된 평가의 카테고리 순위를 가중치/최근성 기준만 바꿔 다시 계산 (크롤링/모델/DB 없음)"""
+    try:
+        result = await middleissue_controller.rescore_assessment(request)
+        return result
+        
+    except Exception as e:
+        logger.error(f"❌ 가중치 재계산 처리 중 오류: {str(e)}")
+        raise HTTPException(status_code=500, detail=str(e))
+
+@middleissue_router.post("/middleissue/assessment/batch", response_model=MiddleIssueResponse)
+async def start_batch_middleissue_assessment(request: BatchAssessmentRequest):
+    """여러 기업 일괄 평가 시작 (검색/감성 분석 공유, 백그라운드 실행 → data.job_id로 진행 상황 조회)"""
+    try:
+        logger.info(f"📊 일괄 평가 요청 받음 - 기업 {len(request.company_ids)}개")
+        
+        result = await middleissue_controller.start_batch_assessment(request)
+        
+        logger.info(f"✅ 일괄 평가 시작 응답 전송 - {result.get('success', False)}")
+        
+        return result
+        
+    except Exception as e:
+        logger.error(f"❌ 일괄 평가 시작 처리 중 오류: {str(e)}")
+        raise HTTPException(status_code=500, detail=str(e))
+
+@middleissue_router.get("/middleissue/assessment/batch/{job_id}", response_model=MiddleIssueResponse)
+async def get_batch_middleissue_assessment(job_id: str, company: Optional[str] = None):
+    """일괄 평가 진행 상황 (기업별 상태/수집 건수), company를 주면 그 기업의 평가 결과"""
+    try:
+        return await middleissue_controller.get_batch_status(job_id, company)
+        
+    except Exception as e:
+        logger.error(f"❌ 일괄 평가 조회 처리 중 오류: {str(e)}")
+        raise HTTPException(status_code=500, detail=str(e))
+
 @middleissue_router.get("/middleissue/list", response_model=List[dict])
 async def list_middle_issues():
     """중간 이슈 목록 조회"""
@@ -46,21 +104,44 @@ async def list_middle_issues():
         raise HTTPException(status_code=500, detail=str(e))
 
 @middleissue_router.get("/issuepool/all", summary="issuepool DB 전체 데이터 조회")
-async def get_all_issuepool_data_endpoint():
+async def get_all_issuepool_data_endpoint(uow: UnitOfWork = Depends(get_unit_of_work)):
     """issuepool DB에서 모든 데이터를 조회합니다"""
     try:
         logger.info("🔍 issuepool DB 전체 데이터 조회 요청 받음")
         
-        # 서비스 함수 호출
-        result = await get_all_issuepool_data()
+        # 서비스 함수 호출 (버전별로 캐시된 JSON 바이트)
+        success, body = await get_all_issuepool_data_json(uow)
         
-        if result["success"]:
+        if success:
             logger.info("✅ issuepool DB 전체 데이터 조회 완료")
-            return result
+            return Response(content=body, media_type="application/json")
         else:
-            logger.error(f"❌ issuepool DB 전체 데이터 조회 실패: {result.get('message', '알 수 없는 오류')}")
-            raise HTTPException(status_code=500, detail=result.get('message', '데이터 조회 실패'))
+            logger.error("❌ issuepool DB 전체 데이터 조회 실패")
+            raise HTTPException(status_code=500, detail="데이터 조회 실패")
             
+    except HTTPException:
+        raise
     except Exception as e:
         logger.error(f"❌ issuepool DB 전체 데이터 조회 엔드포인트 오류: {str(e)}")
-        raise HTTPException(status_code=500, detail=f"서버 내부 오류: {str(e)}")
\ No newline at end of file
+        raise HTTPException(status_code=500, detail=f"서버 내부 오류: {str(e)}")
+
+@middleissue_router.post("/reference-data/reload", summary="기준 데이터 스냅샷 다시 로드")
+async def reload_reference_data():
+    """upload_materiality.py 실행 후 카테고리/ESG/issuepool 스냅샷을 즉시 교체합니다"""
+    try:
+        logger.info("🔄 기준 데이터 스냅샷 reload 요청 받음")
+        snapshot = await reference_data_store.reload(force=True)
+        if snapshot is None:
+            raise HTTPException(status_code=500, detail="기준 데이터 스냅샷 로드 실패")
+        return {
+            "success": True,
+            "message": "기준 데이터 스냅샷 로드 완료",
+            "version": snapshot.version,
+            "total_categories": len(snapshot.categories),
+            "total_issuepools": len(snapshot.issuepools)
+        }
+    except HTTPException:
+        raise
+    except Exception as e:
+        logger.error(f"❌ 기준 데이터 스냅샷 reload 오류: {str(e)}")
+        raise HTTPException(status_code=500, detail=f"서버 내부 오류: {str(e)}")
@@ -1,10 +1,11 @@
 """
 Search Router - 기업 검색 관련 API 엔드포인트
 """
-from fastapi import APIRouter, HTTPException, Request
+from fastapi import APIRouter, HTTPException, Request, Depends, Query
 from fastapi.responses import JSONResponse
 from app.domain.search.controller import search_controller
 from app.domain.search.schema import CompanySearchRequest
+from app.common.database.unit_of_work import UnitOfWork, get_unit_of_work
 import logging
 import traceback
 
@@ -13,13 +14,13 @@ logger = logging.getLogger(__name__)
 search_router = APIRouter(prefix="/search", tags=["Search"])
 
 @search_router.get("/companies", summary="기업 목록 조회")
-async def get_companies():
+async def get_companies(uow: UnitOfWork = Depends(get_unit_of_work)):
     """corporation 테이블에서 모든 기업 목록을 가져옴"""
     try:
         logger.info("🔍 라우터: 기업 목록 조회 요청")
         
         # Controller를 통해 Service 호출
-        result = await search_controller.get_all_companies()
+        result = await search_controller.get_all_companies(uow)
         
         logger.info(f"✅ 라우터: 기업 목록 조회 완료 - {len(result.get('companies', []))}개 기업")
         return result
@@ -29,14 +30,29 @@ async def get_companies():
         logger.error(f"상세 오류: {traceback.format_exc()}")
         raise HTTPException(status_code=500, detail=f"기업 목록 조회 중 오류가 발생했습니다: {str(e)}")
 
+@search_router.get("/companies/suggest", summary="기업명 자동완성")
+async def suggest_companies(
+    q: str = Query(..., description="검색어 (접두어/부분 문자열/초성, 예: ㅅㅅ)"),
+    limit: int = Query(10, ge=1, le=50, description="최대 결과 수")
+):
+    """인메모리 기업 인덱스에서 순위가 매겨진 상위 limit개 기업을 반환"""
+    try:
+        result = await search_controller.suggest_companies(q, limit)
+        return result
+        
+    except Exception as e:
+        logger.error(f"❌ 라우터: 기업 자동완성 중 오류 - {str(e)}")
+        logger.error(f"상세 오류: {traceback.format_exc()}")
+        raise HTTPException(status_code=500, detail=f"기업 자동완성 중 오류가 발생했습니다: {str(e)}")
+
 @search_router.post("/company", summary="기업명으로 기업 검색")
-async def search_company(search_data: CompanySearchRequest):
+async def search_company(search_data: CompanySearchRequest, uow: UnitOfWork = Depends(get_unit_of_work)):
     """기업명으로 기업 검색"""
     try:
         logger.info(f"🔍 라우터: 기업 검색 요청 - {search_data.companyname}")
         
         # Controller를 통해 Service 호출
-        result = await search_controller.search_company(search_data)
+        result = await search_controller.search_company(search_data, uow)
         
         logger.info(f"✅ 라우터: 기업 검색 완료 - {result.get('success', False)}")
         return result
@@ -0,0 +1,3 @@
+"""
+Materiality Service Benchmarks - 합성 데이터 기반 성능 측정 스크립트
+"""
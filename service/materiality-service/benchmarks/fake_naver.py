@@ -0,0 +1,309 @@
+"""
+Fake Naver News API - 로컬 네이버 뉴스 검색 API 대체 서버 (표준 라이브러리만 사용)
+
+/v1/search/news.json 과 같은 요청/응답 형식으로, 검색어마다 항상 같은 결과를 페이지 단위로 반환한다.
+크롤링 동시성 / Retry-After 처리 / 페이지네이션을 네트워크 없이 조정·회귀 테스트하기 위한 용도.
+
+장애 주입:
+- latency_ms (+ jitter, 일부 요청만 느린 tail latency)
+- 429 burst (N번째 요청마다 연속 M개 429 + Retry-After), 초당 요청 한도(qps_limit) 초과 시 429
+- 5xx 무작위 주입
+
+단독 실행:
+    python -m benchmarks.fake_naver --port 8765 --latency-ms 80 --error-rate 0.02 --burst-every 200
+    NAVER_API_BASE_URL=http://127.0.0.1:8765/v1/search/news.json NAVER_CLIENT_ID=x NAVER_CLIENT_SECRET=x ...
+관리용: GET /__stats (요청 통계), POST /__reset (통계 초기화)
+"""
+import argparse
+import hashlib
+import json
+import random
+import threading
+import time
+from collections import deque
+from datetime import datetime, timedelta, timezone
+from email.utils import format_datetime
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Dict, Optional
+from urllib.parse import parse_qs, urlparse
+
+NEWS_PATH = "/v1/search/news.json"
+KST = timezone(timedelta(hours=9))
+
+WORDS = ["확대", "논란", "협력", "사고", "투자", "개선", "소송", "수상", "점검", "발표", "하락", "성장"]
+
+
+class FakeNaverConfig:
+    """가짜 서버 동작 설정"""
+
+    def __init__(
+        self,
+        *,
+        min_total: int = 80,
+        max_total: int = 1100,
+        span_days: int = 540,
+        newest: Optional[datetime] = None,
+        duplicate_ratio: float = 0.1,
+        latency_ms: float = 30.0,
+        latency_jitter_ms: float = 20.0,
+        slow_ratio: float = 0.01,
+        slow_ms: float = 800.0,
+        error_rate: float = 0.0,
+        burst_every: int = 0,
+        burst_len: int = 5,
+        retry_after: float = 1.0,
+        qps_limit: float = 0.0,
+        seed: int = 42,
+    ):
+        self.min_total = min_total                  # 검색어별 전체 결과 수 범위
+        self.max_total = max_total
+        self.span_days = span_days                  # 결과 pubDate 분포 기간 (newest 기준 과거로)
+        self.newest = newest or datetime.now(KST)
+        self.duplicate_ratio = duplicate_ratio      # 다른 검색어와 같은 originallink를 공유하는 비율
+        self.latency_ms = latency_ms
+        self.latency_jitter_ms = latency_jitter_ms
+        self.slow_ratio = slow_ratio                # tail latency 요청 비율
+        self.slow_ms = slow_ms
+        self.error_rate = error_rate                # 5xx 비율
+        self.burst_every = burst_every              # N번째 요청마다 429 burst (0이면 사용 안 함)
+        self.burst_len = burst_len
+        self.retry_after = retry_after              # 429 응답의 Retry-After (초)
+        self.qps_limit = qps_limit                  # 초당 요청 한도 (0이면 제한 없음)
+        self.seed = seed
+
+
+class FakeNaverState:
+    """결과 생성 + 장애 주입 + 통계 (핸들러 스레드 간 공유)"""
+
+    def __init__(self, config: FakeNaverConfig):
+        self.config = config
+        self._lock = threading.Lock()
+        self._rng = random.Random(config.seed)
+        self._recent = deque()
+        self.reset()
+
+    def reset(self):
+        with self._lock:
+            self.requests = 0
+            self.status_counts: Dict[int, int] = {}
+            self.items_served = 0
+            self.queries: Dict[str, int] = {}
+            self._burst_remaining = 0
+            self._recent.clear()
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            return {
+                "requests": self.requests,
+                "status_counts": dict(self.status_counts),
+                "items_served": self.items_served,
+                "distinct_queries": len(self.queries),
+            }
+
+    def _record(self, status: int, items: int = 0):
+        self.status_counts[status] = self.status_counts.get(status, 0) + 1
+        self.items_served += items
+
+    def decide(self, query: str):
+        """요청 하나에 대해 (지연 초, 장애 상태코드 또는 None) 결정"""
+        c = self.config
+        with self._lock:
+            self.requests += 1
+            self.queries[query] = self.queries.get(query, 0) + 1
+            n = self.requests
+
+            delay = max(0.0, c.latency_ms + self._rng.uniform(-c.latency_jitter_ms, c.latency_jitter_ms)) / 1000
+            if c.slow_ratio and self._rng.random() < c.slow_ratio:
+                delay += c.slow_ms / 1000
+
+            status = None
+            if c.qps_limit:
+                now = time.monotonic()
+                while self._recent and now - self._recent[0] > 1.0:
+                    self._recent.popleft()
+                if len(self._recent) >= c.qps_limit:
+                    status = 429
+                else:
+                    self._recent.append(now)
+            if status is None and c.burst_every and n % c.burst_every == 0:
+                self._burst_remaining = c.burst_len
+            if status is None and self._burst_remaining > 0:
+                self._burst_remaining -= 1
+                status = 429
+            if status is None and c.error_rate and self._rng.random() < c.error_rate:
+                status = self._rng.choice([500, 502, 503])
+            if status is not None:
+                self._record(status)
+            return delay, status
+
+    # 결정적 결과 생성
+    def _query_seed(self, query: str) -> int:
+        return int(hashlib.md5(f"{self.config.seed}:{query}".encode("utf-8")).hexdigest()[:8], 16)
+
+    def total_for(self, query: str) -> int:
+        c = self.config
+        return c.min_total + self._query_seed(query) % max(1, c.max_total - c.min_total + 1)
+
+    def item(self, query: str, index: int, total: int) -> Dict[str, str]:
+        c = self.config
+        qseed = self._query_seed(query)
+        # 최신순(sort=date): index가 클수록 과거
+        pub = c.newest - timedelta(seconds=index * c.span_days * 86400 / max(total, 1))
+        word = WORDS[(qseed + index) % len(WORDS)]
+        if (qseed + index * 7919) % 1000 < c.duplicate_ratio * 1000:
+            link = f"https://news.example.com/shared/{index}"
+        else:
+            link = f"https://news.example.com/{qseed:x}/{index}?utm_source=naver"
+        return {
+            "title": f"<b>{query}</b> {word} 관련 기사 {index + 1}",
+            "originallink": link,
+            "link": f"https://n.news.naver.com/mnews/article/{qseed % 1000:03d}/{index:010d}",
+            "description": f"{query}에 대한 <b>{word}</b> 소식입니다. 업계에서는 &quot;{word}&quot; 흐름이 이어질 것으로 본다.",
+            "pubDate": format_datetime(pub),
+        }
+
+    def page(self, query: str, start: int, display: int) -> Dict[str, Any]:
+        total = self.total_for(query)
+        end = min(total, start - 1 + display)
+        items = [self.item(query, i, total) for i in range(start - 1, end)]
+        with self._lock:
+            self._record(200, len(items))
+        return {
+            "lastBuildDate": format_datetime(self.config.newest),
+            "total": total,
+            "start": start,
+            "display": len(items),
+            "items": items,
+        }
+
+
+class _Handler(BaseHTTPRequestHandler):
+    server_version = "FakeNaver/1.0"
+
+    def log_message(self, format, *args):  # noqa: A002 - 요청마다 stderr 출력하지 않음
+        pass
+
+    def _send_json(self, status: int, body: Dict[str, Any], headers: Optional[Dict[str, str]] = None):
+        payload = json.dumps(body, ensure_ascii=False).encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json; charset=utf-8")
+        self.send_header("Content-Length", str(len(payload)))
+        for k, v in (headers or {}).items():
+            self.send_header(k, v)
+        self.end_headers()
+        self.wfile.write(payload)
+
+    def do_POST(self):
+        if urlparse(self.path).path == "/__reset":
+            self.server.state.reset()
+            return self._send_json(200, {"ok": True})
+        return self._send_json(404, {"errorMessage": "Not Found"})
+
+    def do_GET(self):
+        state: FakeNaverState = self.server.state
+        parsed = urlparse(self.path)
+        if parsed.path == "/__stats":
+            return self._send_json(200, state.stats())
+        if parsed.path != NEWS_PATH:
+            return self._send_json(404, {"errorMessage": "Not Found"})
+
+        if not self.headers.get("X-Naver-Client-Id") or not self.headers.get("X-Naver-Client-Secret"):
+            return self._send_json(401, {"errorMessage": "Authentication failed", "errorCode": "024"})
+
+        params = parse_qs(parsed.query)
+        query = (params.get("query") or [""])[0]
+        try:
+            display = int((params.get("display") or ["10"])[0])
+            start = int((params.get("start") or ["1"])[0])
+        except ValueError:
+            return self._send_json(400, {"errorMessage": "Invalid parameter", "errorCode": "SE01"})
+        # 실제 API와 같은 파라미터 제한
+        if not query:
+            return self._send_json(400, {"errorMessage": "Incorrect query request", "errorCode": "SE01"})
+        if not 1 <= display <= 100:
+            return self._send_json(400, {"errorMessage": "Invalid display value", "errorCode": "SE02"})
+        if not 1 <= start <= 1000:
+            return self._send_json(400, {"errorMessage": "Invalid start value", "errorCode": "SE03"})
+
+        delay, status = state.decide(query)
+        if delay:
+            time.sleep(delay)
+        if status == 429:
+            return self._send_json(
+                429, {"errorMessage": "Rate limit exceeded", "errorCode": "012"},
+                {"Retry-After": f"{state.config.retry_after:g}"},
+            )
+        if status is not None:
+            return self._send_json(status, {"errorMessage": "System error", "errorCode": "SE99"})
+        return self._send_json(200, state.page(query, start, display))
+
+
+class FakeNaverServer:
+    """백그라운드 스레드에서 동작하는 가짜 서버 (port=0이면 빈 포트 자동 할당)"""
+
+    def __init__(self, config: Optional[FakeNaverConfig] = None, host: str = "127.0.0.1", port: int = 0):
+        self.state = FakeNaverState(config or FakeNaverConfig())
+        self.httpd = ThreadingHTTPServer((host, port), _Handler)
+        self.httpd.daemon_threads = True
+        self.httpd.state = self.state
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def base_url(self) -> str:
+        host, port = self.httpd.server_address[:2]
+        return f"http://{host}:{port}{NEWS_PATH}"
+
+    def start(self) -> "FakeNaverServer":
+        self._thread = threading.Thread(target=self.httpd.serve_forever, name="fake-naver", daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self):
+        self.httpd.shutdown()
+        self.httpd.server_close()
+        if self._thread is not None:
+            self._thread.join(timeout=5)
+
+
+def add_config_arguments(parser: argparse.ArgumentParser):
+    """서버 설정 CLI 인자 (load_naver_crawl.py와 공용)"""
+    parser.add_argument("--latency-ms", type=float, default=30.0)
+    parser.add_argument("--jitter-ms", type=float, default=20.0)
+    parser.add_argument("--slow-ratio", type=float, default=0.01)
+    parser.add_argument("--slow-ms", type=float, default=800.0)
+    parser.add_argument("--error-rate", type=float, default=0.0, help="5xx 비율 (0~1)")
+    parser.add_argument("--burst-every", type=int, default=0, help="N번째 요청마다 429 burst")
+    parser.add_argument("--burst-len", type=int, default=5)
+    parser.add_argument("--retry-after", type=float, default=1.0)
+    parser.add_argument("--qps-limit", type=float, default=0.0, help="초당 요청 한도 (초과 시 429)")
+    parser.add_argument("--seed", type=int, default=42)
+
+
+def config_from_args(args) -> FakeNaverConfig:
+    return FakeNaverConfig(
+        latency_ms=args.latency_ms, latency_jitter_ms=args.jitter_ms,
+        slow_ratio=args.slow_ratio, slow_ms=args.slow_ms,
+        error_rate=args.error_rate, burst_every=args.burst_every, burst_len=args.burst_len,
+        retry_after=args.retry_after, qps_limit=args.qps_limit, seed=args.seed,
+    )
+
+
+def main():
+    parser = argparse.ArgumentParser(description="로컬 가짜 네이버 뉴스 검색 API")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8765)
+    add_config_arguments(parser)
+    args = parser.parse_args()
+
+    server = FakeNaverServer(config_from_args(args), host=args.host, port=args.port)
+    print(f"🚀 Fake Naver API: {server.base_url}")
+    try:
+        server.httpd.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.httpd.server_close()
+
+
+if __name__ == "__main__":
+    main()
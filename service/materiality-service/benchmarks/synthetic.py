@@ -0,0 +1,194 @@
+"""
+Synthetic Data - 벤치마크용 가짜 기사/기준 데이터/인메모리 리포지토리
+실제 DB 없이 start_assessment 각 단계를 실행할 수 있도록
+MiddleIssueRepository와 같은 메서드 이름/반환 타입을 가진 대체 리포지토리를 제공
+"""
+import random
+from datetime import datetime, timedelta
+from email.utils import format_datetime
+from typing import Dict, List, Optional
+
+from app.domain.middleissue.reference_data import ReferenceSnapshot
+from app.domain.middleissue.schema import (
+    Article, CategoryDetailsResponse, CategoryWithESG,
+    CorporationIssueResponse, IssueItem, IssuePoolRow
+)
+
+ESG_CLASSES = {1: "환경", 2: "사회", 3: "지배구조", 4: "경제"}
+
+# (카테고리명, ESG 분류 ID)
+CATEGORIES = [
+    ("기후변화", 1), ("탄소배출", 1), ("대기오염", 1), ("수질오염", 1), ("폐기물", 1),
+    ("에너지효율", 1), ("재생에너지", 1), ("생물다양성", 1), ("화학물질관리", 1), ("자원순환", 1),
+    ("산업안전", 2), ("노사관계", 2), ("인권", 2), ("공급망관리", 2), ("지역사회", 2),
+    ("고객만족", 2), ("제품안전", 2), ("개인정보보호", 2), ("다양성", 2), ("인재육성", 2),
+    ("이사회", 3), ("윤리경영", 3), ("준법경영", 3), ("리스크관리", 3), ("주주권리", 3),
+    ("반부패", 3), ("정보공시", 3), ("내부통제", 3),
+    ("연구개발", 4), ("경제적성과", 4), ("시장지위", 4), ("투자", 4),
+]
+
+COMPANIES = ["한국전력", "삼성전자", "현대자동차", "포스코", "LG화학", "SK하이닉스", "두산에너빌리티", "HL 만도"]
+
+NEGATIVE_WORDS = ["하락", "사고", "소송", "과징금", "파업", "유출", "논란", "위반", "적자", "리콜", "중징계", "화재"]
+POSITIVE_WORDS = ["성장", "수상", "확대", "개선", "흑자", "협력", "인증", "혁신", "지원", "도약", "기부", "채용"]
+NEUTRAL_WORDS = ["발표", "계획", "회의", "설명회", "점검", "추진", "검토", "운영", "참석", "진행"]
+
+TITLE_TEMPLATES = [
+    "{company}, {category} 관련 {w1} {w2}",
+    "[단독] {company} {category} {w1}…업계 {w2}",
+    "{category} 이슈에 {company} {w1} 우려",
+    "{company} {category} 부문 {w1}, 하반기 {w2} 전망",
+    "'{category}' 강화 나선 {company}…{w1} {w2}",
+]
+DESC_TEMPLATES = [
+    "{company}는 {date_text} {category}와 관련해 {w1} 사실을 밝혔다. 업계에서는 {w2} 가능성도 제기된다.",
+    "{category} 분야에서 {company}의 {w1}이 이어지고 있다. 회사 측은 {w2} 방안을 검토 중이라고 설명했다.",
+    "{company} 관계자는 \"{category} 관련 {w1}에 대해 {w2}할 계획\"이라고 말했다.",
+]
+
+
+def _pick_words(rng: random.Random) -> List[str]:
+    # 부정 30%, 긍정 30%, 부정+긍정 동시 10%, 중립 30%
+    r = rng.random()
+    if r < 0.3:
+        return [rng.choice(NEGATIVE_WORDS), rng.choice(NEUTRAL_WORDS)]
+    if r < 0.6:
+        return [rng.choice(POSITIVE_WORDS), rng.choice(NEUTRAL_WORDS)]
+    if r < 0.7:
+        return [rng.choice(NEGATIVE_WORDS), rng.choice(POSITIVE_WORDS)]
+    return [rng.choice(NEUTRAL_WORDS), rng.choice(NEUTRAL_WORDS)]
+
+
+def _pub_date(rng: random.Random, now: datetime) -> str:
+    dt = now - timedelta(days=rng.randint(0, 365), minutes=rng.randint(0, 1440))
+    # 크롤러 입력처럼 RSS / ISO 형식 혼합
+    if rng.random() < 0.7:
+        return format_datetime(dt)
+    return dt.isoformat()
+
+
+def generate_articles(n: int, company: str = "한국전력", seed: int = 42,
+                      now: Optional[datetime] = None) -> List[Article]:
+    """카테고리/감성 분포가 실제 크롤링 결과와 비슷한 가짜 기사 n개"""
+    rng = random.Random(seed)
+    now = now or datetime.now()
+    # 실제 데이터처럼 일부 카테고리에 기사가 몰리도록 가중치 부여
+    weights = [1.0 / (i + 1) ** 0.7 for i in range(len(CATEGORIES))]
+    names = [name for name, _ in CATEGORIES]
+
+    articles = []
+    for i in range(n):
+        category = rng.choices(names, weights=weights)[0]
+        w1, w2 = _pick_words(rng)
+        # 제목에 대상 기업명이 들어가는 비율 약 60%
+        title_company = company if rng.random() < 0.6 else rng.choice(COMPANIES)
+        fields = {
+            "company": title_company, "category": category, "w1": w1, "w2": w2,
+            "date_text": f"{rng.randint(1, 12)}월 {rng.randint(1, 28)}일",
+        }
+        articles.append(Article(
+            company=company,
+            issue=category,
+            original_category=category,
+            query_kind="issue",
+            keyword=f"{company} {category}",
+            title=rng.choice(TITLE_TEMPLATES).format(**fields),
+            description=rng.choice(DESC_TEMPLATES).format(**fields),
+            pubDate=_pub_date(rng, now),
+            originallink=f"https://news.example.com/{seed}/{i}",
+        ))
+    return articles
+
+
+def build_reference_data(seed: int = 42, pools_per_category: int = 6):
+    """카테고리/ESG/이슈풀 기준 데이터 (ReferenceSnapshot 입력 형식)"""
+    rng = random.Random(seed)
+    categories = [
+        CategoryWithESG(
+            id=i + 1, category_name=name,
+            esg_classification_id=esg_id, esg_classification_name=ESG_CLASSES[esg_id]
+        )
+        for i, (name, esg_id) in enumerate(CATEGORIES)
+    ]
+    issuepools = []
+    pool_id = 1
+    for category in categories:
+        for k in range(pools_per_category):
+            publish_year = rng.choice([None, "2022", "2023", "2024"])
+            issuepools.append(IssuePoolRow(
+                id=pool_id,
+                corporation_id=1,
+                publish_year=publish_year,
+                ranking=str(k + 1),
+                base_issue_pool=f"{category.category_name} 대응",
+                issue_pool=f"{category.category_name} 세부이슈 {k + 1}",
+                category_id=category.id,
+                esg_classification_id=category.esg_classification_id,
+            ))
+            pool_id += 1
+    return categories, issuepools
+
+
+def build_snapshot(seed: int = 42) -> ReferenceSnapshot:
+    categories, issuepools = build_reference_data(seed)
+    return ReferenceSnapshot(f"synthetic-{seed}", categories, issuepools)
+
+
+class InMemoryMiddleIssueRepository:
+    """MiddleIssueRepository 대체 - 같은 메서드 시그니처, 데이터는 메모리에서 조회"""
+
+    def __init__(self, seed: int = 42, uow=None):
+        self.categories, self.issuepools = build_reference_data(seed)
+        self.snapshot = ReferenceSnapshot(f"synthetic-{seed}", self.categories, self.issuepools)
+        self.query_count = 0
+
+    async def get_corporation_issues(self, corporation_name: str, year: int) -> CorporationIssueResponse:
+        self.query_count += 1
+        target_year = str(year - 1)
+        year_issues = [
+            IssueItem(category_id=p.category_id, base_issue_pool=p.base_issue_pool)
+            for p in self.issuepools if p.publish_year == target_year
+        ]
+        common_issues = [
+            IssueItem(category_id=p.category_id, base_issue_pool=p.base_issue_pool)
+            for p in self.issuepools if p.publish_year in (None, "", "0")
+        ]
+        return CorporationIssueResponse(year_issues=year_issues, common_issues=common_issues)
+
+    async def get_category_id_by_name(self, category_name: str) -> Optional[int]:
+        self.query_count += 1
+        return self.snapshot.get_category_id(category_name)
+
+    async def get_categories_by_names_batch(self, category_names: List[str]) -> Dict[str, CategoryDetailsResponse]:
+        self.query_count += 1
+        return self.snapshot.get_categories_details(category_names)
+
+    async def get_category_esg_direct(self, category_name: str) -> Optional[str]:
+        self.query_count += 1
+        return self.snapshot.get_category_esg(category_name)
+
+    async def get_category_by_name_direct(self, corporation_name: str = "", category_name: str = "",
+                                          year: int = 0) -> Optional[CategoryDetailsResponse]:
+        self.query_count += 1
+        return self.snapshot.details_by_name.get(category_name)
+
+    async def get_category_details(self, corporation_name: str = "", category_id: str = "",
+                                   year: int = 0) -> Optional[CategoryDetailsResponse]:
+        self.query_count += 1
+        category = self.snapshot.category_by_id.get(int(category_id)) if str(category_id).isdigit() else None
+        return self.snapshot.details_by_name.get(category.category_name) if category else None
+
+    async def get_all_categories_with_esg(self) -> List[CategoryWithESG]:
+        return self.categories
+
+    async def get_all_base_issuepools(self) -> List[IssuePoolRow]:
+        return self.issuepools
+
+    async def get_reference_data_version(self) -> str:
+        return self.snapshot.version
+
+
+__all__ = [
+    "InMemoryMiddleIssueRepository",
+    "build_reference_data", "build_snapshot", "generate_articles",
+]